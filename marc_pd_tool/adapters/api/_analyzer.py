@@ -3,9 +3,16 @@
 """Main analyzer class that combines all mixins"""
 
 # Standard library imports
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from hashlib import md5
 from json import dumps
 from logging import getLogger
+from multiprocessing import cpu_count
+from os.path import abspath
+from os.path import basename
+from typing import Iterator
 
 # Local imports
 from marc_pd_tool.adapters.api._batch_processing import BatchProcessingComponent
@@ -15,9 +22,9 @@ from marc_pd_tool.application.models.analysis_results import AnalysisResults
 from marc_pd_tool.application.models.config_models import AnalysisOptions
 from marc_pd_tool.application.processing.indexer import DataIndexer
 from marc_pd_tool.application.processing.indexer import build_wordbased_index
-from marc_pd_tool.application.processing.text_processing import (
-    extract_best_publisher_match,
-)
+from marc_pd_tool.application.processing.matching_engine import estimate_batch_cost
+from marc_pd_tool.application.processing.task_graph import TaskGraph
+from marc_pd_tool.application.processing.text_processing import extract_best_publisher_match
 from marc_pd_tool.application.processing.text_processing import GenericTitleDetector
 from marc_pd_tool.core.domain.enums import MatchType
 from marc_pd_tool.core.domain.match_result import MatchResult
@@ -30,9 +37,28 @@ from marc_pd_tool.infrastructure.config import get_config
 from marc_pd_tool.infrastructure.persistence import CopyrightDataLoader
 from marc_pd_tool.infrastructure.persistence import MarcLoader
 from marc_pd_tool.infrastructure.persistence import RenewalDataLoader
+from marc_pd_tool.infrastructure.persistence import RunDirectory
 
 logger = getLogger(__name__)
 
+# Options that decide which records are matched and how; a run can only be
+# resumed with the values it was started with
+RESUME_SETTINGS = {
+    "us_only",
+    "min_year",
+    "max_year",
+    "year_tolerance",
+    "title_threshold",
+    "author_threshold",
+    "publisher_threshold",
+    "early_exit_title",
+    "early_exit_author",
+    "early_exit_publisher",
+    "score_everything_mode",
+    "minimum_combined_score",
+    "brute_force_missing_year",
+}
+
 
 class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, ExportComponent):
     """High-level analyzer for MARC copyright status
@@ -69,7 +95,13 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
 
         # Initialize cache manager
         self.cache_dir = cache_dir or ".marcpd_cache"
-        self.cache_manager = CacheManager(self.cache_dir)
+        caching_config = self.config.caching
+        self.cache_manager = CacheManager(
+            self.cache_dir,
+            max_bytes=caching_config.max_bytes,
+            compression=caching_config.compression,
+            compression_level=caching_config.compression_level,
+        )
         if force_refresh:
             logger.info("Force refresh requested - clearing all caches")
             self.cache_manager.clear_all_caches()
@@ -83,6 +115,10 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         self.registration_index: DataIndexer | None = None
         self.renewal_index: DataIndexer | None = None
         self.generic_detector: GenericTitleDetector | None = None
+        # Predicted matching cost of each pickled MARC batch, by path
+        self.batch_costs: dict[str, float] = {}
+        # Durable directory of the current run's batches and results
+        self.run_directory: RunDirectory | None = None
 
         # Default data directories
         self.copyright_dir = "nypl-reg/xml/"
@@ -99,6 +135,7 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         output_path: str | None = None,
         options: AnalysisOptions | None = None,
         temp_dir: str | None = None,
+        resume_dir: str | None = None,
     ) -> AnalysisResults:
         """Analyze a MARC XML file for copyright status
 
@@ -124,10 +161,17 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
                 - single_file: Export all results to single file
                 - batch_size: Number of records per batch
                 - num_processes: Number of worker processes
-            temp_dir: Directory for temporary batch files (optional)
+            temp_dir: Directory to create the run directory in, which holds the
+                batch and result files (optional, system temp by default)
+            resume_dir: Run directory of an interrupted run to resume (optional);
+                its completed batches are kept and only the rest are matched
 
         Returns:
             AnalysisResults object containing processed publications and statistics
+
+        Raises:
+            FileNotFoundError: If resume_dir doesn't hold a run
+            ValueError: If the run in resume_dir was started with other settings
         """
         # Set data directories if provided
         if copyright_dir:
@@ -142,6 +186,13 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         # Store options for later use
         self.analysis_options = options
 
+        # Check a resumed run before spending time on the indexes
+        self.run_directory = None
+        resumed_run = None
+        if resume_dir:
+            resumed_run = RunDirectory.open(resume_dir)
+            resumed_run.check_settings(self._run_settings(marc_path, options))
+
         # Load and index copyright/renewal data first
         self._load_and_index_data(options)
 
@@ -152,8 +203,8 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
             from marc_pd_tool.infrastructure.persistence import CopyrightDataLoader
             from marc_pd_tool.infrastructure.persistence import RenewalDataLoader
 
-            copyright_loader = CopyrightDataLoader(self.copyright_dir)
-            renewal_loader = RenewalDataLoader(self.renewal_dir)
+            copyright_loader = CopyrightDataLoader(self.copyright_dir, cache_dir=self.cache_dir)
+            renewal_loader = RenewalDataLoader(self.renewal_dir, cache_dir=self.cache_dir)
 
             max_copyright_year = copyright_loader.max_data_year
             max_renewal_year = renewal_loader.max_data_year
@@ -182,6 +233,9 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
             max_year=options.max_year,
             us_only=options.us_only,
             max_data_year=max_data_year,
+            # Pipelined runs already overlap parsing with matching, and the parser
+            # runs on the match pool's feeder thread where forking is unsafe
+            num_workers=1 if options.pipeline else options.num_processes,
         )
 
         # Load MARC records
@@ -200,12 +254,62 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         if max_year is not None:
             filtering_options["max_year"] = max_year
 
+        if resumed_run is not None:
+            # Phase 2 was done by the interrupted run: match what it left
+            batch_paths = resumed_run.pending_batches(resumed_run.completed_batches())
+            self.batch_costs = {
+                path: resumed_run.batch_costs[basename(path)]
+                for path in batch_paths
+                if basename(path) in resumed_run.batch_costs
+            }
+            self.run_directory = resumed_run
+            logger.info(f"Resuming run in {resumed_run.path}")
+
+            self._process_marc_batches(batch_paths, marc_path, output_path, options)
+            self._finish_run_directory(output_path, options)
+
+            return self.results
+
+        if options.pipeline:
+            # Pipelined mode: hand batches straight from the parser to the
+            # matching workers, skipping the intermediate pickle files
+            logger.info("Pipelined mode: matching batches as they are parsed")
+            if options.us_only:
+                logger.info("  Filter applied: US publications only")
+            if options.min_year or options.max_year:
+                year_range = f"{options.min_year or 'earliest'} to {options.max_year or 'present'}"
+                logger.info(f"  Year range filter: {year_range}")
+
+            self._process_marc_batches(marc_loader.iter_batches(), marc_path, output_path, options)
+
+            return self.results
+
         # Always use disk-based batch processing for memory efficiency
-        # Extract MARC records to pickled batch files
-        batch_paths, total_records, filtered_count = marc_loader.extract_batches_to_disk(temp_dir)
+        # Extract MARC records to pickled batch files, predicting the matching
+        # cost of each batch while it is in memory so Phase 3 can start the
+        # most expensive ones first
+        batch_cost = None
+        if self.registration_index and self.renewal_index:
+            batch_cost = partial(
+                estimate_batch_cost,
+                registration_index=self.registration_index,
+                renewal_index=self.renewal_index,
+                brute_force_missing_year=options.brute_force_missing_year,
+            )
+        run_directory = RunDirectory.create(self._run_settings(marc_path, options), temp_dir)
+        logger.info(f"Run directory: {run_directory.path}")
+        logger.info(f"  If the run is interrupted, resume it with --resume {run_directory.path}")
+        batch_paths, total_records, filtered_count = marc_loader.extract_batches_to_disk(
+            run_directory.batch_dir, batch_cost=batch_cost
+        )
+        self.batch_costs = marc_loader.batch_costs if batch_cost else {}
+        run_directory.save_batch_costs(self.batch_costs)
+        self.run_directory = run_directory
 
         if not batch_paths:
             logger.warning("No MARC records found or all records were filtered")
+            run_directory.remove()
+            self.run_directory = None
             return self.results
 
         logger.info(f"✓ Extracted {total_records:,} MARC records into {len(batch_paths)} batches")
@@ -221,12 +325,40 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
 
         # Process batches efficiently (Phase 3 and 5 are handled by BatchProcessingComponent)
         self._process_marc_batches(batch_paths, marc_path, output_path, options)
+        self._finish_run_directory(output_path, options)
 
         return self.results
 
+    def _finish_run_directory(self, output_path: str | None, options: AnalysisOptions) -> None:
+        """Remove the run directory of a finished run
+
+        A run that stopped early (interrupted, or with failed batches) keeps
+        its directory so it can be resumed. A finished run's directory is
+        removed once its results are exported; without an output path the
+        results still read the run's result files, so the directory goes with
+        cleanup_temp_files() instead.
+
+        Args:
+            output_path: Path the results were exported to (or None)
+            options: Analysis options
+        """
+        run_directory = self.run_directory
+        if run_directory is None or run_directory.pending_batches(
+            run_directory.completed_batches()
+        ):
+            return
+        if options.keep_run_dir:
+            logger.info(f"Run directory kept: {run_directory.path}")
+        elif output_path:
+            run_directory.remove()
+            self.results.result_file_paths.clear()
+            self.run_directory = None
+        else:
+            self.results.result_temp_dir = run_directory.path
+
     def _process_marc_batches(
         self,
-        batch_paths: list[str],
+        batch_paths: list[str] | Iterator[list[Publication]],
         marc_path: str,
         output_path: str | None,
         options: AnalysisOptions,
@@ -234,7 +366,8 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         """Process MARC batches efficiently
 
         Args:
-            batch_paths: List of paths to pickled batch files
+            batch_paths: List of paths to pickled batch files, or an iterator of
+                in-memory batches in pipelined mode
             marc_path: Original MARC file path (for logging)
             output_path: Path for output files (or None)
             options: Analysis options
@@ -242,6 +375,28 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         # Use the batch processing component's method directly
         BatchProcessingComponent._analyze_marc_file_batch(self, batch_paths, marc_path, output_path, options)  # type: ignore[arg-type]
 
+    def prepare_data(
+        self,
+        copyright_dir: str | None = None,
+        renewal_dir: str | None = None,
+        options: AnalysisOptions | None = None,
+    ) -> None:
+        """Load and index the copyright/renewal data without analyzing any MARC records
+
+        Fills the data, index and generic detector caches for the options' year
+        range, so later analyses with the same range start from the cache.
+
+        Args:
+            copyright_dir: Directory containing copyright XML files
+            renewal_dir: Directory containing renewal TSV files
+            options: Analysis options with the year range and worker count
+        """
+        if copyright_dir:
+            self.copyright_dir = copyright_dir
+        if renewal_dir:
+            self.renewal_dir = renewal_dir
+        self._load_and_index_data(options or AnalysisOptions())
+
     def analyze_marc_records(
         self, publications: list[Publication], options: AnalysisOptions | None = None
     ) -> list[Publication]:
@@ -256,6 +411,7 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         """
         # Clear previous results
         self.results = AnalysisResults()
+        self.run_directory = None
 
         # Initialize options if not provided
         if options is None:
@@ -363,6 +519,157 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         """
         return self.results
 
+    def _run_phase1_tasks(self, options: AnalysisOptions) -> tuple[DataIndexer, DataIndexer]:
+        """Load and index registrations and renewals as two concurrent chains
+
+        Both chains submit their work to one shared process pool, so the
+        smaller renewal load and index build overlap with the registration
+        work instead of waiting for it.
+
+        Args:
+            options: Analysis options with year filters and worker count
+
+        Returns:
+            Tuple of (registration_index, renewal_index)
+
+        Raises:
+            RuntimeError: If the task graph finished without building both indexes
+        """
+        num_workers = options.num_processes
+        pool_size = num_workers if num_workers is not None else max(1, cpu_count() - 4)
+
+        with ProcessPoolExecutor(max_workers=pool_size) as pool:
+            # Start the workers before any coordinator thread exists, so that
+            # fork() never runs while another thread holds a lock
+            pool.submit(int).result()
+
+            graph = TaskGraph("Phase 1")
+            graph.add("load registrations", lambda: self._load_copyright_data(options, pool))
+            graph.add("load renewals", lambda: self._load_renewal_data(options, pool))
+            graph.add(
+                "index registrations",
+                lambda: self._build_registration_index(options, pool),
+                depends_on=("load registrations",),
+            )
+            graph.add(
+                "index renewals",
+                lambda: self._build_renewal_index(options, pool),
+                depends_on=("load renewals",),
+            )
+            try:
+                graph.run()
+            finally:
+                graph.log_timings()
+
+        if self.registration_index is None or self.renewal_index is None:
+            raise RuntimeError("Phase 1 finished without building both indexes")
+        return self.registration_index, self.renewal_index
+
+    def _load_copyright_data(self, options: AnalysisOptions, pool: Executor) -> None:
+        """Load copyright registrations from the data cache or the source files
+
+        Args:
+            options: Analysis options with year filters
+            pool: Process pool for parallel loading
+        """
+        min_year = options.min_year
+        max_year = options.max_year
+        brute_force = options.brute_force_missing_year
+
+        logger.info(f"Loading copyright registration data from: {self.copyright_dir}")
+        cached_copyright = self.cache_manager.get_cached_copyright_data(
+            self.copyright_dir, min_year, max_year, brute_force
+        )
+
+        if cached_copyright:
+            self.copyright_data = cached_copyright
+        else:
+            # Always use parallel loading (with automatic fallback to sequential if needed)
+            loader = CopyrightDataLoader(
+                self.copyright_dir, num_workers=options.num_processes, cache_dir=self.cache_dir
+            )
+            self.copyright_data = loader.load_all_copyright_data(min_year, max_year, pool)
+
+            self.cache_manager.cache_copyright_data(
+                self.copyright_dir, self.copyright_data, min_year, max_year, brute_force
+            )
+
+    def _load_renewal_data(self, options: AnalysisOptions, pool: Executor) -> None:
+        """Load renewals from the data cache or the source files
+
+        Args:
+            options: Analysis options with year filters
+            pool: Process pool for parallel loading
+        """
+        min_year = options.min_year
+        max_year = options.max_year
+        brute_force = options.brute_force_missing_year
+
+        logger.info(f"Loading copyright renewal data from: {self.renewal_dir}")
+        cached_renewal = self.cache_manager.get_cached_renewal_data(
+            self.renewal_dir, min_year, max_year, brute_force
+        )
+
+        if cached_renewal:
+            self.renewal_data = cached_renewal
+        else:
+            # Always use parallel loading (with automatic fallback to sequential if needed)
+            renewal_loader = RenewalDataLoader(
+                self.renewal_dir, num_workers=options.num_processes, cache_dir=self.cache_dir
+            )
+            self.renewal_data = renewal_loader.load_all_renewal_data(min_year, max_year, pool)
+
+            self.cache_manager.cache_renewal_data(
+                self.renewal_dir, self.renewal_data, min_year, max_year, brute_force
+            )
+
+    def _build_registration_index(self, options: AnalysisOptions, pool: Executor) -> None:
+        """Build the registration index from the loaded copyright data
+
+        Args:
+            options: Analysis options with the worker count
+            pool: Process pool for parallel index building
+        """
+        logger.info(f"Building registration index for {len(self.copyright_data):,} records...")
+        self.registration_index = self._build_index(self.copyright_data, options, pool)
+
+    def _build_renewal_index(self, options: AnalysisOptions, pool: Executor) -> None:
+        """Build the renewal index from the loaded renewal data
+
+        Args:
+            options: Analysis options with the worker count
+            pool: Process pool for parallel index building
+        """
+        logger.info(f"Building renewal index for {len(self.renewal_data):,} records...")
+        self.renewal_index = self._build_index(self.renewal_data, options, pool)
+
+    def _build_index(
+        self, publications: list[Publication], options: AnalysisOptions, pool: Executor
+    ) -> DataIndexer:
+        """Build a word-based index, in parallel when possible
+
+        Args:
+            publications: Publications to index
+            options: Analysis options with the worker count
+            pool: Process pool for parallel index building
+
+        Returns:
+            Index of the publications
+        """
+        # Always try parallel index building first (with automatic fallback to sequential)
+        try:
+            # Local imports
+            from marc_pd_tool.application.processing.parallel_indexer import (
+                build_wordbased_index_parallel,
+            )
+
+            return build_wordbased_index_parallel(
+                publications, self.config, num_workers=options.num_processes, executor=pool
+            )
+        except Exception as e:
+            logger.warning(f"Parallel index building failed, falling back to sequential: {e}")
+            return build_wordbased_index(publications, self.config)
+
     def _load_and_index_data(self, options: AnalysisOptions) -> None:
         """Load and index copyright/renewal data"""
         logger.info("=" * 80)
@@ -381,6 +688,9 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
             year_range = f"{min_year or 'earliest'} to {max_year or 'present'}"
             logger.info(f"Loading copyright/renewal data for years: {year_range}")
 
+        # Source files are scanned once per run for all cache checks below
+        self.cache_manager.refresh_sources()
+
         # Check for cached indexes
         config_dict = self.config.config
         config_hash = self._compute_config_hash(config_dict)
@@ -389,6 +699,38 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
             self.copyright_dir, self.renewal_dir, config_hash, min_year, max_year, brute_force
         )
 
+        if cached_indexes is None:
+            # Jobs sharing a cache directory build each index once: a job that
+            # misses while another is building waits, then reuses its result
+            with self.cache_manager.index_build_lock(min_year, max_year, brute_force) as lock:
+                if lock.waited:
+                    cached_indexes = self.cache_manager.get_cached_indexes(
+                        self.copyright_dir,
+                        self.renewal_dir,
+                        config_hash,
+                        min_year,
+                        max_year,
+                        brute_force,
+                    )
+                if cached_indexes is None:
+                    registration_index, renewal_index = self._run_phase1_tasks(options)
+
+                    logger.info(
+                        f"Built indexes: {len(registration_index.publications):,} registration, {len(renewal_index.publications):,} renewal entries"
+                    )
+
+                    # Cache indexes
+                    self.cache_manager.cache_indexes(
+                        self.copyright_dir,
+                        self.renewal_dir,
+                        config_hash,
+                        registration_index,
+                        renewal_index,
+                        min_year,
+                        max_year,
+                        brute_force,
+                    )
+
         if cached_indexes:
             self.registration_index, self.renewal_index = cached_indexes
             if brute_force or (min_year is None and max_year is None):
@@ -397,87 +739,6 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
                 logger.info(
                     f"Loaded indexes from cache (years {min_year or 'earliest'}-{max_year or 'present'})"
                 )
-        else:
-            # Load copyright data
-            logger.info(f"Loading copyright registration data from: {self.copyright_dir}")
-            cached_copyright = self.cache_manager.get_cached_copyright_data(
-                self.copyright_dir, min_year, max_year, brute_force
-            )
-
-            if cached_copyright:
-                self.copyright_data = cached_copyright
-            else:
-                # Always use parallel loading (with automatic fallback to sequential if needed)
-                num_workers = options.num_processes  # Will be None if not specified
-                loader = CopyrightDataLoader(self.copyright_dir, num_workers=num_workers)
-                self.copyright_data = loader.load_all_copyright_data(min_year, max_year)
-
-                self.cache_manager.cache_copyright_data(
-                    self.copyright_dir, self.copyright_data, min_year, max_year, brute_force
-                )
-
-            # Load renewal data
-            logger.info(f"Loading copyright renewal data from: {self.renewal_dir}")
-            cached_renewal = self.cache_manager.get_cached_renewal_data(
-                self.renewal_dir, min_year, max_year, brute_force
-            )
-
-            if cached_renewal:
-                self.renewal_data = cached_renewal
-            else:
-                # Always use parallel loading (with automatic fallback to sequential if needed)
-                num_workers = options.num_processes  # Will be None if not specified
-                renewal_loader = RenewalDataLoader(self.renewal_dir, num_workers=num_workers)
-                self.renewal_data = renewal_loader.load_all_renewal_data(min_year, max_year)
-
-                self.cache_manager.cache_renewal_data(
-                    self.renewal_dir, self.renewal_data, min_year, max_year, brute_force
-                )
-
-            # Build indexes
-            logger.info("Building word-based indexes for fast matching...")
-
-            # Always try parallel index building first (with automatic fallback to sequential)
-            try:
-                # Local imports
-                from marc_pd_tool.application.processing.parallel_indexer import (
-                    build_wordbased_index_parallel,
-                )
-
-                num_workers = options.num_processes  # Will be None if not specified
-                logger.info(
-                    f"Building registration index for {len(self.copyright_data):,} records..."
-                )
-                self.registration_index = build_wordbased_index_parallel(
-                    self.copyright_data, self.config, num_workers=num_workers
-                )
-
-                logger.info(f"Building renewal index for {len(self.renewal_data):,} records...")
-                self.renewal_index = build_wordbased_index_parallel(
-                    self.renewal_data, self.config, num_workers=num_workers
-                )
-            except Exception as e:
-                logger.warning(f"Parallel index building failed, falling back to sequential: {e}")
-                # Fall back to sequential index building
-                self.registration_index = build_wordbased_index(self.copyright_data, self.config)
-
-                self.renewal_index = build_wordbased_index(self.renewal_data, self.config)
-
-            logger.info(
-                f"Built indexes: {len(self.registration_index.publications):,} registration, {len(self.renewal_index.publications):,} renewal entries"
-            )
-
-            # Cache indexes
-            self.cache_manager.cache_indexes(
-                self.copyright_dir,
-                self.renewal_dir,
-                config_hash,
-                self.registration_index,
-                self.renewal_index,
-                min_year,
-                max_year,
-                brute_force,
-            )
 
         # Initialize generic title detector
         detector_config: dict[str, int | bool] = {
@@ -486,21 +747,38 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
         }
         if not detector_config.get("disable_generic_detection", False):
             cached_detector = self.cache_manager.get_cached_generic_detector(
-                self.copyright_dir, self.renewal_dir, detector_config
+                self.copyright_dir,
+                self.renewal_dir,
+                detector_config,
+                min_year,
+                max_year,
+                brute_force,
             )
 
             if cached_detector:
                 self.generic_detector = cached_detector
             else:
-                self.generic_detector = GenericTitleDetector(
+                # Title frequencies are counted while indexing and cached with the indexes
+                self.generic_detector = GenericTitleDetector.from_title_counts(
+                    [
+                        index.title_counts
+                        for index in (self.registration_index, self.renewal_index)
+                        if isinstance(index, DataIndexer)
+                    ],
                     frequency_threshold=detector_config.get("frequency_threshold", 10),
                     config=self.config,
                 )
-                # Note: GenericTitleDetector tracks title frequencies automatically
-                # as it processes titles during matching
+                frequent = self.generic_detector.get_stats()["generic_by_frequency"]
+                logger.info(f"Generic title detector: {frequent:,} titles generic by frequency")
 
                 self.cache_manager.cache_generic_detector(
-                    self.copyright_dir, self.renewal_dir, detector_config, self.generic_detector
+                    self.copyright_dir,
+                    self.renewal_dir,
+                    detector_config,
+                    self.generic_detector,
+                    min_year,
+                    max_year,
+                    brute_force,
                 )
 
     def _apply_match_to_publication(
@@ -558,8 +836,30 @@ class MarcCopyrightAnalyzer(BatchProcessingComponent, GroundTruthComponent, Expo
                 else:
                     pub.generic_detection_reason = generic_info["copyright_detection_reason"]
 
+    def _run_settings(self, marc_path: str, options: AnalysisOptions) -> JSONDict:
+        """Settings a resumed run must share with the run it resumes
+
+        Args:
+            marc_path: MARC file or directory being analyzed
+            options: Analysis options
+
+        Returns:
+            Input paths, configuration hash and the options in RESUME_SETTINGS
+        """
+        settings: JSONDict = {
+            "marc_path": abspath(marc_path),
+            "copyright_dir": abspath(self.copyright_dir),
+            "renewal_dir": abspath(self.renewal_dir),
+            "config_hash": self._compute_config_hash(self.config.config),
+        }
+        settings.update(options.model_dump(include=RESUME_SETTINGS))
+        return settings
+
     def _compute_config_hash(self, config_dict: JSONDict) -> str:
         """Compute hash of configuration for cache validation"""
-        # Create a stable string representation
-        config_str = dumps(config_dict, sort_keys=True)
+        # Create a stable string representation. Cache settings (size budget,
+        # compression) don't change what gets cached, so they are left out.
+        config_str = dumps(
+            {key: value for key, value in config_dict.items() if key != "caching"}, sort_keys=True
+        )
         return md5(config_str.encode()).hexdigest()
@@ -10,21 +10,51 @@ This component handles:
 """
 
 # Standard library imports
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from functools import partial
+from gc import freeze
+from gc import unfreeze
+from itertools import count
 from logging import getLogger
+from math import ceil
 from multiprocessing import Pool
 from multiprocessing import get_start_method
 from multiprocessing import set_start_method
+from os.path import basename
+from statistics import StatisticsError
+from statistics import correlation
+from sys import _is_gil_enabled
 from tempfile import mkdtemp
+from threading import BoundedSemaphore
+from threading import Event
 from time import time
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import TYPE_CHECKING
+from typing import cast
 
 # Local imports
+from marc_pd_tool.application.models.batch_stats import BatchStats
 from marc_pd_tool.application.models.config_models import AnalysisOptions
+from marc_pd_tool.application.processing.matching_engine import count_copyright_statuses
 from marc_pd_tool.application.processing.matching_engine import init_worker
+from marc_pd_tool.application.processing.matching_engine import init_worker_in_process
+from marc_pd_tool.application.processing.matching_engine import init_worker_shared
 from marc_pd_tool.application.processing.matching_engine import process_batch
+from marc_pd_tool.application.processing.shared_index import SharedIndexSegment
 from marc_pd_tool.core.domain.publication import Publication
 from marc_pd_tool.core.types.aliases import BatchProcessingInfo
 from marc_pd_tool.core.types.protocols import BatchAnalyzerProtocol
+from marc_pd_tool.infrastructure.cache import MatchResultCache
+from marc_pd_tool.infrastructure.cache import match_run_key
+from marc_pd_tool.infrastructure.persistence import BatchResultEntry
+from marc_pd_tool.infrastructure.persistence import CompletedBatch
+from marc_pd_tool.infrastructure.persistence import RunDirectory
 from marc_pd_tool.shared.utils.time_utils import format_time_duration
 
 # Third party imports removed - psutil not needed (memory monitoring handled by CLI)
@@ -37,6 +67,226 @@ if TYPE_CHECKING:
 logger = getLogger(__name__)
 
 
+def _iter_bounded[T](items: Iterable[T], slots: BoundedSemaphore, stop: Event) -> Iterator[T]:
+    """Yield items only while a free slot is available
+
+    Used as the task source for ``Pool.imap_unordered`` in pipelined mode. The
+    pool's task-handler thread pulls from this generator, so the MARC parser
+    behind ``items`` runs concurrently with matching but never gets more than
+    the number of slots ahead of the workers. The consumer releases a slot for
+    every completed batch.
+
+    Args:
+        items: Source of tasks (typically wrapping a live MARC batch iterator)
+        slots: Semaphore bounding the number of in-flight tasks
+        stop: Event set by the consumer to abandon the feed (e.g. on error)
+    """
+    for item in items:
+        # Poll so a stopped consumer can't leave the pool's task thread blocked
+        while not slots.acquire(timeout=0.5):
+            if stop.is_set():
+                return
+        if stop.is_set():
+            return
+        yield item
+
+
+def _log_cost_predictions(pairs: list[tuple[float, float]]) -> None:
+    """Log how well predicted batch costs ranked the measured batch times
+
+    Args:
+        pairs: (predicted cost, processing seconds) of each completed batch
+    """
+    if len(pairs) < 2:
+        return
+    predicted = [cost for cost, _ in pairs]
+    actual = [seconds for _, seconds in pairs]
+    try:
+        rank_correlation = correlation(predicted, actual, method="ranked")
+    except StatisticsError:
+        # Every prediction (or every time) was the same
+        return
+    per_unit = sum(actual) / sum(predicted) * 1000 if sum(predicted) else 0.0
+    logger.info(
+        f"Batch cost predictions: rank correlation {rank_correlation:.2f} with batch times "
+        f"over {len(pairs)} batches ({per_unit:.3f} ms per predicted comparison)"
+    )
+
+
+class _ThreadBatchPool:
+    """Thread counterpart of the multiprocessing Pool used for batches
+
+    Tasks run on threads of this process, so batches and results are passed
+    as objects and every thread reads the same in-memory indexes. Matching is
+    CPU-bound, so this only runs in parallel on a free-threaded CPython build.
+    """
+
+    def __init__(self, threads: int) -> None:
+        """Initialize the pool
+
+        Args:
+            threads: Number of worker threads
+        """
+        self.threads = threads
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="batch")
+
+    def imap_unordered[T, R](self, func: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+        """Apply func to every item, yielding results as they complete
+
+        Tasks are submitted at most two per thread ahead of the results taken,
+        so a live item source such as the pipelined MARC parser is read as
+        threads free up instead of all at once.
+
+        Args:
+            func: Function to run on the threads
+            items: Task arguments
+
+        Returns:
+            Iterator over the results, in completion order
+        """
+        source = iter(items)
+        pending: set[Future[R]] = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < self.threads * 2:
+                try:
+                    item = next(source)
+                except StopIteration:
+                    exhausted = True
+                    break
+                pending.add(self._executor.submit(func, item))
+            if not pending:
+                return
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    def __enter__(self) -> "_ThreadBatchPool":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _DeferredTail(list[Publication]):
+    """Records deferred by a batch, remembering the pickled batch they came from"""
+
+    def __init__(self, records: list[Publication], origin: str | None) -> None:
+        super().__init__(records)
+        self.origin = origin
+
+
+class _BatchScheduler:
+    """Sizes batches toward a target duration and reschedules deferred tails
+
+    Every completed batch updates a running estimate of the seconds spent per
+    record. Batches cut from the pipelined parser stream are sized from that
+    estimate, and a batch that ran over its time budget (twice the target)
+    hands back its unprocessed tail, which is split so that the idle workers
+    can take it up instead of one worker finishing it alone.
+
+    The task source runs on the pool's task thread while results are recorded
+    on the calling thread; the two only share a deque and plain attributes.
+    """
+
+    # Weight of the newest batch in the per-record cost estimate
+    SMOOTHING = 0.3
+    # Cut batches may grow to this many times the configured batch size
+    MAX_GROWTH = 10
+
+    def __init__(self, workers: int, batch_size: int, target_seconds: float) -> None:
+        """Initialize the scheduler
+
+        Args:
+            workers: Number of workers taking batches
+            batch_size: Configured batch size, used until costs are measured
+            target_seconds: Target duration of a batch; 0 disables adaptive sizing
+        """
+        self.workers = max(1, workers)
+        self.batch_size = batch_size
+        self.target_seconds = target_seconds
+        self.seconds_per_record: float | None = None
+        self._max_size = batch_size * self.MAX_GROWTH
+        self._deferred: deque[list[Publication]] = deque()
+
+    @property
+    def time_budget(self) -> float | None:
+        """Seconds a batch may run before deferring the rest, None if unlimited"""
+        return self.target_seconds * 2 if self.target_seconds > 0 else None
+
+    def record(self, stats: BatchStats, origin: str | None = None) -> int:
+        """Update the cost estimate from a completed batch and take its tail
+
+        Args:
+            stats: Statistics of the completed batch
+            origin: Pickled batch the completed batch came from, kept on its tail
+
+        Returns:
+            Number of batches the deferred tail was split into
+        """
+        attempted = stats.marc_count + stats.skipped_no_year
+        cost = stats.processing_time / attempted if attempted else 0.0
+        if cost > 0:
+            if self.seconds_per_record is None:
+                self.seconds_per_record = cost
+            else:
+                self.seconds_per_record += self.SMOOTHING * (cost - self.seconds_per_record)
+            if self.target_seconds > 0:
+                size = round(self.target_seconds / self.seconds_per_record)
+                self.batch_size = max(1, min(self._max_size, size))
+
+        tail = stats.deferred
+        stats.deferred = []
+        if tail:
+            # Size the pieces from this batch's own cost, which the average
+            # understates, and spread them over all workers
+            size = max(1, round(self.target_seconds / cost)) if cost > 0 else 1
+            size = min(size, ceil(len(tail) / self.workers))
+            for start in range(0, len(tail), size):
+                self._deferred.append(_DeferredTail(tail[start : start + size], origin))
+        return ceil(len(tail) / size) if tail else 0
+
+    def take_deferred(self) -> list[list[Publication]]:
+        """Remove and return the deferred tails not yet scheduled"""
+        tails = []
+        while self._deferred:
+            tails.append(self._deferred.popleft())
+        return tails
+
+    def feed[S](self, sources: Iterable[S]) -> Iterator[S | list[Publication]]:
+        """Yield batch sources as they are, each preceded by any deferred tails
+
+        Args:
+            sources: Batch sources (pickled batch paths)
+        """
+        for source in sources:
+            yield from self.take_deferred()
+            yield source
+
+    def rebatch(self, batches: Iterable[list[Publication]]) -> Iterator[list[Publication]]:
+        """Re-cut a stream of batches to the current batch size
+
+        Deferred tails are yielded as soon as they come back. Once the stream
+        ends, the remaining records are split over all workers so the end of
+        the run isn't left to one batch.
+
+        Args:
+            batches: Stream of in-memory batches from the parser
+        """
+        buffer: list[Publication] = []
+        for batch in batches:
+            yield from self.take_deferred()
+            buffer.extend(batch)
+            while len(buffer) >= self.batch_size:
+                size = self.batch_size
+                yield buffer[:size]
+                buffer = buffer[size:]
+        size = max(1, min(self.batch_size, ceil(len(buffer) / self.workers)))
+        for start in range(0, len(buffer), size):
+            yield from self.take_deferred()
+            yield buffer[start : start + size]
+
+
 class BatchProcessingComponent:
     """Component for batch-based parallel processing of datasets
 
@@ -91,7 +341,7 @@ class BatchProcessingComponent:
 
     def _analyze_marc_file_batch(
         self: BatchAnalyzerProtocol,
-        batch_paths: list[str],
+        batch_paths: list[str] | Iterator[list[Publication]],
         marc_path: str,
         output_path: str | None,
         options: AnalysisOptions,
@@ -99,7 +349,9 @@ class BatchProcessingComponent:
         """Analyze MARC file by processing pre-pickled batches.
 
         This method processes pickled batch files directly without loading
-        all publications into memory simultaneously.
+        all publications into memory simultaneously. In pipelined mode
+        ``batch_paths`` is instead a live iterator of in-memory batches coming
+        straight from the MARC parser.
         """
         # Clear previous results
         self.results = type(self.results)()  # Create new instance
@@ -141,11 +393,20 @@ class BatchProcessingComponent:
             num_processes = max(1, cpu_count() - 4)
         min_year = options.min_year
         max_year = options.max_year
+        target_batch_seconds = (
+            options.target_batch_seconds
+            if options.target_batch_seconds is not None
+            else self.config.processing.target_batch_seconds
+        )
 
         # Print processing info
-        logger.info(f"Processing {len(batch_paths)} pre-pickled batches")
-        logger.info(f"  Workers: {num_processes}")
-        logger.info(f"  Total batches: {len(batch_paths)}")
+        if isinstance(batch_paths, list):
+            logger.info(f"Processing {len(batch_paths)} pre-pickled batches")
+            logger.info(f"  Workers: {num_processes}")
+            logger.info(f"  Total batches: {len(batch_paths)}")
+        else:
+            logger.info("Processing batches as they are parsed (pipelined)")
+            logger.info(f"  Workers: {num_processes}")
 
         # Process batches in parallel
         self._process_batches_parallel(
@@ -163,6 +424,13 @@ class BatchProcessingComponent:
             brute_force_missing_year,
             min_year,
             max_year,
+            shared_indexes=options.shared_indexes,
+            executor=options.executor,
+            batch_size=options.batch_size,
+            target_batch_seconds=target_batch_seconds,
+            batch_costs=self.batch_costs,
+            run_directory=self.run_directory,
+            use_result_cache=options.result_cache,
         )
 
         # Export results if output path provided
@@ -186,7 +454,7 @@ class BatchProcessingComponent:
 
     def _process_batches_parallel(
         self: BatchAnalyzerProtocol,
-        batch_paths: list[str],
+        batch_paths: list[str] | Iterator[list[Publication]],
         num_processes: int,
         year_tolerance: int,
         title_threshold: int,
@@ -200,17 +468,82 @@ class BatchProcessingComponent:
         brute_force_missing_year: bool,
         min_year: int | None,
         max_year: int | None,
+        shared_indexes: bool = False,
+        executor: str = "processes",
+        batch_size: int = 100,
+        target_batch_seconds: float = 0.0,
+        batch_costs: dict[str, float] | None = None,
+        run_directory: RunDirectory | None = None,
+        use_result_cache: bool = False,
     ) -> list[Publication]:
         """Process pre-pickled batches in parallel
 
         This method works with pre-pickled batches to efficiently process
         large datasets without loading all data into memory at once.
+
+        When ``batch_paths`` is an iterator of in-memory batches (pipelined
+        mode), batches are dispatched while the parser is still producing them.
+        At most two batches per worker are in flight, which keeps parsing ahead
+        of matching without buffering the whole file.
+
+        With ``shared_indexes`` the indexes are published once in shared
+        memory and every worker attaches them, under fork or spawn alike.
+
+        With ``executor="threads"`` batches run on threads of this process
+        instead of a process pool: every thread reads the loaded indexes and
+        batch results come back as objects rather than result files.
+
+        With ``target_batch_seconds`` batches are scheduled adaptively (see
+        _BatchScheduler): pipelined batches are re-cut toward that duration
+        and a batch running over twice that defers its tail as new batches.
+
+        With ``batch_costs`` (predicted cost by pickled batch path) the batches
+        are dispatched most expensive first, which shortens the run when a few
+        batches take much longer than the rest (longest processing time first).
+        Predicted costs are logged next to the measured batch times.
+
+        With ``run_directory`` the pickled batches live in a durable run
+        directory: results are written there, each batch is recorded in its
+        manifest once all of its pieces are done, and batches the manifest
+        already lists are counted from it instead of being matched again.
+
+        With ``use_result_cache`` records whose matching fields are unchanged
+        since an earlier run with the same indexes and settings take their
+        results from the match result cache in the cache directory; cached and
+        computed record counts are added to the statistics.
         """
         start_time = time()
 
-        # Create temporary directory for results
-        result_temp_dir = mkdtemp(prefix="marc_results_")
-        logger.info(f"Worker results will be saved to: {result_temp_dir}")
+        # A list means Phase 2 already pickled every batch; anything else is a
+        # live parser stream whose length isn't known until it is exhausted
+        pickled_paths: list[str] = []
+        batch_stream: Iterator[list[Publication]] | None = None
+        if isinstance(batch_paths, list):
+            pickled_paths = batch_paths
+        else:
+            batch_stream = batch_paths
+        pipelined = batch_stream is not None
+
+        use_threads = executor == "threads"
+        if use_threads and not (self.registration_index and self.renewal_index):
+            logger.warning("Thread executor needs loaded indexes; using worker processes")
+            use_threads = False
+
+        # Create temporary directory for results (threads hand results back directly)
+        result_temp_dir: str | None = None
+        if pipelined:
+            # Batches are never written to disk, so there is nothing to resume from
+            logger.warning(
+                "Pipelined mode keeps no run directory: an interrupted run can't be resumed"
+            )
+            run_directory = None
+        if run_directory is not None:
+            # Results stay with the run, so an interrupted run can be resumed
+            result_temp_dir = run_directory.result_dir
+            logger.info(f"Worker results will be saved to: {result_temp_dir}")
+        elif not use_threads:
+            result_temp_dir = mkdtemp(prefix="marc_results_")
+            logger.info(f"Worker results will be saved to: {result_temp_dir}")
 
         # Get configuration hash for cache validation
         config_dict = self.config.config
@@ -224,13 +557,85 @@ class BatchProcessingComponent:
                 if isinstance(value, (int, bool)):
                     detector_config[key] = value
 
-        # Create batch info tuples with pre-pickled paths
-        batch_infos = []
-        total_batches = len(batch_paths)
-        for i, batch_path in enumerate(batch_paths):
-            batch_info: BatchProcessingInfo = (
-                i + 1,  # batch_id
-                batch_path,  # batch_path (already pickled)
+        # Records matched by an earlier run with the same indexes and settings
+        result_cache: MatchResultCache | None = None
+        if use_result_cache:
+            # Local imports
+            from marc_pd_tool import __version__
+
+            if self.cache_dir and self.registration_index and self.renewal_index:
+                result_cache = MatchResultCache.open(
+                    self.cache_dir,
+                    match_run_key(
+                        __version__,
+                        self.registration_index.fingerprint(),
+                        self.renewal_index.fingerprint(),
+                        config_hash,
+                        self.generic_detector is not None,
+                        year_tolerance,
+                        title_threshold,
+                        author_threshold,
+                        publisher_threshold,
+                        early_exit_title,
+                        early_exit_author,
+                        early_exit_publisher,
+                        score_everything_mode,
+                        minimum_combined_score,
+                        brute_force_missing_year,
+                    ),
+                )
+            else:
+                logger.info("Match result cache needs a cache directory and loaded indexes")
+
+        # Batches completed before an interruption are taken from the manifest,
+        # and results of those that didn't complete are thrown away
+        completed: dict[str, CompletedBatch] = {}
+        first_batch_id = 1
+        if run_directory is not None:
+            completed = run_directory.completed_batches()
+            run_directory.discard_unfinished_results(completed)
+            first_batch_id = run_directory.next_batch_id(completed)
+            pickled_paths = [path for path in pickled_paths if basename(path) not in completed]
+
+        # Create batch info tuples with pre-pickled paths (or in-memory batches)
+        total_batches = len(pickled_paths)
+        scheduler = _BatchScheduler(num_processes, batch_size, target_batch_seconds)
+        batch_ids = count(first_batch_id)
+
+        # Pickled batch each dispatched batch came from, how many of its pieces
+        # are still running and the results of those that are done
+        batch_origins: dict[int, str] = {}
+        open_pieces: dict[str, int] = {}
+        finished_pieces: dict[str, list[BatchResultEntry]] = {}
+
+        # Longest processing time first: a long batch dispatched last would
+        # leave the other workers idle until it finishes
+        predicted_costs: dict[int, float] = {}
+        predicted_costs_enabled = bool(not pipelined and batch_costs)
+        if predicted_costs_enabled:
+            costs = cast(dict[str, float], batch_costs)
+            pickled_paths = sorted(
+                pickled_paths, key=lambda path: costs.get(path, 0.0), reverse=True
+            )
+            logger.info("Dispatching batches by predicted cost, most expensive first")
+
+        def make_batch_info(batch_source: str | list[Publication]) -> BatchProcessingInfo:
+            batch_id = next(batch_ids)
+            if predicted_costs_enabled and isinstance(batch_source, str):
+                predicted_costs[batch_id] = cast(dict[str, float], batch_costs).get(
+                    batch_source, 0.0
+                )
+            if run_directory is not None:
+                origin = (
+                    batch_source
+                    if isinstance(batch_source, str)
+                    else getattr(batch_source, "origin", None)
+                )
+                if origin is not None:
+                    batch_origins[batch_id] = origin
+            return (
+                batch_id,  # batch_id
+                batch_source,  # batch_path (already pickled, or in-memory batch)
                 self.cache_dir or ".marcpd_cache",  # cache_dir (provide default if None)
                 self.copyright_dir,  # copyright_dir
                 self.renewal_dir,  # renewal_dir
@@ -251,13 +656,48 @@ class BatchProcessingComponent:
                 max_year,
                 result_temp_dir,  # result_temp_dir for workers to save results
             )
-            batch_infos.append(batch_info)
+
+        feed_slots = BoundedSemaphore(max(1, num_processes) * 2)
+        feed_stop = Event()
+        batch_infos: Iterable[BatchProcessingInfo]
+        if batch_stream is not None:
+            if target_batch_seconds > 0:
+                batch_stream = scheduler.rebatch(batch_stream)
+            batch_infos = _iter_bounded(
+                (make_batch_info(batch) for batch in batch_stream), feed_slots, feed_stop
+            )
+        else:
+            batch_infos = (make_batch_info(source) for source in scheduler.feed(pickled_paths))
+        run_batch = partial(
+            process_batch,
+            time_budget=scheduler.time_budget,
+            keep_batch_file=run_directory is not None,
+            result_cache=result_cache,
+        )
 
         # Process batches in parallel using existing infrastructure
         all_stats = []
         completed_batches = 0
         total_reg_matches = 0
         total_ren_matches = 0
+        # (predicted cost, seconds) of completed batches, to check the predictor
+        cost_pairs: list[tuple[float, float]] = []
+        total_cost = sum((batch_costs or {}).values()) if predicted_costs_enabled else 0.0
+        completed_cost = 0.0
+
+        if run_directory is not None:
+            for entry in completed.values():
+                for piece in entry.results:
+                    self.results.add_result_file(run_directory.result_path(piece))
+                    piece_stats = BatchStats.model_validate(piece.stats)
+                    all_stats.append(piece_stats)
+                    total_reg_matches += piece_stats.registration_matches_found
+                    total_ren_matches += piece_stats.renewal_matches_found
+        if completed:
+            logger.info(
+                f"Resuming run: {len(completed)} batches already complete, "
+                f"{total_batches} left to match"
+            )
 
         # Log multiprocessing configuration
         start_method = get_start_method()
@@ -267,8 +707,13 @@ class BatchProcessingComponent:
         indexes_loaded = self.registration_index is not None and self.renewal_index is not None
         logger.info(f"Pre-loaded indexes available: {indexes_loaded}")
 
+        # Shared memory segments owned by this process, removed once the pool is done
+        shared_segments: list[SharedIndexSegment] = []
+        gc_frozen = False
+
         # Force fork mode on macOS if indexes are pre-loaded for memory sharing
-        if indexes_loaded and start_method == "spawn":
+        # (shared memory indexes work under spawn, so leave the platform default)
+        if indexes_loaded and start_method == "spawn" and not (shared_indexes or use_threads):
             try:
                 set_start_method("fork", force=True)
                 start_method = "fork"
@@ -281,7 +726,12 @@ class BatchProcessingComponent:
             # Calculate optimal recycling frequency based on workload
             batches_per_worker = total_batches // num_processes
 
-            if batches_per_worker < 20:
+            if pipelined:
+                # Recycling re-forks workers while the parser thread is running,
+                # and the batch count isn't known yet anyway
+                tasks_per_child = None
+                logger.info("Pipelined mode - worker recycling disabled")
+            elif batches_per_worker < 20:
                 tasks_per_child = None
                 logger.info("Small job detected - worker recycling disabled")
             else:
@@ -289,10 +739,48 @@ class BatchProcessingComponent:
                 logger.info(f"Worker recycling: every {tasks_per_child} batches")
 
             # Platform-specific worker initialization
-            if start_method == "fork" and self.registration_index and self.renewal_index:
+            if use_threads:
+                # Checked when the executor was chosen; the threads share these objects
+                if self.registration_index is None or self.renewal_index is None:
+                    raise RuntimeError("Thread executor requires the indexes to be loaded")
+                logger.info(f"Thread executor: {num_processes} threads sharing the loaded indexes")
+                if _is_gil_enabled():
+                    logger.warning(
+                        "The GIL is enabled, so matching threads will take turns; use a "
+                        "free-threaded Python build (python3.13t) to run them in parallel"
+                    )
+                init_worker_in_process(
+                    self.registration_index, self.renewal_index, self.generic_detector
+                )
+            elif shared_indexes and self.registration_index and self.renewal_index:
+                # Publish the indexes once; workers attach them instead of loading copies
+                logger.info(
+                    f"{start_method.capitalize()} mode: Publishing indexes in shared memory"
+                )
+                shared_segments.append(SharedIndexSegment(self.registration_index))
+                shared_segments.append(SharedIndexSegment(self.renewal_index))
+                shared_mb = sum(segment.size for segment in shared_segments) / 1024 / 1024
+                logger.info(f"  Shared index segments: {shared_mb:,.1f} MB")
+
+                pool_args = {
+                    "processes": num_processes,
+                    "initializer": init_worker_shared,
+                    "initargs": (
+                        shared_segments[0].handle,
+                        shared_segments[1].handle,
+                        self.generic_detector,
+                    ),
+                    "maxtasksperchild": tasks_per_child,
+                }
+            elif start_method == "fork" and self.registration_index and self.renewal_index:
                 # Linux with pre-loaded indexes: Use fork memory sharing
                 logger.info("Fork mode: Using pre-loaded indexes via memory sharing")
 
+                # Cached indexes load their sections on first use; read them all
+                # here so the workers share one copy instead of each loading its own
+                self.registration_index.load_sections()
+                self.renewal_index.load_sections()
+
                 # Store indexes in module for fork to inherit
                 # Local imports
                 import marc_pd_tool.application.processing.matching_engine as me
@@ -366,38 +854,124 @@ class BatchProcessingComponent:
                     "maxtasksperchild": tasks_per_child,
                 }
 
-            with Pool(**pool_args) as pool:  # type: ignore[arg-type]
-                for result in pool.imap_unordered(process_batch, batch_infos):
-                    batch_id, result_file_path, batch_stats = result
-
-                    # Register the result file with AnalysisResults for later loading
-                    self.results.add_result_file(result_file_path)
-
-                    all_stats.append(batch_stats)
-                    completed_batches += 1
-                    total_reg_matches += batch_stats.registration_matches_found
-                    total_ren_matches += batch_stats.renewal_matches_found
-
-                    # Progress logging
-                    elapsed_time = time() - start_time
-                    avg_time_per_batch = elapsed_time / completed_batches
-                    remaining_batches = total_batches - completed_batches
-                    eta = remaining_batches * avg_time_per_batch
-
-                    batch_duration_str = format_time_duration(batch_stats.processing_time)
-                    eta_str = format_time_duration(eta)
-
-                    logger.info(
-                        f"✓ Batch {batch_id} complete ({completed_batches}/{total_batches}) | "
-                        f"Batch time: {batch_duration_str} | "
-                        f"Matches so far: {total_reg_matches} reg, {total_ren_matches} ren | "
-                        f"Progress: ({completed_batches/total_batches*100:.1f}%) | "
-                        f"ETA: {eta_str}"
+            if start_method == "fork" and not use_threads:
+                # Move everything allocated so far out of the collector's reach, so
+                # collections in the workers don't write to (and copy) the parent's
+                # pages. Workers forked later by recycling benefit too.
+                freeze()
+                gc_frozen = True
+
+            feeding = True
+
+            def batch_results() -> Iterator[tuple[int, str | list[Publication], BatchStats]]:
+                """Results of the fed batches, then of tails deferred after the feed ended"""
+                nonlocal feeding
+                yield from pool.imap_unordered(run_batch, batch_infos)
+                feeding = False
+                while tails := scheduler.take_deferred():
+                    yield from pool.imap_unordered(
+                        run_batch, [make_batch_info(tail) for tail in tails]
                     )
 
-                    # Memory monitoring removed - handled by CLI's MemoryMonitor when --monitor-memory is used
+            if use_threads:
+                pool_context = _ThreadBatchPool(num_processes)
+            else:
+                pool_context = Pool(**pool_args)  # type: ignore[arg-type,assignment]
+            with pool_context as pool:
+                try:
+                    for result in batch_results():
+                        batch_id, batch_result, batch_stats = result
+                        if pipelined and feeding:
+                            feed_slots.release()
+
+                        if isinstance(batch_result, list):
+                            # Thread executor: the publications themselves
+                            self.results.publications.extend(batch_result)
+                        else:
+                            # Register the result file with AnalysisResults for later loading
+                            self.results.add_result_file(batch_result)
+
+                        predicted = predicted_costs.get(batch_id)
+                        if isinstance(batch_stats, BatchStats):
+                            deferred = len(batch_stats.deferred)
+                            if predicted is not None and not deferred:
+                                # A batch that deferred its tail didn't run in full
+                                cost_pairs.append((predicted, batch_stats.processing_time))
+                            origin = batch_origins.pop(batch_id, None)
+                            new_batches = scheduler.record(batch_stats, origin)
+                            if (
+                                run_directory is not None
+                                and origin is not None
+                                and isinstance(batch_result, str)
+                            ):
+                                # The pickled batch is complete once its last piece is
+                                pieces = finished_pieces.setdefault(origin, [])
+                                pieces.append(
+                                    BatchResultEntry(
+                                        batch_id=batch_id,
+                                        result_file=batch_result,
+                                        stats=batch_stats.model_dump(),
+                                    )
+                                )
+                                open_pieces[origin] = open_pieces.get(origin, 1) + new_batches - 1
+                                if not open_pieces[origin]:
+                                    del open_pieces[origin]
+                                    run_directory.mark_complete(origin, finished_pieces.pop(origin))
+                            if new_batches:
+                                total_batches += new_batches
+                                logger.info(
+                                    f"Batch {batch_id} ran over its time budget; rescheduling "
+                                    f"its last {deferred} records as {new_batches} batches"
+                                )
+
+                        all_stats.append(batch_stats)
+                        completed_batches += 1
+                        total_reg_matches += batch_stats.registration_matches_found
+                        total_ren_matches += batch_stats.renewal_matches_found
+
+                        # Progress logging
+                        batch_duration_str = format_time_duration(batch_stats.processing_time)
+                        if pipelined:
+                            # Total is unknown until the parser finishes, so no ETA
+                            logger.info(
+                                f"✓ Batch {batch_id} complete ({completed_batches} done) | "
+                                f"Batch time: {batch_duration_str} | "
+                                f"Matches so far: {total_reg_matches} reg, "
+                                f"{total_ren_matches} ren"
+                            )
+                            continue
+
+                        elapsed_time = time() - start_time
+                        completed_cost += predicted or 0.0
+                        if completed_cost and total_cost > completed_cost:
+                            # Expensive batches go first, so extrapolate by predicted cost
+                            eta = elapsed_time * (total_cost - completed_cost) / completed_cost
+                        else:
+                            avg_time_per_batch = elapsed_time / completed_batches
+                            remaining_batches = total_batches - completed_batches
+                            eta = remaining_batches * avg_time_per_batch
+                        eta_str = format_time_duration(eta)
+                        predicted_str = (
+                            f"Predicted cost: {predicted:,.0f} | " if predicted is not None else ""
+                        )
+
+                        logger.info(
+                            f"✓ Batch {batch_id} complete ({completed_batches}/{total_batches}) | "
+                            f"Batch time: {batch_duration_str} | {predicted_str}"
+                            f"Matches so far: {total_reg_matches} reg, {total_ren_matches} ren | "
+                            f"Progress: ({completed_batches/total_batches*100:.1f}%) | "
+                            f"ETA: {eta_str}"
+                        )
+
+                        # Memory monitoring removed - handled by CLI's MemoryMonitor when --monitor-memory is used
+                finally:
+                    # Let the feed generator exit so the pool's task thread can be joined
+                    feed_stop.set()
 
         except KeyboardInterrupt:
+            if run_directory is not None:
+                logger.warning(f"Interrupted by user. Resume with: --resume {run_directory.path}")
+                return self.results.publications
             logger.warning("Interrupted by user. Cleaning up...")
             # Ensure cleanup happens
             if hasattr(self, "results") and hasattr(self.results, "cleanup_temp_files"):
@@ -405,21 +979,29 @@ class BatchProcessingComponent:
             return self.results.publications
         except Exception as e:
             logger.error(f"Error in parallel processing: {e}")
+            if run_directory is not None:
+                logger.warning(
+                    f"Completed batches kept; resume with: --resume {run_directory.path}"
+                )
+                return self.results.publications
             # Ensure cleanup happens on any error
             if hasattr(self, "results") and hasattr(self.results, "cleanup_temp_files"):
                 self.results.cleanup_temp_files()
             return self.results.publications
         finally:
-            # Store result directory path for later cleanup (if not already cleaned)
-            if hasattr(self, "results") and result_temp_dir:
+            if gc_frozen:
+                unfreeze()
+            for segment in shared_segments:
+                segment.close()
+
+            # Store result directory path for later cleanup (if not already cleaned);
+            # a run directory is kept so the run can be resumed or re-exported
+            if hasattr(self, "results") and result_temp_dir and run_directory is None:
                 self.results.result_temp_dir = result_temp_dir
 
         # Note: result_temp_dir is now set in the finally block above
 
         # Aggregate statistics from all batches
-        # Local imports
-        from marc_pd_tool.application.models.batch_stats import BatchStats
-
         # Calculate totals from batch stats
         batch_stats_list = [stats for stats in all_stats if isinstance(stats, BatchStats)]
 
@@ -428,6 +1010,7 @@ class BatchProcessingComponent:
         total_us_records = sum(stats.us_records for stats in batch_stats_list)
         total_non_us_records = sum(stats.non_us_records for stats in batch_stats_list)
         total_unknown_country = sum(stats.unknown_country_records for stats in batch_stats_list)
+        total_cached = sum(stats.cached_records for stats in batch_stats_list)
         sum(stats.records_with_errors for stats in batch_stats_list)
 
         # Update the statistics with the aggregated counts
@@ -438,12 +1021,18 @@ class BatchProcessingComponent:
         self.results.statistics.us_records = total_us_records
         self.results.statistics.non_us_records = total_non_us_records
         self.results.statistics.unknown_country = total_unknown_country
+        if result_cache is not None:
+            self.results.statistics.cached_records = total_cached
+            self.results.statistics.computed_records = total_records - total_cached
         # Note: errors field doesn't exist in AnalysisStatistics, skip it
 
         # Note: Copyright status counts are stored in batch stats pickle files
         # Load and aggregate them now for the final statistics
         if result_temp_dir:
             self._load_copyright_status_counts_from_stats_files(result_temp_dir)
+        elif use_threads:
+            statuses = count_copyright_statuses(self.results.publications)
+            self.results.statistics.extra_fields.update(statuses)
 
         # Calculate no matches (records that didn't match either registration or renewal)
         self.results.statistics.no_matches = total_records - (total_reg_matches + total_ren_matches)
@@ -459,5 +1048,11 @@ class BatchProcessingComponent:
         logger.info(
             f"Found {total_reg_matches} registration matches, {total_ren_matches} renewal matches"
         )
+        if result_cache is not None:
+            logger.info(
+                f"Match result cache: {total_cached} records reused, "
+                f"{total_records - total_cached} matched"
+            )
+        _log_cost_predictions(cost_pairs)
 
         return self.results.publications
@@ -68,12 +68,14 @@ class GroundTruthComponent:
 
             self._load_and_index_data(AnalysisOptions(min_year=min_year, max_year=max_year))
 
-        # If indexes were loaded from cache, extract the publications from them
+        # If indexes were loaded from cache, rebuild the publications from them
         if self.registration_index and not self.copyright_data:
-            self.copyright_data = self.registration_index.publications
+            self.copyright_data = [
+                view.to_publication() for view in self.registration_index.publications
+            ]
 
         if self.renewal_index and not self.renewal_data:
-            self.renewal_data = self.renewal_index.publications
+            self.renewal_data = [view.to_publication() for view in self.renewal_index.publications]
 
         # Extract ground truth pairs
         extractor = GroundTruthExtractor()
@@ -0,0 +1,271 @@
+# marc_pd_tool/adapters/cli/cache_command.py
+
+"""`marc-pd-tool cache` subcommands for managing the data cache"""
+
+# Standard library imports
+from argparse import ArgumentParser
+from argparse import ArgumentTypeError
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from multiprocessing import cpu_count
+from os import getcwd
+from time import time
+from typing import Callable
+
+# Third party imports
+from pydantic import BaseModel
+
+# Local imports
+from marc_pd_tool.adapters.api import MarcCopyrightAnalyzer
+from marc_pd_tool.adapters.cli.logging_setup import set_up_logging
+from marc_pd_tool.application.models.config_models import AnalysisOptions
+from marc_pd_tool.infrastructure import CacheManager
+from marc_pd_tool.infrastructure.config import get_config
+
+logger = getLogger(__name__)
+
+type YearWindow = tuple[int | None, int | None]
+
+ALL_YEARS: YearWindow = (None, None)
+
+
+class CacheBuildReport(BaseModel):
+    """Outcome of building the cache entries for one year window"""
+
+    window: str
+    seconds: float
+    derived: bool
+    entry_sizes: dict[str, int]
+
+
+def parse_year_window(text: str) -> YearWindow:
+    """Parse a year window argument
+
+    Accepts "all", "1930-1940", "1950-" (1950 onwards), "-1925" (up to 1925)
+    and a single year such as "1935".
+
+    Args:
+        text: Window argument
+
+    Returns:
+        Tuple of (min_year, max_year), None for an open end
+
+    Raises:
+        ArgumentTypeError: If the window can't be parsed or is reversed
+    """
+    if text.strip().lower() == "all":
+        return ALL_YEARS
+    start, separator, end = text.strip().partition("-")
+    try:
+        min_year = int(start) if start else None
+        max_year = (int(end) if end else None) if separator else min_year
+    except ValueError:
+        raise ArgumentTypeError(f"Invalid year window: {text!r}") from None
+    if min_year is not None and max_year is not None and max_year < min_year:
+        raise ArgumentTypeError(f"Year window {text!r} ends before it starts")
+    return min_year, max_year
+
+
+def window_label(window: YearWindow) -> str:
+    """Human-readable name of a year window"""
+    min_year, max_year = window
+    if window == ALL_YEARS:
+        return "all"
+    return f"{min_year or 'earliest'}-{max_year or 'present'}"
+
+
+def _covers(outer: YearWindow, inner: YearWindow) -> bool:
+    """Check whether one window contains another"""
+    (outer_min, outer_max), (inner_min, inner_max) = outer, inner
+    covers_min = outer_min is None or (inner_min is not None and outer_min <= inner_min)
+    covers_max = outer_max is None or (inner_max is not None and inner_max <= outer_max)
+    return covers_min and covers_max
+
+
+def plan_windows(
+    windows: list[YearWindow], can_derive: Callable[[YearWindow, YearWindow], bool]
+) -> tuple[list[YearWindow], list[YearWindow]]:
+    """Split requested windows into ones to build and ones to derive
+
+    A window inside another requested window is derived from that window's
+    cached index instead of being built from the source files, when the
+    derived index is the same as a built one.
+
+    Args:
+        windows: Requested windows
+        can_derive: Whether an index for the second window derived from one
+            for the first equals an index built for the second
+
+    Returns:
+        Tuple of (windows to build, windows to derive)
+    """
+    unique = list(dict.fromkeys(windows))
+    built = [
+        w for w in unique if not any(o != w and _covers(o, w) and can_derive(o, w) for o in unique)
+    ]
+    derived = [w for w in unique if w not in built]
+    return built, derived
+
+
+def build_cache_windows(
+    windows: list[YearWindow],
+    copyright_dir: str,
+    renewal_dir: str,
+    cache_dir: str,
+    max_workers: int,
+) -> list[CacheBuildReport]:
+    """Build the cache entries for several year windows
+
+    Windows that can't be derived from another window are built concurrently,
+    splitting the worker processes between them; the remaining windows are
+    then derived from the cached indexes of the windows that cover them.
+
+    Args:
+        windows: Year windows to build
+        copyright_dir: Directory containing copyright XML files
+        renewal_dir: Directory containing renewal TSV files
+        cache_dir: Cache directory to fill
+        max_workers: Worker processes to use in total
+
+    Returns:
+        One report per window, built windows first
+    """
+    cache_manager = CacheManager(cache_dir)
+    built, derived = plan_windows(
+        windows,
+        lambda outer, inner: cache_manager.year_subset_matches_build(
+            copyright_dir, renewal_dir, *outer, *inner
+        ),
+    )
+    workers_per_build = max(1, max_workers // max(1, len(built)))
+
+    def prepare(window: YearWindow, num_processes: int) -> float:
+        start = time()
+        analyzer = MarcCopyrightAnalyzer(cache_dir=cache_dir)
+        analyzer.prepare_data(
+            copyright_dir,
+            renewal_dir,
+            AnalysisOptions(min_year=window[0], max_year=window[1], num_processes=num_processes),
+        )
+        return time() - start
+
+    logger.info(
+        f"Building {len(built)} cache windows ({workers_per_build} workers each)"
+        + (f", then deriving {len(derived)}" if derived else "")
+    )
+    with ThreadPoolExecutor(max_workers=max(1, len(built))) as threads:
+        built_seconds = list(threads.map(lambda window: prepare(window, workers_per_build), built))
+    derived_seconds = [prepare(window, max_workers) for window in derived]
+
+    sizes = cache_manager.entry_sizes()
+
+    reports = []
+    for window, seconds, is_derived in [
+        *((w, s, False) for w, s in zip(built, built_seconds)),
+        *((w, s, True) for w, s in zip(derived, derived_seconds)),
+    ]:
+        suffix = cache_manager.year_range_suffix(*window)
+        entries = [
+            f"copyright_data/{suffix}",
+            f"renewal_data/{suffix}",
+            f"indexes/{suffix}",
+            # A single slot holding the detector of the last window prepared
+            "generic_detector",
+        ]
+        reports.append(
+            CacheBuildReport(
+                window=window_label(window),
+                seconds=seconds,
+                derived=is_derived,
+                entry_sizes={name: sizes[name] for name in entries if name in sizes},
+            )
+        )
+    return reports
+
+
+def log_build_reports(reports: list[CacheBuildReport], total_bytes: int | None = None) -> None:
+    """Log build time and entry sizes per window
+
+    Args:
+        reports: Reports from build_cache_windows
+        total_bytes: Total cache size to report at the end, if known
+    """
+    logger.info("=== CACHE BUILD SUMMARY ===")
+    for report in reports:
+        how = "derived" if report.derived else "built"
+        logger.info(f"{report.window:<16} {how} in {report.seconds:.1f}s")
+        for name, size in sorted(report.entry_sizes.items()):
+            logger.info(f"    {name:<32} {size / 1024 / 1024:>9.1f} MB")
+    if total_bytes is not None:
+        logger.info(f"Total cache size: {total_bytes / 1024 / 1024:.1f} MB")
+
+
+def create_cache_parser() -> ArgumentParser:
+    """Create the argument parser for the cache subcommands"""
+    cwd = getcwd()
+    caching_config = get_config().caching
+
+    parser = ArgumentParser(
+        prog="marc-pd-tool cache", description="Manage the copyright/renewal data cache"
+    )
+    subparsers = parser.add_subparsers(dest="cache_command", required=True)
+
+    build = subparsers.add_parser(
+        "build",
+        help="Build cache entries for year windows",
+        description=(
+            "Load and index the copyright/renewal data for each year window and cache "
+            "the results, so analyses over those windows start warm. Windows inside "
+            "another requested window (e.g. 1930-1940 with all) are derived from it."
+        ),
+    )
+    build.add_argument(
+        "windows",
+        nargs="*",
+        type=parse_year_window,
+        default=[ALL_YEARS],
+        help='Year windows such as "all", "1930-1940", "1950-" or "-1925" (default: all)',
+    )
+    build.add_argument(
+        "--copyright-dir",
+        default=f"{cwd}/nypl-reg/xml",
+        help="Path to copyright registration XML directory",
+    )
+    build.add_argument(
+        "--renewal-dir", default=f"{cwd}/nypl-ren/data", help="Path to renewal TSV directory"
+    )
+    build.add_argument(
+        "--cache-dir", default=caching_config.cache_dir, help="Directory for cached indexes"
+    )
+    build.add_argument(
+        "--max-workers",
+        type=int,
+        default=None,
+        help="Worker processes to use in total (default: CPU count - 4)",
+    )
+    build.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Logging level",
+    )
+    return parser
+
+
+def cache_main(argv: list[str]) -> None:
+    """Entry point for `marc-pd-tool cache ...`
+
+    Args:
+        argv: Arguments after "cache"
+    """
+    args = create_cache_parser().parse_args(argv)
+    set_up_logging(log_level=args.log_level, disable_file_logging=True)
+
+    max_workers = args.max_workers or max(1, cpu_count() - 4)
+    start = time()
+    reports = build_cache_windows(
+        args.windows, args.copyright_dir, args.renewal_dir, args.cache_dir, max_workers
+    )
+    total_bytes = sum(CacheManager(args.cache_dir).entry_sizes().values())
+    log_build_reports(reports, total_bytes)
+    logger.info(f"Cache build finished in {time() - start:.1f}s")
@@ -19,6 +19,7 @@ from time import time
 
 # Local imports
 from marc_pd_tool import MarcCopyrightAnalyzer
+from marc_pd_tool.adapters.cli.cache_command import cache_main
 from marc_pd_tool.adapters.cli.logging_setup import log_run_summary
 from marc_pd_tool.adapters.cli.logging_setup import set_up_logging
 from marc_pd_tool.adapters.cli.parser import create_argument_parser
@@ -32,6 +33,14 @@ logger = getLogger(__name__)
 
 def main() -> None:
     """Main CLI entry point using the public API"""
+    # Standard library imports
+    from sys import argv
+
+    # Subcommands; everything else is an analysis run
+    if argv[1:2] == ["cache"]:
+        cache_main(argv[2:])
+        return
+
     parser = create_argument_parser()
     args = parser.parse_args()
 
@@ -192,7 +201,13 @@ def main() -> None:
             formats=args.output_formats,
             single_file=args.single_file,
             batch_size=args.batch_size,
+            target_batch_seconds=args.batch_seconds,
             num_processes=args.max_workers,
+            pipeline=args.pipeline,
+            shared_indexes=args.shared_indexes,
+            executor=args.executor,
+            result_cache=not (args.disable_cache or args.no_result_cache),
+            keep_run_dir=args.keep_run_dir,
         )
 
         # Log memory before processing
@@ -207,6 +222,7 @@ def main() -> None:
             output_path=output_filename,
             options=options,
             temp_dir=args.temp_dir,  # Pass temp_dir for batch processing
+            resume_dir=args.resume,
         )
 
         # Log memory after processing
@@ -293,6 +309,8 @@ def main() -> None:
             undetermined_records=undetermined_records,
             error_records=int(stats.get("errors", 0)),
             skipped_no_year=int(stats.get("skipped_no_year", 0)),
+            cached_records=int(stats.get("cached_records", 0)),
+            computed_records=int(stats.get("computed_records", 0)),
         )
 
         # Log final memory summary
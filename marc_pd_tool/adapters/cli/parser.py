@@ -33,7 +33,9 @@ def create_argument_parser() -> ArgumentParser:
 
     # Required arguments
     parser.add_argument(
-        "--marcxml", required=True, help="Path to MARC XML file or directory of MARC files"
+        "--marcxml",
+        required=True,
+        help="Path to MARC XML or binary MARC (.mrc) file, or directory of MARC files",
     )
 
     # Data source directories
@@ -75,12 +77,38 @@ def create_argument_parser() -> ArgumentParser:
         default=processing_config.batch_size,
         help="MARC records per batch",
     )
+    parser.add_argument(
+        "--batch-seconds",
+        type=float,
+        default=processing_config.target_batch_seconds,
+        help="Target seconds per batch; batches are resized from measured cost and split "
+        "when over twice this (0 = fixed batch size)",
+    )
     parser.add_argument(
         "--max-workers",
         type=int,
         default=processing_config.max_workers,
         help="Number of processes (default: CPU count - 2)",
     )
+    # Pipelined runs keep no batch files, so they can't resume an earlier run
+    run_source = parser.add_mutually_exclusive_group()
+    run_source.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Match MARC batches as they are parsed instead of pickling them to disk first "
+        "(the run can't be resumed)",
+    )
+    parser.add_argument(
+        "--shared-indexes",
+        action="store_true",
+        help="Publish the indexes once in shared memory for all workers instead of one copy each",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["processes", "threads"],
+        default="processes",
+        help="Match on worker processes or on threads sharing one index (for free-threaded Python)",
+    )
 
     # Memory monitoring options
     parser.add_argument(
@@ -160,6 +188,13 @@ def create_argument_parser() -> ArgumentParser:
         default=caching_config.no_cache,
         help="Disable caching entirely",
     )
+    # The result cache is enabled by default, so use store_true to disable it
+    parser.add_argument(
+        "--no-result-cache",
+        action="store_true",
+        default=not caching_config.result_cache,
+        help="Match every record again instead of reusing results of unchanged records",
+    )
 
     # Logging options
     parser.add_argument(
@@ -182,6 +217,17 @@ def create_argument_parser() -> ArgumentParser:
     parser.add_argument(
         "--temp-dir", default=None, help="Directory for temporary batch files during processing"
     )
+    run_source.add_argument(
+        "--resume",
+        metavar="RUN_DIR",
+        default=None,
+        help="Resume an interrupted run from its run directory, matching only unfinished batches",
+    )
+    parser.add_argument(
+        "--keep-run-dir",
+        action="store_true",
+        help="Keep the run directory after a run finishes (it is always kept if the run stops early)",
+    )
 
     return parser
 
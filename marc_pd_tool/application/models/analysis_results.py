@@ -51,6 +51,8 @@ class AnalysisStatistics(BaseModel):
     research_us_only_pd: int = 0
     country_unknown: int = 0
     skipped_no_year: int = 0
+    cached_records: int = 0  # Match results reused from the result cache
+    computed_records: int = 0  # Records matched while the result cache was in use
 
     # Allow dynamic fields for copyright status tracking
     extra_fields: dict[str, int] = Field(default_factory=dict)
@@ -7,6 +7,9 @@ from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
 
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+
 
 class ScoreRange(BaseModel):
     """Score range information for analysis"""
@@ -33,7 +36,7 @@ class ThresholdRecommendation(BaseModel):
 class BatchStats(BaseModel):
     """Statistics from processing a batch of MARC records"""
 
-    model_config = ConfigDict()
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     batch_id: int = Field(..., description="Batch identifier")
     marc_count: int = Field(0, description="Number of MARC records processed")
@@ -48,6 +51,12 @@ class BatchStats(BaseModel):
     skipped_out_of_range: int = Field(0, description="Records skipped due to year out of range")
     skipped_non_us: int = Field(0, description="Records skipped due to non-US classification")
     records_with_errors: int = Field(0, description="Records that had processing errors")
+    cached_records: int = Field(0, description="Records whose match results came from the cache")
+    deferred: list[Publication] = Field(
+        default_factory=list,
+        exclude=True,
+        description="Records left unprocessed because the batch ran over its time budget",
+    )
 
     def increment(self, field: str, value: int = 1) -> None:
         """Increment a statistic field
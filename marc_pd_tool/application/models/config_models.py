@@ -3,6 +3,7 @@
 """Pydantic models for configuration options"""
 
 # Standard library imports
+from typing import Literal
 
 # Third party imports
 from pydantic import BaseModel
@@ -30,11 +31,17 @@ class AnalysisOptions(BaseModel):
     fuzzy_ratio_threshold: int = 65
     num_processes: int | None = None
     batch_size: int = 100
+    target_batch_seconds: float | None = None  # Adaptive batch duration (None = config value)
     brute_force_missing_year: bool = False
     formats: list[str] = Field(default_factory=lambda: ["csv"])
     single_file: bool = False
     minimum_combined_score: int | None = None
     parallel_loading: bool = True  # Use parallel loading for copyright/renewal data
+    pipeline: bool = False  # Match batches as they are parsed, without pickling to disk
+    shared_indexes: bool = False  # Workers attach indexes in shared memory instead of copies
+    executor: Literal["processes", "threads"] = "processes"  # Phase 3 worker backend
+    result_cache: bool = True  # Reuse match results of records unchanged since an earlier run
+    keep_run_dir: bool = False  # Keep the run directory of a run that finished
 
     def get[T](self, key: str, default: T | None = None) -> T | None:
         """Get option value with default
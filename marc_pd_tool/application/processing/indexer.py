@@ -3,24 +3,94 @@
 """Publication indexer for fast lookup using multiple indexing strategies"""
 
 # Standard library imports
+from copy import copy
 from re import sub
+from typing import Callable
 from typing import Optional  # Needed for forward references
+from typing import cast
+from typing import overload
 
 # Local imports
+from marc_pd_tool.application.processing.text_processing import (
+    FREQUENCY_TITLE_MAX_LENGTH,
+)
 from marc_pd_tool.application.processing.text_processing import LanguageProcessor
 from marc_pd_tool.application.processing.text_processing import MultiLanguageStemmer
+from marc_pd_tool.application.processing.text_processing import count_title_frequencies
 from marc_pd_tool.application.processing.text_processing import expand_abbreviations
+from marc_pd_tool.application.processing.text_processing import normalize_generic_title
 from marc_pd_tool.core.domain.index_entry import IndexEntry
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import PublicationStore
+from marc_pd_tool.core.domain.publication_store import PublicationView
 from marc_pd_tool.core.types.json import JSONDict
 from marc_pd_tool.infrastructure.config import ConfigLoader
 from marc_pd_tool.infrastructure.config import get_config
 from marc_pd_tool.shared.mixins.mixins import ConfigurableMixin
 
+# Attributes cached as separate files, so a loaded index can read each one on
+# first use instead of unpickling everything up front
+INDEX_SECTIONS = (
+    "publications",
+    "title_index",
+    "author_index",
+    "publisher_index",
+    "year_index",
+    "lccn_index",
+    "title_counts",
+)
+
+
+class _IndexSection[T]:
+    """Index attribute that a lazily loaded index reads on first access"""
+
+    def __set_name__(self, owner: type["DataIndexer"], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, indexer: None, owner: type["DataIndexer"]) -> "_IndexSection[T]": ...
+
+    @overload
+    def __get__(self, indexer: "DataIndexer", owner: type["DataIndexer"]) -> T: ...
+
+    def __get__(
+        self, indexer: "DataIndexer | None", owner: type["DataIndexer"]
+    ) -> "_IndexSection[T] | T":
+        if indexer is None:
+            return self
+        values = indexer.__dict__
+        if self.name in values:
+            return cast(T, values[self.name])
+        loader = values.get("_section_loader")
+        if loader is None:
+            raise AttributeError(f"{owner.__name__!r} object has no attribute {self.name!r}")
+        value = cast(T, loader(self.name))
+        values[self.name] = value
+        if all(section in values for section in INDEX_SECTIONS):
+            # Everything is in memory; let the loader release its files
+            indexer._section_loader = None
+        return value
+
+    def __set__(self, indexer: "DataIndexer", value: T) -> None:
+        indexer.__dict__[self.name] = value
+
 
 class DataIndexer(ConfigurableMixin):
     """Indexes publications for fast lookup using titles, authors, publishers, years, and LCCNs"""
 
+    # Struct-of-arrays publication storage, indexed by pub_id
+    publications = _IndexSection[PublicationStore]()
+
+    # Word-based indexes using stemmed/processed terms
+    title_index = _IndexSection[dict[str, IndexEntry]]()
+    author_index = _IndexSection[dict[str, IndexEntry]]()
+    publisher_index = _IndexSection[dict[str, IndexEntry]]()
+    year_index = _IndexSection[dict[int, IndexEntry]]()
+    lccn_index = _IndexSection[dict[str, IndexEntry]]()
+
+    # Normalized title frequencies for generic title detection
+    title_counts = _IndexSection[dict[str, int]]()
+
     def __init__(self, config_loader: Optional["ConfigLoader"] = None) -> None:
         """Initialize the publication indexer
 
@@ -29,20 +99,21 @@ class DataIndexer(ConfigurableMixin):
         """
         self.config = self._init_config(config_loader)
 
-        # Storage for publications and indexes
-        self.publications: list[Publication] = []
-
-        # Word-based indexes using stemmed/processed terms
-        self.title_index: dict[str, IndexEntry] = {}
-        self.author_index: dict[str, IndexEntry] = {}
-        self.publisher_index: dict[str, IndexEntry] = {}
-        self.year_index: dict[int, IndexEntry] = {}
-        self.lccn_index: dict[str, IndexEntry] = {}
+        self.publications = PublicationStore()
+        self.title_index = {}
+        self.author_index = {}
+        self.publisher_index = {}
+        self.year_index = {}
+        self.lccn_index = {}
+        self.title_counts = {}
 
         # Initialize language processing components (lazy initialization to avoid pickling issues)
         self._lang_processor: Optional[LanguageProcessor] = None
         self._stemmer: Optional[MultiLanguageStemmer] = None
 
+        # Reads sections missing from __dict__ when the index was loaded lazily
+        self._section_loader: Callable[[str], object] | None = None
+
         # Get abbreviation expansion setting from config
         config_dict = self.config.config
         self.enable_abbreviation_expansion = bool(
@@ -53,8 +124,7 @@ class DataIndexer(ConfigurableMixin):
 
     def add_publication(self, pub: Publication) -> int:
         """Add a publication to the word-based index and return its ID"""
-        pub_id = len(self.publications)
-        self.publications.append(pub)
+        pub_id = self.publications.append(pub)
 
         # Index by title using word-based processing with publication's language
         title_keys = generate_wordbased_title_keys(
@@ -111,6 +181,12 @@ class DataIndexer(ConfigurableMixin):
                 self.lccn_index[pub.normalized_lccn] = IndexEntry()
             self.lccn_index[pub.normalized_lccn].add(pub_id)
 
+        # Count short titles for frequency-based generic title detection
+        if pub.title:
+            generic_title = normalize_generic_title(pub.title)
+            if generic_title and len(generic_title) < FREQUENCY_TITLE_MAX_LENGTH:
+                self.title_counts[generic_title] = self.title_counts.get(generic_title, 0) + 1
+
         return pub_id
 
     def find_candidates(self, query_pub: Publication, year_tolerance: int = 1) -> set[int]:
@@ -223,9 +299,59 @@ class DataIndexer(ConfigurableMixin):
 
         return candidates
 
+    def estimate_candidates(self, query_pub: Publication, year_tolerance: int = 1) -> float:
+        """Predict how many candidates find_candidates would return
+
+        Only posting sizes are read, no ID sets are built. Title (or author)
+        postings are assumed independent of the year, so their intersection
+        with the year window is estimated as their product over the index size.
+
+        Args:
+            query_pub: Publication to predict for
+            year_tolerance: Maximum year difference for matching
+
+        Returns:
+            Predicted number of candidates
+        """
+        if query_pub.normalized_lccn:
+            entry = self.lccn_index.get(query_pub.normalized_lccn)
+            if entry and not entry.is_empty():
+                return float(len(entry))
+
+        title_keys = generate_wordbased_title_keys(
+            query_pub.title,
+            query_pub.language_code,
+            self.lang_processor,
+            self.stemmer,
+            self.enable_abbreviation_expansion,
+        )
+        title_postings = sum(len(self.title_index.get(key) or ()) for key in title_keys)
+        if title_postings:
+            postings = title_postings
+        elif query_pub.author:
+            author_keys = generate_wordbased_author_keys(
+                query_pub.author, query_pub.language_code, self.enable_abbreviation_expansion
+            )
+            postings = sum(len(self.author_index.get(key) or ()) for key in author_keys)
+        else:
+            postings = 0
+
+        if not postings:
+            return 0.0
+        year_postings = 0
+        if query_pub.year:
+            year_postings = sum(
+                len(self.year_index.get(query_pub.year + offset) or ())
+                for offset in range(-year_tolerance, year_tolerance + 1)
+            )
+        if not year_postings:
+            # find_candidates falls back to the title (or author) postings alone
+            return float(postings)
+        return postings * year_postings / max(1, len(self.publications))
+
     def get_candidates_list(
         self, query_pub: Publication, year_tolerance: int = 1
-    ) -> list[Publication]:
+    ) -> list[PublicationView]:
         """Get list of candidate publications for word-based matching
 
         Args:
@@ -233,11 +359,102 @@ class DataIndexer(ConfigurableMixin):
             year_tolerance: Maximum year difference for matching
 
         Returns:
-            List of candidate publications
+            List of read-only views of the candidate publications
         """
         candidate_ids = self.find_candidates(query_pub, year_tolerance)
         return [self.publications[pub_id] for pub_id in candidate_ids]
 
+    def subset_by_year(self, min_year: int | None, max_year: int | None) -> "DataIndexer":
+        """Derive the index of the publications within a year range
+
+        Keeps the publications the loaders' year filter keeps (undated ones
+        included), without regenerating any keys. Loading a range also skips
+        whole source files by the year in their path, so the result matches an
+        index built for the range only when those files hold no kept entries;
+        CacheManager checks that before deriving.
+
+        Args:
+            min_year: Minimum year (inclusive), None for no minimum
+            max_year: Maximum year (inclusive), None for no maximum
+
+        Returns:
+            New index holding the kept publications and their postings
+        """
+        store = self.publications
+        kept: list[int] = []
+        # Old pub_id -> new pub_id, -1 for dropped publications
+        new_ids = [-1] * len(store)
+        for pub_id in range(len(store)):
+            year = store.year(pub_id)
+            if year is not None and (
+                (min_year is not None and year < min_year)
+                or (max_year is not None and year > max_year)
+            ):
+                continue
+            new_ids[pub_id] = len(kept)
+            kept.append(pub_id)
+
+        def remap[K](index: dict[K, IndexEntry]) -> dict[K, IndexEntry]:
+            remapped: dict[K, IndexEntry] = {}
+            for key, entry in index.items():
+                ids = [new_ids[pub_id] for pub_id in entry.ids if new_ids[pub_id] >= 0]
+                if ids:
+                    remapped[key] = IndexEntry.from_ids(ids)
+            return remapped
+
+        subset = DataIndexer(self.config)
+        subset.enable_abbreviation_expansion = self.enable_abbreviation_expansion
+        subset.publications = store.subset(kept)
+        subset.title_index = remap(self.title_index)
+        subset.author_index = remap(self.author_index)
+        subset.publisher_index = remap(self.publisher_index)
+        subset.year_index = remap(self.year_index)
+        subset.lccn_index = remap(self.lccn_index)
+        subset.title_counts = count_title_frequencies(store.value("title", i) for i in kept)
+        return subset
+
+    @property
+    def loaded_sections(self) -> list[str]:
+        """Sections currently in memory"""
+        return [name for name in INDEX_SECTIONS if name in self.__dict__]
+
+    def attach_sections(self, loader: Callable[[str], object]) -> None:
+        """Read missing sections through a loader when they are first used
+
+        Args:
+            loader: Returns the value of a section given its name
+        """
+        self._section_loader = loader
+
+    def load_sections(self) -> None:
+        """Load every section that hasn't been used yet"""
+        if self.__dict__.get("_section_loader") is not None:
+            for name in INDEX_SECTIONS:
+                getattr(self, name)
+
+    def split_sections(self) -> tuple["DataIndexer", dict[str, object]]:
+        """Separate the index into a small header and its sections
+
+        Returns:
+            Tuple of (copy of the index without its sections, section name -> value)
+        """
+        self.load_sections()
+        header = copy(self)
+        sections = {name: header.__dict__.pop(name) for name in INDEX_SECTIONS}
+        return header, sections
+
+    def fingerprint(self) -> str:
+        """Hash of the indexed publications
+
+        The postings and title counts are derived from the publications and
+        the configuration, so equal fingerprints under one configuration mean
+        equal candidates and match results.
+
+        Returns:
+            Hex digest
+        """
+        return self.publications.fingerprint()
+
     def size(self) -> int:
         """Return number of publications in index"""
         return len(self.publications)
@@ -281,10 +498,12 @@ class DataIndexer(ConfigurableMixin):
 
     def __getstate__(self) -> JSONDict:
         """Custom serialization to exclude non-picklable objects"""
+        self.load_sections()
         state = self.__dict__.copy()
         # Remove the unpicklable language processing objects
         state["_lang_processor"] = None
         state["_stemmer"] = None
+        state["_section_loader"] = None
         return state
 
     def __setstate__(self, state: JSONDict) -> None:
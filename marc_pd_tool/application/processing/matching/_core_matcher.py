@@ -4,6 +4,7 @@
 
 # Standard library imports
 from logging import getLogger
+from typing import Sequence
 
 # Local imports
 from marc_pd_tool.application.processing.derived_work_detector import (
@@ -19,6 +20,7 @@ from marc_pd_tool.application.processing.similarity_calculator import (
 )
 from marc_pd_tool.application.processing.text_processing import GenericTitleDetector
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.types.protocols import ReferencePublicationProtocol
 from marc_pd_tool.core.types.results import MatchResultDict
 from marc_pd_tool.infrastructure.config import ConfigLoader
 from marc_pd_tool.shared.mixins.mixins import ConfigurableMixin
@@ -57,7 +59,7 @@ class CoreMatcher(ConfigurableMixin):
     def find_best_match(
         self,
         marc_pub: Publication,
-        copyright_pubs: list[Publication],
+        copyright_pubs: Sequence[ReferencePublicationProtocol],
         title_threshold: int,
         author_threshold: int,
         publisher_threshold: int | None = None,
@@ -255,7 +257,7 @@ class CoreMatcher(ConfigurableMixin):
     def find_best_match_ignore_thresholds(
         self,
         marc_pub: Publication,
-        copyright_pubs: list[Publication],
+        copyright_pubs: Sequence[ReferencePublicationProtocol],
         year_tolerance: int = 1,
         minimum_combined_score: int | None = None,
     ) -> MatchResultDict | None:
@@ -396,7 +398,10 @@ class CoreMatcher(ConfigurableMixin):
         return best_match
 
     def _check_year_tolerance(
-        self, marc_pub: Publication, copyright_pub: Publication, year_tolerance: int
+        self,
+        marc_pub: Publication,
+        copyright_pub: ReferencePublicationProtocol,
+        year_tolerance: int,
     ) -> bool:
         """Check if publications are within year tolerance
 
@@ -8,6 +8,7 @@ from logging import getLogger
 # Local imports
 from marc_pd_tool.application.processing.text_processing import GenericTitleDetector
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.types.protocols import ReferencePublicationProtocol
 from marc_pd_tool.core.types.results import GenericTitleInfoDict
 from marc_pd_tool.core.types.results import MatchResultDict
 
@@ -20,7 +21,7 @@ class MatchResultBuilder:
     @staticmethod
     def create_match_result(
         marc_pub: Publication,
-        copyright_pub: Publication,
+        copyright_pub: ReferencePublicationProtocol,
         title_score: float,
         author_score: float,
         publisher_score: float,
@@ -78,7 +79,9 @@ class MatchResultBuilder:
 
     @staticmethod
     def _check_generic_titles(
-        marc_pub: Publication, copyright_pub: Publication, generic_detector: GenericTitleDetector
+        marc_pub: Publication,
+        copyright_pub: ReferencePublicationProtocol,
+        generic_detector: GenericTitleDetector,
     ) -> GenericTitleInfoDict | None:
         """Check if titles are generic
 
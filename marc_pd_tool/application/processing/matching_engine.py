@@ -18,6 +18,8 @@ from pickle import dump
 from pickle import load
 from tempfile import gettempdir
 from time import time
+from typing import Sequence
+from typing import TYPE_CHECKING
 
 # Third party imports
 import psutil
@@ -33,9 +35,19 @@ from marc_pd_tool.core.domain.enums import MatchType
 from marc_pd_tool.core.domain.match_result import MatchResult
 from marc_pd_tool.core.domain.publication import Publication
 from marc_pd_tool.core.types.aliases import BatchProcessingInfo
+from marc_pd_tool.core.types.protocols import ReferencePublicationProtocol
 from marc_pd_tool.core.types.results import MatchResultDict
+from marc_pd_tool.infrastructure.cache import MatchResultCache
+from marc_pd_tool.infrastructure.cache import apply_match_outcome
+from marc_pd_tool.infrastructure.cache import match_outcome
+from marc_pd_tool.infrastructure.cache import match_record_key
 from marc_pd_tool.infrastructure.config import ConfigLoader
 
+if TYPE_CHECKING:
+    # Local imports
+    from marc_pd_tool.application.processing.indexer import DataIndexer
+    from marc_pd_tool.application.processing.shared_index import SharedIndexHandle
+
 # Module logger - will be reconfigured in worker processes
 logger = getLogger(__name__)
 
@@ -62,7 +74,7 @@ class DataMatcher:
     def find_best_match(
         self,
         marc_pub: Publication,
-        copyright_pubs: list[Publication],
+        copyright_pubs: Sequence[ReferencePublicationProtocol],
         title_threshold: int,
         author_threshold: int,
         publisher_threshold: int | None = None,
@@ -95,7 +107,7 @@ class DataMatcher:
     def find_best_match_ignore_thresholds(
         self,
         marc_pub: Publication,
-        copyright_pubs: list[Publication],
+        copyright_pubs: Sequence[ReferencePublicationProtocol],
         year_tolerance: int = 1,
         minimum_combined_score: int | None = None,
         generic_detector: GenericTitleDetector | None = None,
@@ -163,12 +175,8 @@ def init_worker(
     if cached_indexes is None:
         raise RuntimeError(f"Worker {getpid()}: Failed to load indexes from cache")
 
-    _worker_registration_index, _worker_renewal_index = cached_indexes
-
-    # Load generic detector
-    _worker_generic_detector = cache_manager.get_cached_generic_detector(
-        copyright_dir, renewal_dir, detector_config
-    )
+    registration_index, renewal_index = cached_indexes
+    _worker_registration_index, _worker_renewal_index = registration_index, renewal_index
 
     # Load config
     # Local imports
@@ -176,6 +184,19 @@ def init_worker(
 
     _worker_config = get_config()
 
+    # Load generic detector, or rebuild it from the title frequencies cached
+    # with the indexes
+    _worker_generic_detector = cache_manager.get_cached_generic_detector(
+        copyright_dir, renewal_dir, detector_config, min_year, max_year, brute_force
+    )
+    detector_settings = _worker_config.generic_detector
+    if _worker_generic_detector is None and not detector_settings.disable_generic_detection:
+        _worker_generic_detector = GenericTitleDetector.from_title_counts(
+            [registration_index.title_counts, renewal_index.title_counts],
+            frequency_threshold=detector_settings.frequency_threshold,
+            config=_worker_config,
+        )
+
     # Store options - these will be passed in process_batch now
     _worker_options = {}
 
@@ -183,10 +204,146 @@ def init_worker(
     # Workers will inherit the main process's logging configuration
 
 
-def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats]:
+def init_worker_shared(
+    registration_handle: "SharedIndexHandle",
+    renewal_handle: "SharedIndexHandle",
+    generic_detector: GenericTitleDetector | None,
+) -> None:
+    """Initialize worker process with indexes published in shared memory
+
+    Works with both fork and spawn: the worker attaches the parent's segments
+    instead of loading its own copy of the indexes.
+
+    Args:
+        registration_handle: Handle of the shared registration index
+        renewal_handle: Handle of the shared renewal index
+        generic_detector: Parent's generic title detector, None if disabled
+    """
+    # Ignore SIGINT in worker processes - let the main process handle it
+    # Standard library imports
+    import signal
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    global _worker_registration_index
+    global _worker_renewal_index
+    global _worker_generic_detector
+    global _worker_config
+    global _worker_options
+
+    # Local imports
+    from marc_pd_tool.application.processing.shared_index import attach_shared_index
+    from marc_pd_tool.infrastructure.config import get_config
+
+    _worker_registration_index = attach_shared_index(registration_handle)
+    _worker_renewal_index = attach_shared_index(renewal_handle)
+    _worker_generic_detector = generic_detector
+    _worker_config = get_config()
+    _worker_options = {}
+
+
+def init_worker_in_process(
+    registration_index: "DataIndexer",
+    renewal_index: "DataIndexer",
+    generic_detector: GenericTitleDetector | None,
+) -> None:
+    """Set up this process to run process_batch on worker threads
+
+    Every thread reads the same in-memory indexes, so nothing is loaded,
+    copied or attached.
+
+    Args:
+        registration_index: Registration index
+        renewal_index: Renewal index
+        generic_detector: Generic title detector, None if disabled
+    """
+    global _worker_registration_index
+    global _worker_renewal_index
+    global _worker_generic_detector
+    global _worker_config
+    global _worker_options
+
+    # Local imports
+    from marc_pd_tool.infrastructure.config import get_config
+
+    _worker_registration_index = registration_index
+    _worker_renewal_index = renewal_index
+    _worker_generic_detector = generic_detector
+    _worker_config = get_config()
+    _worker_options = {}
+
+
+def count_copyright_statuses(publications: list[Publication]) -> dict[str, int]:
+    """Count publications by copyright status
+
+    Args:
+        publications: Processed publications
+
+    Returns:
+        Lowercased copyright status -> number of publications
+    """
+    counts: dict[str, int] = {}
+    for pub in publications:
+        if hasattr(pub, "copyright_status") and pub.copyright_status:
+            status_key = pub.copyright_status.lower()
+            counts[status_key] = counts.get(status_key, 0) + 1
+    return counts
+
+
+def estimate_batch_cost(
+    batch: list[Publication],
+    registration_index: "DataIndexer",
+    renewal_index: "DataIndexer",
+    brute_force_missing_year: bool = False,
+) -> float:
+    """Predict the relative cost of matching a batch, before it is dispatched
+
+    Matching time is dominated by scoring candidates, so the cost is the
+    predicted number of candidates in both indexes plus one per record for
+    the fixed per-record work. Records process_batch skips cost nothing.
+
+    Args:
+        batch: Publications of the batch
+        registration_index: Index of registration records
+        renewal_index: Index of renewal records
+        brute_force_missing_year: Whether records without a year are matched
+
+    Returns:
+        Predicted cost, in candidate comparisons
+    """
+    cost = 0.0
+    for pub in batch:
+        if pub.year is None and not brute_force_missing_year:
+            continue
+        cost += 1.0
+        cost += registration_index.estimate_candidates(pub)
+        cost += renewal_index.estimate_candidates(pub)
+    return cost
+
+
+def process_batch(
+    batch_info: BatchProcessingInfo,
+    time_budget: float | None = None,
+    keep_batch_file: bool = False,
+    result_cache: MatchResultCache | None = None,
+) -> tuple[int, str | list[Publication], BatchStats]:
     """Process a batch of MARC publications
 
-    This function is called by worker processes to process batches.
+    This function is called by worker processes to process batches. When the
+    batch info carries no result directory (thread executor), the processed
+    publications are returned in place of a result file path.
+
+    With a time budget, a batch that runs over it stops early and returns its
+    unprocessed records in ``stats.deferred`` for the caller to reschedule.
+    At least one record is always processed.
+
+    A pickled batch is deleted once loaded, unless ``keep_batch_file`` is set
+    because the caller removes it only after recording the batch as complete.
+
+    With a result cache, records matched by an earlier run with the same
+    indexes and settings take their results from the cache instead of being
+    matched again, and the results of the records that are matched are added
+    to it. ``stats.cached_records`` counts the records taken from the cache.
     """
     # Unpack all the batch info
     (
@@ -214,17 +371,21 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
     ) = batch_info
 
     batch_num = batch_id
-    pickled_batch_path = batch_path
 
-    # Load the batch
-    with open(pickled_batch_path, "rb") as f:
-        batch = load(f)
+    # Load the batch - pipelined runs hand us the publications directly,
+    # otherwise the batch was pickled to disk during Phase 2
+    if isinstance(batch_path, list):
+        batch = batch_path
+    else:
+        with open(batch_path, "rb") as f:
+            batch = load(f)
 
-    # Clean up the pickle file
-    try:
-        unlink(pickled_batch_path)
-    except Exception:
-        pass  # Ignore cleanup errors
+        # Clean up the pickle file
+        if not keep_batch_file:
+            try:
+                unlink(batch_path)
+            except Exception:
+                pass  # Ignore cleanup errors
 
     # Don't log batch start - main process handles progress tracking
 
@@ -243,8 +404,21 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
     # Track processed publications (not skipped ones)
     processed_publications = []
 
+    # Results of unchanged records, and of the records matched here for the cache
+    record_keys: list[bytes] = []
+    cached_outcomes: dict[bytes, tuple[object, ...]] = {}
+    new_outcomes: dict[bytes, tuple[object, ...]] = {}
+    if result_cache is not None:
+        record_keys = [match_record_key(pub) for pub in batch]
+        cached_outcomes = result_cache.lookup(record_keys)
+
     # Process each publication
-    for pub in batch:
+    for position, pub in enumerate(batch):
+        # Over budget: hand the rest back rather than hold up the run
+        if time_budget is not None and position and time() - start_time > time_budget:
+            stats.deferred = batch[position:]
+            break
+
         # Skip if no year and not brute forcing
         if pub.year is None and not brute_force_missing_year:
             stats.skipped_no_year += 1
@@ -253,6 +427,18 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
         # Add to processed list
         processed_publications.append(pub)
 
+        # Unchanged since an earlier run: reuse its results
+        if record_keys and record_keys[position] in cached_outcomes:
+            apply_match_outcome(pub, cached_outcomes[record_keys[position]])
+            if pub.registration_match is not None:
+                stats.registration_matches_found += 1
+            if pub.renewal_match is not None:
+                stats.renewal_matches_found += 1
+            stats.cached_records += 1
+            stats.marc_count += 1
+            pub.determine_copyright_status()
+            continue
+
         # Find registration matches
         if _worker_registration_index:
             candidates = _worker_registration_index.find_candidates(pub)
@@ -286,6 +472,7 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
                     stats.registration_matches_found += 1
                     copyright_rec = match["copyright_record"]
                     scores = match["similarity_scores"]
+                    matched_year = copyright_rec.get("year")
 
                     match_result = MatchResult(
                         matched_title=copyright_rec["title"],
@@ -295,9 +482,7 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
                         author_score=scores["author"],
                         publisher_score=scores.get("publisher", 0.0),
                         year_difference=(
-                            abs(pub.year - copyright_rec["year"])
-                            if pub.year and copyright_rec.get("year")
-                            else 0
+                            abs(pub.year - matched_year) if pub.year and matched_year else 0
                         ),
                         source_id=copyright_rec.get("source_id", ""),
                         source_type="registration",
@@ -370,6 +555,7 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
                     stats.renewal_matches_found += 1
                     copyright_rec = match["copyright_record"]
                     scores = match["similarity_scores"]
+                    matched_year = copyright_rec.get("year")
 
                     match_result = MatchResult(
                         matched_title=copyright_rec["title"],
@@ -379,9 +565,7 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
                         author_score=scores["author"],
                         publisher_score=scores.get("publisher", 0.0),
                         year_difference=(
-                            abs(pub.year - copyright_rec["year"])
-                            if pub.year and copyright_rec.get("year")
-                            else 0
+                            abs(pub.year - matched_year) if pub.year and matched_year else 0
                         ),
                         source_id=copyright_rec.get("source_id", ""),
                         source_type="renewal",
@@ -424,38 +608,46 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
         stats.marc_count += 1  # Count actually processed records
         stats.total_comparisons += 1  # Track comparisons made
 
+        if record_keys:
+            new_outcomes[record_keys[position]] = match_outcome(pub)
+
         # Determine copyright status
         pub.determine_copyright_status()
 
+    if result_cache is not None:
+        result_cache.store(new_outcomes)
+
     # Calculate timing
     elapsed = time() - start_time
     stats.processing_time = elapsed
 
-    # Save results to file (only processed publications)
-    result_file_path = join(result_temp_dir, f"batch_{batch_num}_result.pkl")
-    with open(result_file_path, "wb") as f:
-        dump(processed_publications, f, protocol=HIGHEST_PROTOCOL)
-
-    # Create detailed statistics dictionary for the stats file
-    detailed_stats = {
-        "total_records": stats.marc_count,
-        "registration_matches": stats.registration_matches_found,
-        "renewal_matches": stats.renewal_matches_found,
-        "skipped_no_year": stats.skipped_no_year,
-        "skipped_out_of_range": stats.skipped_out_of_range,
-        "skipped_non_us": stats.skipped_non_us,
-    }
-
-    # Count copyright statuses for stats file
-    for pub in processed_publications:
-        if hasattr(pub, "copyright_status") and pub.copyright_status:
-            status_key = pub.copyright_status.lower()
-            detailed_stats[status_key] = detailed_stats.get(status_key, 0) + 1
-
-    # Save statistics to separate file
-    stats_file_path = join(result_temp_dir, f"batch_{batch_num}_stats.pkl")
-    with open(stats_file_path, "wb") as f:
-        dump(detailed_stats, f, protocol=HIGHEST_PROTOCOL)
+    result: str | list[Publication]
+    if result_temp_dir is None:
+        # Same process as the caller: hand the publications back directly
+        result = processed_publications
+    else:
+        # Save results to file (only processed publications)
+        result = join(result_temp_dir, f"batch_{batch_num}_result.pkl")
+        with open(result, "wb") as f:
+            dump(processed_publications, f, protocol=HIGHEST_PROTOCOL)
+
+        # Create detailed statistics dictionary for the stats file
+        detailed_stats = {
+            "total_records": stats.marc_count,
+            "registration_matches": stats.registration_matches_found,
+            "renewal_matches": stats.renewal_matches_found,
+            "skipped_no_year": stats.skipped_no_year,
+            "skipped_out_of_range": stats.skipped_out_of_range,
+            "skipped_non_us": stats.skipped_non_us,
+        }
+
+        # Count copyright statuses for stats file
+        detailed_stats.update(count_copyright_statuses(processed_publications))
+
+        # Save statistics to separate file
+        stats_file_path = join(result_temp_dir, f"batch_{batch_num}_stats.pkl")
+        with open(stats_file_path, "wb") as f:
+            dump(detailed_stats, f, protocol=HIGHEST_PROTOCOL)
 
     # Get memory usage
     process = psutil.Process(getpid())
@@ -466,9 +658,9 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
     records_per_sec = stats.marc_count / elapsed if elapsed > 0 else 0
 
     # Only log if something unusual happened
-    if stats.marc_count < len(batch):
+    if stats.marc_count + len(stats.deferred) < len(batch):
         # Some records were skipped - worth noting
-        skipped = len(batch) - stats.marc_count
+        skipped = len(batch) - len(stats.deferred) - stats.marc_count
         logger.debug(f"  Batch {batch_num}: {skipped} records skipped (no year or filtered)")
 
     # Log if processing was unusually slow
@@ -514,4 +706,4 @@ def process_batch(batch_info: BatchProcessingInfo) -> tuple[int, str, BatchStats
             except Exception as e:
                 logger.debug(f"    Failed to save debug data: {e}")
 
-    return batch_num, result_file_path, stats
+    return batch_num, result, stats
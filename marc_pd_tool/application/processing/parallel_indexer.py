@@ -3,8 +3,10 @@
 """Parallel index building for faster startup times"""
 
 # Standard library imports
+from concurrent.futures import Executor
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import as_completed
+from contextlib import nullcontext
 from logging import getLogger
 from pickle import dumps
 from pickle import loads
@@ -25,8 +27,10 @@ from marc_pd_tool.application.processing.indexer import generate_wordbased_autho
 from marc_pd_tool.application.processing.indexer import generate_wordbased_title_keys
 from marc_pd_tool.application.processing.text_processing import LanguageProcessor
 from marc_pd_tool.application.processing.text_processing import MultiLanguageStemmer
+from marc_pd_tool.application.processing.text_processing import count_title_frequencies
 from marc_pd_tool.core.domain.index_entry import IndexEntry
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import PublicationStore
 from marc_pd_tool.infrastructure.config import ConfigLoader
 from marc_pd_tool.infrastructure.config import get_config
 
@@ -53,12 +57,16 @@ class PartialIndexResult(BaseModel):
     lccn_index: dict[str, set[int]] = Field(
         default_factory=dict, description="LCCN to publication ID mappings"
     )
+    title_counts: dict[str, int] = Field(
+        default_factory=dict, description="Normalized title frequencies for generic detection"
+    )
 
 
 def build_wordbased_index_parallel(
     publications: list[Publication],
     config_loader: Optional[ConfigLoader] = None,
     num_workers: int | None = None,
+    executor: Executor | None = None,
 ) -> DataIndexer:
     """Build an index from publications using parallel processing
 
@@ -66,6 +74,7 @@ def build_wordbased_index_parallel(
         publications: List of publications to index
         config_loader: Optional configuration loader
         num_workers: Number of parallel workers (default: cpu_count - 1, max 8)
+        executor: Process pool shared with other Phase 1 work, or None to start one
 
     Returns:
         DataIndexer with all publications indexed
@@ -116,17 +125,21 @@ def build_wordbased_index_parallel(
 
     # Process chunks in parallel
     partial_indexes = []
-    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+    with (
+        nullcontext(executor)
+        if executor is not None
+        else ProcessPoolExecutor(max_workers=num_workers)
+    ) as pool:
         # Submit all chunks for processing
         future_to_chunk = {
-            executor.submit(_index_chunk, start_idx, chunk, config_data): (start_idx, chunk)
+            pool.submit(_index_chunk, start_idx, chunk, config_data): (start_idx, chunk)
             for start_idx, chunk in chunks
         }
 
         # Collect results as they complete
         completed = 0
         total_pubs_indexed = 0
-        last_log_time = 0
+        last_log_time = 0.0
         for future in as_completed(future_to_chunk):
             start_idx, chunk = future_to_chunk[future]
             try:
@@ -263,6 +276,7 @@ def _index_chunk(
         publisher_index=publisher_index,
         year_index=year_index,
         lccn_index=lccn_index,
+        title_counts=count_title_frequencies(pub.title for pub in publications),
     )
 
 
@@ -283,7 +297,7 @@ def _merge_indexes(
     """
     # Create final indexer
     final_indexer = DataIndexer(config_loader)
-    final_indexer.publications = publications
+    final_indexer.publications = PublicationStore.from_publications(publications)
 
     # Sort partial indexes by start index to ensure correct order
     partial_indexes.sort(key=lambda x: x[0])
@@ -325,4 +339,9 @@ def _merge_indexes(
             for pub_id in pub_ids:
                 final_indexer.lccn_index[lccn].add(pub_id)
 
+        # Merge title frequencies
+        title_counts = final_indexer.title_counts
+        for title, count in partial.title_counts.items():
+            title_counts[title] = title_counts.get(title, 0) + count
+
     return final_indexer
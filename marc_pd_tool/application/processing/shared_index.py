@@ -0,0 +1,351 @@
+# marc_pd_tool/application/processing/shared_index.py
+
+"""Indexes published in shared memory for worker processes
+
+A DataIndexer keeps its postings in dicts of IndexEntry objects and its
+publications in a PublicationStore of int arrays over a string table. Loading
+that per worker costs one full copy of the index per process. Instead, the
+parent packs everything into flat arrays in one shared memory segment:
+
+- strings become UTF-8 bytes plus an array of offsets
+- each postings dict becomes sorted keys with an offsets array into one array
+  of publication ids, looked up by binary search
+
+Workers attach the segment read-only and only unpickle a small header, so the
+memory used stays nearly constant in the number of workers.
+"""
+
+# Standard library imports
+from array import array
+from bisect import bisect_left
+from copy import copy
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterator
+from typing import Literal
+from typing import Mapping
+from typing import NamedTuple
+from typing import Sequence
+from typing import cast
+
+# Local imports
+from marc_pd_tool.application.processing.indexer import DataIndexer
+from marc_pd_tool.core.domain.index_entry import IndexEntry
+from marc_pd_tool.core.domain.publication_store import PublicationStore
+from marc_pd_tool.core.domain.publication_store import STORE_FIELDS
+
+# Postings sections, and whether their keys are strings (years are ints)
+POSTINGS_SECTIONS = {
+    "title_index": True,
+    "author_index": True,
+    "publisher_index": True,
+    "year_index": False,
+    "lccn_index": True,
+}
+
+# Lone surrogates from bad source data must survive the round trip
+_ENCODING = "utf-8"
+_ERRORS = "surrogatepass"
+
+# Typecodes of the packed arrays: "B" for raw bytes, "i" and "q" for ints
+type ArrayTypecode = Literal["B", "i", "q"]
+
+# Array name -> (typecode, byte offset in the segment, byte length)
+type ArrayLayout = dict[str, tuple[ArrayTypecode, int, int]]
+
+# Segments attached by this process, kept open for the life of the process
+_attached_segments: list[SharedMemory] = []
+
+
+class SharedIndexHandle(NamedTuple):
+    """Everything a worker needs to attach an index published in shared memory"""
+
+    segment: str
+    layout: ArrayLayout
+    header: DataIndexer
+    none_string: int
+
+
+class SharedStrings(Sequence[str | None]):
+    """String table read from UTF-8 bytes and offsets"""
+
+    def __init__(self, data: memoryview, offsets: memoryview, none_id: int = -1) -> None:
+        """Initialize the table
+
+        Args:
+            data: Concatenated UTF-8 encoded strings
+            offsets: Start of each string in data, plus the end of the last one
+            none_id: Position that holds None, -1 if none does
+        """
+        self._data = data
+        self._offsets = offsets
+        self._none_id = none_id
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str | None:  # type: ignore[override]
+        if index == self._none_id:
+            return None
+        return str(self._data[self._offsets[index] : self._offsets[index + 1]], _ENCODING, _ERRORS)
+
+
+class _EncodedKeys(Sequence[bytes]):
+    """Sorted string keys as bytes, so bisect compares without decoding"""
+
+    def __init__(self, data: memoryview, offsets: memoryview) -> None:
+        self._data = data
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> bytes:  # type: ignore[override]
+        return bytes(self._data[self._offsets[index] : self._offsets[index + 1]])
+
+
+class SharedPostings(Mapping[object, IndexEntry]):
+    """Read-only postings dict backed by sorted keys and flat id arrays
+
+    Supports what DataIndexer does with its index dicts: get, membership,
+    len and iteration. A lookup is a binary search over the keys.
+    """
+
+    def __init__(
+        self,
+        keys: Sequence[bytes] | Sequence[int],
+        offsets: memoryview,
+        ids: memoryview,
+        string_keys: bool,
+    ) -> None:
+        """Initialize the postings
+
+        Args:
+            keys: Sorted keys, UTF-8 encoded if string_keys
+            offsets: Start of each key's ids in ids, plus the end of the last
+            ids: Publication ids of all keys, key by key
+            string_keys: Whether keys are strings rather than ints
+        """
+        self._keys = keys
+        self._offsets = offsets
+        self._ids = ids
+        self._string_keys = string_keys
+
+    def _position(self, key: object) -> int:
+        """Position of a key, or -1 if it isn't present"""
+        probe: bytes | int
+        if self._string_keys and isinstance(key, str):
+            probe = key.encode(_ENCODING, _ERRORS)
+        elif not self._string_keys and isinstance(key, int):
+            probe = key
+        else:
+            return -1
+        position = bisect_left(self._keys, probe)
+        if position < len(self._keys) and self._keys[position] == probe:
+            return position
+        return -1
+
+    def __getitem__(self, key: object) -> IndexEntry:
+        position = self._position(key)
+        if position < 0:
+            raise KeyError(key)
+        return IndexEntry.from_ids(self._ids[self._offsets[position] : self._offsets[position + 1]])
+
+    def __contains__(self, key: object) -> bool:
+        return self._position(key) >= 0
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __iter__(self) -> Iterator[object]:
+        for position in range(len(self)):
+            key = self._keys[position]
+            yield str(key, _ENCODING, _ERRORS) if isinstance(key, bytes) else key
+
+
+def _encode_strings(strings: Sequence[str | None]) -> tuple[bytes, "array[int]", int]:
+    """Pack strings into UTF-8 bytes and offsets
+
+    Args:
+        strings: Strings to pack; at most one may be None
+
+    Returns:
+        Tuple of (bytes, offsets, position of None or -1)
+    """
+    chunks = []
+    offsets = array("q", [0])
+    none_id = -1
+    end = 0
+    for position, string in enumerate(strings):
+        if string is None:
+            none_id = position
+            encoded = b""
+        else:
+            encoded = string.encode(_ENCODING, _ERRORS)
+        chunks.append(encoded)
+        end += len(encoded)
+        offsets.append(end)
+    return b"".join(chunks), offsets, none_id
+
+
+def _pack_postings(
+    name: str, index: Mapping[object, IndexEntry], string_keys: bool
+) -> dict[str, "bytes | array[int]"]:
+    """Pack a postings dict into sorted keys and flat id arrays
+
+    Args:
+        name: Section name, used as the prefix of the array names
+        index: Postings to pack
+        string_keys: Whether keys are strings rather than ints
+
+    Returns:
+        Array name -> packed array
+    """
+    packed: dict[str, bytes | array[int]] = {}
+    if string_keys:
+        keys: list[object] = sorted(index, key=lambda key: str(key).encode(_ENCODING, _ERRORS))
+        packed[f"{name}.keys"], packed[f"{name}.key_offsets"], _ = _encode_strings(
+            cast(list[str], keys)
+        )
+    else:
+        keys = sorted(index, key=lambda key: cast(int, key))
+        packed[f"{name}.keys"] = array("q", cast(list[int], keys))
+
+    offsets = array("q", [0])
+    ids = array("i")
+    for key in keys:
+        ids.extend(sorted(index[key].ids))
+        offsets.append(len(ids))
+    packed[f"{name}.offsets"] = offsets
+    packed[f"{name}.ids"] = ids
+    return packed
+
+
+def _segment_buffer(memory: SharedMemory) -> "memoryview[int]":
+    """Byte view of a shared memory segment
+
+    Args:
+        memory: Open segment
+
+    Returns:
+        Writable view of the whole segment
+
+    Raises:
+        ValueError: If the segment has been closed
+    """
+    buffer = memory.buf
+    if buffer is None:
+        raise ValueError(f"Shared memory segment {memory.name} is closed")
+    return buffer
+
+
+class SharedIndexSegment:
+    """Shared memory segment holding one published index, owned by the parent
+
+    The segment is removed by close(), or by the resource tracker if the
+    parent dies first. Workers attach it with attach_shared_index.
+    """
+
+    def __init__(self, index: DataIndexer) -> None:
+        """Publish an index
+
+        Args:
+            index: Index to copy into shared memory
+        """
+        header, sections = index.split_sections()
+        # Small, and only used to build the generic title detector
+        header.title_counts = cast(dict[str, int], sections["title_counts"])
+        store = cast(PublicationStore, sections["publications"]).__getstate__()
+        columns = cast(dict[str, "array[int]"], store["columns"])
+
+        arrays: dict[str, bytes | array[int]] = {}
+        arrays["strings"], arrays["string_offsets"], none_string = _encode_strings(
+            cast(list[str | None], store["strings"])
+        )
+        for field in STORE_FIELDS:
+            arrays[f"columns.{field}"] = columns[field]
+        arrays["years"] = cast("array[int]", store["years"])
+        for name, string_keys in POSTINGS_SECTIONS.items():
+            arrays.update(
+                _pack_postings(name, cast(Mapping[object, IndexEntry], sections[name]), string_keys)
+            )
+
+        layout: ArrayLayout = {}
+        end = 0
+        for name, values in arrays.items():
+            # Packed arrays are only ever created with the "i" and "q" typecodes
+            typecode = cast(ArrayTypecode, values.typecode) if isinstance(values, array) else "B"
+            nbytes = len(values) * (values.itemsize if isinstance(values, array) else 1)
+            layout[name] = (typecode, end, nbytes)
+            # Keep every array 8-byte aligned
+            end += (nbytes + 7) // 8 * 8
+
+        self.size = end
+        memory = SharedMemory(create=True, size=max(1, end))
+        self._memory: SharedMemory | None = memory
+        buffer = _segment_buffer(memory)
+        for name, values in arrays.items():
+            _, offset, nbytes = layout[name]
+            buffer[offset : offset + nbytes] = memoryview(values).cast("B")
+        del buffer
+
+        self.handle = SharedIndexHandle(memory.name, layout, header, none_string)
+
+    def close(self) -> None:
+        """Release and remove the segment"""
+        if self._memory is None:
+            return
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+    def __enter__(self) -> "SharedIndexSegment":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+def attach_shared_index(handle: SharedIndexHandle) -> DataIndexer:
+    """Attach an index published by SharedIndexSegment
+
+    The result reads straight from the shared segment, which stays mapped
+    until the process exits. It is read-only and can't be pickled.
+
+    Args:
+        handle: Handle of the published index
+
+    Returns:
+        Index whose publications and postings live in shared memory
+    """
+    # The parent owns the segment; don't let this process's tracker remove it
+    memory = SharedMemory(name=handle.segment, track=False)
+    _attached_segments.append(memory)
+    buffer = _segment_buffer(memory).toreadonly()
+    views = {
+        name: buffer[offset : offset + nbytes].cast(typecode)
+        for name, (typecode, offset, nbytes) in handle.layout.items()
+    }
+
+    store = PublicationStore.__new__(PublicationStore)
+    store.__setstate__(
+        {
+            "strings": SharedStrings(views["strings"], views["string_offsets"], handle.none_string),
+            "columns": {field: views[f"columns.{field}"] for field in STORE_FIELDS},
+            "years": views["years"],
+        }
+    )
+
+    index = copy(handle.header)
+    index.publications = store
+    for name, string_keys in POSTINGS_SECTIONS.items():
+        keys: Sequence[bytes] | Sequence[int] = (
+            _EncodedKeys(views[f"{name}.keys"], views[f"{name}.key_offsets"])
+            if string_keys
+            else cast(Sequence[int], views[f"{name}.keys"])
+        )
+        setattr(
+            index,
+            name,
+            SharedPostings(keys, views[f"{name}.offsets"], views[f"{name}.ids"], string_keys),
+        )
+    return index
@@ -0,0 +1,132 @@
+# marc_pd_tool/application/processing/task_graph.py
+
+"""Small dependency-ordered task runner with per-task timing"""
+
+# Standard library imports
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
+from logging import getLogger
+from time import perf_counter
+from typing import Callable
+
+# Third party imports
+from pydantic import BaseModel
+
+logger = getLogger(__name__)
+
+
+class TaskTiming(BaseModel):
+    """When a task started and how long it ran, relative to the graph start"""
+
+    name: str
+    started: float
+    elapsed: float
+
+
+class TaskGraph:
+    """Runs named tasks on threads as soon as the tasks they depend on finish
+
+    Tasks are meant to be coordinators: the heavy work they do goes to a
+    process pool shared by all tasks, so independent chains (for example
+    loading and indexing registrations vs. renewals) keep the pool busy
+    together instead of each starting and draining its own.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize an empty graph
+
+        Args:
+            name: Name used in log messages
+        """
+        self.name = name
+        self._tasks: dict[str, tuple[Callable[[], None], tuple[str, ...]]] = {}
+        self.timings: list[TaskTiming] = []
+        self.elapsed = 0.0
+
+    def add(self, name: str, task: Callable[[], None], depends_on: tuple[str, ...] = ()) -> None:
+        """Add a task
+
+        Args:
+            name: Unique task name
+            task: Function to run
+            depends_on: Names of tasks that must finish first
+
+        Raises:
+            ValueError: If the name is taken or a dependency is unknown
+        """
+        if name in self._tasks:
+            raise ValueError(f"Duplicate task: {name}")
+        for dependency in depends_on:
+            if dependency not in self._tasks:
+                raise ValueError(f"Task {name} depends on unknown task {dependency}")
+        self._tasks[name] = (task, depends_on)
+
+    def run(self) -> None:
+        """Run every task, starting each one once its dependencies have finished
+
+        Tasks that don't depend on a failed task still run to completion;
+        the first failure is then raised.
+        """
+        start = perf_counter()
+        self.timings = []
+        done: set[str] = set()
+        failed: set[str] = set()
+        first_error: BaseException | None = None
+
+        def timed(name: str, task: Callable[[], None]) -> None:
+            task_start = perf_counter()
+            try:
+                task()
+            finally:
+                self.timings.append(
+                    TaskTiming(
+                        name=name, started=task_start - start, elapsed=perf_counter() - task_start
+                    )
+                )
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(self._tasks)), thread_name_prefix="task_graph"
+        ) as threads:
+            running: dict[Future[None], str] = {}
+            pending = dict(self._tasks)
+
+            while pending or running:
+                for name, (task, depends_on) in list(pending.items()):
+                    if any(dependency in failed for dependency in depends_on):
+                        logger.warning(f"{self.name}: skipping {name} after a failed dependency")
+                        failed.add(name)
+                        del pending[name]
+                    elif all(dependency in done for dependency in depends_on):
+                        running[threads.submit(timed, name, task)] = name
+                        del pending[name]
+
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        done.add(name)
+                    else:
+                        logger.error(f"{self.name}: {name} failed: {error}")
+                        failed.add(name)
+                        first_error = first_error or error
+
+        self.elapsed = perf_counter() - start
+        if first_error is not None:
+            raise first_error
+
+    def log_timings(self) -> None:
+        """Log when each task ran and for how long"""
+        if not self.timings:
+            return
+        logger.info(f"{self.name} task timings:")
+        for timing in sorted(self.timings, key=lambda t: t.started):
+            logger.info(
+                f"  {timing.name:<24} started +{timing.started:.1f}s, ran {timing.elapsed:.1f}s"
+            )
+        busy = sum(timing.elapsed for timing in self.timings)
+        logger.info(f"  {self.elapsed:.1f}s wall clock for {busy:.1f}s of task time")
@@ -14,8 +14,12 @@ This module combines:
 from collections import Counter
 from functools import lru_cache
 from re import split as re_split
+from threading import local
+from typing import Iterable
+from typing import Mapping
 from typing import Optional  # Needed for function signatures
 from typing import TYPE_CHECKING
+from typing import cast
 
 # Third party imports
 from Stemmer import Stemmer  # type: ignore[import-not-found]
@@ -85,8 +89,18 @@ class MultiLanguageStemmer:
             "ita": "italian",
         }
 
-        # Initialize stemmers lazily to avoid serialization issues
-        self._stemmers: Optional[StemmerDict] = None
+        # PyStemmer objects aren't thread-safe, so each thread gets its own
+        # stemmers, created lazily (which also keeps them out of pickles)
+        self._local = local()
+
+    @property
+    def _stemmers(self) -> Optional[StemmerDict]:
+        """Stemmers of the calling thread, None until it first stems"""
+        return cast(Optional[StemmerDict], getattr(self._local, "stemmers", None))
+
+    @_stemmers.setter
+    def _stemmers(self, stemmers: Optional[StemmerDict]) -> None:
+        self._local.stemmers = stemmers
 
     def _get_stemmers(self) -> dict[str, Stemmer]:
         """Lazy initialization of stemmers to avoid pickle issues"""
@@ -125,14 +139,15 @@ class MultiLanguageStemmer:
 
     def __getstate__(self) -> JSONDict:
         """Custom pickle support - exclude C objects"""
-        state = self.__dict__.copy()
+        state = {name: value for name, value in self.__dict__.items() if name != "_local"}
         # Remove the unpicklable stemmers
         state["_stemmers"] = None
         return state
 
     def __setstate__(self, state: JSONDict) -> None:
         """Custom unpickle support"""
-        self.__dict__.update(state)
+        self.__dict__.update({name: value for name, value in state.items() if name != "_stemmers"})
+        self._local = local()
 
 
 # Lazy loading of abbreviations
@@ -284,6 +299,49 @@ def extract_best_publisher_match(
 
 # Note: LRUCache class removed in favor of functools.lru_cache
 
+# Only normalized titles shorter than this can be generic by frequency
+FREQUENCY_TITLE_MAX_LENGTH = 20
+
+
+def normalize_generic_title(title: str) -> str:
+    """Normalize a title for generic title detection
+
+    Args:
+        title: Title to normalize
+
+    Returns:
+        Lowercased title without punctuation or repeated whitespace
+    """
+    # Basic normalization: lowercase, remove punctuation, collapse whitespace
+    normalized = normalize_unicode(title).lower()
+    # Remove punctuation except spaces
+    words = re_split(r"[^\w\s]", normalized)
+    normalized = " ".join(words)
+    # Collapse multiple spaces
+    normalized = " ".join(normalized.split())
+    return normalized.strip()
+
+
+def count_title_frequencies(titles: Iterable[str | None]) -> dict[str, int]:
+    """Count normalized titles for frequency-based generic title detection
+
+    Titles too long to ever be generic by frequency are skipped, which keeps
+    the table a fraction of the corpus size.
+
+    Args:
+        titles: Titles to count
+
+    Returns:
+        Normalized title -> number of occurrences
+    """
+    counts: Counter[str] = Counter()
+    for title in titles:
+        if title:
+            normalized = normalize_generic_title(title)
+            if normalized and len(normalized) < FREQUENCY_TITLE_MAX_LENGTH:
+                counts[normalized] += 1
+    return dict(counts)
+
 
 class GenericTitleDetector:
     """Detects generic titles like 'Collected Works', 'Poems', etc.
@@ -335,15 +393,52 @@ class GenericTitleDetector:
         # Create cached detection method with proper maxsize
         self._is_generic_cached = lru_cache(maxsize=cache_size)(self._is_generic_impl)
 
+    @classmethod
+    def from_title_counts(
+        cls,
+        title_counts: Iterable[Mapping[str, int]],
+        frequency_threshold: int = 10,
+        config: Optional["ConfigLoader"] = None,
+    ) -> "GenericTitleDetector":
+        """Create a detector from precomputed title frequency tables
+
+        Args:
+            title_counts: Tables from count_title_frequencies, e.g. one per index
+            frequency_threshold: Minimum occurrences to consider a title generic
+            config: Configuration loader for accessing stopwords
+
+        Returns:
+            Detector whose frequency rule covers all the tables
+        """
+        detector = cls(frequency_threshold=frequency_threshold, config=config)
+        for counts in title_counts:
+            detector.add_title_counts(counts)
+        return detector
+
     def _trim_title_counts(self) -> None:
         """Trim the counter to prevent unbounded memory growth"""
         if len(self.title_counts) > self.max_title_counts:
-            # Keep only the most common titles
+            # Titles seen once are the bulk of the counter and the least likely
+            # to become generic; dropping them is a single pass. Only if that
+            # isn't enough, keep the most common titles.
             self.title_counts = Counter(
-                dict(self.title_counts.most_common(self.max_title_counts // 2))
+                {title: count for title, count in self.title_counts.items() if count > 1}
             )
+            if len(self.title_counts) > self.max_title_counts // 2:
+                self.title_counts = Counter(
+                    dict(self.title_counts.most_common(self.max_title_counts // 2))
+                )
             self._trim_performed = True
 
+    def add_title_counts(self, counts: Mapping[str, int]) -> None:
+        """Add a precomputed title frequency table
+
+        Args:
+            counts: Normalized title -> occurrences, from count_title_frequencies
+        """
+        self.title_counts.update(counts)
+        self._is_generic_cached.cache_clear()
+
     def add_title(self, title: str) -> None:
         """Add a title to the frequency counter
 
@@ -353,11 +448,9 @@ class GenericTitleDetector:
         if not title:
             return
 
-        # Normalize Unicode before processing
-        title = normalize_unicode(title)
-
-        normalized = self._normalize_title(title)
-        if normalized:
+        normalized = normalize_generic_title(title)
+        # Longer titles are never generic by frequency, so they aren't counted
+        if normalized and len(normalized) < FREQUENCY_TITLE_MAX_LENGTH:
             self.title_counts[normalized] += 1
 
             # Trim counter if it gets too large
@@ -403,7 +496,10 @@ class GenericTitleDetector:
 
         # Check frequency-based detection
         # Add a minimum length requirement to avoid false positives on short titles
-        if len(normalized) < 20 and self.title_counts[normalized] >= self.frequency_threshold:
+        if (
+            len(normalized) < FREQUENCY_TITLE_MAX_LENGTH
+            and self.title_counts.get(normalized, 0) >= self.frequency_threshold
+        ):
             return True
 
         return False
@@ -435,8 +531,8 @@ class GenericTitleDetector:
                 return f"pattern: {pattern}"
 
         # Check frequency
-        count = self.title_counts[normalized]
-        if len(normalized) < 20 and count >= self.frequency_threshold:
+        count = self.title_counts.get(normalized, 0)
+        if len(normalized) < FREQUENCY_TITLE_MAX_LENGTH and count >= self.frequency_threshold:
             return f"frequency: {count} occurrences"
 
         return "none"
@@ -450,14 +546,7 @@ class GenericTitleDetector:
         Returns:
             Normalized title string
         """
-        # Basic normalization: lowercase, remove punctuation, collapse whitespace
-        normalized = title.lower()
-        # Remove punctuation except spaces
-        words = re_split(r"[^\w\s]", normalized)
-        normalized = " ".join(words)
-        # Collapse multiple spaces
-        normalized = " ".join(normalized.split())
-        return normalized.strip()
+        return normalize_generic_title(title)
 
     def get_stats(self) -> dict[str, int]:
         """Get statistics about the detector
@@ -468,7 +557,7 @@ class GenericTitleDetector:
         generic_by_freq = sum(
             1
             for title, count in self.title_counts.items()
-            if len(title) < 20 and count >= self.frequency_threshold
+            if len(title) < FREQUENCY_TITLE_MAX_LENGTH and count >= self.frequency_threshold
         )
 
         return {
@@ -11,6 +11,8 @@ from marc_pd_tool.core.domain.enums import MatchType
 from marc_pd_tool.core.domain.enums import STATUS_RULE_DESCRIPTIONS
 from marc_pd_tool.core.domain.match_result import MatchResult
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import PublicationStore
+from marc_pd_tool.core.domain.publication_store import PublicationView
 
 __all__ = [
     "CopyrightStatus",
@@ -19,6 +21,8 @@ __all__ = [
     "MatchResult",
     "MatchType",
     "Publication",
+    "PublicationStore",
+    "PublicationView",
     "STATUS_RULE_DESCRIPTIONS",
     "determine_copyright_status",
 ]
@@ -2,6 +2,9 @@
 
 """Index-related data structures"""
 
+# Standard library imports
+from typing import Iterable
+
 
 class IndexEntry:
     """Memory-efficient container for index entries - stores single int or set"""
@@ -11,6 +14,17 @@ class IndexEntry:
     def __init__(self) -> None:
         self._data: int | set[int] | None = None  # None, int, or set
 
+    @classmethod
+    def from_ids(cls, pub_ids: Iterable[int]) -> "IndexEntry":
+        """Create an entry holding the given publication IDs"""
+        entry = cls()
+        ids = set(pub_ids)
+        if len(ids) == 1:
+            entry._data = ids.pop()
+        elif ids:
+            entry._data = ids
+        return entry
+
     def add(self, pub_id: int) -> None:
         """Add a publication ID to this entry"""
         if self._data is None:
@@ -38,3 +52,12 @@ class IndexEntry:
     def is_empty(self) -> bool:
         """Check if entry is empty"""
         return self._data is None
+
+    def __len__(self) -> int:
+        """Number of publication IDs, without copying them"""
+        if self._data is None:
+            return 0
+        elif isinstance(self._data, int):
+            return 1
+        else:
+            return len(self._data)
@@ -0,0 +1,314 @@
+# marc_pd_tool/core/domain/publication_store.py
+
+"""Struct-of-arrays storage for the copyright/renewal reference corpus"""
+
+# Standard library imports
+from array import array
+from hashlib import blake2b
+from operator import attrgetter
+from typing import Iterable
+from typing import Iterator
+from typing import cast
+from typing import overload
+
+# Local imports
+from marc_pd_tool.core.domain.enums import CountryClassification
+from marc_pd_tool.core.domain.publication import Publication
+
+# Publication attributes kept per record. The cleaned title/author/... values are
+# stored alongside the originals so views never redo the cleanup.
+STORE_FIELDS = (
+    "original_title",
+    "original_author",
+    "original_main_author",
+    "pub_date",
+    "original_publisher",
+    "original_place",
+    "original_edition",
+    "lccn",
+    "normalized_lccn",
+    "language_code",
+    "language_detection_status",
+    "source",
+    "source_id",
+    "full_text",
+    "country_code",
+    "country_classification",
+    "title",
+    "author",
+    "main_author",
+    "publisher",
+    "place",
+    "edition",
+)
+
+# Year value for an unknown year
+NO_VALUE = -1
+
+
+class PublicationStore:
+    """Reference publications held as parallel int arrays over one string table
+
+    Every distinct string is stored once and each field is an array of string
+    ids, so a record costs a few bytes per field instead of a full Publication
+    object. Indexing returns a PublicationView that reads from the arrays.
+    """
+
+    def __init__(self) -> None:
+        # String table plus its reverse lookup. None is stored like any other
+        # value so missing fields need no special casing.
+        self._strings: list[str | None] = []
+        self._string_ids: dict[str | None, int] | None = {}
+        self._columns: dict[str, array[int]] = {name: array("i") for name in STORE_FIELDS}
+        self._years: array[int] = array("i")
+
+    @classmethod
+    def from_publications(cls, publications: Iterable[Publication]) -> "PublicationStore":
+        """Build a store from publications
+
+        Args:
+            publications: Publications to store, in index order
+
+        Returns:
+            Store holding the publications
+        """
+        store = cls()
+        store.extend(publications)
+        return store
+
+    def _lookup(self) -> dict[str | None, int]:
+        """String -> id lookup, rebuilt on first write after unpickling"""
+        if self._string_ids is None:
+            self._string_ids = {string: i for i, string in enumerate(self._strings)}
+        return self._string_ids
+
+    def append(self, pub: Publication) -> int:
+        """Add a publication
+
+        Args:
+            pub: Publication to store
+
+        Returns:
+            Position of the publication in the store
+        """
+        string_ids = self._lookup()
+        strings = self._strings
+
+        for name, column in self._columns.items():
+            value = getattr(pub, name)
+            if name == "country_classification":
+                value = value.value
+            string_id = string_ids.setdefault(value, len(strings))
+            if string_id == len(strings):
+                strings.append(value)
+            column.append(string_id)
+
+        self._years.append(NO_VALUE if pub.year is None else pub.year)
+        return len(self._years) - 1
+
+    def extend(self, publications: Iterable[Publication]) -> None:
+        """Add several publications, one column at a time
+
+        Args:
+            publications: Publications to store
+        """
+        pubs = list(publications)
+        string_ids = self._lookup()
+        intern = string_ids.setdefault
+
+        for name, column in self._columns.items():
+            if name == "country_classification":
+                values = [pub.country_classification.value for pub in pubs]
+            else:
+                values = list(map(attrgetter(name), pubs))
+            column.extend([intern(value, len(string_ids)) for value in values])
+
+        self._years.extend([NO_VALUE if pub.year is None else pub.year for pub in pubs])
+        if len(string_ids) > len(self._strings):
+            self._strings.extend(list(string_ids)[len(self._strings) :])
+
+    def subset(self, positions: Iterable[int]) -> "PublicationStore":
+        """Build a store holding only some of the records
+
+        Args:
+            positions: Record positions to keep, in their new order
+
+        Returns:
+            New store whose string table holds only the strings the kept records use
+        """
+        positions = list(positions)
+        store = PublicationStore()
+        string_ids = store._lookup()
+        intern = string_ids.setdefault
+        strings = self._strings
+
+        for name, column in self._columns.items():
+            store._columns[name] = array(
+                "i", [intern(strings[column[i]], len(string_ids)) for i in positions]
+            )
+        store._years = array("i", [self._years[i] for i in positions])
+        store._strings = list(string_ids)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._years)
+
+    @overload
+    def __getitem__(self, index: int) -> "PublicationView": ...
+
+    @overload
+    def __getitem__(self, index: "slice[int | None]") -> list["PublicationView"]: ...
+
+    def __getitem__(
+        self, index: "int | slice[int | None]"
+    ) -> "PublicationView | list[PublicationView]":
+        if isinstance(index, slice):
+            return [PublicationView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("publication index out of range")
+        return PublicationView(self, index)
+
+    def __iter__(self) -> Iterator["PublicationView"]:
+        for i in range(len(self)):
+            yield PublicationView(self, i)
+
+    def value(self, field: str, index: int) -> str | None:
+        """Read one string field of one record
+
+        Args:
+            field: Name from STORE_FIELDS
+            index: Record position
+
+        Returns:
+            Stored string, or None if the field was empty
+        """
+        return self._strings[self._columns[field][index]]
+
+    def year(self, index: int) -> int | None:
+        """Publication year of one record, or None if unknown"""
+        year = self._years[index]
+        return None if year == NO_VALUE else year
+
+    def fingerprint(self) -> str:
+        """Hash of every stored record, identifying the store's contents
+
+        Returns:
+            Hex digest
+        """
+        digest = blake2b(digest_size=16)
+        digest.update(self._years.tobytes())
+        for name in STORE_FIELDS:
+            digest.update(self._columns[name].tobytes())
+        # None and "" have different ids in the columns, so joining can't confuse them
+        joined = "\0".join("" if string is None else string for string in self._strings)
+        digest.update(joined.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle the arrays and the string table, without the lookup"""
+        return {"strings": self._strings, "columns": self._columns, "years": self._years}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        # The lookup is only needed to add records; a loaded index is read-only
+        # in practice, so skip the memory until something is appended
+        self._strings = cast(list[str | None], state["strings"])
+        self._string_ids = None
+        self._columns = cast(dict[str, "array[int]"], state["columns"])
+        self._years = cast("array[int]", state["years"])
+
+
+class _StringField[D: str | None]:
+    """Read-only view attribute for a stored string field"""
+
+    def __init__(self, name: str, default: D) -> None:
+        self.name = name
+        self.default = default
+        self.__doc__ = f"Stored {name}"
+
+    @overload
+    def __get__(self, view: None, owner: type["PublicationView"]) -> "_StringField[D]": ...
+
+    @overload
+    def __get__(self, view: "PublicationView", owner: type["PublicationView"]) -> str | D: ...
+
+    def __get__(
+        self, view: "PublicationView | None", owner: type["PublicationView"]
+    ) -> "_StringField[D] | str | D":
+        if view is None:
+            return self
+        value = view._store.value(self.name, view._index)
+        return self.default if value is None else value
+
+
+class PublicationView:
+    """Lightweight read-only Publication stand-in backed by a PublicationStore"""
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: PublicationStore, index: int) -> None:
+        self._store = store
+        self._index = index
+
+    original_title = _StringField("original_title", "")
+    original_author = _StringField("original_author", None)
+    original_main_author = _StringField("original_main_author", None)
+    pub_date = _StringField("pub_date", None)
+    original_publisher = _StringField("original_publisher", None)
+    original_place = _StringField("original_place", None)
+    original_edition = _StringField("original_edition", None)
+    lccn = _StringField("lccn", None)
+    normalized_lccn = _StringField("normalized_lccn", "")
+    language_code = _StringField("language_code", "")
+    language_detection_status = _StringField("language_detection_status", "")
+    source = _StringField("source", None)
+    source_id = _StringField("source_id", None)
+    full_text = _StringField("full_text", None)
+    country_code = _StringField("country_code", None)
+    title = _StringField("title", "")
+    author = _StringField("author", "")
+    main_author = _StringField("main_author", "")
+    publisher = _StringField("publisher", "")
+    place = _StringField("place", "")
+    edition = _StringField("edition", "")
+
+    @property
+    def year(self) -> int | None:
+        """Publication year"""
+        return self._store.year(self._index)
+
+    @property
+    def country_classification(self) -> CountryClassification:
+        """Country classification"""
+        return CountryClassification(self._store.value("country_classification", self._index))
+
+    def to_publication(self) -> Publication:
+        """Build a full Publication with the stored values
+
+        Returns:
+            New Publication equal to the one that was stored
+        """
+        pub = Publication(
+            title=self.original_title,
+            author=self.original_author,
+            main_author=self.original_main_author,
+            pub_date=self.pub_date,
+            publisher=self.original_publisher,
+            place=self.original_place,
+            edition=self.original_edition,
+            lccn=self.lccn,
+            normalized_lccn=self.normalized_lccn,
+            source=self.source,
+            source_id=self.source_id,
+            country_code=self.country_code,
+            country_classification=self.country_classification,
+            full_text=self.full_text,
+            year=self.year,
+        )
+        pub.language_code = self.language_code
+        pub.language_detection_status = self.language_detection_status
+        return pub
+
+    def __repr__(self) -> str:
+        return f"PublicationView({self._index}, {self.original_title!r})"
@@ -59,6 +59,7 @@ from marc_pd_tool.core.types.protocols import MatcherProtocol
 from marc_pd_tool.core.types.protocols import MultiFormatExporterProtocol
 from marc_pd_tool.core.types.protocols import PersistentCacheProtocol
 from marc_pd_tool.core.types.protocols import ProcessorProtocol
+from marc_pd_tool.core.types.protocols import ReferencePublicationProtocol
 from marc_pd_tool.core.types.protocols import StemmerProtocol
 from marc_pd_tool.core.types.protocols import TextProcessorProtocol
 from marc_pd_tool.core.types.protocols import ThresholdConfigProtocol
@@ -105,6 +106,7 @@ __all__ = [
     # Processing Protocols
     "ProcessorProtocol",
     "TextProcessorProtocol",
+    "ReferencePublicationProtocol",
     "MatcherProtocol",
     # Cache Protocols
     "CacheProtocol",
@@ -6,6 +6,8 @@
 from typing import TypeVar
 
 # Local imports
+from marc_pd_tool.core.domain.publication import Publication
+
 # Local imports - import protocol directly to avoid forward reference
 from marc_pd_tool.core.types.protocols import StemmerProtocol
 
@@ -18,7 +20,7 @@ type StemmerDict = dict[str, StemmerProtocol]  # Language -> Stemmer object (no
 # Batch processing info type - using type statement for clarity
 type BatchProcessingInfo = tuple[
     int,  # batch_id (i + 1)
-    str,  # batch_path (path to pickled batch file)
+    str | list[Publication],  # batch_path (pickled batch file, or in-memory batch when pipelined)
     str,  # worker_cache_dir
     str,  # copyright_dir
     str,  # renewal_dir
@@ -37,7 +39,7 @@ type BatchProcessingInfo = tuple[
     bool,  # brute_force_missing_year
     int | None,  # min_year
     int | None,  # max_year
-    str,  # result_temp_dir (path to directory for result pickle files)
+    str | None,  # result_temp_dir (directory for result pickle files, None to return results)
 ]
 
 # Generic type variables
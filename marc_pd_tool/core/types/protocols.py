@@ -27,6 +27,7 @@ if TYPE_CHECKING:
     from marc_pd_tool.core.types.json import JSONType
     from marc_pd_tool.infrastructure import CacheManager
     from marc_pd_tool.infrastructure.config import ConfigLoader
+    from marc_pd_tool.infrastructure.persistence import RunDirectory
 
 
 # Type alias for CSV row data
@@ -100,6 +101,32 @@ class TextProcessorProtocol(Protocol):
     def remove_stopwords(self, tokens: list[str]) -> list[str]: ...
 
 
+class ReferencePublicationProtocol(Protocol):
+    """Protocol for the copyright/renewal publications matching compares against.
+
+    Satisfied by Publication and by the PublicationView of an indexed store.
+    """
+
+    @property
+    def title(self) -> str: ...
+    @property
+    def author(self) -> str: ...
+    @property
+    def main_author(self) -> str: ...
+    @property
+    def publisher(self) -> str: ...
+    @property
+    def pub_date(self) -> str | None: ...
+    @property
+    def year(self) -> int | None: ...
+    @property
+    def source_id(self) -> str | None: ...
+    @property
+    def full_text(self) -> str | None: ...
+    @property
+    def normalized_lccn(self) -> str: ...
+
+
 class MatcherProtocol(Protocol):
     """Protocol for matching operations."""
 
@@ -267,15 +294,18 @@ class BatchAnalyzerProtocol(Protocol):
     registration_index: "DataIndexer | None"
     renewal_index: "DataIndexer | None"
     generic_detector: "GenericTitleDetector | None"
+    batch_costs: dict[str, float]
+    run_directory: "RunDirectory | None"
 
     def _compute_config_hash(self, config_dict: dict[str, "JSONType"]) -> str: ...
     def _load_and_index_data(self, options: "AnalysisOptions") -> None: ...
+    def _load_copyright_status_counts_from_stats_files(self, result_temp_dir: str) -> None: ...
     def export_results(
         self, output_path: str, formats: list[str] | None, single_file: bool
     ) -> None: ...
     def _process_batches_parallel(
         self,
-        batch_paths: list[str],
+        batch_paths: list[str] | Iterator[list[Publication]],
         num_processes: int,
         year_tolerance: int,
         title_threshold: int,
@@ -289,6 +319,13 @@ class BatchAnalyzerProtocol(Protocol):
         brute_force_missing_year: bool,
         min_year: int | None,
         max_year: int | None,
+        shared_indexes: bool = False,
+        executor: str = "processes",
+        batch_size: int = 100,
+        target_batch_seconds: float = 0.0,
+        batch_costs: dict[str, float] | None = None,
+        run_directory: "RunDirectory | None" = None,
+        use_result_cache: bool = False,
     ) -> list[Publication]: ...
 
 
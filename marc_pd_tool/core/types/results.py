@@ -60,6 +60,14 @@ class MatchResultDict(TypedDict):
     generic_title_info: Optional[GenericTitleInfoDict]
 
 
+class FileFingerprintDict(TypedDict):
+    """Size, modification time and content hash of one cache source file"""
+
+    size: int
+    mtime_ns: int
+    hash: str | None
+
+
 class CacheMetadata(TypedDict):
     """Type for cache metadata"""
 
@@ -68,6 +76,8 @@ class CacheMetadata(TypedDict):
     source_mtimes: list[float]
     cache_time: float
     additional_deps: dict[str, "JSONType"]
+    # Source path -> relative file path -> fingerprint (empty for mtime validation)
+    source_fingerprints: dict[str, dict[str, FileFingerprintDict]]
 
 
 __all__ = [
@@ -75,5 +85,6 @@ __all__ = [
     "GenericTitleInfoDict",
     "CopyrightRecordDict",
     "MatchResultDict",
+    "FileFingerprintDict",
     "CacheMetadata",
 ]
@@ -8,5 +8,17 @@ like data indexing and MARC file parsing.
 
 # Local imports
 from marc_pd_tool.infrastructure.cache._manager import CacheManager
+from marc_pd_tool.infrastructure.cache._result_cache import MatchResultCache
+from marc_pd_tool.infrastructure.cache._result_cache import apply_match_outcome
+from marc_pd_tool.infrastructure.cache._result_cache import match_outcome
+from marc_pd_tool.infrastructure.cache._result_cache import match_record_key
+from marc_pd_tool.infrastructure.cache._result_cache import match_run_key
 
-__all__ = ["CacheManager"]
+__all__ = [
+    "CacheManager",
+    "MatchResultCache",
+    "apply_match_outcome",
+    "match_outcome",
+    "match_record_key",
+    "match_run_key",
+]
@@ -0,0 +1,119 @@
+# marc_pd_tool/infrastructure/cache/_access_log.py
+
+"""Persisted write and hit history of cache entries"""
+
+# Standard library imports
+from json import JSONDecodeError
+from json import dump
+from json import load
+from logging import getLogger
+from os import getpid
+from os import replace
+from os.path import exists
+from threading import get_ident
+from time import time
+
+# Third party imports
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+logger = getLogger(__name__)
+
+ACCESS_LOG_FILENAME = "access.json"
+
+# Number of hit times kept per entry
+HIT_HISTORY_LENGTH = 10
+
+
+class CacheAccessRecord(BaseModel):
+    """When a cache entry was written and used"""
+
+    written: float
+    last_access: float
+    hits: int = 0
+    recent_hits: list[float] = []
+
+
+class CacheAccessLog:
+    """Last-access times and hit counts of cache entries, kept in one JSON file
+
+    Entries are named by their directory relative to the cache root. The file
+    is re-read before every update, so several processes sharing a cache lose
+    at most a concurrent update, never the whole history.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the log
+
+        Args:
+            path: JSON file holding the log
+        """
+        self.path = path
+
+    def read(self) -> dict[str, CacheAccessRecord]:
+        """Read every record, ignoring an unreadable log
+
+        Returns:
+            Entry name -> access record
+        """
+        if not exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                data = load(f)
+            return {name: CacheAccessRecord.model_validate(value) for name, value in data.items()}
+        except (OSError, JSONDecodeError, AttributeError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable cache access log {self.path}: {e}")
+            return {}
+
+    def _write(self, records: dict[str, CacheAccessRecord]) -> None:
+        """Replace the log file atomically"""
+        try:
+            temp_path = f"{self.path}.{getpid()}.{get_ident()}.tmp"
+            with open(temp_path, "w") as f:
+                dump({name: record.model_dump() for name, record in sorted(records.items())}, f)
+            replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save cache access log {self.path}: {e}")
+
+    def record_write(self, entry: str) -> None:
+        """Record that an entry was (re)written
+
+        Args:
+            entry: Entry name
+        """
+        records = self.read()
+        now = time()
+        record = records.get(entry)
+        if record is None:
+            records[entry] = CacheAccessRecord(written=now, last_access=now)
+        else:
+            record.written = now
+            record.last_access = now
+        self._write(records)
+
+    def record_hit(self, entry: str) -> None:
+        """Record that an entry was loaded
+
+        Args:
+            entry: Entry name
+        """
+        records = self.read()
+        now = time()
+        record = records.setdefault(entry, CacheAccessRecord(written=now, last_access=now))
+        record.last_access = now
+        record.hits += 1
+        record.recent_hits = (record.recent_hits + [now])[-HIT_HISTORY_LENGTH:]
+        self._write(records)
+
+    def forget(self, entries: list[str]) -> None:
+        """Drop the records of removed entries
+
+        Args:
+            entries: Entry names
+        """
+        records = self.read()
+        if any(entry in records for entry in entries):
+            for entry in entries:
+                records.pop(entry, None)
+            self._write(records)
@@ -0,0 +1,146 @@
+# marc_pd_tool/infrastructure/cache/_build_lock.py
+
+"""Cross-process lock around building a cache entry"""
+
+# Standard library imports
+from json import JSONDecodeError
+from json import dumps
+from json import loads
+from logging import getLogger
+from os import O_CREAT
+from os import O_EXCL
+from os import O_WRONLY
+from os import close
+from os import getpid
+from os import kill
+from os import open as os_open
+from os import remove
+from os import write
+from os.path import getmtime
+from socket import gethostname
+from time import monotonic
+from time import sleep
+from time import time
+
+logger = getLogger(__name__)
+
+
+class CacheBuildLock:
+    """Lock file that lets one process build a cache entry while others wait
+
+    The lock is a file created with O_CREAT | O_EXCL, so exactly one process
+    can hold it, and holds the owner's host and pid. Waiters poll until the
+    file disappears. A lock whose owner is gone (a dead pid on this host, or
+    a file older than stale_after from another host) is removed so a crashed
+    job can't block the others forever.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        timeout: float | None = None,
+        poll_interval: float = 1.0,
+        stale_after: float = 12 * 3600,
+    ) -> None:
+        """Initialize the lock
+
+        Args:
+            path: Lock file path
+            timeout: Seconds to wait for another holder before going ahead without
+                the lock (None to wait as long as the holder is alive)
+            poll_interval: Seconds between checks while waiting
+            stale_after: Age in seconds after which a lock held from another host
+                is considered abandoned
+        """
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.held = False
+        self.waited = False
+
+    def _try_create(self) -> bool:
+        """Create the lock file, returning False if it already exists"""
+        try:
+            fd = os_open(self.path, O_CREAT | O_EXCL | O_WRONLY)
+        except FileExistsError:
+            return False
+        try:
+            owner = {"host": gethostname(), "pid": getpid(), "started": time()}
+            write(fd, dumps(owner).encode("utf-8"))
+        finally:
+            close(fd)
+        return True
+
+    def _is_stale(self) -> bool:
+        """Check whether the current lock file was left behind by a dead owner"""
+        try:
+            with open(self.path, "r") as f:
+                owner = loads(f.read() or "{}")
+            age = time() - getmtime(self.path)
+        except FileNotFoundError:
+            return False
+        except (OSError, JSONDecodeError):
+            # Unreadable or still being written; only old files count as stale
+            owner = {}
+            try:
+                age = time() - getmtime(self.path)
+            except OSError:
+                return False
+
+        if owner.get("host") == gethostname() and isinstance(owner.get("pid"), int):
+            try:
+                kill(owner["pid"], 0)
+            except ProcessLookupError:
+                return True
+            except PermissionError:
+                # The process exists but belongs to another user
+                return False
+            return False
+        return age > self.stale_after
+
+    def acquire(self) -> bool:
+        """Take the lock, waiting while another process holds it
+
+        Returns:
+            True if the lock was held by someone else first, in which case the
+            entry they were building may now be cached
+        """
+        deadline = None if self.timeout is None else monotonic() + self.timeout
+        while not self._try_create():
+            if not self.waited:
+                logger.info(f"Waiting for another process building the cache ({self.path})")
+            self.waited = True
+            if self._is_stale():
+                logger.warning(f"Removing stale cache build lock {self.path}")
+                try:
+                    remove(self.path)
+                except FileNotFoundError:
+                    pass
+                continue
+            if deadline is not None and monotonic() >= deadline:
+                logger.warning(
+                    f"Gave up waiting for cache build lock {self.path} after {self.timeout:.0f}s"
+                )
+                return True
+            sleep(self.poll_interval)
+
+        self.held = True
+        return self.waited
+
+    def release(self) -> None:
+        """Release the lock if this process holds it"""
+        if not self.held:
+            return
+        self.held = False
+        try:
+            remove(self.path)
+        except FileNotFoundError:
+            logger.warning(f"Cache build lock {self.path} was removed while held")
+
+    def __enter__(self) -> "CacheBuildLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
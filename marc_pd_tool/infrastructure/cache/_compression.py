@@ -0,0 +1,76 @@
+# marc_pd_tool/infrastructure/cache/_compression.py
+
+"""Optional compression of cache files
+
+GzipFile and LZMAFile are buffered binary streams with the BinaryIO interface,
+so they are returned as BinaryIO like plain files.
+"""
+
+# Standard library imports
+from gzip import GzipFile
+from lzma import LZMAFile
+from typing import BinaryIO
+from typing import Literal
+from typing import cast
+
+type CompressionMethod = Literal["none", "gzip", "lzma"]
+
+# Leading bytes that identify a compressed file, so files are read correctly
+# whatever compression setting was active when they were written
+_GZIP_MAGIC = b"\x1f\x8b"
+_XZ_MAGIC = b"\xfd7zXZ\x00"
+
+
+def open_cache_writer(path: str, method: CompressionMethod, level: int) -> BinaryIO:
+    """Open a cache file for writing with the given compression
+
+    Args:
+        path: File to write
+        method: "none", "gzip" or "lzma"
+        level: Compression level from 0 to 9; lower is faster, higher is smaller
+
+    Returns:
+        Writable binary file object
+    """
+    if method == "gzip":
+        return cast(BinaryIO, GzipFile(path, "wb", compresslevel=max(1, min(level, 9))))
+    if method == "lzma":
+        return cast(BinaryIO, LZMAFile(path, "wb", preset=max(0, min(level, 9))))
+    return open(path, "wb")
+
+
+def open_cache_reader(path: str) -> BinaryIO:
+    """Open a cache file for reading, detecting its compression from its first bytes
+
+    Args:
+        path: File to read
+
+    Returns:
+        Readable binary file object yielding the uncompressed content
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(_XZ_MAGIC))
+    if magic.startswith(_GZIP_MAGIC):
+        return cast(BinaryIO, GzipFile(path, "rb"))
+    if magic.startswith(_XZ_MAGIC):
+        return cast(BinaryIO, LZMAFile(path, "rb"))
+    return open(path, "rb")
+
+
+def wrap_cache_reader(f: BinaryIO) -> BinaryIO:
+    """Wrap an open cache file in the matching decompressor
+
+    Args:
+        f: Seekable binary file object; the caller closes it
+
+    Returns:
+        Readable binary file object yielding the uncompressed content
+    """
+    f.seek(0)
+    magic = f.read(len(_XZ_MAGIC))
+    f.seek(0)
+    if magic.startswith(_GZIP_MAGIC):
+        return cast(BinaryIO, GzipFile(fileobj=f, mode="rb"))
+    if magic.startswith(_XZ_MAGIC):
+        return cast(BinaryIO, LZMAFile(f, "rb"))
+    return f
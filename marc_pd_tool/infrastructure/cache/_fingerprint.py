@@ -0,0 +1,169 @@
+# marc_pd_tool/infrastructure/cache/_fingerprint.py
+
+"""Per-file fingerprints of cache source data"""
+
+# Standard library imports
+from hashlib import blake2b
+from logging import getLogger
+from os import scandir
+from os import stat
+from os.path import basename
+from os.path import isdir
+from os.path import join
+
+# Local imports
+from marc_pd_tool.core.types.results import FileFingerprintDict
+
+logger = getLogger(__name__)
+
+# (size, mtime_ns) of every file under a source path, keyed by relative path
+type SourceScan = dict[str, tuple[int, int]]
+
+
+def _hash_file(path: str) -> str:
+    """Hash the raw bytes of a file
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SourceFingerprinter:
+    """Scans cache source paths once and compares them with recorded fingerprints
+
+    A fingerprint is the size, mtime_ns and (optionally) content hash of every
+    file under a source path. Scans and hashes are memoized, so validating and
+    saving several cache entries built from the same source directory costs a
+    single directory scan, and each changed file is hashed at most once.
+    Files that were touched but still have the same content hash don't count
+    as changed.
+    """
+
+    def __init__(self, hash_contents: bool = True) -> None:
+        """Initialize the fingerprinter
+
+        Args:
+            hash_contents: Record content hashes so that touched but unchanged
+                files keep caches valid. Without hashes any mtime change counts.
+        """
+        self.hash_contents = hash_contents
+        self.scan_count = 0
+        self._scans: dict[str, SourceScan] = {}
+        self._hashes: dict[tuple[str, int, int], str] = {}
+
+    def forget(self) -> None:
+        """Drop memoized scans and hashes so the next check sees current files"""
+        self._scans.clear()
+        self._hashes.clear()
+
+    def scan(self, source_path: str) -> SourceScan:
+        """Size and mtime_ns of every file under a source path, scanned once
+
+        Args:
+            source_path: Source file or directory
+
+        Returns:
+            Relative path -> (size, mtime_ns); a single file is keyed by its name
+        """
+        scan = self._scans.get(source_path)
+        if scan is None:
+            scan = {}
+            if isdir(source_path):
+                self._scan_directory(source_path, "", scan)
+            else:
+                file_stat = stat(source_path)
+                scan[basename(source_path)] = (file_stat.st_size, file_stat.st_mtime_ns)
+            self._scans[source_path] = scan
+            self.scan_count += 1
+        return scan
+
+    def _scan_directory(self, directory: str, prefix: str, scan: SourceScan) -> None:
+        """Add the files under a directory to a scan"""
+        with scandir(directory) as entries:
+            for entry in entries:
+                key = f"{prefix}{entry.name}"
+                if entry.is_dir():
+                    self._scan_directory(entry.path, f"{key}/", scan)
+                elif entry.is_file():
+                    entry_stat = entry.stat()
+                    scan[key] = (entry_stat.st_size, entry_stat.st_mtime_ns)
+
+    def _content_hash(self, source_path: str, key: str, size: int, mtime_ns: int) -> str:
+        """Content hash of one scanned file, computed once per size/mtime"""
+        path = join(source_path, key) if isdir(source_path) else source_path
+        memo_key = (path, size, mtime_ns)
+        content_hash = self._hashes.get(memo_key)
+        if content_hash is None:
+            content_hash = self._hashes[memo_key] = _hash_file(path)
+        return content_hash
+
+    def fingerprint(
+        self, source_path: str, previous: dict[str, FileFingerprintDict] | None = None
+    ) -> dict[str, FileFingerprintDict]:
+        """Fingerprint every file under a source path
+
+        Args:
+            source_path: Source file or directory
+            previous: Earlier fingerprint of the same path; hashes of files whose
+                size and mtime are unchanged are reused instead of recomputed
+
+        Returns:
+            Relative path -> fingerprint
+        """
+        previous = previous or {}
+        fingerprints: dict[str, FileFingerprintDict] = {}
+        for key, (size, mtime_ns) in sorted(self.scan(source_path).items()):
+            old = previous.get(key)
+            if old is not None and old["size"] == size and old["mtime_ns"] == mtime_ns:
+                content_hash = old["hash"]
+            elif self.hash_contents:
+                content_hash = self._content_hash(source_path, key, size, mtime_ns)
+            else:
+                content_hash = None
+            fingerprints[key] = {"size": size, "mtime_ns": mtime_ns, "hash": content_hash}
+        return fingerprints
+
+    def changed_files(
+        self, source_path: str, recorded: dict[str, FileFingerprintDict]
+    ) -> tuple[list[str], list[str]]:
+        """Compare the files under a source path with a recorded fingerprint
+
+        Args:
+            source_path: Source file or directory
+            recorded: Fingerprint saved with a cache entry
+
+        Returns:
+            Tuple of (files added, removed or changed; files only touched)
+        """
+        scan = self.scan(source_path)
+        changed = sorted(set(scan).symmetric_difference(recorded))
+        touched: list[str] = []
+
+        for key, (size, mtime_ns) in scan.items():
+            old = recorded.get(key)
+            if old is None or (old["size"] == size and old["mtime_ns"] == mtime_ns):
+                continue
+            if (
+                old["size"] == size
+                and old["hash"] is not None
+                and self.hash_contents
+                and self._content_hash(source_path, key, size, mtime_ns) == old["hash"]
+            ):
+                touched.append(key)
+            else:
+                changed.append(key)
+
+        return changed, touched
+
+    def latest_mtime(self, source_path: str) -> float:
+        """Latest file modification time under a source path, in seconds"""
+        scan = self.scan(source_path)
+        return max((mtime_ns for _, mtime_ns in scan.values()), default=0) / 1e9
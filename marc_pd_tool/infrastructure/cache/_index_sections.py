@@ -0,0 +1,102 @@
+# marc_pd_tool/infrastructure/cache/_index_sections.py
+
+"""Cached indexes stored as separately loadable section files"""
+
+# Standard library imports
+from logging import getLogger
+from os.path import join
+from pickle import load as pickle_load
+from threading import Lock
+from typing import BinaryIO
+from typing import NamedTuple
+
+# Local imports
+from marc_pd_tool.infrastructure.cache._compression import wrap_cache_reader
+
+logger = getLogger(__name__)
+
+
+class SectionedIndex(NamedTuple):
+    """Content of the header file of an index cached in sections
+
+    Each save writes the sections under a fresh token, so a header only ever
+    refers to the section files written with it.
+    """
+
+    token: str
+    sections: tuple[str, ...]
+    header: object
+
+
+def section_filename(name: str, section: str, token: str) -> str:
+    """File name of one section of a cached index
+
+    Args:
+        name: Index name, e.g. "registration"
+        section: Section name, e.g. "title_index"
+        token: Token of the save that wrote the section
+
+    Returns:
+        File name within the cache entry directory
+    """
+    return f"{name}.{section}.{token}.pkl"
+
+
+class IndexSectionReader:
+    """Section files of one cached index, opened together and read on first use
+
+    All files are opened when the index header is loaded. An open file stays
+    readable after it is replaced or removed, so a concurrent rewrite or
+    eviction of the cache entry can't mix sections from different builds.
+    """
+
+    def __init__(self, cache_subdir: str, name: str, index: SectionedIndex) -> None:
+        """Open the section files of a cached index
+
+        Args:
+            cache_subdir: Cache entry directory
+            name: Index name the sections were saved under
+            index: Header file content naming the sections
+
+        Raises:
+            OSError: If a section file is missing or unreadable
+        """
+        self._lock = Lock()
+        self._files: dict[str, BinaryIO] = {}
+        self._loaded: dict[str, object] = {}
+        try:
+            for section in index.sections:
+                path = join(cache_subdir, section_filename(name, section, index.token))
+                self._files[section] = open(path, "rb")
+        except OSError:
+            self.close()
+            raise
+
+    def __call__(self, section: str) -> object:
+        """Read one section, at most once
+
+        Args:
+            section: Section name
+
+        Returns:
+            Unpickled section value
+        """
+        with self._lock:
+            if section not in self._loaded:
+                f = self._files.pop(section)
+                try:
+                    with wrap_cache_reader(f) as reader:
+                        self._loaded[section] = pickle_load(reader)
+                finally:
+                    f.close()
+                logger.debug(f"Loaded cached index section {section}")
+            return self._loaded[section]
+
+    def close(self) -> None:
+        """Close the files of sections that were never read"""
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def __del__(self) -> None:
+        self.close()
@@ -6,25 +6,45 @@
 from json import dump as json_dump
 from json import load as json_load
 from logging import getLogger
+from os import getpid
+from os import listdir
 from os import makedirs
+from os import remove
+from os import replace
 from os import walk
 from os.path import exists
 from os.path import getmtime
+from os.path import getsize
 from os.path import isdir
 from os.path import join
+from os.path import relpath
 from pickle import dump as pickle_dump
 from pickle import load as pickle_load
 from shutil import rmtree
+from threading import get_ident
 from time import time
+from typing import Literal
 from typing import Mapping
 from typing import Optional  # Needed for forward references
 from typing import TYPE_CHECKING
+from uuid import uuid4
 
 # Local imports
 from marc_pd_tool.core.types.aliases import T
 from marc_pd_tool.core.types.json import JSONDict
 from marc_pd_tool.core.types.json import JSONType
 from marc_pd_tool.core.types.results import CacheMetadata
+from marc_pd_tool.core.types.results import FileFingerprintDict
+from marc_pd_tool.infrastructure.cache._access_log import ACCESS_LOG_FILENAME
+from marc_pd_tool.infrastructure.cache._access_log import CacheAccessLog
+from marc_pd_tool.infrastructure.cache._build_lock import CacheBuildLock
+from marc_pd_tool.infrastructure.cache._compression import CompressionMethod
+from marc_pd_tool.infrastructure.cache._compression import open_cache_reader
+from marc_pd_tool.infrastructure.cache._compression import open_cache_writer
+from marc_pd_tool.infrastructure.cache._fingerprint import SourceFingerprinter
+from marc_pd_tool.infrastructure.cache._index_sections import IndexSectionReader
+from marc_pd_tool.infrastructure.cache._index_sections import SectionedIndex
+from marc_pd_tool.infrastructure.cache._index_sections import section_filename
 
 if TYPE_CHECKING:
     # Local imports
@@ -38,13 +58,36 @@ logger = getLogger(__name__)
 class CacheManager:
     """Manages persistent caching of parsed data and built indexes"""
 
-    def __init__(self, cache_dir: str = ".marcpd_cache"):
+    def __init__(
+        self,
+        cache_dir: str = ".marcpd_cache",
+        validation: Literal["fingerprint", "mtime"] = "fingerprint",
+        hash_contents: bool = True,
+        max_bytes: int | None = None,
+        compression: CompressionMethod = "none",
+        compression_level: int = 1,
+    ):
         """Initialize cache manager with specified cache directory
 
         Args:
             cache_dir: Base directory for cache storage
+            validation: "fingerprint" compares per-file size, mtime and content hash
+                from one memoized scan per source path; "mtime" compares the latest
+                modification time of each source tree, walked on every check
+            hash_contents: In fingerprint mode, hash source files so that touched
+                but unchanged files don't invalidate caches
+            max_bytes: Size budget for all cache entries; least recently used entries
+                are evicted after a write exceeds it (None for no limit)
+            compression: Compression for newly written cache files: "none", "gzip"
+                or "lzma". Files are read correctly whatever they were written with.
+            compression_level: 0-9; lower is faster, higher is smaller
         """
         self.cache_dir = cache_dir
+        self.validation = validation
+        self.fingerprinter = SourceFingerprinter(hash_contents=hash_contents)
+        self.max_bytes = max_bytes
+        self.compression: CompressionMethod = compression
+        self.compression_level = compression_level
         self.copyright_cache_dir = join(cache_dir, "copyright_data")
         self.renewal_cache_dir = join(cache_dir, "renewal_data")
         self.marc_cache_dir = join(cache_dir, "marc_data")
@@ -61,6 +104,16 @@ class CacheManager:
         ]:
             makedirs(cache_subdir, exist_ok=True)
 
+        self.access_log = CacheAccessLog(join(cache_dir, ACCESS_LOG_FILENAME))
+        self.locks_dir = join(cache_dir, "locks")
+
+    def refresh_sources(self) -> None:
+        """Forget memoized source scans so the next cache check rescans the sources
+
+        Call once per run; within a run every source directory is scanned once.
+        """
+        self.fingerprinter.forget()
+
     def _get_directory_modification_time(self, directory_path: str) -> float:
         """Get the latest modification time of all files in a directory
 
@@ -86,6 +139,61 @@ class CacheManager:
 
         return max_mtime
 
+    def build_lock(self, name: str, timeout: float | None = None) -> CacheBuildLock:
+        """Lock that serializes building one cache entry across processes
+
+        Use as a context manager around "check the cache, build on a miss, save".
+        If the lock's waited flag is set, another process held it first and the
+        cache should be checked again before building.
+
+        Args:
+            name: Entry name, e.g. "indexes_1930_1940"
+            timeout: Seconds to wait before building anyway (None to wait for the
+                other process for as long as it is alive)
+
+        Returns:
+            Unacquired lock
+        """
+        makedirs(self.locks_dir, exist_ok=True)
+        return CacheBuildLock(join(self.locks_dir, f"{name}.lock"), timeout=timeout)
+
+    def index_build_lock(
+        self,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        brute_force: bool = False,
+        timeout: float | None = None,
+    ) -> CacheBuildLock:
+        """Build lock for the indexes of a year range
+
+        Args:
+            min_year: Minimum year filter
+            max_year: Maximum year filter
+            brute_force: Whether brute-force mode is active
+            timeout: Seconds to wait before building anyway
+
+        Returns:
+            Unacquired lock
+        """
+        name = self._get_year_range_cache_filename("indexes", min_year, max_year, brute_force)
+        return self.build_lock(name.replace(".pkl", ""), timeout=timeout)
+
+    def year_range_suffix(
+        self, min_year: int | None = None, max_year: int | None = None, brute_force: bool = False
+    ) -> str:
+        """Name of the cache subdirectories holding one year range, e.g. "1930_1940"
+
+        Args:
+            min_year: Minimum year filter
+            max_year: Maximum year filter
+            brute_force: Whether brute-force mode is active
+
+        Returns:
+            Subdirectory name used under copyright_data, renewal_data and indexes
+        """
+        filename = self._get_year_range_cache_filename("entry", min_year, max_year, brute_force)
+        return filename.removeprefix("entry_").removesuffix(".pkl")
+
     def _get_year_range_cache_filename(
         self,
         base_name: str,
@@ -116,6 +224,19 @@ class CacheManager:
             # This shouldn't happen but provide fallback
             return f"{base_name}_all.pkl"
 
+    @staticmethod
+    def _temp_path(path: str) -> str:
+        """Unique temporary name a file is written under before being renamed into place"""
+        return f"{path}.{getpid()}.{get_ident()}.tmp"
+
+    @staticmethod
+    def _remove_temp(temp_path: str) -> None:
+        """Remove a temporary file left by a failed write"""
+        try:
+            remove(temp_path)
+        except OSError:
+            pass
+
     def _save_metadata(self, cache_subdir: str, metadata: CacheMetadata) -> None:
         """Save cache metadata to JSON file
 
@@ -124,10 +245,13 @@ class CacheManager:
             metadata: Metadata dictionary to save
         """
         metadata_file = join(cache_subdir, "metadata.json")
+        temp_file = self._temp_path(metadata_file)
         try:
-            with open(metadata_file, "w") as f:
+            with open(temp_file, "w") as f:
                 json_dump(metadata, f, indent=2)
+            replace(temp_file, metadata_file)
         except Exception as e:  # pragma: no cover - JSON serialization/IO errors
+            self._remove_temp(temp_file)
             logger.warning(f"Failed to save cache metadata to {metadata_file}: {e}")
 
     def _load_metadata(self, cache_subdir: str) -> CacheMetadata | None:
@@ -153,6 +277,7 @@ class CacheManager:
                     source_mtimes=data.get("source_mtimes", []),
                     cache_time=data.get("cache_time", 0.0),
                     additional_deps=data.get("additional_deps", {}),
+                    source_fingerprints=data.get("source_fingerprints", {}),
                 )
         except Exception as e:  # pragma: no cover - JSON deserialization/IO errors
             logger.warning(f"Failed to load cache metadata from {metadata_file}: {e}")
@@ -164,7 +289,12 @@ class CacheManager:
         source_paths: list[str],
         additional_dependencies: Mapping[str, JSONType | None] | None = None,
     ) -> bool:
-        """Check if cache is valid by comparing source file modification times
+        """Check if cache is valid by comparing source fingerprints or modification times
+
+        In fingerprint mode, metadata that was saved with fingerprints is
+        checked file by file; files that were only touched keep the cache valid
+        and their new mtimes are written back so they aren't hashed again.
+        Older metadata without fingerprints falls back to modification times.
 
         Args:
             cache_subdir: Cache subdirectory path
@@ -183,12 +313,25 @@ class CacheManager:
             logger.debug(f"Cache invalid: source paths changed")
             return False
 
-        # Check modification times for each source path
+        # Check fingerprints or modification times for each source path
+        touched = False
         for source_path in source_paths:
             if not exists(source_path):
                 logger.debug(f"Cache invalid: source path {source_path} no longer exists")
                 return False
 
+            recorded = metadata["source_fingerprints"].get(source_path)
+            if self.validation == "fingerprint" and recorded is not None:
+                changed, touched_files = self.fingerprinter.changed_files(source_path, recorded)
+                if changed:
+                    logger.debug(
+                        f"Cache invalid: {len(changed)} files changed in {source_path} "
+                        f"({', '.join(changed[:5])})"
+                    )
+                    return False
+                touched = touched or bool(touched_files)
+                continue
+
             # Get current modification time
             if exists(source_path):
                 if isdir(source_path):
@@ -221,6 +364,14 @@ class CacheManager:
                 logger.debug(f"Cache invalid: additional dependencies changed")
                 return False
 
+        if touched:
+            metadata["source_fingerprints"] = {
+                source_path: self.fingerprinter.fingerprint(source_path, recorded)
+                for source_path, recorded in metadata["source_fingerprints"].items()
+                if source_path in source_paths
+            }
+            self._save_metadata(cache_subdir, metadata)
+
         return True
 
     def _save_cache_data(
@@ -244,37 +395,78 @@ class CacheManager:
             True if successful, False otherwise
         """
         try:
-            # Save the data
-            data_file = join(cache_subdir, filename)
-            with open(data_file, "wb") as f:
-                pickle_dump(data, f)
-
-            # Create metadata
-            modification_times: dict[str, float] = {}
-            for source_path in source_paths:
-                if exists(source_path):
-                    if isdir(source_path):
-                        modification_times[source_path] = self._get_directory_modification_time(
-                            source_path
-                        )
-                    else:
-                        modification_times[source_path] = getmtime(source_path)
-
-            metadata: CacheMetadata = {
-                "version": "1.0",
-                "source_files": source_paths,
-                "source_mtimes": [modification_times.get(p, 0.0) for p in source_paths],
-                "cache_time": time(),
-                "additional_deps": dict(additional_dependencies) if additional_dependencies else {},
-            }
-
-            self._save_metadata(cache_subdir, metadata)
+            self._write_cache_file(join(cache_subdir, filename), data)
+            self._record_save(cache_subdir, source_paths, additional_dependencies)
             return True
-
         except Exception as e:
             logger.error(f"Failed to save cache data to {cache_subdir}/{filename}: {e}")
             return False
 
+    def _write_cache_file(self, data_file: str, data: object) -> None:
+        """Pickle data to a cache file
+
+        The data is written under a temporary name and renamed into place, so
+        concurrent readers see either the old file or the complete new one.
+
+        Args:
+            data_file: File to write
+            data: Data to pickle
+        """
+        temp_file = self._temp_path(data_file)
+        try:
+            with open_cache_writer(temp_file, self.compression, self.compression_level) as f:
+                pickle_dump(data, f)
+            replace(temp_file, data_file)
+        except BaseException:
+            self._remove_temp(temp_file)
+            raise
+
+    def _record_save(
+        self,
+        cache_subdir: str,
+        source_paths: list[str],
+        additional_dependencies: Mapping[str, JSONType | None] | None = None,
+    ) -> None:
+        """Write the metadata of a cache entry after its data files were saved
+
+        Args:
+            cache_subdir: Cache subdirectory path
+            source_paths: List of source file/directory paths
+            additional_dependencies: Additional dependencies to track
+        """
+        modification_times: dict[str, float] = {}
+        fingerprints: dict[str, dict[str, FileFingerprintDict]] = {}
+        previous = self._load_metadata(cache_subdir)
+        previous_fingerprints = previous["source_fingerprints"] if previous else {}
+        for source_path in source_paths:
+            if not exists(source_path):
+                continue
+            if self.validation == "fingerprint":
+                # Hashes of files unchanged since the previous save are reused
+                fingerprints[source_path] = self.fingerprinter.fingerprint(
+                    source_path, previous_fingerprints.get(source_path)
+                )
+                modification_times[source_path] = self.fingerprinter.latest_mtime(source_path)
+            elif isdir(source_path):
+                modification_times[source_path] = self._get_directory_modification_time(source_path)
+            else:
+                modification_times[source_path] = getmtime(source_path)
+
+        metadata: CacheMetadata = {
+            "version": "1.0",
+            "source_files": source_paths,
+            "source_mtimes": [modification_times.get(p, 0.0) for p in source_paths],
+            "cache_time": time(),
+            "additional_deps": dict(additional_dependencies) if additional_dependencies else {},
+            "source_fingerprints": fingerprints,
+        }
+
+        self._save_metadata(cache_subdir, metadata)
+        entry = self._entry_name(cache_subdir)
+        self.access_log.record_write(entry)
+        if self.max_bytes is not None:
+            self.enforce_budget(keep=entry)
+
     def _load_cache_data(self, cache_subdir: str, filename: str) -> T | None:
         """Load data from cache
 
@@ -290,12 +482,34 @@ class CacheManager:
             return None
 
         try:
-            with open(data_file, "rb") as f:
-                return pickle_load(f)  # type: ignore[no-any-return]
+            with open_cache_reader(data_file) as f:
+                data = pickle_load(f)
+            self.access_log.record_hit(self._entry_name(cache_subdir))
+            return data  # type: ignore[no-any-return]
         except Exception as e:
             logger.warning(f"Failed to load cache data from {data_file}: {e}")
             return None
 
+    def _entry_name(self, cache_subdir: str) -> str:
+        """Name of a cache entry: its directory relative to the cache root"""
+        return relpath(cache_subdir, self.cache_dir).replace("\\", "/")
+
+    def entry_sizes(self) -> dict[str, int]:
+        """Size in bytes of every cache entry
+
+        An entry is a directory holding a metadata.json next to its data files.
+
+        Returns:
+            Entry name -> total size of its files
+        """
+        sizes: dict[str, int] = {}
+        for root, _, files in walk(self.cache_dir):
+            if "metadata.json" in files:
+                sizes[self._entry_name(root)] = sum(
+                    getsize(join(root, name)) for name in files if exists(join(root, name))
+                )
+        return sizes
+
     # Public interface methods
 
     def get_cached_copyright_data(
@@ -558,7 +772,7 @@ class CacheManager:
         min_year: int | None = None,
         max_year: int | None = None,
         brute_force: bool = False,
-    ) -> tuple["DataIndexer", Optional["DataIndexer"]] | None:
+    ) -> tuple["DataIndexer", "DataIndexer"] | None:
         """Get cached indexes if valid
 
         Args:
@@ -580,23 +794,188 @@ class CacheManager:
         )
         cache_subdir = join(self.indexes_cache_dir, year_suffix)
 
-        if not exists(cache_subdir):
+        if exists(cache_subdir):
+            additional_deps = {
+                "config_hash": config_hash,
+                "min_year": min_year,
+                "max_year": max_year,
+                "brute_force": brute_force,
+            }
+            if self._is_cache_valid(cache_subdir, [copyright_dir, renewal_dir], additional_deps):
+                logger.debug(f"Loading indexes from cache for year range: {year_suffix}")
+                reg_index = self._load_index(cache_subdir, "registration")
+                ren_index = self._load_index(cache_subdir, "renewal")
+                if reg_index is not None and ren_index is not None:
+                    return (reg_index, ren_index)
+        else:
             logger.info(f"Index cache not found at: {cache_subdir}")
+
+        return self._derive_indexes_from_superset(
+            copyright_dir, renewal_dir, config_hash, min_year, max_year, brute_force
+        )
+
+    def _find_superset_index_cache(
+        self,
+        copyright_dir: str,
+        renewal_dir: str,
+        config_hash: str,
+        min_year: int | None,
+        max_year: int | None,
+    ) -> tuple[str, int | None, int | None] | None:
+        """Find the narrowest valid cached index a requested year range can be derived from
+
+        Args:
+            copyright_dir: Path to copyright XML directory
+            renewal_dir: Path to renewal TSV directory
+            config_hash: Hash of configuration the indexes must have been built with
+            min_year: Requested minimum year (None for no minimum)
+            max_year: Requested maximum year (None for no maximum)
+
+        Returns:
+            Tuple of (cache subdirectory, its min_year, its max_year) or None
+        """
+        if not exists(self.indexes_cache_dir):
             return None
 
-        additional_deps = {
-            "config_hash": config_hash,
-            "min_year": min_year,
-            "max_year": max_year,
-            "brute_force": brute_force,
-        }
-        if self._is_cache_valid(cache_subdir, [copyright_dir, renewal_dir], additional_deps):
-            logger.debug(f"Loading indexes from cache for year range: {year_suffix}")
-            reg_index = self._load_cache_data(cache_subdir, "registration.pkl")
-            ren_index = self._load_cache_data(cache_subdir, "renewal.pkl")
-            if reg_index is not None and ren_index is not None:  # type: ignore[unreachable]
-                return (reg_index, ren_index)  # type: ignore[unreachable]
-        return None
+        candidates: list[tuple[int, str, int | None, int | None]] = []
+        for name in listdir(self.indexes_cache_dir):
+            cache_subdir = join(self.indexes_cache_dir, name)
+            metadata = self._load_metadata(cache_subdir) if isdir(cache_subdir) else None
+            if not metadata:
+                continue
+            deps = metadata["additional_deps"]
+            if deps.get("config_hash") != config_hash:
+                continue
+            cached_min = deps.get("min_year")
+            cached_max = deps.get("max_year")
+            if not (cached_min is None or isinstance(cached_min, int)) or not (
+                cached_max is None or isinstance(cached_max, int)
+            ):
+                continue
+            covers_min = cached_min is None or (min_year is not None and cached_min <= min_year)
+            covers_max = cached_max is None or (max_year is not None and max_year <= cached_max)
+            if not (covers_min and covers_max):
+                continue
+            if (cached_min, cached_max) == (min_year, max_year):
+                # The exact range was already checked by the caller
+                continue
+            if not self._is_cache_valid(cache_subdir, [copyright_dir, renewal_dir], deps):
+                continue
+            if not self.year_subset_matches_build(
+                copyright_dir, renewal_dir, cached_min, cached_max, min_year, max_year
+            ):
+                continue
+            span = (cached_max if cached_max is not None else 9999) - (cached_min or 0)
+            candidates.append((span, cache_subdir, cached_min, cached_max))
+
+        if not candidates:
+            return None
+        _, cache_subdir, cached_min, cached_max = min(candidates)
+        return cache_subdir, cached_min, cached_max
+
+    def year_subset_matches_build(
+        self,
+        copyright_dir: str,
+        renewal_dir: str,
+        cached_min: int | None,
+        cached_max: int | None,
+        min_year: int | None,
+        max_year: int | None,
+    ) -> bool:
+        """Check whether a year subset of a cached index equals a build for the range
+
+        DataIndexer.subset_by_year filters by each entry's own year, while a
+        build for the range also skips whole files by the year in their path.
+
+        Args:
+            copyright_dir: Path to copyright XML directory
+            renewal_dir: Path to renewal TSV directory
+            cached_min: Minimum year the cached index was built with
+            cached_max: Maximum year the cached index was built with
+            min_year: Requested minimum year
+            max_year: Requested maximum year
+
+        Returns:
+            True if the derived indexes hold the same entries as built ones
+        """
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence import CopyrightDataLoader
+        from marc_pd_tool.infrastructure.persistence import RenewalDataLoader
+
+        loaders = (
+            CopyrightDataLoader(copyright_dir, cache_dir=self.cache_dir),
+            RenewalDataLoader(renewal_dir, cache_dir=self.cache_dir),
+        )
+        if all(
+            loader.year_filter_matches_load(cached_min, cached_max, min_year, max_year)
+            for loader in loaders
+        ):
+            return True
+        logger.info(
+            f"Not deriving years {min_year or 'earliest'}-{max_year or 'present'} from cached "
+            f"years {cached_min or 'earliest'}-{cached_max or 'present'}: source files the "
+            "range skips by path year hold entries within it"
+        )
+        return False
+
+    def _derive_indexes_from_superset(
+        self,
+        copyright_dir: str,
+        renewal_dir: str,
+        config_hash: str,
+        min_year: int | None,
+        max_year: int | None,
+        brute_force: bool,
+    ) -> tuple["DataIndexer", "DataIndexer"] | None:
+        """Derive indexes for a year range from a cached index covering a wider range
+
+        The derived indexes are cached under the requested range, so the next
+        run with the same range loads them directly.
+
+        Args:
+            copyright_dir: Path to copyright XML directory
+            renewal_dir: Path to renewal TSV directory
+            config_hash: Hash of configuration for cache validation
+            min_year: Requested minimum year
+            max_year: Requested maximum year
+            brute_force: Whether brute-force mode is active
+
+        Returns:
+            Tuple of (registration_index, renewal_index) or None if no superset is cached
+        """
+        superset = self._find_superset_index_cache(
+            copyright_dir, renewal_dir, config_hash, min_year, max_year
+        )
+        if superset is None:
+            return None
+        cache_subdir, cached_min, cached_max = superset
+
+        reg_index = self._load_index(cache_subdir, "registration")
+        ren_index = self._load_index(cache_subdir, "renewal")
+        if reg_index is None or ren_index is None:
+            return None
+
+        start = time()
+        reg_subset = reg_index.subset_by_year(min_year, max_year)
+        ren_subset = ren_index.subset_by_year(min_year, max_year)
+        logger.info(
+            f"Derived indexes for years {min_year or 'earliest'}-{max_year or 'present'} from "
+            f"cached years {cached_min or 'earliest'}-{cached_max or 'present'} in "
+            f"{time() - start:.1f}s ({len(reg_subset.publications):,} registration, "
+            f"{len(ren_subset.publications):,} renewal entries)"
+        )
+
+        self.cache_indexes(
+            copyright_dir,
+            renewal_dir,
+            config_hash,
+            reg_subset,
+            ren_subset,
+            min_year,
+            max_year,
+            brute_force,
+        )
+        return reg_subset, ren_subset
 
     def cache_indexes(
         self,
@@ -654,9 +1033,9 @@ class CacheManager:
         logger.info(
             f"  Saving registration index ({len(registration_index.publications):,} entries)..."
         )
-        reg_success = self._save_cache_data(
+        reg_success = self._save_index(
             cache_subdir,
-            "registration.pkl",
+            "registration",
             registration_index,
             [copyright_dir, renewal_dir],
             additional_deps,
@@ -665,12 +1044,8 @@ class CacheManager:
             logger.info(f"    ✓ Cached registration index")
 
         logger.info(f"  Saving renewal index ({len(renewal_index.publications):,} entries)...")
-        ren_success = self._save_cache_data(
-            cache_subdir,
-            "renewal.pkl",
-            renewal_index,
-            [copyright_dir, renewal_dir],
-            additional_deps,
+        ren_success = self._save_index(
+            cache_subdir, "renewal", renewal_index, [copyright_dir, renewal_dir], additional_deps
         )
         if ren_success:
             logger.info(f"    ✓ Cached renewal index")
@@ -679,8 +1054,114 @@ class CacheManager:
             logger.info(f"✓ Successfully cached both indexes")
         return reg_success and ren_success
 
+    def _save_index(
+        self,
+        cache_subdir: str,
+        name: str,
+        index: "DataIndexer",
+        source_paths: list[str],
+        additional_dependencies: Mapping[str, JSONType | None],
+    ) -> bool:
+        """Save an index as a small header file plus one file per section
+
+        The sections are written first under a fresh token and the header that
+        names them last, so readers never see a header without its sections.
+        Section files of earlier saves are removed afterwards; readers that
+        already opened them keep reading the old files.
+
+        Args:
+            cache_subdir: Cache entry directory
+            name: Index name, e.g. "registration"
+            index: Index to save
+            source_paths: List of source file/directory paths
+            additional_dependencies: Additional dependencies to track
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import DataIndexer
+
+        try:
+            header_data: object = index
+            if isinstance(index, DataIndexer):
+                token = uuid4().hex
+                header, sections = index.split_sections()
+                for section, value in sections.items():
+                    self._write_cache_file(
+                        join(cache_subdir, section_filename(name, section, token)), value
+                    )
+                header_data = SectionedIndex(token, tuple(sections), header)
+            self._write_cache_file(join(cache_subdir, f"{name}.pkl"), header_data)
+            self._record_save(cache_subdir, source_paths, additional_dependencies)
+        except Exception as e:
+            logger.error(f"Failed to save cache data to {cache_subdir}/{name}.pkl: {e}")
+            return False
+
+        current = (
+            {section_filename(name, section, header_data.token) for section in header_data.sections}
+            if isinstance(header_data, SectionedIndex)
+            else set()
+        )
+        for filename in listdir(cache_subdir):
+            if (
+                filename.startswith(f"{name}.")
+                and filename.endswith(".pkl")
+                and filename != f"{name}.pkl"
+                and filename not in current
+            ):
+                try:
+                    remove(join(cache_subdir, filename))
+                except OSError:
+                    pass
+        return True
+
+    def _load_index(self, cache_subdir: str, name: str) -> Optional["DataIndexer"]:
+        """Load an index header, leaving its sections to be read on first use
+
+        Args:
+            cache_subdir: Cache entry directory
+            name: Index name, e.g. "registration"
+
+        Returns:
+            Index, or None if it isn't cached or its sections can't be opened
+        """
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import DataIndexer
+        from marc_pd_tool.application.processing.indexer import INDEX_SECTIONS
+
+        data: object = self._load_cache_data(cache_subdir, f"{name}.pkl")
+        if isinstance(data, SectionedIndex):
+            present = set(data.sections)
+        elif isinstance(data, DataIndexer):
+            # Cached whole by an earlier version
+            present = set(data.loaded_sections)
+        else:
+            return data  # type: ignore[return-value]
+        missing = [section for section in INDEX_SECTIONS if section not in present]
+        if missing:
+            logger.info(f"Cached {name} index predates {', '.join(missing)}; rebuilding")
+            return None
+        if not isinstance(data, SectionedIndex):
+            return data
+
+        try:
+            reader = IndexSectionReader(cache_subdir, name, data)
+        except OSError as e:
+            logger.warning(f"Failed to open cached index sections in {cache_subdir}: {e}")
+            return None
+        index: "DataIndexer" = data.header  # type: ignore[assignment]
+        index.attach_sections(reader)
+        return index
+
     def get_cached_generic_detector(
-        self, copyright_dir: str, renewal_dir: str, detector_config: dict[str, int | bool]
+        self,
+        copyright_dir: str,
+        renewal_dir: str,
+        detector_config: dict[str, int | bool],
+        min_year: int | None = None,
+        max_year: int | None = None,
+        brute_force: bool = False,
     ) -> Optional["GenericTitleDetector"]:
         """Get cached generic title detector if valid
 
@@ -688,11 +1169,19 @@ class CacheManager:
             copyright_dir: Path to copyright XML directory
             renewal_dir: Path to renewal TSV directory
             detector_config: Generic detector configuration
+            min_year: Minimum year of the data whose titles the detector counted
+            max_year: Maximum year of the data whose titles the detector counted
+            brute_force: Whether brute-force mode was active
 
         Returns:
             Cached detector or None if not valid
         """
-        additional_deps: JSONDict = {"detector_config": detector_config}  # type: ignore[dict-item]
+        additional_deps: JSONDict = {
+            "detector_config": detector_config,  # type: ignore[dict-item]
+            "min_year": min_year,
+            "max_year": max_year,
+            "brute_force": brute_force,
+        }
         if self._is_cache_valid(
             self.generic_detector_cache_dir, [copyright_dir, renewal_dir], additional_deps
         ):
@@ -706,6 +1195,9 @@ class CacheManager:
         renewal_dir: str,
         detector_config: dict[str, int | bool],
         detector: "GenericTitleDetector",
+        min_year: int | None = None,
+        max_year: int | None = None,
+        brute_force: bool = False,
     ) -> bool:
         """Cache populated generic title detector
 
@@ -714,12 +1206,20 @@ class CacheManager:
             renewal_dir: Path to renewal TSV directory
             detector_config: Generic detector configuration
             detector: Populated detector to cache
+            min_year: Minimum year of the data whose titles the detector counted
+            max_year: Maximum year of the data whose titles the detector counted
+            brute_force: Whether brute-force mode was active
 
         Returns:
             True if successful
         """
         logger.info(f"Caching generic title detector...")
-        additional_deps: JSONDict = {"detector_config": detector_config}  # type: ignore[dict-item]
+        additional_deps: JSONDict = {
+            "detector_config": detector_config,  # type: ignore[dict-item]
+            "min_year": min_year,
+            "max_year": max_year,
+            "brute_force": brute_force,
+        }
         result = self._save_cache_data(
             self.generic_detector_cache_dir,
             "detector.pkl",
@@ -749,6 +1249,66 @@ class CacheManager:
         except Exception as e:
             logger.error(f"Failed to clear caches: {e}")
 
+    def remove_entry(self, entry: str) -> None:
+        """Delete one cache entry
+
+        Args:
+            entry: Entry name as reported by get_cache_info, e.g. "indexes/1930_1940"
+        """
+        entry_dir = join(self.cache_dir, entry)
+        try:
+            if exists(entry_dir):
+                rmtree(entry_dir)
+            if "/" not in entry:
+                # Entries stored directly in a component directory keep the directory
+                makedirs(entry_dir, exist_ok=True)
+        except OSError as e:
+            logger.error(f"Failed to remove cache entry {entry}: {e}")
+        self.access_log.forget([entry])
+
+    def enforce_budget(self, max_bytes: int | None = None, keep: str | None = None) -> list[str]:
+        """Evict least recently used entries until the cache fits its size budget
+
+        Args:
+            max_bytes: Budget to enforce, defaults to the manager's max_bytes
+            keep: Entry that must not be evicted, such as the one just written
+
+        Returns:
+            Names of the evicted entries
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        if budget is None:
+            return []
+
+        sizes = self.entry_sizes()
+        total = sum(sizes.values())
+        if total <= budget:
+            return []
+
+        records = self.access_log.read()
+        # Entries the log doesn't know about are the oldest
+        by_last_access = sorted(
+            sizes, key=lambda name: records[name].last_access if name in records else 0.0
+        )
+
+        evicted: list[str] = []
+        for entry in by_last_access:
+            if total <= budget:
+                break
+            if entry == keep:
+                continue
+            self.remove_entry(entry)
+            total -= sizes[entry]
+            evicted.append(entry)
+            logger.info(f"Evicted cache entry {entry} ({sizes[entry] / 1024 / 1024:.1f} MB)")
+
+        if total > budget:
+            logger.warning(
+                f"Cache is {total / 1024 / 1024:.1f} MB after eviction, "
+                f"over its {budget / 1024 / 1024:.1f} MB budget"
+            )
+        return evicted
+
     def get_cache_info(self) -> JSONDict:
         """Get information about current cache state
 
@@ -774,4 +1334,21 @@ class CacheManager:
             metadata = self._load_metadata(component_dir)
             components_dict[component_name] = {"cached": metadata is not None, "metadata": metadata}
 
+        sizes = self.entry_sizes() if exists(self.cache_dir) else {}
+        records = self.access_log.read()
+        entries: JSONDict = {}
+        for entry, size in sorted(sizes.items()):
+            record = records.get(entry)
+            entries[entry] = {
+                "size_bytes": size,
+                "written": record.written if record else None,
+                "last_access": record.last_access if record else None,
+                "hits": record.hits if record else 0,
+                "recent_hits": list(record.recent_hits) if record else [],
+            }
+        info["entries"] = entries
+        info["total_bytes"] = sum(sizes.values())
+        info["max_bytes"] = self.max_bytes
+        info["compression"] = self.compression
+
         return info
@@ -0,0 +1,227 @@
+# marc_pd_tool/infrastructure/cache/_result_cache.py
+
+"""Match results of earlier runs, reused for MARC records that haven't changed
+
+A record's match results depend only on the fields matching reads, on the
+registration and renewal indexes and on the matching settings. The cache
+stores each record's results under a hash of its matching fields, within a
+run key that hashes everything else, so a monthly rerun of a catalog with a
+few changed records only matches those records.
+
+The cache is one SQLite database in the cache directory. Worker processes and
+threads each open their own connection; the database is in WAL mode, so
+lookups never wait for another worker's writes.
+"""
+
+# Standard library imports
+from hashlib import blake2b
+from logging import getLogger
+from os import getpid
+from os import makedirs
+from os.path import join
+from pickle import HIGHEST_PROTOCOL
+from pickle import dumps
+from pickle import loads
+from sqlite3 import Connection
+from sqlite3 import Error
+from sqlite3 import connect
+from threading import local
+
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+
+logger = getLogger(__name__)
+
+RESULT_CACHE_FILENAME = "match_results.sqlite3"
+
+# Part of every run key; bump when a change to matching changes its results
+RESULT_CACHE_VERSION = 1
+
+# Publication attributes matching reads from a MARC record
+MATCH_INPUT_FIELDS = (
+    "original_title",
+    "original_author",
+    "original_main_author",
+    "original_publisher",
+    "year",
+    "normalized_lccn",
+    "language_code",
+)
+
+# Publication attributes matching sets on a MARC record
+MATCH_OUTPUT_FIELDS = (
+    "registration_match",
+    "renewal_match",
+    "generic_title_detected",
+    "registration_generic_title",
+    "renewal_generic_title",
+    "generic_detection_reason",
+)
+
+# Keys per lookup query, below SQLite's limit on query parameters
+LOOKUP_CHUNK_SIZE = 500
+
+# Seconds a write waits for another worker's write to finish
+WRITE_TIMEOUT = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    run_key TEXT NOT NULL,
+    record_key BLOB NOT NULL,
+    outcome BLOB NOT NULL,
+    PRIMARY KEY (run_key, record_key)
+) WITHOUT ROWID
+"""
+
+
+def match_record_key(pub: Publication) -> bytes:
+    """Hash of the fields matching reads from a MARC record
+
+    Args:
+        pub: MARC publication
+
+    Returns:
+        16-byte digest
+    """
+    digest = blake2b(digest_size=16)
+    digest.update(repr(tuple(getattr(pub, name) for name in MATCH_INPUT_FIELDS)).encode())
+    return digest.digest()
+
+
+def match_run_key(*parts: object) -> str:
+    """Hash of everything besides the record that match results depend on
+
+    Args:
+        parts: Index fingerprints, configuration hash, thresholds, ...
+
+    Returns:
+        Hex digest
+    """
+    return blake2b(repr((RESULT_CACHE_VERSION, parts)).encode(), digest_size=16).hexdigest()
+
+
+class _ConnectionLocal(local):
+    """Per-thread connection and the process that opened it"""
+
+    connection: Connection
+    pid: int | None = None
+
+
+class MatchResultCache:
+    """Match results of MARC records within one run key
+
+    Instances are sent to worker processes with every batch; only the path
+    and the run key are pickled, and each process or thread opens its own
+    connection on first use.
+    """
+
+    def __init__(self, path: str, run_key: str) -> None:
+        """Initialize the cache
+
+        Args:
+            path: SQLite database file
+            run_key: Key of the indexes and settings, from match_run_key()
+        """
+        self.path = path
+        self.run_key = run_key
+        self._local = _ConnectionLocal()
+
+    @classmethod
+    def open(cls, cache_dir: str, run_key: str) -> "MatchResultCache | None":
+        """Open the result cache of a cache directory, creating it if needed
+
+        Args:
+            cache_dir: Cache directory
+            run_key: Key of the indexes and settings, from match_run_key()
+
+        Returns:
+            The cache, or None if the database can't be opened
+        """
+        cache = cls(join(cache_dir, RESULT_CACHE_FILENAME), run_key)
+        try:
+            makedirs(cache_dir, exist_ok=True)
+            with connect(cache.path, timeout=WRITE_TIMEOUT) as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute(SCHEMA)
+            connection.close()
+        except (OSError, Error) as e:
+            logger.warning(f"Match result cache unavailable ({cache.path}): {e}")
+            return None
+        return cache
+
+    def __getstate__(self) -> dict[str, object]:
+        """Pickle the location only; connections belong to one process"""
+        return {"path": self.path, "run_key": self.run_key}
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.path = str(state["path"])
+        self.run_key = str(state["run_key"])
+        self._local = _ConnectionLocal()
+
+    def _connection(self) -> Connection:
+        """Connection of the current thread, reopened after a fork"""
+        if self._local.pid != getpid():
+            connection = connect(self.path, timeout=WRITE_TIMEOUT)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = getpid()
+        return self._local.connection
+
+    def lookup(self, keys: list[bytes]) -> dict[bytes, tuple[object, ...]]:
+        """Cached results of records
+
+        Args:
+            keys: Record keys, from match_record_key()
+
+        Returns:
+            Record key -> values of MATCH_OUTPUT_FIELDS, for the keys that are cached
+        """
+        found: dict[bytes, tuple[object, ...]] = {}
+        try:
+            connection = self._connection()
+            for start in range(0, len(keys), LOOKUP_CHUNK_SIZE):
+                chunk = keys[start : start + LOOKUP_CHUNK_SIZE]
+                rows = connection.execute(
+                    "SELECT record_key, outcome FROM results WHERE run_key = ? "
+                    f"AND record_key IN ({', '.join('?' * len(chunk))})",
+                    [self.run_key, *chunk],
+                )
+                for key, outcome in rows:
+                    found[key] = loads(outcome)
+        except Error as e:
+            logger.warning(f"Match result cache lookup failed: {e}")
+            return {}
+        return found
+
+    def store(self, outcomes: dict[bytes, tuple[object, ...]]) -> None:
+        """Cache results of records, in one transaction
+
+        Args:
+            outcomes: Record key -> values of MATCH_OUTPUT_FIELDS
+        """
+        if not outcomes:
+            return
+        try:
+            connection = self._connection()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO results (run_key, record_key, outcome) "
+                    "VALUES (?, ?, ?)",
+                    [
+                        (self.run_key, key, dumps(outcome, protocol=HIGHEST_PROTOCOL))
+                        for key, outcome in outcomes.items()
+                    ],
+                )
+        except Error as e:
+            logger.warning(f"Could not save match results to the cache: {e}")
+
+
+def match_outcome(pub: Publication) -> tuple[object, ...]:
+    """Values of MATCH_OUTPUT_FIELDS of a matched publication"""
+    return tuple(getattr(pub, name) for name in MATCH_OUTPUT_FIELDS)
+
+
+def apply_match_outcome(pub: Publication, outcome: tuple[object, ...]) -> None:
+    """Set cached values of MATCH_OUTPUT_FIELDS on a publication"""
+    for name, value in zip(MATCH_OUTPUT_FIELDS, outcome):
+        setattr(pub, name, value)
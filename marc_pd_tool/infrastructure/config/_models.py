@@ -4,6 +4,7 @@
 
 # Standard library imports
 from pathlib import Path
+from typing import Literal
 
 # Third party imports
 from pydantic import BaseModel
@@ -20,6 +21,9 @@ class ProcessingConfig(BaseModel):
     """Processing configuration with validation"""
 
     batch_size: int = Field(100, gt=0, description="Records per batch")
+    target_batch_seconds: float = Field(
+        30.0, ge=0, description="Target seconds per batch for adaptive sizing (0 to disable)"
+    )
     max_workers: int | None = Field(None, ge=1, description="Number of worker processes")
     score_everything_mode: bool = Field(
         False, description="Find best match regardless of thresholds"
@@ -65,6 +69,23 @@ class CachingConfig(BaseModel):
     no_cache: bool = Field(
         False, description="Disable caching"
     )  # Will rename to disable_cache later
+    max_size_mb: int | None = Field(
+        None, gt=0, description="Cache size budget in MB; least recently used entries are evicted"
+    )
+    compression: Literal["none", "gzip", "lzma"] = Field(
+        "none", description="Compression for cache files (gzip is faster, lzma smaller)"
+    )
+    compression_level: int = Field(
+        1, ge=0, le=9, description="Compression level, 0-9 (lower is faster, higher is smaller)"
+    )
+    result_cache: bool = Field(
+        True, description="Reuse match results of MARC records unchanged since an earlier run"
+    )
+
+    @property
+    def max_bytes(self) -> int | None:
+        """Cache size budget in bytes, or None for no limit"""
+        return self.max_size_mb * 1024 * 1024 if self.max_size_mb is not None else None
 
 
 class LoggingConfig(BaseModel):
@@ -110,6 +110,8 @@ def log_run_summary(
     undetermined_records: int,
     error_records: int,
     skipped_no_year: int = 0,
+    cached_records: int = 0,
+    computed_records: int = 0,
 ) -> None:
     """Log final run summary with statistics
 
@@ -126,6 +128,8 @@ def log_run_summary(
         undetermined_records: Undetermined status records
         error_records: Records with errors
         skipped_no_year: Records skipped due to missing year (default 0)
+        cached_records: Records whose match results came from the result cache (default 0)
+        computed_records: Records matched while the result cache was in use (default 0)
     """
     logger = getLogger(__name__)
 
@@ -163,6 +167,12 @@ def log_run_summary(
         ]
     )
 
+    # Only show the result cache when it was used
+    if cached_records or computed_records:
+        summary_lines.append(
+            f"Match results: {cached_records:,} reused from cache, {computed_records:,} computed"
+        )
+
     # Only show statistics if records were actually processed
     if total_records > 0:
         # Calculate percentages
@@ -12,5 +12,15 @@ from marc_pd_tool.infrastructure.persistence._copyright_loader import (
 )
 from marc_pd_tool.infrastructure.persistence._marc_loader import MarcLoader
 from marc_pd_tool.infrastructure.persistence._renewal_loader import RenewalDataLoader
+from marc_pd_tool.infrastructure.persistence._run_directory import BatchResultEntry
+from marc_pd_tool.infrastructure.persistence._run_directory import CompletedBatch
+from marc_pd_tool.infrastructure.persistence._run_directory import RunDirectory
 
-__all__ = ["CopyrightDataLoader", "MarcLoader", "RenewalDataLoader"]
+__all__ = [
+    "BatchResultEntry",
+    "CompletedBatch",
+    "CopyrightDataLoader",
+    "MarcLoader",
+    "RenewalDataLoader",
+    "RunDirectory",
+]
@@ -0,0 +1,250 @@
+# marc_pd_tool/infrastructure/persistence/_columnar_shard.py
+
+"""Compact columnar files for handing loaded publications between processes"""
+
+# Standard library imports
+from array import array
+from collections import Counter
+from json import dumps
+from json import loads
+from mmap import ACCESS_READ
+from mmap import mmap
+from os import replace
+from struct import Struct
+from sys import byteorder
+from typing import Literal
+
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence._string_interner import INTERNED_FIELDS
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
+from marc_pd_tool.shared.utils.memory_utils import paused_gc
+
+SHARD_MAGIC = b"MPDCOL01"
+
+# Column name -> Publication attribute holding the original value
+SHARD_COLUMNS = {
+    "title": "original_title",
+    "author": "original_author",
+    "pub_date": "pub_date",
+    "publisher": "original_publisher",
+    "place": "original_place",
+    "lccn": "lccn",
+    "source": "source",
+    "source_id": "source_id",
+    "full_text": "full_text",
+}
+
+# String id for a missing value, and year value for an unknown year
+NO_VALUE = -1
+
+_HEADER_LENGTH = Struct("<I")
+_ALIGNMENT = 8
+
+
+def _padding(offset: int) -> int:
+    """Bytes needed to align an offset to the array alignment"""
+    return -offset % _ALIGNMENT
+
+
+def write_shard(path: str, publications: list[Publication]) -> int:
+    """Write publications as a columnar shard
+
+    Every distinct string is stored once in a UTF-8 string table; each
+    column is an int32 array of string ids and the years are an int32
+    array. The file is written under a temporary name and renamed so
+    readers never see a partial shard.
+
+    Args:
+        path: Shard file to write
+        publications: Publications to store
+
+    Returns:
+        Number of rows written
+    """
+    string_ids: dict[str, int] = {}
+    blob = bytearray()
+    offsets = array("q", [0])
+
+    def intern(value: str | None) -> int:
+        if value is None:
+            return NO_VALUE
+        string_id = string_ids.get(value)
+        if string_id is None:
+            string_id = string_ids[value] = len(string_ids)
+            blob.extend(value.encode("utf-8", errors="surrogatepass"))
+            offsets.append(len(blob))
+        return string_id
+
+    columns = {
+        name: array("i", [intern(getattr(pub, attribute)) for pub in publications])
+        for name, attribute in SHARD_COLUMNS.items()
+    }
+    years = array("i", [NO_VALUE if pub.year is None else pub.year for pub in publications])
+
+    header = dumps(
+        {
+            "rows": len(publications),
+            "strings": len(string_ids),
+            "columns": list(columns),
+            "blob_bytes": len(blob),
+            "byteorder": byteorder,
+        }
+    ).encode("utf-8")
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(SHARD_MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        f.write(b"\0" * _padding(len(SHARD_MAGIC) + _HEADER_LENGTH.size + len(header)))
+        # Each array starts on an 8-byte boundary so it can be cast in place
+        for data in (offsets, *columns.values(), years):
+            raw = data.tobytes()
+            f.write(raw)
+            f.write(b"\0" * _padding(len(raw)))
+        f.write(blob)
+    replace(temp_path, path)
+
+    return len(publications)
+
+
+class ColumnarShard:
+    """Read-only, memory-mapped view of a shard written by write_shard"""
+
+    def __init__(self, path: str) -> None:
+        """Map a shard file
+
+        Args:
+            path: Shard file
+
+        Raises:
+            ValueError: If the file isn't a shard written on this platform
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap(f.fileno(), 0, access=ACCESS_READ)
+        self._view = memoryview(self._map)
+
+        if self._view[: len(SHARD_MAGIC)] != SHARD_MAGIC:
+            self.close()
+            raise ValueError(f"Not a columnar shard: {path}")
+        position = len(SHARD_MAGIC)
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._view, position)
+        position += _HEADER_LENGTH.size
+        header = loads(bytes(self._view[position : position + header_length]))
+        position += header_length
+        position += _padding(position)
+
+        if header["byteorder"] != byteorder:
+            self.close()
+            raise ValueError(f"Shard {path} was written with {header['byteorder']} byte order")
+
+        self.rows: int = header["rows"]
+        self.column_names: list[str] = header["columns"]
+
+        def take(typecode: Literal["i", "q"], count: int, itemsize: int) -> "memoryview[int]":
+            nonlocal position
+            size = count * itemsize
+            data = self._view[position : position + size].cast(typecode)
+            position += size + _padding(size)
+            return data
+
+        self._offsets = take("q", header["strings"] + 1, 8)
+        self._columns = {name: take("i", self.rows, 4) for name in self.column_names}
+        self.years = take("i", self.rows, 4)
+        self._blob = self._view[position : position + header["blob_bytes"]]
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def strings(self) -> list[str]:
+        """Decode the string table
+
+        Returns:
+            Every distinct string in the shard, indexed by string id
+        """
+        blob = bytes(self._blob)
+        offsets = self._offsets.tolist()
+        return [
+            blob[start:end].decode("utf-8", errors="surrogatepass")
+            for start, end in zip(offsets, offsets[1:])
+        ]
+
+    def column(self, name: str) -> "memoryview[int]":
+        """String ids of one column
+
+        Args:
+            name: Column name from SHARD_COLUMNS
+
+        Returns:
+            int32 view of string ids, NO_VALUE for missing values
+        """
+        return self._columns[name]
+
+    def to_publications(self, interner: StringInterner | None = None) -> list[Publication]:
+        """Build Publication objects for every row
+
+        Args:
+            interner: Interner to share repeated field values across shards
+
+        Returns:
+            Publications equal to the ones the shard was written from
+        """
+        # A trailing None lets NO_VALUE (-1) index straight to "missing"
+        table: list[str | None] = [*self.strings(), None]
+
+        if interner is not None:
+            # Values are already unique within the shard, so each string table
+            # entry of a repeated-value column is interned once
+            for name, attribute in SHARD_COLUMNS.items():
+                if attribute in INTERNED_FIELDS:
+                    for string_id, count in Counter(self._columns[name].tolist()).items():
+                        table[string_id] = interner.intern(table[string_id], count)
+
+        columns = [[table[i] for i in self._columns[name].tolist()] for name in SHARD_COLUMNS]
+        years = [None if year == NO_VALUE else year for year in self.years.tolist()]
+
+        with paused_gc():
+            return [
+                Publication(
+                    title=title or "",
+                    author=author,
+                    pub_date=pub_date,
+                    publisher=publisher,
+                    place=place,
+                    lccn=lccn,
+                    source=source,
+                    source_id=source_id,
+                    full_text=full_text,
+                    year=year,
+                )
+                for (
+                    title,
+                    author,
+                    pub_date,
+                    publisher,
+                    place,
+                    lccn,
+                    source,
+                    source_id,
+                    full_text,
+                    year,
+                ) in zip(*columns, years)
+            ]
+
+    def close(self) -> None:
+        """Release the memory map"""
+        # Views sliced from the map must be released before the map can close
+        views = [*getattr(self, "_columns", {}).values()]
+        views += [getattr(self, name, None) for name in ("_offsets", "years", "_blob", "_view")]
+        for view in views:
+            if view is not None:
+                view.release()
+        self._map.close()
+
+    def __enter__(self) -> "ColumnarShard":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
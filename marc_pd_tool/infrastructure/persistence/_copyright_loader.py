@@ -3,10 +3,12 @@
 """Copyright data XML loader for publications"""
 
 # Standard library imports
+from concurrent.futures import Executor
 from functools import cached_property
 from logging import getLogger
 from pathlib import Path
 from re import search
+from typing import Iterator
 from xml.etree.cElementTree import Element
 from xml.etree.cElementTree import ParseError
 from xml.etree.cElementTree import iterparse
@@ -17,31 +19,63 @@ from marc_pd_tool.core.domain.publication import Publication
 from marc_pd_tool.infrastructure.persistence._parallel_copyright_loader import (
     ParallelCopyrightLoader,
 )
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceManifest
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceScanError
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
 from marc_pd_tool.shared.mixins.mixins import YearFilterableMixin
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import open_binary
 from marc_pd_tool.shared.utils.text_utils import extract_year
 
 logger = getLogger(__name__)
 
 
 class CopyrightDataLoader(YearFilterableMixin):
-    def __init__(self, copyright_dir: str, num_workers: int | None = None) -> None:
+    def __init__(
+        self, copyright_dir: str, num_workers: int | None = None, cache_dir: str | None = None
+    ) -> None:
+        """Initialize the copyright loader
+
+        Args:
+            copyright_dir: Directory containing copyright XML files
+            num_workers: Number of parallel workers (default: cpu_count - 4)
+            cache_dir: Directory for the source manifest, string table and loader shards
+                (in memory and the system temp directory if None)
+        """
         self.copyright_dir = Path(copyright_dir)
         self.num_workers = num_workers
+        self.cache_dir = cache_dir
+        self.manifest = SourceManifest(
+            self.copyright_dir,
+            ".xml",
+            self._iter_entry_years,
+            recursive=True,
+            cache_dir=cache_dir,
+            kind="copyright",
+        )
 
     def load_all_copyright_data(
-        self, min_year: int | None = None, max_year: int | None = None
+        self,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        executor: Executor | None = None,
     ) -> list[Publication]:
         """Load copyright data, optionally filtered by year range
 
         Args:
             min_year: Minimum year to include (inclusive)
             max_year: Maximum year to include (inclusive)
+            executor: Process pool to load files in, or None to start one
 
         Returns:
             List of Publication objects
         """
         self._log_year_filtering(min_year, max_year, "copyright")
 
+        # Repeated authors, publishers, places and dates share one string each;
+        # the table is seeded from and saved back to the cache directory
+        interner = StringInterner.for_cache_dir(self.cache_dir)
+
         # Always try parallel loading first, with automatic fallback to sequential
         try:
             parallel_loader = ParallelCopyrightLoader(
@@ -49,14 +83,28 @@ class CopyrightDataLoader(YearFilterableMixin):
                 min_year=min_year,
                 max_year=max_year,
                 num_workers=self.num_workers,
+                manifest=self.manifest if min_year is not None or max_year is not None else None,
+                shard_dir=self.cache_dir,
+                interner=interner,
+                executor=executor,
             )
-            return parallel_loader.load_all_parallel()
+            publications = parallel_loader.load_all_parallel()
+            interner.log_stats("copyright")
+            interner.save()
+            return publications
         except Exception as e:
             logger.warning(f"Parallel loading failed, falling back to sequential: {e}")
             # Fall through to sequential loading
 
         all_publications: list[Publication] = []
-        xml_files = sorted(self.copyright_dir.rglob("*.xml"), key=lambda x: str(x))
+        xml_files = [
+            Path(path)
+            for path in self.manifest.filter_files(
+                [str(path) for path in find_data_files(self.copyright_dir, ".xml", recursive=True)],
+                min_year,
+                max_year,
+            )
+        ]
         logger.info(f"Found {len(xml_files)} XML files in copyright directory")
 
         batch_start_count = 0
@@ -73,7 +121,7 @@ class CopyrightDataLoader(YearFilterableMixin):
             # Use mixin for year filtering
             pubs = self._filter_by_year(pubs, min_year, max_year)
 
-            all_publications.extend(pubs)
+            all_publications.extend(interner.intern_publication(pub) for pub in pubs)
 
             # Log summary after completing each batch of 10 (or at the end)
             if (i + 1) % 10 == 0 or i == len(xml_files) - 1:
@@ -88,6 +136,8 @@ class CopyrightDataLoader(YearFilterableMixin):
         logger.info(
             f"Loaded {len(all_publications):,} copyright entries from {len(xml_files)} files"
         )
+        interner.log_stats("copyright")
+        interner.save()
         return all_publications
 
     def _extract_year_from_filename(self, filename: str) -> str:
@@ -98,7 +148,8 @@ class CopyrightDataLoader(YearFilterableMixin):
         publications = []
 
         try:
-            tree = parse(xml_file)
+            with open_binary(xml_file) as xml_fh:
+                tree = parse(xml_fh)
             root = tree.getroot()
 
             for entry in root.findall(".//copyrightEntry"):
@@ -199,57 +250,93 @@ class CopyrightDataLoader(YearFilterableMixin):
     def year_range(self) -> tuple[int | None, int | None]:
         """Get the year range (min, max) of copyright data without loading full publications
 
+        Reads the source manifest, so only new or changed files are scanned.
+
         Returns:
             Tuple of (min_year, max_year) or (None, None) if no valid years found
         """
         logger.info("Analyzing year range in copyright data...")
 
-        xml_files = sorted(self.copyright_dir.rglob("*.xml"), key=lambda x: str(x))
-        if not xml_files:
+        self.manifest.refresh()
+        if not self.manifest.entries:
             logger.warning("No copyright XML files found")
             return None, None
 
-        min_year = None
-        max_year = None
-        valid_years = 0
-        total_entries = 0
+        min_year, max_year = self.manifest.year_range
+        logger.info(
+            f"Copyright data year analysis: {self.manifest.dated_count:,}/"
+            f"{self.manifest.record_count:,} entries with valid years"
+        )
+        if min_year is not None and max_year is not None:
+            logger.info(f"Copyright data year range: {min_year} - {max_year}")
+        else:
+            logger.warning("No valid years found in copyright data")
+
+        return min_year, max_year
+
+    def year_filter_matches_load(
+        self,
+        loaded_min: int | None,
+        loaded_max: int | None,
+        min_year: int | None,
+        max_year: int | None,
+    ) -> bool:
+        """Check whether year-filtering a wider load gives the entries of loading a range
 
-        for xml_file in xml_files:
-            try:
-                # Use iterparse for memory efficiency with large files
-                context = iterparse(xml_file, events=("start", "end"))
+        Loading a year range skips files whose path names a year outside it
+        (``1950/`` or ``1950_v1.xml``) together with their undated and misfiled
+        entries, which the year filter alone keeps. The two agree only if none of
+        the files skipped that way holds an entry the year filter keeps.
+
+        Args:
+            loaded_min: Minimum year of the wider load, None for no minimum
+            loaded_max: Maximum year of the wider load, None for no maximum
+            min_year: Minimum year of the range, None for no minimum
+            max_year: Maximum year of the range, None for no maximum
+
+        Returns:
+            True if filtering the wider load by year gives the same entries
+        """
+        source_dir = str(self.copyright_dir)
+        loaded = ParallelCopyrightLoader(
+            source_dir, loaded_min, loaded_max, num_workers=1
+        ).xml_files
+        kept = set(ParallelCopyrightLoader(source_dir, min_year, max_year, num_workers=1).xml_files)
+        return not any(
+            self.manifest.may_contain_years(path, min_year, max_year)
+            for path in loaded
+            if path not in kept
+        )
+
+    def _iter_entry_years(self, xml_file: Path) -> Iterator[int | None]:
+        """Yield the year of every copyright entry in a file
+
+        Args:
+            xml_file: Copyright XML file
+
+        Yields:
+            Entry year, or None for entries without a usable date
+
+        Raises:
+            SourceScanError: If the file can't be read or parsed
+        """
+        try:
+            # Use iterparse for memory efficiency with large files
+            with open_binary(xml_file) as xml_fh:
+                context = iterparse(xml_fh, events=("start", "end"))
                 event, root = next(context)
 
                 for event, elem in context:
                     if event == "end" and elem.tag == "copyrightEntry":
-                        total_entries += 1
-                        year = self._extract_year_from_entry(elem)
-
-                        if year is not None:
-                            valid_years += 1
-                            if min_year is None or year < min_year:
-                                min_year = year
-                            if max_year is None or year > max_year:
-                                max_year = year
+                        yield self._extract_year_from_entry(elem)
 
                         # Clear element to save memory
                         elem.clear()
                         root.clear()
 
-            except (ParseError, OSError, UnicodeDecodeError) as e:
-                # Same as above - XML parsing errors
-                logger.warning(f"Error analyzing years in {xml_file}: {e}")
-                continue
-
-        logger.info(
-            f"Copyright data year analysis: {valid_years:,}/{total_entries:,} entries with valid years"
-        )
-        if min_year is not None and max_year is not None:
-            logger.info(f"Copyright data year range: {min_year} - {max_year}")
-        else:
-            logger.warning("No valid years found in copyright data")
-
-        return min_year, max_year
+        except (ParseError, OSError, UnicodeDecodeError) as e:
+            # Same as above - XML parsing errors
+            raise SourceScanError(e) from e
 
     def _extract_year_from_entry(self, entry: Element) -> int | None:
         """Extract year from a copyright entry without creating Publication object
@@ -320,5 +407,11 @@ class CopyrightDataLoader(YearFilterableMixin):
             logger.debug(f"Maximum copyright data year detected: {max_year}")
             return max_year
 
+        # Without year directories, fall back to the entry years in the manifest
+        _, manifest_max_year = self.manifest.year_range
+        if manifest_max_year is not None:
+            logger.debug(f"Maximum copyright data year from source manifest: {manifest_max_year}")
+            return manifest_max_year
+
         logger.warning("No year directories found in copyright data")
         return None
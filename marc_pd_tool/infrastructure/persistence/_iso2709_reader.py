@@ -0,0 +1,335 @@
+# marc_pd_tool/infrastructure/persistence/_iso2709_reader.py
+
+"""Streaming reader for binary MARC21 (ISO 2709) files"""
+
+# Standard library imports
+from logging import getLogger
+from pathlib import Path
+from typing import BinaryIO
+from typing import Iterator
+from unicodedata import normalize
+
+# Local imports
+from marc_pd_tool.shared.utils.file_utils import open_binary
+from marc_pd_tool.shared.utils.file_utils import strip_compression_suffix
+
+logger = getLogger(__name__)
+
+# Extensions treated as binary MARC without looking at the content
+ISO2709_EXTENSIONS = frozenset([".mrc", ".marc"])
+
+RECORD_TERMINATOR = b"\x1d"
+FIELD_TERMINATOR = b"\x1e"
+SUBFIELD_DELIMITER = b"\x1f"
+
+LEADER_LENGTH = 24
+DIRECTORY_ENTRY_LENGTH = 12
+
+ESCAPE = 0x1B
+
+# MARC-8 extended Latin (ANSEL) spacing characters in the G1 range
+MARC8_SPACING = {
+    0xA1: "\u0141",  # Ł
+    0xA2: "\u00d8",  # Ø
+    0xA3: "\u0110",  # Đ
+    0xA4: "\u00de",  # Þ
+    0xA5: "\u00c6",  # Æ
+    0xA6: "\u0152",  # Œ
+    0xA7: "\u02b9",  # soft sign
+    0xA8: "\u00b7",  # middle dot
+    0xA9: "\u266d",  # music flat
+    0xAA: "\u00ae",  # registered sign
+    0xAB: "\u00b1",  # plus-minus
+    0xAC: "\u01a0",  # Ơ
+    0xAD: "\u01af",  # Ư
+    0xAE: "\u02bc",  # alif
+    0xB0: "\u02bb",  # ayn
+    0xB1: "\u0142",  # ł
+    0xB2: "\u00f8",  # ø
+    0xB3: "\u0111",  # đ
+    0xB4: "\u00fe",  # þ
+    0xB5: "\u00e6",  # æ
+    0xB6: "\u0153",  # œ
+    0xB7: "\u02ba",  # hard sign
+    0xB8: "\u0131",  # dotless i
+    0xB9: "\u00a3",  # pound sign
+    0xBA: "\u00f0",  # ð
+    0xBC: "\u01a1",  # ơ
+    0xBD: "\u01b0",  # ư
+    0xC0: "\u00b0",  # degree sign
+    0xC1: "\u2113",  # script small l
+    0xC2: "\u2117",  # sound recording copyright
+    0xC3: "\u00a9",  # copyright sign
+    0xC4: "\u266f",  # music sharp
+    0xC5: "\u00bf",  # inverted question mark
+    0xC6: "\u00a1",  # inverted exclamation mark
+    0xC7: "\u00df",  # ß
+    0xC8: "\u20ac",  # euro sign
+}
+
+# MARC-8 combining marks; in MARC-8 they precede the letter they modify
+MARC8_COMBINING = {
+    0xE0: "\u0309",  # hook above
+    0xE1: "\u0300",  # grave
+    0xE2: "\u0301",  # acute
+    0xE3: "\u0302",  # circumflex
+    0xE4: "\u0303",  # tilde
+    0xE5: "\u0304",  # macron
+    0xE6: "\u0306",  # breve
+    0xE7: "\u0307",  # dot above
+    0xE8: "\u0308",  # umlaut
+    0xE9: "\u030c",  # caron
+    0xEA: "\u030a",  # ring above
+    0xEB: "\ufe20",  # ligature, left half
+    0xEC: "\ufe21",  # ligature, right half
+    0xED: "\u0315",  # comma above right
+    0xEE: "\u030b",  # double acute
+    0xEF: "\u0310",  # candrabindu
+    0xF0: "\u0327",  # cedilla
+    0xF1: "\u0328",  # ogonek
+    0xF2: "\u0323",  # dot below
+    0xF3: "\u0324",  # double dot below
+    0xF4: "\u0325",  # ring below
+    0xF5: "\u0333",  # double underscore
+    0xF6: "\u0332",  # underscore
+    0xF7: "\u0326",  # comma below
+    0xF8: "\u031c",  # left half ring below
+    0xF9: "\u032e",  # breve below
+    0xFA: "\ufe22",  # double tilde, left half
+    0xFB: "\ufe23",  # double tilde, right half
+    0xFE: "\u0313",  # comma above
+}
+
+# Control fields keyed by tag, data subfields keyed by (tag, code), and the
+# (code, text) pairs of the first 245 - the same shape the XML walker builds
+type MarcFields = tuple[
+    dict[str, str | None], dict[tuple[str, str], str | None], list[tuple[str, str | None]]
+]
+
+
+def is_iso2709_file(marc_file: Path) -> bool:
+    """Decide whether a MARC file is binary ISO 2709 rather than MARCXML
+
+    Known binary extensions are trusted (after dropping any compression
+    suffix); anything else is sniffed. A binary record starts with a
+    five-digit record length, while XML starts with '<' (possibly after a
+    byte order mark or whitespace).
+
+    Args:
+        marc_file: Path to the MARC file
+
+    Returns:
+        True if the file should be read as ISO 2709
+    """
+    suffix = strip_compression_suffix(marc_file).suffix.lower()
+    if suffix in ISO2709_EXTENSIONS:
+        return True
+    if suffix in (".xml", ".marcxml"):
+        return False
+
+    try:
+        with open_binary(marc_file) as f:
+            head = f.read(LEADER_LENGTH)
+    except (OSError, EOFError):
+        return False
+
+    return len(head) == LEADER_LENGTH and head[:5].isdigit() and head[12:17].isdigit()
+
+
+def _decode(data: bytes, utf8: bool) -> str:
+    """Decode field data from a record
+
+    Args:
+        data: Raw field bytes
+        utf8: Whether leader position 9 declares UTF-8
+
+    Returns:
+        Decoded text
+    """
+    if utf8:
+        return data.decode("utf-8", errors="replace")
+    return _decode_marc8(data)
+
+
+def _decode_marc8(data: bytes) -> str:
+    """Decode MARC-8 basic and extended Latin text
+
+    Combining marks are moved after the letter they precede and the result is
+    composed (NFC), the form MARCXML converters write. Text in the other
+    MARC-8 character sets (Greek, Cyrillic, CJK, ...), selected by escape
+    sequences, is dropped rather than decoded as the wrong letters, and so
+    are bytes with no MARC-8 meaning.
+
+    Args:
+        data: Raw MARC-8 field bytes
+
+    Returns:
+        Decoded text
+    """
+    chars: list[str] = []
+    marks: list[str] = []
+    basic_g0 = True
+    latin_g1 = True
+    position = 0
+    while position < len(data):
+        byte = data[position]
+        position += 1
+
+        if byte == ESCAPE:
+            # Escape, intermediate bytes, then the final byte naming the set
+            start = position
+            while position < len(data) and 0x20 <= data[position] <= 0x2F:
+                position += 1
+            if position == len(data):
+                break
+            intermediates = data[start:position]
+            final = data[position]
+            position += 1
+            if intermediates in (b")", b"-", b"$)", b"$-"):
+                latin_g1 = final == ord("E")
+            else:
+                # G0: ASCII is "(B" or the single-byte return "s"
+                basic_g0 = final in (ord("B"), ord("s"))
+            continue
+
+        if byte < 0x80:
+            if not basic_g0:
+                continue
+            char = chr(byte)
+        elif latin_g1 and byte in MARC8_COMBINING:
+            marks.append(MARC8_COMBINING[byte])
+            continue
+        elif latin_g1 and byte in MARC8_SPACING:
+            char = MARC8_SPACING[byte]
+        else:
+            continue
+
+        chars.append(char)
+        if marks:
+            chars.extend(marks)
+            marks.clear()
+
+    return normalize("NFC", "".join(chars))
+
+
+def parse_iso2709_record(record: bytes, data_field_tags: frozenset[str]) -> MarcFields | None:
+    """Pull the control fields and wanted data subfields out of one record
+
+    Args:
+        record: A single record including its leader
+        data_field_tags: Data field tags to keep
+
+    Returns:
+        Extracted fields, or None if the leader/directory is malformed
+    """
+    if len(record) < LEADER_LENGTH:
+        return None
+
+    leader = record[:LEADER_LENGTH]
+    try:
+        base_address = int(leader[12:17])
+    except ValueError:
+        return None
+    utf8 = leader[9:10] == b"a"
+
+    control_fields: dict[str, str | None] = {}
+    data_fields: dict[tuple[str, str], str | None] = {}
+    title_subfields: list[tuple[str, str | None]] | None = None
+
+    directory_end = record.find(FIELD_TERMINATOR, LEADER_LENGTH)
+    if directory_end < 0:
+        return None
+
+    for entry_start in range(LEADER_LENGTH, directory_end, DIRECTORY_ENTRY_LENGTH):
+        entry = record[entry_start : entry_start + DIRECTORY_ENTRY_LENGTH]
+        if len(entry) < DIRECTORY_ENTRY_LENGTH:
+            break
+        tag = entry[:3].decode("ascii", errors="replace")
+        try:
+            length = int(entry[3:7])
+            start = base_address + int(entry[7:12])
+        except ValueError:
+            return None
+
+        # Drop the field terminator
+        field = record[start : start + length].rstrip(FIELD_TERMINATOR)
+
+        if tag < "010":
+            control_fields.setdefault(tag, _decode(field, utf8))
+            continue
+        if tag not in data_field_tags:
+            continue
+
+        collect_title = tag == "245" and title_subfields is None
+        field_subfields: list[tuple[str, str | None]] = []
+
+        # Skip the two indicators before the first delimiter
+        for subfield in field.split(SUBFIELD_DELIMITER)[1:]:
+            if not subfield:
+                continue
+            code = chr(subfield[0])
+            text = _decode(subfield[1:], utf8) if len(subfield) > 1 else None
+            if collect_title:
+                field_subfields.append((code, text))
+            # Keep the first occurrence, matching the XML extractor
+            data_fields.setdefault((tag, code), text)
+        if collect_title:
+            title_subfields = field_subfields
+
+    return control_fields, data_fields, title_subfields or []
+
+
+def iter_iso2709_records(fh: BinaryIO) -> Iterator[bytes]:
+    """Yield raw records from a binary MARC stream
+
+    Records are read using the length in each leader. If a length is
+    unreadable or wrong, the reader resynchronises on the record terminator,
+    keeping the bytes it read past it for the next record, so the stream is
+    never seeked (compressed and piped streams can't seek back cheaply).
+
+    Args:
+        fh: Binary file handle positioned at the start of a record
+
+    Yields:
+        Raw record bytes, including the record terminator
+    """
+    # Bytes read past the end of the previous record
+    pending = b""
+
+    def read(size: int) -> bytes:
+        nonlocal pending
+        if not pending:
+            return fh.read(size)
+        data, pending = pending[:size], pending[size:]
+        if len(data) < size:
+            data += fh.read(size - len(data))
+        return data
+
+    while True:
+        length_bytes = read(5)
+        # Tolerate stray line breaks some exporters put between records
+        while length_bytes[:1] in (b"\r", b"\n"):
+            length_bytes = length_bytes[1:] + read(1)
+        if not length_bytes:
+            return
+
+        try:
+            record_length = int(length_bytes)
+        except ValueError:
+            record_length = 0
+
+        record = length_bytes + (read(record_length - 5) if record_length > 5 else b"")
+
+        # Records are only trusted up to their own terminator: a wrong length
+        # either stops short of it or runs into the next record
+        while RECORD_TERMINATOR not in record:
+            chunk = read(4096)
+            if not chunk:
+                return
+            record += chunk
+
+        end = record.index(RECORD_TERMINATOR) + 1
+        if end != len(record):
+            logger.debug("Malformed ISO 2709 record length, resynchronising on terminator")
+            pending = record[end:] + pending
+        yield record[:end]
@@ -7,8 +7,8 @@ from logging import getLogger
 from pathlib import Path
 from pickle import HIGHEST_PROTOCOL
 from pickle import dump
-from pickle import load
 from tempfile import mkdtemp
+from typing import Callable
 from typing import Iterator
 from xml.etree.cElementTree import Element
 from xml.etree.cElementTree import iterparse
@@ -16,11 +16,33 @@ from xml.etree.cElementTree import iterparse
 # Local imports
 from marc_pd_tool.core.domain.enums import CountryClassification
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import ISO2709_EXTENSIONS
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import is_iso2709_file
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import iter_iso2709_records
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import parse_iso2709_record
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import is_compressed
+from marc_pd_tool.shared.utils.file_utils import open_binary
+from marc_pd_tool.shared.utils.file_utils import strip_compression_suffix
 from marc_pd_tool.shared.utils.marc_utilities import extract_country_from_marc_008
 from marc_pd_tool.shared.utils.text_utils import remove_bracketed_content
 
 logger = getLogger(__name__)
 
+# Files at least this large are parsed across worker processes by byte range
+PARALLEL_PARSE_MIN_BYTES = 64 * 1024 * 1024
+
+# Lower bound on the size of each byte range handed to a worker
+PARALLEL_PARSE_MIN_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Most distinct field values the MARC loader keeps shared strings for
+MARC_INTERN_TABLE_SIZE = 250_000
+
+# Data fields read from each record: title/responsibility, main entries,
+# imprint, language, edition and LCCN
+MARC_DATA_FIELD_TAGS = frozenset(["245", "100", "110", "111", "260", "264", "041", "250", "010"])
+
 
 class MarcLoader:
     def __init__(
@@ -31,6 +53,7 @@ class MarcLoader:
         max_year: int | None = None,
         us_only: bool = False,
         max_data_year: int | None = None,
+        num_workers: int | None = None,
     ) -> None:
         self.marc_path = Path(marc_path)
         self.batch_size = batch_size
@@ -38,7 +61,28 @@ class MarcLoader:
         self.max_year = max_year
         self.us_only = us_only
         self.max_data_year = max_data_year  # Maximum year we have data for
+
+        # Worker processes for splitting large files by record byte ranges
+        if num_workers is None:
+            # Standard library imports
+            from multiprocessing import cpu_count
+
+            num_workers = max(1, cpu_count() - 4)
+        self.num_workers = num_workers
         self._temp_batch_dir: str | None = None  # Track temp dir for cleanup
+        # Element names for the namespace of the records being parsed
+        self._record_tag = ""
+        self._controlfield_tag = "controlfield"
+        self._datafield_tag = "datafield"
+        self._subfield_tag = "subfield"
+        # Running totals from the most recent pass over the MARC files
+        self.total_record_count = 0
+        self.filtered_count = 0
+        # Predicted matching cost of each pickled batch, by path
+        self.batch_costs: dict[str, float] = {}
+        # Shared strings for repeated authors, publishers, places and dates. MARC
+        # input is streamed, so the table is bounded rather than holding every value
+        self.interner = StringInterner(max_size=MARC_INTERN_TABLE_SIZE)
 
     def extract_all_batches(self) -> list[list[Publication]]:
         """Extract all MARC records and return as list of batches
@@ -68,7 +112,11 @@ class MarcLoader:
         )
         return batches
 
-    def extract_batches_to_disk(self, output_dir: str | None = None) -> tuple[list[str], int, int]:
+    def extract_batches_to_disk(
+        self,
+        output_dir: str | None = None,
+        batch_cost: Callable[[list[Publication]], float] | None = None,
+    ) -> tuple[list[str], int, int]:
         """Extract MARC records as pickled batches directly to disk for large datasets.
 
         This is the preferred method for very large datasets (8M+ records) where
@@ -76,17 +124,27 @@ class MarcLoader:
 
         Args:
             output_dir: Directory for pickle files (temp dir created if None)
+            batch_cost: Optional cost predictor, applied to each batch while it is
+                still in memory; results are kept in ``batch_costs``
 
         Returns:
             Tuple of (pickle file paths, total records, filtered count)
         """
-        return self._stream_batches_to_disk(output_dir)
+        return self._stream_batches_to_disk(output_dir, batch_cost)
 
-    def _stream_batches_to_disk(self, output_dir: str | None = None) -> tuple[list[str], int, int]:
+    def _stream_batches_to_disk(
+        self,
+        output_dir: str | None = None,
+        batch_cost: Callable[[list[Publication]], float] | None = None,
+    ) -> tuple[list[str], int, int]:
         """Stream MARC XML and pickle batches of Publication objects directly to disk.
 
+        Uses a single parse of the input: batches come from iter_batches(), which
+        keeps the record/filter counts and reports progress by bytes consumed.
+
         Args:
             output_dir: Directory for pickle files (temp dir created if None)
+            batch_cost: Optional cost predictor for each batch
 
         Returns:
             Tuple of (pickle file paths, total records, filtered count)
@@ -95,164 +153,51 @@ class MarcLoader:
             output_dir = mkdtemp(prefix="marc_stream_")
             self._temp_batch_dir = output_dir
 
-        # Get list of MARC files to process
-        marc_files = self._get_marc_files()
-        if not marc_files:
-            logger.error(f"No MARC XML files found at: {self.marc_path}")
-            return [], 0, 0
-
-        logger.info(f"Found {len(marc_files)} MARC file(s) to process")
-
-        # Quick first pass to count total records for better progress reporting
-        logger.info("Counting records...")
-        total_record_estimate = 0
-        estimated_batches = 0
-        for marc_file in marc_files:
-            try:
-                # Just count record tags without parsing content
-                record_count = 0
-                for event, elem in iterparse(marc_file, events=("end",)):
-                    if elem.tag.endswith("record"):
-                        record_count += 1
-                        elem.clear()
-                total_record_estimate += record_count
-            except Exception as e:
-                logger.warning(f"Could not count records in {marc_file.name}: {e}")
-
-        if total_record_estimate > 0:
-            # Estimate total batches (accounting for some filtering)
-            estimated_batches = max(1, int((total_record_estimate * 0.9) // self.batch_size + 1))
-            logger.info(
-                f"Found ~{total_record_estimate:,} total records, expecting ~{estimated_batches} batches"
-            )
-
         logger.info(f"Streaming batches to: {output_dir}")
 
-        batch_paths = []
-        current_batch = []
-        batch_count = 0
-        total_record_count = 0
-        filtered_count = 0
-        no_year_count = 0
-        year_out_of_range_count = 0
-        non_us_count = 0
-        beyond_data_count = 0
-
-        for marc_file in marc_files:
-            logger.info(f"Processing MARC file: {marc_file.name}")
-            try:
-                context = iterparse(marc_file, events=("start", "end"))
-                event, root = next(context)
+        batch_paths: list[str] = []
+        total_publications = 0
+        self.batch_costs = {}
 
-                file_record_count = 0
-
-                for event, elem in context:
-                    if event == "end" and elem.tag.endswith("record"):
-                        pub = self._extract_from_record(elem)
-                        if pub:
-                            include_record, filter_reason = self._should_include_record_with_reason(
-                                pub
-                            )
-                            if include_record:
-                                current_batch.append(pub)
-                            else:
-                                filtered_count += 1
-                                if filter_reason == "no_year":
-                                    no_year_count += 1
-                                elif filter_reason == "year_out_of_range":
-                                    year_out_of_range_count += 1
-                                elif filter_reason == "non_us":
-                                    non_us_count += 1
-                                elif filter_reason == "beyond_available_data":
-                                    beyond_data_count += 1
-
-                        file_record_count += 1
-                        total_record_count += 1
-
-                        # Pickle batch when it reaches target size
-                        if len(current_batch) >= self.batch_size:
-                            batch_path = f"{output_dir}/batch_{batch_count:05d}.pkl"
-                            with open(batch_path, "wb") as f:
-                                dump(current_batch, f, protocol=HIGHEST_PROTOCOL)
-
-                            batch_paths.append(batch_path)
-                            batch_count += 1
-                            # Use the pre-calculated estimate if available
-                            if estimated_batches > 0:
-                                batch_indicator = f"{batch_count}/~{estimated_batches}"
-                            else:
-                                batch_indicator = f"{batch_count}"
-                            logger.info(
-                                f"Pickled batch {batch_indicator} with {len(current_batch)} publications ({total_record_count:,} total records processed)"
-                            )
-
-                            # Clear batch from memory immediately
-                            current_batch = []
-
-                        # Clear element to save memory
-                        elem.clear()
-                        root.clear()
-
-                logger.info(f"  Processed {file_record_count:,} records from {marc_file.name}")
-
-            except Exception as e:
-                logger.error(f"Error parsing MARC file {marc_file}: {e}")
-                continue
-
-        # Pickle final batch if any records remain
-        if current_batch:
-            batch_path = f"{output_dir}/batch_{batch_count:05d}.pkl"
+        for batch in self.iter_batches():
+            batch_path = f"{output_dir}/batch_{len(batch_paths):05d}.pkl"
+            if batch_cost is not None:
+                self.batch_costs[batch_path] = batch_cost(batch)
             with open(batch_path, "wb") as f:
-                dump(current_batch, f, protocol=HIGHEST_PROTOCOL)
+                dump(batch, f, protocol=HIGHEST_PROTOCOL)
 
             batch_paths.append(batch_path)
-            batch_count += 1
-            logger.info(
-                f"Pickled final batch {batch_count}/{batch_count} with {len(current_batch)} publications"
-            )
-
-        total_publications = (
-            sum(len(load(open(path, "rb"))) for path in batch_paths) if batch_paths else 0
-        )
+            total_publications += len(batch)
 
         logger.info(
-            f"Created {batch_count} batches containing {total_publications:,} publications from {len(marc_files)} file(s)"
+            f"Created {len(batch_paths)} batches containing {total_publications:,} publications"
         )
-        if filtered_count > 0:
-            logger.info(f"Filtered out {filtered_count:,} total records:")
-            if no_year_count > 0:
-                logger.info(f"  - {no_year_count:,} records missing year data")
-            if year_out_of_range_count > 0:
-                if self.min_year and self.max_year:
-                    logger.info(
-                        f"  - {year_out_of_range_count:,} records outside year range {self.min_year}-{self.max_year}"
-                    )
-                elif self.min_year:
-                    logger.info(f"  - {year_out_of_range_count:,} records before {self.min_year}")
-                elif self.max_year:
-                    logger.info(f"  - {year_out_of_range_count:,} records after {self.max_year}")
-            if non_us_count > 0:
-                logger.info(f"  - {non_us_count:,} non-US publications")
-            if beyond_data_count > 0:
-                logger.info(
-                    f"  - {beyond_data_count:,} records beyond available data (> {self.max_data_year})"
-                )
 
-        return batch_paths, total_record_count, filtered_count
+        return batch_paths, self.total_record_count, self.filtered_count
 
     def iter_batches(self) -> Iterator[list[Publication]]:
         """Yield batches of Publication objects without accumulating in memory.
 
         For use in sequential processing mode where you want to process
         batches one at a time without loading everything into memory.
+
+        Progress is estimated from the bytes consumed across all input files,
+        so no separate counting pass is needed. Once the iterator is exhausted,
+        ``total_record_count`` and ``filtered_count`` hold the totals.
         """
+        self.total_record_count = 0
+        self.filtered_count = 0
+
         # Get list of MARC files to process
         marc_files = self._get_marc_files()
         if not marc_files:
             logger.error(f"No MARC XML files found at: {self.marc_path}")
             return
 
-        logger.info(f"Found {len(marc_files)} MARC file(s) to process")
+        total_bytes = sum(marc_file.stat().st_size for marc_file in marc_files)
+        logger.info(
+            f"Found {len(marc_files)} MARC file(s) to process ({total_bytes / 1024 / 1024:,.1f} MB)"
+        )
 
         current_batch = []
         total_record_count = 0
@@ -262,55 +207,54 @@ class MarcLoader:
         non_us_count = 0
         beyond_data_count = 0
         batch_count = 0
+        bytes_before_file = 0
 
         for marc_file in marc_files:
             logger.info(f"Processing MARC file: {marc_file.name}")
             try:
-                context = iterparse(marc_file, events=("start", "end"))
-                event, root = next(context)
                 file_record_count = 0
 
-                for event, elem in context:
-                    if event == "end" and elem.tag.endswith("record"):
-                        pub = self._extract_from_record(elem)
-                        if pub:
-                            include_record, filter_reason = self._should_include_record_with_reason(
-                                pub
-                            )
-                            if include_record:
-                                current_batch.append(pub)
-                            else:
-                                filtered_count += 1
-                                if filter_reason == "no_year":
-                                    no_year_count += 1
-                                elif filter_reason == "year_out_of_range":
-                                    year_out_of_range_count += 1
-                                elif filter_reason == "non_us":
-                                    non_us_count += 1
-                                elif filter_reason == "beyond_available_data":
-                                    beyond_data_count += 1
-
-                        file_record_count += 1
-                        total_record_count += 1
-
-                        # Yield batch when it reaches target size
-                        if len(current_batch) >= self.batch_size:
-                            batch_count += 1
-                            logger.info(
-                                f"Created batch {batch_count} with {len(current_batch)} publications (processed {total_record_count:,} records)"
-                            )
-                            yield current_batch
-                            current_batch = []
-
-                        # Clear element to save memory
-                        elem.clear()
-                        root.clear()
+                for pub, include_record, filter_reason, file_bytes_done in self._iter_file_records(
+                    marc_file
+                ):
+                    if pub:
+                        if include_record:
+                            current_batch.append(pub)
+                        else:
+                            filtered_count += 1
+                            if filter_reason == "no_year":
+                                no_year_count += 1
+                            elif filter_reason == "year_out_of_range":
+                                year_out_of_range_count += 1
+                            elif filter_reason == "non_us":
+                                non_us_count += 1
+                            elif filter_reason == "beyond_available_data":
+                                beyond_data_count += 1
+
+                    file_record_count += 1
+                    total_record_count += 1
+                    self.total_record_count = total_record_count
+                    self.filtered_count = filtered_count
+
+                    # Yield batch when it reaches target size
+                    if len(current_batch) >= self.batch_size:
+                        batch_count += 1
+                        # The parser reads ahead in chunks, so this is an estimate
+                        bytes_done = bytes_before_file + file_bytes_done
+                        percent = bytes_done / total_bytes * 100 if total_bytes else 100.0
+                        logger.info(
+                            f"Created batch {batch_count} with {len(current_batch)} publications (processed {total_record_count:,} records, ~{min(percent, 100.0):.1f}% of input)"
+                        )
+                        yield current_batch
+                        current_batch = []
 
                 logger.info(f"  Processed {file_record_count:,} records from {marc_file.name}")
 
             except Exception as e:
                 logger.error(f"Error parsing MARC file {marc_file}: {e}")
                 continue
+            finally:
+                bytes_before_file += marc_file.stat().st_size
 
         # Yield final batch if any records remain
         if current_batch:
@@ -318,6 +262,11 @@ class MarcLoader:
             logger.info(f"Created final batch {batch_count} with {len(current_batch)} publications")
             yield current_batch
 
+        logger.info(
+            f"Read {total_record_count:,} records from {len(marc_files)} file(s) into {batch_count} batches"
+        )
+        self.interner.log_stats("MARC")
+
         # Log filtering statistics
         if filtered_count > 0:
             logger.info(f"Filtered out {filtered_count:,} total records:")
@@ -339,232 +288,293 @@ class MarcLoader:
                     f"  - {beyond_data_count:,} records beyond available data (> {self.max_data_year})"
                 )
 
-    def get_temp_batch_dir(self) -> str | None:
-        """Get the temporary batch directory path if using disk-based streaming"""
-        return self._temp_batch_dir
+    def _iter_file_records(
+        self, marc_file: Path
+    ) -> Iterator[tuple[Publication | None, bool, str | None, int]]:
+        """Parse one MARC XML file, yielding each record's extraction and filter outcome
 
-    def _extract_marc_field(
-        self, record: Element, ns: dict[str, str], tags: list[str], subfield_code: str
-    ) -> Element | None:
-        """Extract a MARC field using pattern matching, trying multiple tags in order
+        Large files are split into record-aligned byte ranges and parsed across a
+        process pool when more than one worker is configured. Records still come
+        back in file order.
 
         Args:
-            record: MARC record element
-            ns: Namespace dictionary
-            tags: List of tags to try in order (e.g., ['264', '260'])
-            subfield_code: Subfield code to extract
+            marc_file: MARC XML file to parse
 
-        Returns:
-            Element if found, None otherwise
+        Yields:
+            Tuple of (publication or None, include_record, filter_reason, bytes of
+            the file consumed so far)
         """
-        for tag in tags:
-            # Try without namespace first
-            elem = record.find(f".//datafield[@tag='{tag}']/subfield[@code='{subfield_code}']")
-            if elem is not None:
-                return elem
-            # Try with namespace
-            elem = record.find(
-                f".//marc:datafield[@tag='{tag}']/marc:subfield[@code='{subfield_code}']", ns
+        if is_iso2709_file(marc_file):
+            yield from self._iter_iso2709_file_records(marc_file)
+            return
+
+        if (
+            self.num_workers > 1
+            and not is_compressed(marc_file)
+            and marc_file.stat().st_size >= PARALLEL_PARSE_MIN_BYTES
+        ):
+            # Local imports
+            from marc_pd_tool.infrastructure.persistence._parallel_marc_loader import (
+                iter_records_parallel,
             )
-            if elem is not None:
-                return elem
-        return None
+
+            chunk_bytes = max(
+                PARALLEL_PARSE_MIN_CHUNK_BYTES, marc_file.stat().st_size // (self.num_workers * 4)
+            )
+            records = iter_records_parallel(
+                marc_file,
+                self.num_workers,
+                chunk_bytes,
+                self.min_year,
+                self.max_year,
+                self.us_only,
+                self.max_data_year,
+            )
+            if records is not None:
+                yield from records
+                return
+
+        # Progress is measured on the raw (possibly compressed) file
+        with open(marc_file, "rb") as raw_fh, open_binary(marc_file, raw_fh) as marc_fh:
+            context = iterparse(marc_fh, events=("start", "end"))
+            event, root = next(context)
+
+            for event, elem in context:
+                if event == "end" and elem.tag.endswith("record"):
+                    pub = self._extract_from_record(elem)
+                    if pub:
+                        include_record, filter_reason = self._should_include_record_with_reason(pub)
+                        yield pub, include_record, filter_reason, raw_fh.tell()
+                    else:
+                        yield None, False, None, raw_fh.tell()
+
+                    # Clear element to save memory
+                    elem.clear()
+                    root.clear()
+
+    def _iter_iso2709_file_records(
+        self, marc_file: Path
+    ) -> Iterator[tuple[Publication | None, bool, str | None, int]]:
+        """Read a binary MARC21 (ISO 2709) file, yielding each record's outcome
+
+        Fields are located through the record directory and fed to the same
+        Publication builder as MARCXML records.
+
+        Args:
+            marc_file: Binary MARC file to read
+
+        Yields:
+            Tuple of (publication or None, include_record, filter_reason, bytes of
+            the file consumed so far)
+        """
+        with open(marc_file, "rb") as raw_fh, open_binary(marc_file, raw_fh) as marc_fh:
+            for record in iter_iso2709_records(marc_fh):
+                pub = None
+                try:
+                    fields = parse_iso2709_record(record, MARC_DATA_FIELD_TAGS)
+                    if fields is not None:
+                        pub = self._build_publication(*fields)
+                except Exception:
+                    pub = None
+
+                if pub:
+                    include_record, filter_reason = self._should_include_record_with_reason(pub)
+                    yield pub, include_record, filter_reason, raw_fh.tell()
+                else:
+                    yield None, False, None, raw_fh.tell()
+
+    def get_temp_batch_dir(self) -> str | None:
+        """Get the temporary batch directory path if using disk-based streaming"""
+        return self._temp_batch_dir
 
     def _get_marc_files(self) -> list[Path]:
-        """Get list of MARC XML files from path (file or directory)"""
+        """Get list of MARC XML or binary MARC files from path (file or directory)
+
+        Files may be gzip, bzip2 or xz compressed (e.g. ``catalog.xml.gz``).
+        """
+        marc_suffixes = [".xml", ".marcxml", *sorted(ISO2709_EXTENSIONS)]
         if self.marc_path.is_file():
             # Single file
-            if self.marc_path.suffix.lower() in [".xml", ".marcxml"]:
+            if strip_compression_suffix(self.marc_path).suffix.lower() in marc_suffixes:
                 return [self.marc_path]
             else:
-                logger.warning(f"File {self.marc_path} doesn't have .xml or .marcxml extension")
-                return [self.marc_path]  # Try anyway
+                logger.warning(
+                    f"File {self.marc_path} doesn't have a .xml, .marcxml, .mrc or .marc extension"
+                )
+                return [self.marc_path]  # Try anyway - the format is sniffed when read
         elif self.marc_path.is_dir():
-            # Directory - find all XML/MARCXML files
+            # Directory - find all XML/MARCXML and binary MARC files, compressed or not
             marc_files: list[Path] = []
-            for pattern in ["*.xml", "*.marcxml"]:
-                marc_files.extend(self.marc_path.glob(pattern))
+            for suffix in marc_suffixes:
+                marc_files.extend(find_data_files(self.marc_path, suffix))
             return sorted(marc_files)
         else:
             return []
 
     def _extract_from_record(self, record: Element) -> Publication | None:
-        try:
-            ns = {"marc": "http://www.loc.gov/MARC21/slim"}
+        """Extract a Publication from a MARC XML record element
 
-            # Extract complete title from 245 subfields in original order
-            title_parts = []
+        Walks the record's fields once, dispatching on tag and subfield code,
+        instead of running a separate subtree search for every field.
 
-            # Find all subfields under 245 datafield
-            title_datafield = record.find(".//datafield[@tag='245']")
-            if title_datafield is None:
-                title_datafield = record.find(".//marc:datafield[@tag='245']", ns)
-
-            if title_datafield is not None:
-                # Get all subfields in their original order
-                subfields = title_datafield.findall("./subfield") or title_datafield.findall(
-                    "./marc:subfield", ns
-                )
-
-                for subfield in subfields:
-                    code = subfield.get("code")
-                    if code in ["a", "b", "n", "p"] and subfield.text:
-                        title_parts.append(subfield.text.strip())
-
-            title = " ".join(title_parts) if title_parts else ""
-
-            # Remove bracketed content from title (e.g., "[microform]", "[electronic resource]")
-            if title:
-                title = remove_bracketed_content(title)
-
-            if not title:
-                return None
-
-            # Extract author from 245$c (statement of responsibility)
-            author_elem = record.find(".//datafield[@tag='245']/subfield[@code='c']")
-            if author_elem is None:
-                author_elem = record.find(
-                    ".//marc:datafield[@tag='245']/marc:subfield[@code='c']", ns
-                )
-
-            author = author_elem.text if author_elem is not None else ""
+        Args:
+            record: MARC record element (namespaced or not)
 
-            # Extract main author from 1xx fields (100, 110, 111) - priority order
-            main_author = ""
+        Returns:
+            Publication, or None if the record has no usable title
+        """
+        try:
+            # Resolve element names once per namespace rather than per record
+            if record.tag != self._record_tag:
+                self._record_tag = record.tag
+                prefix = record.tag[: record.tag.index("}") + 1] if record.tag[0] == "{" else ""
+                self._controlfield_tag = f"{prefix}controlfield"
+                self._datafield_tag = f"{prefix}datafield"
+                self._subfield_tag = f"{prefix}subfield"
+
+            control_fields: dict[str, str | None] = {}
+            data_fields: dict[tuple[str, str], str | None] = {}
+            title_subfields: list[tuple[str, str | None]] | None = None
+
+            for field in record:
+                field_tag = field.tag
+                if field_tag == self._datafield_tag:
+                    tag = field.get("tag")
+                    if tag not in MARC_DATA_FIELD_TAGS:
+                        continue
+                    collect_title = tag == "245" and title_subfields is None
+                    field_subfields: list[tuple[str, str | None]] = []
+                    for subfield in field:
+                        if subfield.tag != self._subfield_tag:
+                            continue
+                        code = subfield.get("code") or ""
+                        if collect_title:
+                            field_subfields.append((code, subfield.text))
+                        # Keep the first occurrence, matching find() semantics
+                        data_fields.setdefault((tag, code), subfield.text)
+                    if collect_title:
+                        title_subfields = field_subfields
+                elif field_tag == self._controlfield_tag:
+                    control_fields.setdefault(field.get("tag") or "", field.text)
+
+            return self._build_publication(control_fields, data_fields, title_subfields or [])
 
-            # Try 100$a (personal name) first
-            main_author_elem = record.find(".//datafield[@tag='100']/subfield[@code='a']")
-            if main_author_elem is None:
-                main_author_elem = record.find(
-                    ".//marc:datafield[@tag='100']/marc:subfield[@code='a']", ns
-                )
+        except Exception:
+            return None
 
-            if main_author_elem is not None:
-                main_author = main_author_elem.text or ""
-                # Clean up dates from personal names (e.g., "Smith, John, 1945-" -> "Smith, John")
-                if main_author and "," in main_author:
-                    parts = main_author.split(",")
-                    if len(parts) >= 3:
-                        # Check if the last part looks like a date
-                        last_part = parts[-1].strip()
-                        if last_part and (last_part[0].isdigit() or last_part.endswith("-")):
-                            main_author = ",".join(parts[:-1]).strip()
-
-            # If no 100, try 110$a (corporate name)
-            if not main_author:
-                main_author_elem = record.find(".//datafield[@tag='110']/subfield[@code='a']")
-                if main_author_elem is None:
-                    main_author_elem = record.find(
-                        ".//marc:datafield[@tag='110']/marc:subfield[@code='a']", ns
-                    )
-                if main_author_elem is not None:
-                    main_author = main_author_elem.text or ""
-
-            # If no 100 or 110, try 111$a (meeting name)
-            if not main_author:
-                main_author_elem = record.find(".//datafield[@tag='111']/subfield[@code='a']")
-                if main_author_elem is None:
-                    main_author_elem = record.find(
-                        ".//marc:datafield[@tag='111']/marc:subfield[@code='a']", ns
-                    )
-                if main_author_elem is not None:
-                    main_author = main_author_elem.text or ""
+    def _build_publication(
+        self,
+        control_fields: dict[str, str | None],
+        data_fields: dict[tuple[str, str], str | None],
+        title_subfields: list[tuple[str, str | None]],
+    ) -> Publication | None:
+        """Build a Publication from fields already pulled out of a MARC record
 
-            # Ensure main_author is a string
-            main_author = main_author if main_author else ""
+        Args:
+            control_fields: First value of each control field, keyed by tag
+            data_fields: First value of each subfield, keyed by (tag, code)
+            title_subfields: (code, text) pairs of the first 245 field, in order
 
-            # Extract publication date (try 264 first, then 260)
-            pub_date_elem = self._extract_marc_field(record, ns, ["264", "260"], "c")
+        Returns:
+            Publication, or None if the record has no usable title
+        """
+        # Extract complete title from 245 subfields in original order
+        title_parts = [
+            text.strip() for code, text in title_subfields if code in ["a", "b", "n", "p"] and text
+        ]
+        title = " ".join(title_parts) if title_parts else ""
 
-            # Get 008 field for both publication date and country extraction
-            control_008 = record.find(".//controlfield[@tag='008']")
-            if control_008 is None:
-                control_008 = record.find(".//marc:controlfield[@tag='008']", ns)
+        # Remove bracketed content from title (e.g., "[microform]", "[electronic resource]")
+        if title:
+            title = remove_bracketed_content(title)
 
-            if pub_date_elem is not None:
-                pub_date = pub_date_elem.text
-            else:
-                if control_008 is not None and control_008.text and len(control_008.text) >= 11:
-                    pub_date = control_008.text[7:11]
-                else:
-                    pub_date = ""
-
-            # Extract country information from 008 field
-            country_code = ""
-            country_classification = CountryClassification.UNKNOWN
-            language_code = ""
-            if control_008 is not None and control_008.text:
-                country_code, country_classification = extract_country_from_marc_008(
-                    control_008.text
-                )
-                # Extract language code from positions 35-37
-                if len(control_008.text) >= 38:
-                    language_code = control_008.text[35:38].strip().lower()
-
-            # Fallback to field 041$a if no language in 008
-            if not language_code:
-                lang_041_elem = record.find(".//datafield[@tag='041']/subfield[@code='a']")
-                if lang_041_elem is None:
-                    lang_041_elem = record.find(
-                        ".//marc:datafield[@tag='041']/marc:subfield[@code='a']", ns
-                    )
-                if lang_041_elem is not None and lang_041_elem.text:
-                    language_code = lang_041_elem.text.strip().lower()[:3]  # Take first 3 chars
-
-            # Extract publisher (try 264 first, then 260)
-            publisher_elem = self._extract_marc_field(record, ns, ["264", "260"], "b")
-            publisher = publisher_elem.text if publisher_elem is not None else ""
-
-            # Extract place (try 264 first, then 260)
-            place_elem = self._extract_marc_field(record, ns, ["264", "260"], "a")
-            place = place_elem.text if place_elem is not None else ""
-
-            # Extract edition statement from field 250$a
-            edition_elem = record.find(".//datafield[@tag='250']/subfield[@code='a']")
-            if edition_elem is None:
-                edition_elem = record.find(
-                    ".//marc:datafield[@tag='250']/marc:subfield[@code='a']", ns
-                )
-            edition = edition_elem.text if edition_elem is not None else ""
-
-            # Extract record ID
-            control_001 = record.find(".//controlfield[@tag='001']")
-            if control_001 is None:
-                control_001 = record.find(".//marc:controlfield[@tag='001']", ns)
-            source_id = control_001.text if control_001 is not None else ""
-
-            # Extract LCCN from field 010$a
-            lccn_elem = record.find(".//datafield[@tag='010']/subfield[@code='a']")
-            if lccn_elem is None:
-                lccn_elem = record.find(
-                    ".//marc:datafield[@tag='010']/marc:subfield[@code='a']", ns
-                )
-            lccn = lccn_elem.text.strip() if lccn_elem is not None and lccn_elem.text else ""
-
-            pub = Publication(
-                title=title,
-                author=author,
-                main_author=main_author,
-                pub_date=pub_date,
-                publisher=publisher,
-                place=place,
-                edition=edition,
-                lccn=lccn,
-                language_code=language_code,
-                source="MARC",
-                source_id=source_id,
-                country_code=country_code,
-                country_classification=country_classification,
-            )
+        if not title:
+            return None
 
-            # Extract year from pub_date if not already set
-            if pub.year is None and pub_date:
-                pub.year = pub.extract_year()
+        # Extract author from 245$c (statement of responsibility)
+        author = data_fields.get(("245", "c"), "")
+
+        # Extract main author from 1xx fields (100, 110, 111) - priority order
+        main_author = data_fields.get(("100", "a")) or ""
+        # Clean up dates from personal names (e.g., "Smith, John, 1945-" -> "Smith, John")
+        if main_author and "," in main_author:
+            parts = main_author.split(",")
+            if len(parts) >= 3:
+                # Check if the last part looks like a date
+                last_part = parts[-1].strip()
+                if last_part and (last_part[0].isdigit() or last_part.endswith("-")):
+                    main_author = ",".join(parts[:-1]).strip()
+
+        # If no 100, try 110$a (corporate name), then 111$a (meeting name)
+        if not main_author:
+            main_author = data_fields.get(("110", "a")) or ""
+        if not main_author:
+            main_author = data_fields.get(("111", "a")) or ""
+
+        # 008 field is used for publication date, country and language
+        control_008 = control_fields.get("008")
+
+        # Extract publication date (try 264 first, then 260, then 008)
+        if ("264", "c") in data_fields:
+            pub_date = data_fields[("264", "c")]
+        elif ("260", "c") in data_fields:
+            pub_date = data_fields[("260", "c")]
+        elif control_008 and len(control_008) >= 11:
+            pub_date = control_008[7:11]
+        else:
+            pub_date = ""
+
+        # Extract country information from 008 field
+        country_code = ""
+        country_classification = CountryClassification.UNKNOWN
+        language_code = ""
+        if control_008:
+            country_code, country_classification = extract_country_from_marc_008(control_008)
+            # Extract language code from positions 35-37
+            if len(control_008) >= 38:
+                language_code = control_008[35:38].strip().lower()
+
+        # Fallback to field 041$a if no language in 008
+        if not language_code:
+            lang_041 = data_fields.get(("041", "a"))
+            if lang_041:
+                language_code = lang_041.strip().lower()[:3]  # Take first 3 chars
+
+        # Extract publisher and place (try 264 first, then 260)
+        publisher = data_fields.get(("264", "b"), data_fields.get(("260", "b"), ""))
+        place = data_fields.get(("264", "a"), data_fields.get(("260", "a"), ""))
+
+        # Extract edition statement from field 250$a
+        edition = data_fields.get(("250", "a"), "")
+
+        # Extract record ID
+        source_id = control_fields.get("001", "")
+
+        # Extract LCCN from field 010$a
+        lccn_text = data_fields.get(("010", "a"))
+        lccn = lccn_text.strip() if lccn_text else ""
+
+        pub = Publication(
+            title=title,
+            author=author,
+            main_author=main_author,
+            pub_date=pub_date,
+            publisher=publisher,
+            place=place,
+            edition=edition,
+            lccn=lccn,
+            language_code=language_code,
+            source="MARC",
+            source_id=source_id,
+            country_code=country_code,
+            country_classification=country_classification,
+        )
 
-            return pub
+        # Extract year from pub_date if not already set
+        if pub.year is None and pub_date:
+            pub.year = pub.extract_year()
 
-        except Exception:
-            return None
+        return self.interner.intern_publication(pub)
 
     def _should_include_record(self, pub: Publication) -> bool:
         """Check if record should be included based on year and country filters"""
@@ -3,19 +3,29 @@
 """Parallel loader for copyright registration XML files"""
 
 # Standard library imports
+from concurrent.futures import Executor
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import as_completed
-from glob import glob
+from contextlib import nullcontext
 from logging import getLogger
+from os import makedirs
+from os import remove
 from os.path import exists
 from os.path import join
 from re import match
 from re import search
+from tempfile import TemporaryDirectory
 from time import time
 from xml.etree import ElementTree as ET
 
 # Local imports
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence._columnar_shard import ColumnarShard
+from marc_pd_tool.infrastructure.persistence._columnar_shard import write_shard
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceManifest
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import open_binary
 
 logger = getLogger(__name__)
 
@@ -29,6 +39,10 @@ class ParallelCopyrightLoader:
         min_year: int | None = None,
         max_year: int | None = None,
         num_workers: int | None = None,
+        manifest: SourceManifest | None = None,
+        shard_dir: str | None = None,
+        interner: StringInterner | None = None,
+        executor: Executor | None = None,
     ):
         """Initialize parallel copyright loader
 
@@ -37,10 +51,19 @@ class ParallelCopyrightLoader:
             min_year: Minimum year to load (inclusive)
             max_year: Maximum year to load (inclusive)
             num_workers: Number of parallel workers (default: cpu_count - 4)
+            manifest: Source manifest used to skip files wholly outside the year range
+            shard_dir: Directory for the workers' temporary columnar shards
+                (default: the system temp directory)
+            interner: Interner shared with other loaders for repeated field values
+            executor: Process pool shared with other Phase 1 work, or None to start one
         """
         self.copyright_dir = copyright_dir
         self.min_year = min_year
         self.max_year = max_year
+        self.manifest = manifest
+        self.shard_dir = shard_dir
+        self.interner = interner if interner is not None else StringInterner()
+        self.executor = executor
 
         # Use specified number of workers, with fallback
         if num_workers is None:
@@ -66,9 +89,10 @@ class ParallelCopyrightLoader:
             logger.warning(f"Copyright directory does not exist: {self.copyright_dir}")
             return []
 
-        # Find all XML files recursively
-        pattern = join(self.copyright_dir, "**", "*.xml")
-        all_files = glob(pattern, recursive=True)
+        # Find all XML files recursively, including gzip/bzip2/xz compressed ones
+        all_files = [
+            str(path) for path in find_data_files(self.copyright_dir, ".xml", recursive=True)
+        ]
 
         if not self.min_year and not self.max_year:
             return all_files
@@ -85,6 +109,11 @@ class ParallelCopyrightLoader:
                     continue
             filtered_files.append(file_path)
 
+        if self.manifest is not None:
+            filtered_files = self.manifest.filter_files(
+                filtered_files, self.min_year, self.max_year
+            )
+
         return filtered_files
 
     def _extract_year_from_path(self, file_path: str) -> int | None:
@@ -143,31 +172,51 @@ class ParallelCopyrightLoader:
             f"using {self.num_workers} worker{'s' if self.num_workers != 1 else ''} "
             f"({len(file_chunks)} chunks)"
         )
+        if self.manifest is not None:
+            expected = self.manifest.expected_records(self.xml_files)
+            logger.info(f"  Source manifest lists {expected:,} entries in these files")
 
         start_time = time()
-        all_publications = []
+        chunk_publications: list[list[Publication]] = [[] for _ in file_chunks]
         chunks_processed = 0
         total_files_processed = 0
         files_with_errors = 0
 
-        # Use ProcessPoolExecutor for true parallelism
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+        if self.shard_dir is not None:
+            makedirs(self.shard_dir, exist_ok=True)
+
+        # Workers write columnar shards rather than pickling publications back;
+        # the parent maps each shard and builds its publications in one pass
+        with (
+            TemporaryDirectory(prefix="marcpd_shards_", dir=self.shard_dir) as shard_dir,
+            (
+                nullcontext(self.executor)
+                if self.executor is not None
+                else ProcessPoolExecutor(max_workers=self.num_workers)
+            ) as executor,
+        ):
             # Submit chunks for processing
             future_to_chunk = {
                 executor.submit(
-                    _load_multiple_xml_files_static, chunk, self.min_year, self.max_year
-                ): chunk
-                for chunk in file_chunks
+                    _load_xml_files_to_shard_static,
+                    chunk,
+                    self.min_year,
+                    self.max_year,
+                    join(shard_dir, f"chunk_{index:05d}.shard"),
+                ): (index, chunk)
+                for index, chunk in enumerate(file_chunks)
             }
 
             # Process results as they complete
             for future in as_completed(future_to_chunk):
-                chunk = future_to_chunk[future]
+                index, chunk = future_to_chunk[future]
                 chunks_processed += 1
 
                 try:
-                    publications, chunk_errors = future.result()
-                    all_publications.extend(publications)
+                    shard_path, chunk_errors = future.result()
+                    with ColumnarShard(shard_path) as shard:
+                        chunk_publications[index] = shard.to_publications(self.interner)
+                    remove(shard_path)
                     total_files_processed += len(chunk)
                     files_with_errors += chunk_errors
 
@@ -184,6 +233,9 @@ class ParallelCopyrightLoader:
                     files_with_errors += len(chunk)
                     logger.warning(f"Error processing chunk: {e}")
 
+        # Keep file order regardless of which chunk finished first
+        all_publications = [pub for publications in chunk_publications for pub in publications]
+
         elapsed = time() - start_time
         logger.info(
             f"Loaded {len(all_publications):,} copyright records from "
@@ -214,10 +266,12 @@ def _load_multiple_xml_files_static(
     """
     all_publications = []
     files_with_errors = 0
+    # Shared by every file in the chunk, so the shard stores each repeated value once
+    interner = StringInterner()
 
     for file_path in file_paths:
         try:
-            publications = _load_single_xml_file_static(file_path, min_year, max_year)
+            publications = _load_single_xml_file_static(file_path, min_year, max_year, interner)
             all_publications.extend(publications)
         except Exception:
             files_with_errors += 1
@@ -226,8 +280,32 @@ def _load_multiple_xml_files_static(
     return all_publications, files_with_errors
 
 
+def _load_xml_files_to_shard_static(
+    file_paths: list[str], min_year: int | None, max_year: int | None, shard_path: str
+) -> tuple[str, int]:
+    """Load a chunk of XML files in a worker process and write them as a columnar shard
+
+    Args:
+        file_paths: List of XML file paths to process
+        min_year: Minimum year filter
+        max_year: Maximum year filter
+        shard_path: Shard file to write
+
+    Returns:
+        Tuple of (shard path, number of files with errors)
+    """
+    publications, files_with_errors = _load_multiple_xml_files_static(
+        file_paths, min_year, max_year
+    )
+    write_shard(shard_path, publications)
+    return shard_path, files_with_errors
+
+
 def _load_single_xml_file_static(
-    file_path: str, min_year: int | None, max_year: int | None
+    file_path: str,
+    min_year: int | None,
+    max_year: int | None,
+    interner: StringInterner | None = None,
 ) -> list[Publication]:
     """Static method to load a single XML file
 
@@ -238,14 +316,18 @@ def _load_single_xml_file_static(
         file_path: Path to XML file
         min_year: Minimum year filter
         max_year: Maximum year filter
+        interner: Interner for repeated field values (a new one per file if None)
 
     Returns:
         List of Publication objects from this file
     """
+    if interner is None:
+        interner = StringInterner()
     publications = []
 
     try:
-        tree = ET.parse(file_path)
+        with open_binary(file_path) as xml_file:
+            tree = ET.parse(xml_file)
         root = tree.getroot()
 
         # Process each copyright entry
@@ -332,7 +414,7 @@ def _load_single_xml_file_static(
                     source_id=source_id,
                     year=year,
                 )
-                publications.append(pub)
+                publications.append(interner.intern_publication(pub))
 
             except (AttributeError, KeyError, ValueError):
                 # AttributeError: missing XML attributes
@@ -0,0 +1,194 @@
+# marc_pd_tool/infrastructure/persistence/_parallel_marc_loader.py
+
+"""Parallel parsing of a single large MARC XML file by record byte ranges"""
+
+# Standard library imports
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from logging import getLogger
+from pathlib import Path
+from re import compile as re_compile
+from typing import Iterator
+from xml.etree.cElementTree import iterparse
+
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+
+logger = getLogger(__name__)
+
+# Start of a <record> element, with or without a namespace prefix (e.g. <marc:record ...>)
+_RECORD_START = re_compile(rb"<(?:[A-Za-z_][\w.-]*:)?record[\s>/]")
+
+# First real element in the file header - the collection root wrapping the records
+_ROOT_START = re_compile(rb"<([A-Za-z_][\w.:-]*)[\s>/]")
+
+# How far to read when searching for a boundary near a split point
+_SCAN_BLOCK_BYTES = 1024 * 1024
+
+# (publication or None, include_record, filter_reason) for every record in a range
+type RecordOutcome = tuple[Publication | None, bool, str | None]
+
+# (marc_path, start, end, header, footer, min_year, max_year, us_only, max_data_year)
+type ByteRangeTask = tuple[str, int, int, bytes, bytes, int | None, int | None, bool, int | None]
+
+
+def find_record_byte_ranges(
+    marc_file: Path, chunk_bytes: int
+) -> tuple[bytes, bytes, list[tuple[int, int]]] | None:
+    """Split a MARC XML file into byte ranges that each start at a record boundary
+
+    Args:
+        marc_file: MARC XML file to split
+        chunk_bytes: Approximate size of each range
+
+    Returns:
+        Tuple of (header bytes before the first record, closing root tag, list of
+        (start, end) ranges), or None if the file layout isn't recognised
+    """
+    file_size = marc_file.stat().st_size
+
+    with open(marc_file, "rb") as f:
+        head = f.read(_SCAN_BLOCK_BYTES)
+        first_record = _RECORD_START.search(head)
+        if first_record is None:
+            return None
+        header = head[: first_record.start()]
+
+        # Skip the XML declaration, comments and doctype to find the root element
+        root_name = None
+        for root_match in _ROOT_START.finditer(header):
+            root_name = root_match.group(1)
+            break
+        if root_name is None:
+            return None
+        footer = b"</" + root_name + b">"
+
+        # Records end where the closing root tag begins
+        tail_start = max(0, file_size - _SCAN_BLOCK_BYTES)
+        f.seek(tail_start)
+        tail = f.read()
+        footer_pos = tail.rfind(footer)
+        if footer_pos < 0:
+            return None
+        data_end = tail_start + footer_pos
+
+        boundaries = [first_record.start()]
+        position = first_record.start() + chunk_bytes
+        while position < data_end:
+            f.seek(position)
+            block = f.read(_SCAN_BLOCK_BYTES)
+            next_record = _RECORD_START.search(block)
+            if next_record is None:
+                # No record starts in this block; keep scanning forward
+                position += len(block) or _SCAN_BLOCK_BYTES
+                continue
+            boundary = position + next_record.start()
+            if boundary >= data_end:
+                break
+            boundaries.append(boundary)
+            position = boundary + chunk_bytes
+
+    ranges = list(zip(boundaries, boundaries[1:] + [data_end]))
+    return header, footer, ranges
+
+
+def _parse_byte_range_static(task: ByteRangeTask) -> list[RecordOutcome]:
+    """Parse the records in one byte range (static method for multiprocessing)
+
+    Args:
+        task: Byte range and loader filter settings
+
+    Returns:
+        Extraction and filter outcome for each record, in file order
+    """
+    # Local imports
+    from marc_pd_tool.infrastructure.persistence._marc_loader import MarcLoader
+
+    marc_path, start, end, header, footer, min_year, max_year, us_only, max_data_year = task
+    loader = MarcLoader(
+        marc_path,
+        min_year=min_year,
+        max_year=max_year,
+        us_only=us_only,
+        max_data_year=max_data_year,
+        num_workers=1,
+    )
+
+    with open(marc_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    outcomes: list[RecordOutcome] = []
+    context = iterparse(BytesIO(header + data + footer), events=("start", "end"))
+    event, root = next(context)
+    for event, elem in context:
+        if event == "end" and elem.tag.endswith("record"):
+            pub = loader._extract_from_record(elem)
+            if pub:
+                include_record, filter_reason = loader._should_include_record_with_reason(pub)
+                outcomes.append((pub, include_record, filter_reason))
+            else:
+                outcomes.append((None, False, None))
+            elem.clear()
+            root.clear()
+
+    return outcomes
+
+
+def iter_records_parallel(
+    marc_file: Path,
+    num_workers: int,
+    chunk_bytes: int,
+    min_year: int | None,
+    max_year: int | None,
+    us_only: bool,
+    max_data_year: int | None,
+) -> Iterator[tuple[Publication | None, bool, str | None, int]] | None:
+    """Parse a MARC XML file across a process pool, yielding records in file order
+
+    Args:
+        marc_file: MARC XML file to parse
+        num_workers: Number of worker processes
+        chunk_bytes: Approximate byte range handed to each task
+        min_year: Minimum publication year filter
+        max_year: Maximum publication year filter
+        us_only: Only include US publications
+        max_data_year: Latest year covered by the copyright/renewal data
+
+    Returns:
+        Iterator of (publication or None, include_record, filter_reason, bytes
+        consumed), or None if the file can't be split and must be read sequentially
+    """
+    split = find_record_byte_ranges(marc_file, chunk_bytes)
+    if split is None:
+        logger.debug(f"Could not split {marc_file.name} by records, parsing sequentially")
+        return None
+
+    header, footer, ranges = split
+    logger.info(
+        f"  Parsing {marc_file.name} in {len(ranges)} byte ranges across {num_workers} workers"
+    )
+    tasks: list[ByteRangeTask] = [
+        (str(marc_file), start, end, header, footer, min_year, max_year, us_only, max_data_year)
+        for start, end in ranges
+    ]
+
+    def generate() -> Iterator[tuple[Publication | None, bool, str | None, int]]:
+        # Keep a bounded window of ranges in flight so results are consumed in
+        # order without holding the whole file's publications in memory
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            pending: deque[tuple[Future[list[RecordOutcome]], int]] = deque()
+            next_task = 0
+            while next_task < len(tasks) or pending:
+                while next_task < len(tasks) and len(pending) < num_workers * 2:
+                    task = tasks[next_task]
+                    pending.append((executor.submit(_parse_byte_range_static, task), task[2]))
+                    next_task += 1
+
+                future, range_end = pending.popleft()
+                for pub, include_record, filter_reason in future.result():
+                    yield pub, include_record, filter_reason, range_end
+
+    return generate()
@@ -3,19 +3,33 @@
 """Parallel loader for renewal TSV files"""
 
 # Standard library imports
+from concurrent.futures import Executor
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import as_completed
+from contextlib import nullcontext
 from csv import DictReader
 from csv import Error
-from glob import glob
+from io import StringIO
 from logging import getLogger
+from os import makedirs
+from os import remove
 from os.path import exists
 from os.path import join
 from re import match
+from tempfile import TemporaryDirectory
 from time import time
 
 # Local imports
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence._columnar_shard import ColumnarShard
+from marc_pd_tool.infrastructure.persistence._columnar_shard import write_shard
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceManifest
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import open_text
+from marc_pd_tool.shared.utils.file_utils import strip_compression_suffix
+from marc_pd_tool.shared.utils.memory_utils import paused_gc
+from marc_pd_tool.shared.utils.text_utils import extract_year
 
 logger = getLogger(__name__)
 
@@ -29,6 +43,10 @@ class ParallelRenewalLoader:
         min_year: int | None = None,
         max_year: int | None = None,
         num_workers: int | None = None,
+        manifest: SourceManifest | None = None,
+        shard_dir: str | None = None,
+        interner: StringInterner | None = None,
+        executor: Executor | None = None,
     ):
         """Initialize parallel renewal loader
 
@@ -37,10 +55,19 @@ class ParallelRenewalLoader:
             min_year: Minimum year to load (inclusive)
             max_year: Maximum year to load (inclusive)
             num_workers: Number of parallel workers (default: cpu_count - 4)
+            manifest: Source manifest used to skip files wholly outside the year range
+            shard_dir: Directory for the workers' temporary columnar shards
+                (default: the system temp directory)
+            interner: Interner shared with other loaders for repeated field values
+            executor: Process pool shared with other Phase 1 work, or None to start one
         """
         self.renewal_dir = renewal_dir
         self.min_year = min_year
         self.max_year = max_year
+        self.manifest = manifest
+        self.shard_dir = shard_dir
+        self.interner = interner if interner is not None else StringInterner()
+        self.executor = executor
 
         # Use specified number of workers, with fallback
         if num_workers is None:
@@ -66,9 +93,8 @@ class ParallelRenewalLoader:
             logger.warning(f"Renewal directory does not exist: {self.renewal_dir}")
             return []
 
-        # Find all TSV files
-        pattern = join(self.renewal_dir, "*.tsv")
-        all_files = glob(pattern)
+        # Find all TSV files, including gzip/bzip2/xz compressed ones
+        all_files = [str(path) for path in find_data_files(self.renewal_dir, ".tsv")]
 
         if not self.min_year and not self.max_year:
             return all_files
@@ -85,6 +111,11 @@ class ParallelRenewalLoader:
                     continue
             filtered_files.append(file_path)
 
+        if self.manifest is not None:
+            filtered_files = self.manifest.filter_files(
+                filtered_files, self.min_year, self.max_year
+            )
+
         return filtered_files
 
     def _extract_year_from_path(self, file_path: str) -> int | None:
@@ -97,7 +128,7 @@ class ParallelRenewalLoader:
             Year or None if not found
         """
         # Extract filename
-        filename = file_path.split("/")[-1].replace(".tsv", "")
+        filename = strip_compression_suffix(file_path).name.replace(".tsv", "")
 
         # Try to find 4-digit year at start of filename
         year_match = match(r"^(\d{4})", filename)
@@ -139,31 +170,51 @@ class ParallelRenewalLoader:
             f"using {self.num_workers} worker{'s' if self.num_workers != 1 else ''} "
             f"({len(file_chunks)} chunks)"
         )
+        if self.manifest is not None:
+            expected = self.manifest.expected_records(self.tsv_files)
+            logger.info(f"  Source manifest lists {expected:,} entries in these files")
 
         start_time = time()
-        all_publications = []
+        chunk_publications: list[list[Publication]] = [[] for _ in file_chunks]
         chunks_processed = 0
         total_files_processed = 0
         files_with_errors = 0
 
-        # Use ProcessPoolExecutor for true parallelism
-        with ProcessPoolExecutor(max_workers=self.num_workers) as executor:
+        if self.shard_dir is not None:
+            makedirs(self.shard_dir, exist_ok=True)
+
+        # Workers write columnar shards rather than pickling publications back;
+        # the parent maps each shard and builds its publications in one pass
+        with (
+            TemporaryDirectory(prefix="marcpd_shards_", dir=self.shard_dir) as shard_dir,
+            (
+                nullcontext(self.executor)
+                if self.executor is not None
+                else ProcessPoolExecutor(max_workers=self.num_workers)
+            ) as executor,
+        ):
             # Submit chunks for processing
             future_to_chunk = {
                 executor.submit(
-                    _load_multiple_tsv_files_static, chunk, self.min_year, self.max_year
-                ): chunk
-                for chunk in file_chunks
+                    _load_tsv_files_to_shard_static,
+                    chunk,
+                    self.min_year,
+                    self.max_year,
+                    join(shard_dir, f"chunk_{index:05d}.shard"),
+                ): (index, chunk)
+                for index, chunk in enumerate(file_chunks)
             }
 
             # Process results as they complete
             for future in as_completed(future_to_chunk):
-                chunk = future_to_chunk[future]
+                index, chunk = future_to_chunk[future]
                 chunks_processed += 1
 
                 try:
-                    publications, chunk_errors = future.result()
-                    all_publications.extend(publications)
+                    shard_path, chunk_errors = future.result()
+                    with ColumnarShard(shard_path) as shard:
+                        chunk_publications[index] = shard.to_publications(self.interner)
+                    remove(shard_path)
                     total_files_processed += len(chunk)
                     files_with_errors += chunk_errors
 
@@ -180,6 +231,9 @@ class ParallelRenewalLoader:
                     files_with_errors += len(chunk)
                     logger.warning(f"Error processing chunk: {e}")
 
+        # Keep file order regardless of which chunk finished first
+        all_publications = [pub for publications in chunk_publications for pub in publications]
+
         elapsed = time() - start_time
         logger.info(
             f"Loaded {len(all_publications):,} renewal records from "
@@ -210,10 +264,12 @@ def _load_multiple_tsv_files_static(
     """
     all_publications = []
     files_with_errors = 0
+    # Shared by every file in the chunk, so the shard stores each repeated value once
+    interner = StringInterner()
 
     for file_path in file_paths:
         try:
-            publications = _load_single_tsv_file_static(file_path, min_year, max_year)
+            publications = _load_single_tsv_file_static(file_path, min_year, max_year, interner)
             all_publications.extend(publications)
         except Exception:
             files_with_errors += 1
@@ -222,94 +278,260 @@ def _load_multiple_tsv_files_static(
     return all_publications, files_with_errors
 
 
+def _load_tsv_files_to_shard_static(
+    file_paths: list[str], min_year: int | None, max_year: int | None, shard_path: str
+) -> tuple[str, int]:
+    """Load a chunk of TSV files in a worker process and write them as a columnar shard
+
+    Args:
+        file_paths: List of TSV file paths to process
+        min_year: Minimum year filter
+        max_year: Maximum year filter
+        shard_path: Shard file to write
+
+    Returns:
+        Tuple of (shard path, number of files with errors)
+    """
+    publications, files_with_errors = _load_multiple_tsv_files_static(
+        file_paths, min_year, max_year
+    )
+    write_shard(shard_path, publications)
+    return shard_path, files_with_errors
+
+
 def _load_single_tsv_file_static(
-    file_path: str, min_year: int | None, max_year: int | None
+    file_path: str,
+    min_year: int | None,
+    max_year: int | None,
+    interner: StringInterner | None = None,
 ) -> list[Publication]:
     """Static method to load a single TSV file
 
     This must be a module-level function for multiprocessing to pickle it.
-    Replicates the logic from RenewalDataLoader._extract_from_row exactly.
+    Produces the same publications as RenewalDataLoader._extract_from_row.
 
     Args:
         file_path: Path to TSV file
         min_year: Minimum year filter
         max_year: Maximum year filter
+        interner: Interner for repeated field values (a new one per file if None)
 
     Returns:
         List of Publication objects from this file
     """
-    publications = []
+    if interner is None:
+        interner = StringInterner()
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = DictReader(f, delimiter="\t")
+        with open_text(file_path) as f:
+            text = f.read()
 
-            for row in reader:
-                try:
-                    # Extract title
-                    title = row.get("title", "").strip()
-                    if not title:
-                        continue
-
-                    # Extract author
-                    author = row.get("author", "").strip()
-
-                    # Extract publication date - use original registration date (odat)
-                    pub_date = row.get("odat", "").strip()
-
-                    # Extract entry_id for source_id (direct lookup in TSV files)
-                    entry_id = row.get("entry_id", "").strip()
-                    source_id = entry_id
-
-                    # Extract volume and part information from TSV columns (but don't append to title for better matching)
-                    row.get("volume", "").strip()
-                    row.get("part", "").strip()
-
-                    # Note: Volume/part information available but not concatenated to avoid match pollution
-
-                    # Store full_text for publisher fuzzy matching (don't extract publisher)
-                    full_text = row.get("full_text", "").strip()
-                    publisher = ""  # Will be populated from full_text during fuzzy matching
-                    place = ""
-
-                    # Create Publication object matching RenewalDataLoader exactly
-                    pub = Publication(
-                        title=title,
-                        author=author,
-                        main_author="",  # Renewal data doesn't have separate main author field
-                        pub_date=pub_date,
-                        publisher=publisher,
-                        place=place,
-                        lccn="",  # Renewal data doesn't contain LCCN information
-                        source="Renewal",
-                        source_id=source_id,
-                        full_text=full_text,
-                    )
-
-                    # Extract year from pub_date if not already set
-                    # Note: pub.year is set in the Publication constructor from pub_date
-                    # so we don't need to call extract_year() here
-
-                    # Apply year filter
-                    if pub.year is not None:
-                        if min_year and pub.year < min_year:
-                            continue
-                        if max_year and pub.year > max_year:
-                            continue
-
-                    publications.append(pub)
-
-                except (KeyError, ValueError, AttributeError) as e:
-                    # KeyError: missing expected columns in row
-                    # ValueError: invalid data format for year extraction
-                    # AttributeError: None values in expected fields
-                    logger.debug(f"Error extracting from row in {file_path}: {e}")
-                    continue
+        if _has_quoted_fields(text):
+            return _parse_tsv_dict_rows(text, file_path, min_year, max_year, interner)
+        return _parse_tsv_positional(text, min_year, max_year, interner)
 
     except (OSError, UnicodeDecodeError, Error) as e:
         # OSError: file access issues
         # UnicodeDecodeError: encoding problems in TSV file
         # Error: malformed CSV/TSV data
         logger.warning(f"Error parsing {file_path}: {e}")
+        return []
+
+
+def _has_quoted_fields(text: str) -> bool:
+    """Check whether any field starts with a quote character
+
+    The csv module treats such fields as quoted (they may then contain tabs
+    or line breaks), so they can't be split positionally.
+
+    Args:
+        text: Whole TSV file content
+
+    Returns:
+        True if the file needs full csv parsing
+    """
+    return text.startswith('"') or '\t"' in text or '\n"' in text
+
+
+def _parse_tsv_positional(
+    text: str, min_year: int | None, max_year: int | None, interner: StringInterner | None = None
+) -> list[Publication]:
+    """Parse an unquoted renewal TSV by column position
+
+    Header indices are resolved once, lines are split directly, and the year
+    filter runs on the raw odat before any Publication is built.
+
+    Args:
+        text: Whole TSV file content
+        min_year: Minimum year filter
+        max_year: Maximum year filter
+        interner: Interner for the author and date values (a new one if None)
+
+    Returns:
+        List of Publication objects from this file
+    """
+    intern = (interner if interner is not None else StringInterner()).intern
+
+    # Publications and row tuples hold no reference cycles
+    with paused_gc():
+        lines = text.split("\n")
+        header = lines[0].split("\t")
+        columns = {name: i for i, name in enumerate(header)}
+
+        title_idx = columns.get("title")
+        author_idx = columns.get("author")
+        odat_idx = columns.get("odat")
+        entry_id_idx = columns.get("entry_id")
+        full_text_idx = columns.get("full_text")
+
+        # csv.DictReader fills columns missing from a short row with None, which made
+        # the row-based extraction skip the row; only columns it read count here
+        read_columns = [
+            columns[name]
+            for name in ("title", "author", "odat", "entry_id", "volume", "part", "full_text")
+            if name in columns
+        ]
+        min_fields = max(read_columns) + 1 if read_columns else 0
+
+        # Registration dates repeat heavily, so each distinct odat is parsed once
+        years: dict[str, int | None] = {}
+        rows: list[tuple[str, str, str, str, str, int | None]] = []
+        for line in lines[1:]:
+            if not line:
+                continue
+            fields = line.split("\t")
+            if len(fields) < min_fields:
+                continue
+
+            title = fields[title_idx].strip() if title_idx is not None else ""
+            if not title:
+                continue
+
+            pub_date = fields[odat_idx].strip() if odat_idx is not None else ""
+            if pub_date in years:
+                year = years[pub_date]
+            else:
+                year = years[pub_date] = extract_year(pub_date) if pub_date else None
+            if year is not None:
+                if min_year and year < min_year:
+                    continue
+                if max_year and year > max_year:
+                    continue
+
+            rows.append(
+                (
+                    title,
+                    intern(fields[author_idx].strip()) if author_idx is not None else "",
+                    intern(pub_date),
+                    fields[entry_id_idx].strip() if entry_id_idx is not None else "",
+                    fields[full_text_idx].strip() if full_text_idx is not None else "",
+                    year,
+                )
+            )
+
+        return [
+            Publication(
+                title=title,
+                author=author,
+                main_author="",  # Renewal data doesn't have separate main author field
+                pub_date=pub_date,
+                publisher="",  # Will be populated from full_text during fuzzy matching
+                place="",
+                lccn="",  # Renewal data doesn't contain LCCN information
+                source="Renewal",
+                source_id=source_id,
+                full_text=full_text,
+                year=year,
+            )
+            for title, author, pub_date, source_id, full_text, year in rows
+        ]
+
+
+def _parse_tsv_dict_rows(
+    text: str,
+    file_path: str,
+    min_year: int | None,
+    max_year: int | None,
+    interner: StringInterner | None = None,
+) -> list[Publication]:
+    """Parse a renewal TSV with csv.DictReader, for files with quoted fields
+
+    Replicates the logic from RenewalDataLoader._extract_from_row exactly.
+
+    Args:
+        text: Whole TSV file content
+        file_path: Path to TSV file, for log messages
+        min_year: Minimum year filter
+        max_year: Maximum year filter
+        interner: Interner for repeated field values (a new one if None)
+
+    Returns:
+        List of Publication objects from this file
+    """
+    if interner is None:
+        interner = StringInterner()
+    publications = []
+
+    for row in DictReader(StringIO(text), delimiter="\t"):
+        try:
+            # Extract title
+            title = row.get("title", "").strip()
+            if not title:
+                continue
+
+            # Extract author
+            author = row.get("author", "").strip()
+
+            # Extract publication date - use original registration date (odat)
+            pub_date = row.get("odat", "").strip()
+
+            # Extract entry_id for source_id (direct lookup in TSV files)
+            entry_id = row.get("entry_id", "").strip()
+            source_id = entry_id
+
+            # Extract volume and part information from TSV columns (but don't append to title for better matching)
+            row.get("volume", "").strip()
+            row.get("part", "").strip()
+
+            # Note: Volume/part information available but not concatenated to avoid match pollution
+
+            # Store full_text for publisher fuzzy matching (don't extract publisher)
+            full_text = row.get("full_text", "").strip()
+            publisher = ""  # Will be populated from full_text during fuzzy matching
+            place = ""
+
+            # Create Publication object matching RenewalDataLoader exactly
+            pub = Publication(
+                title=title,
+                author=author,
+                main_author="",  # Renewal data doesn't have separate main author field
+                pub_date=pub_date,
+                publisher=publisher,
+                place=place,
+                lccn="",  # Renewal data doesn't contain LCCN information
+                source="Renewal",
+                source_id=source_id,
+                full_text=full_text,
+            )
+
+            # Extract year from pub_date if not already set
+            # Note: pub.year is set in the Publication constructor from pub_date
+            # so we don't need to call extract_year() here
+
+            # Apply year filter
+            if pub.year is not None:
+                if min_year and pub.year < min_year:
+                    continue
+                if max_year and pub.year > max_year:
+                    continue
+
+            publications.append(interner.intern_publication(pub))
+
+        except (KeyError, ValueError, AttributeError) as e:
+            # KeyError: missing expected columns in row
+            # ValueError: invalid data format for year extraction
+            # AttributeError: None values in expected fields
+            logger.debug(f"Error extracting from row in {file_path}: {e}")
+            continue
 
     return publications
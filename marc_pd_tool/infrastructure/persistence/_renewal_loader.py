@@ -3,19 +3,26 @@
 """Renewal data TSV loader for publications"""
 
 # Standard library imports
+from concurrent.futures import Executor
 from csv import DictReader
 from csv import Error
 from functools import cached_property
 from logging import getLogger
 from pathlib import Path
 from re import search
+from typing import Iterator
 
 # Local imports
 from marc_pd_tool.core.domain.publication import Publication
 from marc_pd_tool.infrastructure.persistence._parallel_renewal_loader import (
     ParallelRenewalLoader,
 )
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceManifest
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceScanError
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
 from marc_pd_tool.shared.mixins.mixins import YearFilterableMixin
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import open_text
 from marc_pd_tool.shared.utils.publisher_utils import clean_publisher_suffix
 from marc_pd_tool.shared.utils.text_utils import extract_year
 
@@ -23,24 +30,46 @@ logger = getLogger(__name__)
 
 
 class RenewalDataLoader(YearFilterableMixin):
-    def __init__(self, renewal_dir: str, num_workers: int | None = None) -> None:
+    def __init__(
+        self, renewal_dir: str, num_workers: int | None = None, cache_dir: str | None = None
+    ) -> None:
+        """Initialize the renewal loader
+
+        Args:
+            renewal_dir: Directory containing renewal TSV files
+            num_workers: Number of parallel workers (default: cpu_count - 4)
+            cache_dir: Directory for the source manifest, string table and loader shards
+                (in memory and the system temp directory if None)
+        """
         self.renewal_dir = Path(renewal_dir)
         self.num_workers = num_workers
+        self.cache_dir = cache_dir
+        self.manifest = SourceManifest(
+            self.renewal_dir, ".tsv", self._iter_row_years, cache_dir=cache_dir, kind="renewal"
+        )
 
     def load_all_renewal_data(
-        self, min_year: int | None = None, max_year: int | None = None
+        self,
+        min_year: int | None = None,
+        max_year: int | None = None,
+        executor: Executor | None = None,
     ) -> list[Publication]:
         """Load renewal data, optionally filtered by year range
 
         Args:
             min_year: Minimum year to include (inclusive)
             max_year: Maximum year to include (inclusive)
+            executor: Process pool to load files in, or None to start one
 
         Returns:
             List of Publication objects
         """
         self._log_year_filtering(min_year, max_year, "renewal")
 
+        # Repeated authors, publishers, places and dates share one string each;
+        # the table is seeded from and saved back to the cache directory
+        interner = StringInterner.for_cache_dir(self.cache_dir)
+
         # Always try parallel loading first, with automatic fallback to sequential
         try:
             parallel_loader = ParallelRenewalLoader(
@@ -48,14 +77,28 @@ class RenewalDataLoader(YearFilterableMixin):
                 min_year=min_year,
                 max_year=max_year,
                 num_workers=self.num_workers,
+                manifest=self.manifest if min_year is not None or max_year is not None else None,
+                shard_dir=self.cache_dir,
+                interner=interner,
+                executor=executor,
             )
-            return parallel_loader.load_all_parallel()
+            publications = parallel_loader.load_all_parallel()
+            interner.log_stats("renewal")
+            interner.save()
+            return publications
         except Exception as e:
             logger.warning(f"Parallel loading failed, falling back to sequential: {e}")
             # Fall through to sequential loading
 
         all_publications: list[Publication] = []
-        tsv_files = sorted(self.renewal_dir.glob("*.tsv"), key=lambda x: str(x))
+        tsv_files = [
+            Path(path)
+            for path in self.manifest.filter_files(
+                [str(path) for path in find_data_files(self.renewal_dir, ".tsv")],
+                min_year,
+                max_year,
+            )
+        ]
         logger.info(f"Found {len(tsv_files)} TSV files in renewal directory")
 
         batch_start_count = 0
@@ -72,7 +115,7 @@ class RenewalDataLoader(YearFilterableMixin):
             # Use mixin for year filtering
             pubs = self._filter_by_year(pubs, min_year, max_year)
 
-            all_publications.extend(pubs)
+            all_publications.extend(interner.intern_publication(pub) for pub in pubs)
 
             # Log summary after completing each batch of 10 (or at the end)
             if (i + 1) % 10 == 0 or i == len(tsv_files) - 1:
@@ -85,13 +128,15 @@ class RenewalDataLoader(YearFilterableMixin):
                 )
 
         logger.info(f"Loaded {len(all_publications):,} renewal entries from {len(tsv_files)} files")
+        interner.log_stats("renewal")
+        interner.save()
         return all_publications
 
     def _extract_from_file(self, tsv_file: Path) -> list[Publication]:
         publications = []
 
         try:
-            with open(tsv_file, "r", encoding="utf-8") as file:
+            with open_text(tsv_file) as file:
                 reader = DictReader(file, delimiter="\t")
 
                 for row in reader:
@@ -211,44 +256,22 @@ class RenewalDataLoader(YearFilterableMixin):
     def year_range(self) -> tuple[int | None, int | None]:
         """Get the year range (min, max) of renewal data without loading full publications
 
+        Reads the source manifest, so only new or changed files are scanned.
+
         Returns:
             Tuple of (min_year, max_year) or (None, None) if no valid years found
         """
         logger.info("Analyzing year range in renewal data...")
 
-        tsv_files = sorted(self.renewal_dir.rglob("*.tsv"), key=lambda x: str(x))
-        if not tsv_files:
+        self.manifest.refresh()
+        if not self.manifest.entries:
             logger.warning("No renewal TSV files found")
             return None, None
 
-        min_year = None
-        max_year = None
-        valid_years = 0
-        total_entries = 0
-
-        for tsv_file in tsv_files:
-            try:
-                with open(tsv_file, "r", encoding="utf-8") as f:
-                    reader = DictReader(f, delimiter="\t")
-
-                    for row in reader:
-                        total_entries += 1
-                        year = self._extract_year_from_row(row)
-
-                        if year is not None:
-                            valid_years += 1
-                            if min_year is None or year < min_year:
-                                min_year = year
-                            if max_year is None or year > max_year:
-                                max_year = year
-
-            except (OSError, UnicodeDecodeError, Error) as e:
-                # Same as above - file/CSV parsing errors
-                logger.warning(f"Error analyzing years in {tsv_file}: {e}")
-                continue
-
+        min_year, max_year = self.manifest.year_range
         logger.info(
-            f"Renewal data year analysis: {valid_years:,}/{total_entries:,} entries with valid years"
+            f"Renewal data year analysis: {self.manifest.dated_count:,}/"
+            f"{self.manifest.record_count:,} entries with valid years"
         )
         if min_year is not None and max_year is not None:
             logger.info(f"Renewal data year range: {min_year} - {max_year}")
@@ -257,6 +280,59 @@ class RenewalDataLoader(YearFilterableMixin):
 
         return min_year, max_year
 
+    def year_filter_matches_load(
+        self,
+        loaded_min: int | None,
+        loaded_max: int | None,
+        min_year: int | None,
+        max_year: int | None,
+    ) -> bool:
+        """Check whether year-filtering a wider load gives the entries of loading a range
+
+        Loading a year range skips files whose path names a year outside it
+        (``1950-1.tsv``) together with their undated and misfiled entries, which
+        the year filter alone keeps. The two agree only if none of the files
+        skipped that way holds an entry the year filter keeps.
+
+        Args:
+            loaded_min: Minimum year of the wider load, None for no minimum
+            loaded_max: Maximum year of the wider load, None for no maximum
+            min_year: Minimum year of the range, None for no minimum
+            max_year: Maximum year of the range, None for no maximum
+
+        Returns:
+            True if filtering the wider load by year gives the same entries
+        """
+        source_dir = str(self.renewal_dir)
+        loaded = ParallelRenewalLoader(source_dir, loaded_min, loaded_max, num_workers=1).tsv_files
+        kept = set(ParallelRenewalLoader(source_dir, min_year, max_year, num_workers=1).tsv_files)
+        return not any(
+            self.manifest.may_contain_years(path, min_year, max_year)
+            for path in loaded
+            if path not in kept
+        )
+
+    def _iter_row_years(self, tsv_file: Path) -> Iterator[int | None]:
+        """Yield the year of every renewal row in a file
+
+        Args:
+            tsv_file: Renewal TSV file
+
+        Yields:
+            Row year, or None for rows without a usable date
+
+        Raises:
+            SourceScanError: If the file can't be read or parsed
+        """
+        try:
+            with open_text(tsv_file) as f:
+                for row in DictReader(f, delimiter="\t"):
+                    yield self._extract_year_from_row(row)
+
+        except (OSError, UnicodeDecodeError, Error) as e:
+            # Same as above - file/CSV parsing errors
+            raise SourceScanError(e) from e
+
     def _extract_year_from_row(self, row: dict[str, str]) -> int | None:
         """Extract year from a renewal row without creating Publication object
 
@@ -292,9 +368,9 @@ class RenewalDataLoader(YearFilterableMixin):
 
         # Look for year-named TSV files (e.g., "2001-from-db.tsv", "1991.tsv")
         year_files = []
-        for item in self.renewal_dir.glob("*.tsv"):
+        for item in find_data_files(self.renewal_dir, ".tsv"):
             # Extract year from filename - look for 4-digit year pattern
-            match = search(r"^(\d{4})", item.stem)
+            match = search(r"^(\d{4})", item.name)
             if match:
                 try:
                     year = int(match.group(1))
@@ -309,5 +385,11 @@ class RenewalDataLoader(YearFilterableMixin):
             logger.debug(f"Maximum renewal data year detected: {max_year}")
             return max_year
 
+        # Without year-named files, fall back to the entry years in the manifest
+        _, manifest_max_year = self.manifest.year_range
+        if manifest_max_year is not None:
+            logger.debug(f"Maximum renewal data year from source manifest: {manifest_max_year}")
+            return manifest_max_year
+
         logger.warning("No year-named TSV files found in renewal data")
         return None
@@ -0,0 +1,276 @@
+# marc_pd_tool/infrastructure/persistence/_run_directory.py
+
+"""Durable directory of an analysis run, so interrupted runs can be resumed
+
+A run directory holds the pickled MARC batches of Phase 2, the result and
+stats files the workers write in Phase 3, and a manifest of the batches that
+are complete. Each completed batch is appended to the manifest as one JSON
+line and flushed to disk before its batch pickle is removed, so after a crash,
+OOM kill or Ctrl-C every batch is either in the manifest with all of its
+result files, or still on disk waiting to be matched again.
+"""
+
+# Standard library imports
+from glob import glob
+from json import JSONDecodeError
+from json import dump
+from json import load
+from logging import getLogger
+from os import fsync
+from os import getpid
+from os import listdir
+from os import makedirs
+from os import replace
+from os import unlink
+from os.path import abspath
+from os.path import basename
+from os.path import exists
+from os.path import join
+from shutil import rmtree
+from tempfile import mkdtemp
+
+# Third party imports
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+# Local imports
+from marc_pd_tool.core.types.json import JSONDict
+
+logger = getLogger(__name__)
+
+RUN_VERSION = 1
+RUN_FILENAME = "run.json"
+MANIFEST_FILENAME = "manifest.jsonl"
+
+
+class BatchResultEntry(BaseModel):
+    """One processed piece of a batch: its result file and statistics
+
+    A batch that ran over its time budget is finished by several pieces.
+    """
+
+    batch_id: int
+    result_file: str
+    stats: dict[str, int | float]
+
+
+class CompletedBatch(BaseModel):
+    """Manifest entry of a completed batch"""
+
+    batch: str
+    results: list[BatchResultEntry]
+
+
+class RunDirectory:
+    """Batches, results and manifest of one analysis run
+
+    Layout::
+
+        run.json        settings the run was started with, predicted batch costs
+        manifest.jsonl  one line per completed batch
+        batches/        MARC batch pickles not yet completed
+        results/        worker result and stats files
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the run directory paths
+
+        Args:
+            path: Run directory
+        """
+        self.path = abspath(path)
+        self.batch_dir = join(self.path, "batches")
+        self.result_dir = join(self.path, "results")
+        self.manifest_path = join(self.path, MANIFEST_FILENAME)
+        self.settings: JSONDict = {}
+        self.batch_costs: dict[str, float] = {}
+
+    @classmethod
+    def create(cls, settings: JSONDict, parent_dir: str | None = None) -> "RunDirectory":
+        """Create a new run directory
+
+        Args:
+            settings: Settings that must match for the run to be resumed
+            parent_dir: Directory to create the run directory in (system temp if None)
+
+        Returns:
+            The new run directory
+        """
+        if parent_dir is not None:
+            makedirs(parent_dir, exist_ok=True)
+        run = cls(mkdtemp(prefix="marc_run_", dir=parent_dir))
+        makedirs(run.batch_dir)
+        makedirs(run.result_dir)
+        run.settings = settings
+        run._save()
+        return run
+
+    @classmethod
+    def open(cls, path: str) -> "RunDirectory":
+        """Open an existing run directory
+
+        Args:
+            path: Run directory
+
+        Returns:
+            The run directory
+
+        Raises:
+            FileNotFoundError: If the directory doesn't hold a run
+            ValueError: If the run file can't be read
+        """
+        run = cls(path)
+        run_file = join(run.path, RUN_FILENAME)
+        if not exists(run_file):
+            raise FileNotFoundError(f"No resumable run in {run.path}")
+        try:
+            with open(run_file, "r") as f:
+                data = load(f)
+            if data.get("version") != RUN_VERSION:
+                raise ValueError(f"unsupported run version {data.get('version')}")
+            run.settings = data["settings"]
+            run.batch_costs = {name: float(cost) for name, cost in data["batch_costs"].items()}
+        except (OSError, JSONDecodeError, KeyError, AttributeError, ValueError) as e:
+            raise ValueError(f"Unreadable run file {run_file}: {e}") from e
+        makedirs(run.batch_dir, exist_ok=True)
+        makedirs(run.result_dir, exist_ok=True)
+        return run
+
+    def _save(self) -> None:
+        """Write the run file, replacing the previous one atomically"""
+        run_file = join(self.path, RUN_FILENAME)
+        temp_path = f"{run_file}.{getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            dump(
+                {
+                    "version": RUN_VERSION,
+                    "settings": self.settings,
+                    "batch_costs": self.batch_costs,
+                },
+                f,
+                indent=1,
+            )
+        replace(temp_path, run_file)
+
+    def check_settings(self, settings: JSONDict) -> None:
+        """Check that a resumed run uses the settings it was started with
+
+        Args:
+            settings: Settings of the resuming run
+
+        Raises:
+            ValueError: If any setting differs
+        """
+        changed = sorted(
+            key
+            for key in self.settings.keys() | settings.keys()
+            if self.settings.get(key) != settings.get(key)
+        )
+        if changed:
+            details = ", ".join(
+                f"{key}: {self.settings.get(key)!r} -> {settings.get(key)!r}" for key in changed
+            )
+            raise ValueError(f"Run in {self.path} was started with different settings ({details})")
+
+    def save_batch_costs(self, batch_costs: dict[str, float]) -> None:
+        """Record the predicted cost of each batch, so resumed runs keep the order
+
+        Args:
+            batch_costs: Predicted cost by batch pickle path
+        """
+        self.batch_costs = {basename(path): cost for path, cost in batch_costs.items()}
+        self._save()
+
+    def completed_batches(self) -> dict[str, CompletedBatch]:
+        """Read the manifest
+
+        A line cut short by a crash while it was written is ignored; its batch
+        is simply matched again.
+
+        Returns:
+            Completed batches by batch pickle name
+        """
+        completed: dict[str, CompletedBatch] = {}
+        if not exists(self.manifest_path):
+            return completed
+        with open(self.manifest_path, "r") as f:
+            for line in f:
+                try:
+                    entry = CompletedBatch.model_validate_json(line)
+                except ValidationError:
+                    logger.warning(f"Ignoring incomplete manifest line in {self.manifest_path}")
+                    continue
+                completed[entry.batch] = entry
+        return completed
+
+    def pending_batches(self, completed: dict[str, CompletedBatch]) -> list[str]:
+        """Batch pickles that still need matching
+
+        Args:
+            completed: Completed batches, from completed_batches()
+
+        Returns:
+            Paths of the batch pickles not in the manifest, in file order
+        """
+        return [
+            path
+            for path in sorted(glob(join(self.batch_dir, "batch_*.pkl")))
+            if basename(path) not in completed
+        ]
+
+    def next_batch_id(self, completed: dict[str, CompletedBatch]) -> int:
+        """First batch id not used by a completed batch's result files
+
+        Args:
+            completed: Completed batches, from completed_batches()
+        """
+        ids = [piece.batch_id for entry in completed.values() for piece in entry.results]
+        return max(ids, default=0) + 1
+
+    def discard_unfinished_results(self, completed: dict[str, CompletedBatch]) -> None:
+        """Remove result files of batches that didn't complete
+
+        They were written for batches the manifest doesn't list, which are
+        matched again, and would otherwise be counted twice.
+
+        Args:
+            completed: Completed batches, from completed_batches()
+        """
+        ids = {piece.batch_id for entry in completed.values() for piece in entry.results}
+        for name in listdir(self.result_dir):
+            # Worker files are named batch_<id>_result.pkl and batch_<id>_stats.pkl
+            parts = name.split("_")
+            if len(parts) == 3 and parts[0] == "batch" and parts[1].isdigit():
+                if int(parts[1]) not in ids:
+                    unlink(join(self.result_dir, name))
+
+    def mark_complete(self, batch_path: str, results: list[BatchResultEntry]) -> None:
+        """Record a batch as complete, then remove its pickle
+
+        Args:
+            batch_path: Path of the batch pickle
+            results: Every processed piece of the batch
+        """
+        entry = CompletedBatch(
+            batch=basename(batch_path),
+            results=[
+                piece.model_copy(update={"result_file": basename(piece.result_file)})
+                for piece in results
+            ],
+        )
+        with open(self.manifest_path, "a") as f:
+            f.write(entry.model_dump_json() + "\n")
+            f.flush()
+            fsync(f.fileno())
+        try:
+            unlink(batch_path)
+        except FileNotFoundError:
+            pass
+
+    def result_path(self, piece: BatchResultEntry) -> str:
+        """Full path of a completed piece's result file"""
+        return join(self.result_dir, piece.result_file)
+
+    def remove(self) -> None:
+        """Delete the run directory and everything in it"""
+        rmtree(self.path, ignore_errors=True)
@@ -0,0 +1,339 @@
+# marc_pd_tool/infrastructure/persistence/_source_manifest.py
+
+"""Persisted per-file manifest of copyright/renewal source data"""
+
+# Standard library imports
+from hashlib import blake2b
+from hashlib import md5
+from json import JSONDecodeError
+from json import dump
+from json import load
+from logging import getLogger
+from os import getpid
+from os import makedirs
+from os import replace
+from os.path import join
+from pathlib import Path
+from threading import get_ident
+from typing import Callable
+from typing import Iterator
+
+# Third party imports
+from pydantic import BaseModel
+from pydantic import ValidationError
+
+# Local imports
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+
+logger = getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Yields the publication year (or None) of every entry in a source file and
+# raises SourceScanError if the file can't be read to the end
+type YearScanner = Callable[[Path], Iterator[int | None]]
+
+
+class SourceScanError(Exception):
+    """A source file could not be scanned to the end"""
+
+
+class SourceFileEntry(BaseModel):
+    """Manifest entry describing one source data file"""
+
+    size: int
+    mtime: float
+    content_hash: str
+    record_count: int
+    min_year: int | None = None
+    max_year: int | None = None
+    undated_count: int = 0
+
+
+def _hash_file(path: Path) -> str:
+    """Hash the raw bytes of a file
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file content
+    """
+    digest = blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SourceManifest:
+    """Per-file size, mtime, content hash, record count and year range
+
+    The manifest is built once by scanning each file and then updated
+    incrementally: files whose size and mtime are unchanged are not opened,
+    and files that were only touched (same content hash) are not rescanned.
+    """
+
+    def __init__(
+        self,
+        source_dir: str | Path,
+        suffix: str,
+        scanner: YearScanner,
+        recursive: bool = False,
+        cache_dir: str | None = None,
+        kind: str = "source",
+    ) -> None:
+        """Initialize the manifest for a source directory
+
+        Args:
+            source_dir: Directory holding the source data files
+            suffix: Data file suffix such as ".xml" or ".tsv"
+            scanner: Function yielding the year of every entry in a file
+            recursive: Search subdirectories for data files
+            cache_dir: Directory to persist the manifest in, or None to keep it in memory
+            kind: Name of the data source, used in the manifest file name
+        """
+        self.source_dir = Path(source_dir)
+        self.suffix = suffix
+        self.scanner = scanner
+        self.recursive = recursive
+        self.entries: dict[str, SourceFileEntry] = {}
+        self._refreshed = False
+
+        self.manifest_path: str | None = None
+        if cache_dir is not None:
+            dir_hash = md5(str(self.source_dir.resolve()).encode()).hexdigest()[:12]
+            self.manifest_path = join(cache_dir, "source_manifests", f"{kind}_{dir_hash}.json")
+            self._load()
+
+    def _key(self, path: Path | str) -> str:
+        """Manifest key for a file: its path relative to the source directory"""
+        path = Path(path)
+        try:
+            return path.relative_to(self.source_dir).as_posix()
+        except ValueError:
+            return path.as_posix()
+
+    def _load(self) -> None:
+        """Read a previously persisted manifest, ignoring unreadable ones"""
+        if self.manifest_path is None or not Path(self.manifest_path).exists():
+            return
+        try:
+            with open(self.manifest_path, "r") as f:
+                data = load(f)
+            if data.get("version") != MANIFEST_VERSION:
+                return
+            self.entries = {
+                key: SourceFileEntry.model_validate(value) for key, value in data["files"].items()
+            }
+        except (OSError, JSONDecodeError, KeyError, AttributeError, ValidationError) as e:
+            logger.warning(f"Ignoring unreadable source manifest {self.manifest_path}: {e}")
+            self.entries = {}
+
+    def _save(self) -> None:
+        """Persist the manifest, replacing the previous file atomically"""
+        if self.manifest_path is None:
+            return
+        try:
+            makedirs(Path(self.manifest_path).parent, exist_ok=True)
+            temp_path = f"{self.manifest_path}.{getpid()}.{get_ident()}.tmp"
+            with open(temp_path, "w") as f:
+                dump(
+                    {
+                        "version": MANIFEST_VERSION,
+                        "source_dir": str(self.source_dir),
+                        "files": {
+                            key: entry.model_dump() for key, entry in sorted(self.entries.items())
+                        },
+                    },
+                    f,
+                    indent=1,
+                )
+            replace(temp_path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Failed to save source manifest {self.manifest_path}: {e}")
+
+    def _scan(self, path: Path, size: int, mtime: float, content_hash: str) -> SourceFileEntry:
+        """Count the entries of a file and collect its year range
+
+        Args:
+            path: File to scan
+            size: File size in bytes
+            mtime: File modification time
+            content_hash: Hash of the file content
+
+        Returns:
+            Manifest entry for the file
+
+        Raises:
+            SourceScanError: If the scanner could not read the whole file
+        """
+        record_count = 0
+        undated_count = 0
+        min_year: int | None = None
+        max_year: int | None = None
+
+        for year in self.scanner(path):
+            record_count += 1
+            if year is None:
+                undated_count += 1
+                continue
+            if min_year is None or year < min_year:
+                min_year = year
+            if max_year is None or year > max_year:
+                max_year = year
+
+        return SourceFileEntry(
+            size=size,
+            mtime=mtime,
+            content_hash=content_hash,
+            record_count=record_count,
+            min_year=min_year,
+            max_year=max_year,
+            undated_count=undated_count,
+        )
+
+    def refresh(self) -> "SourceManifest":
+        """Bring the manifest up to date with the files on disk
+
+        Returns:
+            The manifest itself, for chaining
+        """
+        if self._refreshed:
+            return self
+
+        files = (
+            find_data_files(self.source_dir, self.suffix, recursive=self.recursive)
+            if self.source_dir.exists()
+            else []
+        )
+        entries: dict[str, SourceFileEntry] = {}
+        changed = False
+        scanned = 0
+
+        for path in files:
+            key = self._key(path)
+            stat = path.stat()
+            entry = self.entries.get(key)
+
+            if entry is not None and entry.size == stat.st_size and entry.mtime == stat.st_mtime:
+                entries[key] = entry
+                continue
+
+            changed = True
+            content_hash = _hash_file(path)
+            if entry is not None and entry.content_hash == content_hash:
+                # Touched but unchanged: keep the counts, record the new mtime
+                entries[key] = entry.model_copy(update={"mtime": stat.st_mtime})
+                continue
+
+            try:
+                entries[key] = self._scan(path, stat.st_size, stat.st_mtime, content_hash)
+            except SourceScanError as e:
+                # Leave the file out so it is loaded in full and rescanned next run
+                logger.warning(f"Error analyzing years in {path}: {e}")
+                continue
+            scanned += 1
+
+        if set(entries) != set(self.entries):
+            changed = True
+
+        self.entries = entries
+        self._refreshed = True
+        if scanned:
+            logger.info(f"Scanned {scanned}/{len(files)} files for the {self.source_dir} manifest")
+        if changed:
+            self._save()
+        return self
+
+    @property
+    def year_range(self) -> tuple[int | None, int | None]:
+        """Minimum and maximum entry year across all files"""
+        self.refresh()
+        min_years = [e.min_year for e in self.entries.values() if e.min_year is not None]
+        max_years = [e.max_year for e in self.entries.values() if e.max_year is not None]
+        return (min(min_years) if min_years else None, max(max_years) if max_years else None)
+
+    @property
+    def record_count(self) -> int:
+        """Total number of entries across all files"""
+        self.refresh()
+        return sum(e.record_count for e in self.entries.values())
+
+    @property
+    def dated_count(self) -> int:
+        """Number of entries with a usable year across all files"""
+        self.refresh()
+        return sum(e.record_count - e.undated_count for e in self.entries.values())
+
+    def get(self, path: Path | str) -> SourceFileEntry | None:
+        """Manifest entry for a file, or None if the file is not known"""
+        self.refresh()
+        return self.entries.get(self._key(path))
+
+    def may_contain_years(
+        self, path: Path | str, min_year: int | None, max_year: int | None
+    ) -> bool:
+        """Check whether a file can hold entries that pass a year filter
+
+        Undated entries always pass the loaders' year filter, so files with any
+        undated entries are kept. Unknown files are kept as well.
+
+        Args:
+            path: Source data file
+            min_year: Minimum year (inclusive), None for no minimum
+            max_year: Maximum year (inclusive), None for no maximum
+
+        Returns:
+            False only if every entry in the file lies outside the range
+        """
+        entry = self.get(path)
+        if entry is None or entry.undated_count > 0:
+            return True
+        if entry.min_year is None or entry.max_year is None:
+            # Empty file: nothing to load
+            return False
+        if min_year is not None and entry.max_year < min_year:
+            return False
+        if max_year is not None and entry.min_year > max_year:
+            return False
+        return True
+
+    def filter_files(
+        self, file_paths: list[str], min_year: int | None, max_year: int | None
+    ) -> list[str]:
+        """Drop files lying wholly outside a year range
+
+        Args:
+            file_paths: Candidate source data files
+            min_year: Minimum year (inclusive), None for no minimum
+            max_year: Maximum year (inclusive), None for no maximum
+
+        Returns:
+            Files that may contain entries within the range
+        """
+        if min_year is None and max_year is None:
+            return file_paths
+        kept = [path for path in file_paths if self.may_contain_years(path, min_year, max_year)]
+        if len(kept) < len(file_paths):
+            logger.info(
+                f"Skipping {len(file_paths) - len(kept)} files outside years "
+                f"{min_year or 'earliest'}-{max_year or 'latest'} (per source manifest)"
+            )
+        return kept
+
+    def expected_records(self, file_paths: list[str]) -> int:
+        """Number of entries the given files hold according to the manifest
+
+        Args:
+            file_paths: Source data files
+
+        Returns:
+            Sum of the known record counts
+        """
+        total = 0
+        for path in file_paths:
+            entry = self.get(path)
+            if entry is not None:
+                total += entry.record_count
+        return total
@@ -0,0 +1,180 @@
+# marc_pd_tool/infrastructure/persistence/_string_interner.py
+
+"""Deduplication of repeated field values in loaded publications"""
+
+# Standard library imports
+from logging import getLogger
+from os import getpid
+from os import makedirs
+from os import replace
+from os.path import dirname
+from os.path import exists
+from os.path import join
+from pickle import HIGHEST_PROTOCOL
+from pickle import UnpicklingError
+from pickle import dump
+from pickle import load
+from threading import get_ident
+from typing import overload
+
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+
+logger = getLogger(__name__)
+
+# Publication attributes whose values repeat across many records (authors,
+# publishers, places, dates). Titles, ids and full text are nearly unique and
+# are left alone.
+INTERNED_FIELDS = (
+    "original_author",
+    "original_main_author",
+    "pub_date",
+    "original_publisher",
+    "original_place",
+    "original_edition",
+    "source",
+    "country_code",
+)
+
+STRING_TABLE_FILENAME = "string_table.pkl"
+STRING_TABLE_VERSION = 1
+
+
+class StringInterner:
+    """Maps equal field values to one shared string object
+
+    Publications built from the same table share their author, publisher,
+    place and date strings, which cuts memory and also pickle size, since
+    pickle writes an object it has already seen as a back-reference.
+    """
+
+    def __init__(
+        self, strings: list[str] | None = None, path: str | None = None, max_size: int | None = None
+    ) -> None:
+        """Initialize the interner
+
+        Args:
+            strings: Strings to seed the table with
+            path: File the table is persisted to by save(), or None to keep it in memory
+            max_size: Stop adding new strings once the table holds this many, so a
+                long streaming run keeps only the values seen early (None for no limit)
+        """
+        self._table: dict[str, str] = {string: string for string in strings or []}
+        self.path = path
+        self.max_size = max_size
+        self.seeded_count = len(self._table)
+        self.value_count = 0
+
+    @classmethod
+    def for_cache_dir(cls, cache_dir: str | None) -> "StringInterner":
+        """Create an interner seeded from the table persisted in a cache directory
+
+        Args:
+            cache_dir: Cache directory, or None for an empty in-memory interner
+
+        Returns:
+            Interner that save() writes back to the same cache directory
+        """
+        if cache_dir is None:
+            return cls()
+
+        path = join(cache_dir, STRING_TABLE_FILENAME)
+        strings: list[str] = []
+        if exists(path):
+            try:
+                with open(path, "rb") as f:
+                    data = load(f)
+                if data.get("version") == STRING_TABLE_VERSION:
+                    strings = data["strings"]
+            except (OSError, EOFError, UnpicklingError, AttributeError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable string table {path}: {e}")
+        return cls(strings, path=path)
+
+    @overload
+    def intern(self, value: str, occurrences: int = 1) -> str: ...
+
+    @overload
+    def intern(self, value: None, occurrences: int = 1) -> None: ...
+
+    @overload
+    def intern(self, value: str | None, occurrences: int = 1) -> str | None: ...
+
+    def intern(self, value: str | None, occurrences: int = 1) -> str | None:
+        """Return the shared string equal to a value
+
+        Args:
+            value: Field value; None and empty strings are returned unchanged
+            occurrences: Number of field values this lookup stands for
+
+        Returns:
+            The table's string equal to value
+        """
+        if not value:
+            return value
+        self.value_count += occurrences
+        return self._shared(value)
+
+    def _shared(self, value: str) -> str:
+        """Table entry equal to value, adding value if there is room"""
+        if self.max_size is None or len(self._table) < self.max_size:
+            return self._table.setdefault(value, value)
+        return self._table.get(value, value)
+
+    def intern_publication(self, pub: Publication) -> Publication:
+        """Replace the repeated-value fields of a publication with shared strings
+
+        Args:
+            pub: Publication to update in place
+
+        Returns:
+            The same publication
+        """
+        for name in INTERNED_FIELDS:
+            value = getattr(pub, name)
+            if value:
+                self.value_count += 1
+                setattr(pub, name, self._shared(value))
+        return pub
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Field values interned per distinct string in the table"""
+        return self.value_count / len(self._table) if self._table else 0.0
+
+    def log_stats(self, label: str) -> None:
+        """Log how many values were interned and how far they deduplicated
+
+        Args:
+            label: Data source name for the log message
+        """
+        if not self.value_count:
+            return
+        logger.info(
+            f"Interned {self.value_count:,} {label} field values into "
+            f"{len(self._table) - self.seeded_count:,} new strings "
+            f"(dedup ratio {self.dedup_ratio:.1f}x, table size {len(self._table):,})"
+        )
+
+    def save(self) -> None:
+        """Persist the table next to the cache, replacing the previous file atomically
+
+        Nothing is written when no new strings were added.
+        """
+        if self.path is None or len(self._table) == self.seeded_count:
+            return
+        try:
+            makedirs(dirname(self.path) or ".", exist_ok=True)
+            # Registration and renewal loaders may save at the same time
+            temp_path = f"{self.path}.{getpid()}.{get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                dump(
+                    {"version": STRING_TABLE_VERSION, "strings": list(self._table)},
+                    f,
+                    protocol=HIGHEST_PROTOCOL,
+                )
+            replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save string table {self.path}: {e}")
@@ -3,12 +3,18 @@
 """Shared utility functions for text processing, MARC data handling, and system utilities"""
 
 # Local imports
+# File utilities
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import open_binary
+from marc_pd_tool.shared.utils.file_utils import open_text
+
 # MARC utilities
 from marc_pd_tool.shared.utils.marc_utilities import extract_country_from_marc_008
 from marc_pd_tool.shared.utils.marc_utilities import extract_language_from_marc
 
 # Memory utilities
 from marc_pd_tool.shared.utils.memory_utils import MemoryMonitor
+from marc_pd_tool.shared.utils.memory_utils import paused_gc
 
 # Publisher utilities
 from marc_pd_tool.shared.utils.publisher_utils import clean_publisher_suffix
@@ -35,6 +41,10 @@ __all__ = [
     "normalize_word_splits",
     # Time utilities
     "format_time_duration",
+    # File utilities
+    "find_data_files",
+    "open_binary",
+    "open_text",
     # MARC utilities
     "extract_country_from_marc_008",
     "extract_language_from_marc",
@@ -43,4 +53,5 @@ __all__ = [
     "extract_publisher_candidates",
     # Memory utilities
     "MemoryMonitor",
+    "paused_gc",
 ]
@@ -0,0 +1,108 @@
+# marc_pd_tool/shared/utils/file_utils.py
+
+"""Helpers for reading plain or compressed input data files"""
+
+# Standard library imports
+from bz2 import BZ2File
+from gzip import GzipFile
+from io import BufferedIOBase
+from io import TextIOWrapper
+from lzma import LZMAFile
+from pathlib import Path
+from typing import BinaryIO
+from typing import TextIO
+from typing import cast
+
+# Compression formats that input files may be stored in, by file suffix
+COMPRESSION_SUFFIXES = (".gz", ".bz2", ".xz")
+
+
+def is_compressed(path: Path | str) -> bool:
+    """Check whether a file name carries a supported compression suffix
+
+    Args:
+        path: File path
+
+    Returns:
+        True for .gz, .bz2 and .xz files
+    """
+    return Path(path).suffix.lower() in COMPRESSION_SUFFIXES
+
+
+def strip_compression_suffix(path: Path | str) -> Path:
+    """Drop a compression suffix so the underlying format can be inspected
+
+    Args:
+        path: File path, e.g. "1950.tsv.gz"
+
+    Returns:
+        Path without the compression suffix, e.g. "1950.tsv"
+    """
+    path = Path(path)
+    return path.with_suffix("") if is_compressed(path) else path
+
+
+def find_data_files(directory: Path | str, suffix: str, recursive: bool = False) -> list[Path]:
+    """Find data files with a given suffix, including compressed copies
+
+    Args:
+        directory: Directory to search
+        suffix: Data file suffix such as ".xml" or ".tsv"
+        recursive: Search subdirectories as well
+
+    Returns:
+        Sorted list of matching paths, e.g. both "a.xml" and "b.xml.gz"
+    """
+    directory = Path(directory)
+    glob = directory.rglob if recursive else directory.glob
+
+    files: list[Path] = []
+    for pattern in [f"*{suffix}", *(f"*{suffix}{ext}" for ext in COMPRESSION_SUFFIXES)]:
+        files.extend(glob(pattern))
+    return sorted(files, key=lambda x: str(x))
+
+
+def open_binary(path: Path | str, raw: BinaryIO | None = None) -> BinaryIO:
+    """Open a data file for binary reading, decompressing on the fly if needed
+
+    Args:
+        path: File path; the suffix selects the decompressor
+        raw: Already-open handle on the (compressed) file, so callers can
+            track progress through ``raw.tell()``
+
+    Returns:
+        Readable binary stream of the uncompressed content
+    """
+    suffix = Path(path).suffix.lower()
+    source = raw if raw is not None else str(path)
+
+    decompressed: BufferedIOBase
+    if suffix == ".gz":
+        decompressed = (
+            GzipFile(fileobj=raw, mode="rb") if raw is not None else GzipFile(str(path), "rb")
+        )
+    elif suffix == ".bz2":
+        decompressed = BZ2File(source, mode="rb")
+    elif suffix == ".xz":
+        decompressed = LZMAFile(source, mode="rb")
+    elif raw is not None:
+        return raw
+    else:
+        return open(path, "rb")
+    # The decompressors are buffered binary streams with the BinaryIO interface
+    return cast(BinaryIO, decompressed)
+
+
+def open_text(path: Path | str, encoding: str = "utf-8") -> TextIO:
+    """Open a data file for text reading, decompressing on the fly if needed
+
+    Args:
+        path: File path; the suffix selects the decompressor
+        encoding: Text encoding
+
+    Returns:
+        Readable text stream of the uncompressed content
+    """
+    if is_compressed(path):
+        return TextIOWrapper(open_binary(path), encoding=encoding)
+    return open(path, "r", encoding=encoding)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Compare the process and thread executors on the same synthetic workload
+
+Builds registration and renewal indexes from generated publications, then
+matches the same generated MARC batches with ``executor="processes"`` and
+``executor="threads"``, printing wall time and records per second for each.
+
+The thread executor only scales on a free-threaded build (python3.13t or
+later with the GIL disabled); on a regular build it is expected to be slower
+than worker processes. Run with e.g.:
+
+    python3.13t scripts/benchmark_executors.py --records 20000 --workers 8
+"""
+
+# Standard library imports
+from argparse import ArgumentParser
+from random import Random
+from sys import _is_gil_enabled
+from time import perf_counter
+
+# Local imports
+from marc_pd_tool.adapters.api import MarcCopyrightAnalyzer
+from marc_pd_tool.application.processing.indexer import build_wordbased_index
+from marc_pd_tool.core.domain.publication import Publication
+
+WORDS = (
+    "road river mountain history letters garden winter journey city house night "
+    "ohio valley songs women children war peace england america modern poems art "
+    "science family early years story island north south light shadow voyage"
+).split()
+SURNAMES = "smith jones brown miller davis wilson moore taylor clark hall".split()
+PUBLISHERS = "Scribner;Harper;Knopf;Macmillan;Houghton Mifflin;Viking Press".split(";")
+
+
+def make_publications(count: int, seed: int, prefix: str) -> list[Publication]:
+    """Generate publications with titles drawn from a small vocabulary
+
+    Args:
+        count: Number of publications
+        seed: Random seed, so runs are comparable
+        prefix: Source id prefix
+
+    Returns:
+        Generated publications dated 1930-1970
+    """
+    rng = Random(seed)
+    return [
+        Publication(
+            title=" ".join(rng.choices(WORDS, k=rng.randint(2, 6))),
+            author=f"{rng.choice(SURNAMES).title()}, {rng.choice(SURNAMES).title()}",
+            publisher=rng.choice(PUBLISHERS),
+            pub_date=str(rng.randint(1930, 1970)),
+            source_id=f"{prefix}{i}",
+        )
+        for i in range(count)
+    ]
+
+
+def run(
+    executor: str,
+    registrations: list[Publication],
+    renewals: list[Publication],
+    records: list[Publication],
+    workers: int,
+    batch_size: int,
+) -> float:
+    """Match all records with one executor
+
+    Args:
+        executor: "processes" or "threads"
+        registrations: Registration publications to index
+        renewals: Renewal publications to index
+        records: MARC records to match
+        workers: Number of worker processes or threads
+        batch_size: Records per batch
+
+    Returns:
+        Wall time in seconds
+    """
+    analyzer = MarcCopyrightAnalyzer()
+    analyzer.registration_index = build_wordbased_index(registrations)
+    analyzer.renewal_index = build_wordbased_index(renewals)
+    analyzer.generic_detector = None
+    batches = (records[i : i + batch_size] for i in range(0, len(records), batch_size))
+
+    start = perf_counter()
+    analyzer._process_batches_parallel(
+        batch_paths=batches,
+        num_processes=workers,
+        year_tolerance=1,
+        title_threshold=40,
+        author_threshold=30,
+        publisher_threshold=30,
+        early_exit_title=95,
+        early_exit_author=90,
+        early_exit_publisher=90,
+        score_everything_mode=False,
+        minimum_combined_score=None,
+        brute_force_missing_year=False,
+        min_year=None,
+        max_year=None,
+        executor=executor,
+    )
+    return perf_counter() - start
+
+
+def main() -> None:
+    """Run both executors and print a comparison"""
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=5000, help="MARC records to match")
+    parser.add_argument("--references", type=int, default=50000, help="Registrations to index")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes or threads")
+    parser.add_argument("--batch-size", type=int, default=100, help="Records per batch")
+    args = parser.parse_args()
+
+    registrations = make_publications(args.references, seed=1, prefix="R")
+    renewals = make_publications(args.references // 4, seed=2, prefix="N")
+    records = make_publications(args.records, seed=3, prefix="M")
+
+    print(f"GIL enabled: {_is_gil_enabled()}")
+    for executor in ("processes", "threads"):
+        elapsed = run(executor, registrations, renewals, records, args.workers, args.batch_size)
+        print(f"{executor:>9}: {elapsed:8.2f}s  {args.records / elapsed:10.1f} records/s")
+
+
+if __name__ == "__main__":
+    main()
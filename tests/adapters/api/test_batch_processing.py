@@ -13,11 +13,17 @@ from unittest.mock import MagicMock
 from unittest.mock import Mock
 from unittest.mock import patch
 
+# Third party imports
+from pytest import raises
+
 # Local imports
 from marc_pd_tool import MarcCopyrightAnalyzer
 from marc_pd_tool.application.models.batch_stats import BatchStats
+from marc_pd_tool.application.models.config_models import AnalysisOptions
 from marc_pd_tool.application.processing.indexer import DataIndexer
+from marc_pd_tool.application.processing.matching_engine import process_batch
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence import RunDirectory
 
 
 class TestBatchProcessingComponent:
@@ -222,3 +228,644 @@ class TestBatchProcessingComponent:
                     # Clean up if still exists
                     if Path(temp_dir).exists():
                         shutil.rmtree(temp_dir)
+
+    def test_batch_processing_pipelined_iterator(self):
+        """Test that an iterator of in-memory batches is fed to workers without pickling"""
+        analyzer = MarcCopyrightAnalyzer()
+
+        batches = [
+            [Publication(title=f"Book {i}", pub_date="1960", source_id=f"{i:03d}")]
+            for i in range(5)
+        ]
+        seen_infos = []
+
+        def fake_imap(func, infos):
+            # Pull tasks lazily, the way the pool's task thread would
+            for info in infos:
+                seen_infos.append(info)
+                stats = BatchStats(batch_id=info[0], total_batches=0)
+                stats.marc_count = len(info[1])
+                yield (info[0], f"result_{info[0]}.pkl", stats)
+
+        with patch("marc_pd_tool.adapters.api._batch_processing.Pool") as mock_pool_class:
+            mock_pool = MagicMock()
+            mock_pool_class.return_value.__enter__.return_value = mock_pool
+            mock_pool.imap_unordered.side_effect = fake_imap
+
+            analyzer._process_batches_parallel(
+                batch_paths=iter(batches),
+                num_processes=1,
+                year_tolerance=1,
+                title_threshold=40,
+                author_threshold=30,
+                publisher_threshold=50,
+                early_exit_title=95,
+                early_exit_author=90,
+                early_exit_publisher=85,
+                score_everything_mode=False,
+                minimum_combined_score=None,
+                brute_force_missing_year=False,
+                min_year=None,
+                max_year=None,
+            )
+
+            # Every batch reached the workers as the publications themselves
+            assert [info[1] for info in seen_infos] == batches
+            assert [info[0] for info in seen_infos] == [1, 2, 3, 4, 5]
+            assert analyzer.results.statistics.total_records == 5
+
+            # Worker recycling is disabled while the parser is still running
+            assert mock_pool_class.call_args[1]["maxtasksperchild"] is None
+
+    def test_batch_processing_shared_indexes(self):
+        """Test shared index mode attaches workers to segments removed afterwards"""
+        # Standard library imports
+        from multiprocessing.shared_memory import SharedMemory
+
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import build_wordbased_index
+        from marc_pd_tool.application.processing.matching_engine import (
+            init_worker_shared,
+        )
+
+        analyzer = MarcCopyrightAnalyzer()
+        analyzer.registration_index = build_wordbased_index([Publication(title="Registered")])
+        analyzer.renewal_index = build_wordbased_index([Publication(title="Renewed")])
+        analyzer.generic_detector = None
+
+        with (
+            patch("marc_pd_tool.adapters.api._batch_processing.Pool") as mock_pool_class,
+            patch("marc_pd_tool.adapters.api._batch_processing.get_start_method") as mock_start,
+            patch("marc_pd_tool.adapters.api._batch_processing.set_start_method") as mock_set,
+        ):
+            mock_start.return_value = "spawn"
+            mock_pool = MagicMock()
+            mock_pool_class.return_value.__enter__.return_value = mock_pool
+            mock_pool.imap_unordered.return_value = iter([])
+
+            analyzer._process_batches_parallel(
+                batch_paths=["/test/batch.pkl"],
+                num_processes=2,
+                year_tolerance=1,
+                title_threshold=40,
+                author_threshold=30,
+                publisher_threshold=50,
+                early_exit_title=95,
+                early_exit_author=90,
+                early_exit_publisher=85,
+                score_everything_mode=False,
+                minimum_combined_score=None,
+                brute_force_missing_year=False,
+                min_year=None,
+                max_year=None,
+                shared_indexes=True,
+            )
+
+        # Spawn is kept, since workers don't rely on fork to share the indexes
+        mock_set.assert_not_called()
+        call_kwargs = mock_pool_class.call_args[1]
+        assert call_kwargs["initializer"] is init_worker_shared
+        registration_handle, renewal_handle, detector = call_kwargs["initargs"]
+        assert registration_handle.segment != renewal_handle.segment
+        assert detector is None
+
+        # The parent removes its segments once the pool is done
+        for handle in (registration_handle, renewal_handle):
+            with raises(FileNotFoundError):
+                SharedMemory(name=handle.segment, track=False)
+
+    def test_batch_processing_thread_executor(self):
+        """Test the thread executor matches against the loaded indexes in memory"""
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import build_wordbased_index
+
+        analyzer = MarcCopyrightAnalyzer()
+        analyzer.registration_index = build_wordbased_index(
+            [Publication(title="The Lost Road", author="Smith, John", pub_date="1950")]
+        )
+        analyzer.renewal_index = build_wordbased_index([])
+        analyzer.generic_detector = None
+        batches = [
+            [Publication(title="The Lost Road", author="Smith, John", pub_date="1950")],
+            [Publication(title="Nothing Alike", pub_date="1950")],
+            [Publication(title="Undated")],
+        ]
+
+        with patch("marc_pd_tool.adapters.api._batch_processing.Pool") as mock_pool_class:
+            publications = analyzer._process_batches_parallel(
+                batch_paths=iter(batches),
+                num_processes=2,
+                year_tolerance=1,
+                title_threshold=40,
+                author_threshold=30,
+                publisher_threshold=50,
+                early_exit_title=95,
+                early_exit_author=90,
+                early_exit_publisher=85,
+                score_everything_mode=False,
+                minimum_combined_score=None,
+                brute_force_missing_year=False,
+                min_year=None,
+                max_year=None,
+                executor="threads",
+            )
+
+        mock_pool_class.assert_not_called()
+        # Results come back as objects, with no result files to load later
+        assert sorted(pub.original_title for pub in publications) == [
+            "Nothing Alike",
+            "The Lost Road",
+        ]
+        assert analyzer.results.result_file_paths == []
+        assert analyzer.results.result_temp_dir is None
+        assert analyzer.results.statistics.registration_matches == 1
+        assert analyzer.results.statistics.skipped_no_year == 1
+        assert sum(analyzer.results.statistics.extra_fields.values()) == 2
+
+
+class TestBoundedFeed:
+    """Test the bounded task feed used in pipelined mode"""
+
+    def test_feed_stops_when_slots_exhausted_and_stopped(self):
+        """Test that the feed gives up instead of blocking once the consumer stops"""
+        # Standard library imports
+        from threading import BoundedSemaphore
+        from threading import Event
+
+        # Local imports
+        from marc_pd_tool.adapters.api._batch_processing import _iter_bounded
+
+        slots = BoundedSemaphore(2)
+        stop = Event()
+        feed = _iter_bounded(iter(range(10)), slots, stop)
+
+        assert next(feed) == 0
+        assert next(feed) == 1
+
+        # No slot is free; once stopped the generator must finish
+        stop.set()
+        assert list(feed) == []
+
+    def test_thread_pool_reads_bounded_feed_lazily(self):
+        """Test the thread pool doesn't block on a feed bounded to two tasks per thread"""
+        # Standard library imports
+        from threading import BoundedSemaphore
+        from threading import Event
+
+        # Local imports
+        from marc_pd_tool.adapters.api._batch_processing import _ThreadBatchPool
+        from marc_pd_tool.adapters.api._batch_processing import _iter_bounded
+
+        slots = BoundedSemaphore(4)
+        results = []
+        with _ThreadBatchPool(2) as pool:
+            feed = _iter_bounded(iter(range(20)), slots, Event())
+            for result in pool.imap_unordered(lambda n: n * n, feed):
+                slots.release()
+                results.append(result)
+
+        assert sorted(results) == [n * n for n in range(20)]
+
+
+class TestBatchScheduler:
+    """Test adaptive batch sizing and rescheduling of deferred tails"""
+
+    @staticmethod
+    def records(count: int) -> list[Publication]:
+        """Year-dated publications with distinct source ids"""
+        return [
+            Publication(title=f"Book {i}", pub_date="1950", source_id=str(i)) for i in range(count)
+        ]
+
+    def test_batch_size_follows_measured_cost(self):
+        """Test the batch size moves toward the target duration"""
+        # Local imports
+        from marc_pd_tool.adapters.api._batch_processing import _BatchScheduler
+
+        scheduler = _BatchScheduler(workers=4, batch_size=100, target_seconds=10.0)
+        assert scheduler.time_budget == 20.0
+
+        # 0.5s per record: 20 records make 10 seconds
+        scheduler.record(
+            BatchStats(batch_id=1, marc_count=90, skipped_no_year=10, processing_time=50)
+        )
+        assert scheduler.batch_size == 20
+
+        # Cheap records grow batches, but only up to ten times the configured size
+        for batch_id in range(2, 30):
+            scheduler.record(BatchStats(batch_id=batch_id, marc_count=100, processing_time=0.01))
+        assert scheduler.batch_size == 1000
+
+    def test_disabled_scheduler_keeps_batch_size(self):
+        """Test a zero target leaves batches alone and sets no time budget"""
+        # Local imports
+        from marc_pd_tool.adapters.api._batch_processing import _BatchScheduler
+
+        scheduler = _BatchScheduler(workers=4, batch_size=100, target_seconds=0)
+        scheduler.record(BatchStats(batch_id=1, marc_count=100, processing_time=500))
+
+        assert scheduler.time_budget is None
+        assert scheduler.batch_size == 100
+
+    def test_deferred_tail_spread_over_workers(self):
+        """Test a deferred tail is split by its own cost and across all workers"""
+        # Local imports
+        from marc_pd_tool.adapters.api._batch_processing import _BatchScheduler
+
+        scheduler = _BatchScheduler(workers=4, batch_size=100, target_seconds=10.0)
+        tail = self.records(40)
+
+        # 2s per record: 5 records per piece
+        stats = BatchStats(batch_id=1, marc_count=10, processing_time=20, deferred=tail)
+        assert scheduler.record(stats) == 8
+        assert stats.deferred == []
+        assert [len(piece) for piece in scheduler.take_deferred()] == [5] * 8
+
+        # Cheaper records would fit one piece, but every worker still gets some
+        stats = BatchStats(batch_id=2, marc_count=10, processing_time=0.1, deferred=tail)
+        assert scheduler.record(stats) == 4
+        pieces = scheduler.take_deferred()
+        assert [len(piece) for piece in pieces] == [10] * 4
+        assert [pub for piece in pieces for pub in piece] == tail
+        assert scheduler.take_deferred() == []
+
+    def test_rebatch_recuts_stream(self):
+        """Test the stream is re-cut to the current size, tails first, and spread at the end"""
+        # Local imports
+        from marc_pd_tool.adapters.api._batch_processing import _BatchScheduler
+
+        scheduler = _BatchScheduler(workers=2, batch_size=4, target_seconds=10.0)
+        records = self.records(14)
+        tail = self.records(2)
+        batches = scheduler.rebatch(records[i : i + 5] for i in range(0, 14, 5))
+
+        assert next(batches) == records[0:4]
+        scheduler.record(BatchStats(batch_id=1, marc_count=1, processing_time=30, deferred=tail))
+        scheduler.batch_size = 6
+
+        rest = list(batches)
+        assert [pub.source_id for pub in rest[0]] == ["0"]
+        assert [pub.source_id for pub in rest[1]] == ["1"]
+        # The four records left when the stream ends go to both workers
+        assert [len(batch) for batch in rest[2:]] == [6, 2, 2]
+        assert [pub for batch in rest[2:] for pub in batch] == records[4:]
+
+    def test_deferred_records_all_processed(self):
+        """Test every record is matched once when every batch runs over budget"""
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import build_wordbased_index
+
+        analyzer = MarcCopyrightAnalyzer()
+        analyzer.registration_index = build_wordbased_index(self.records(3))
+        analyzer.renewal_index = build_wordbased_index([])
+        analyzer.generic_detector = None
+        records = self.records(12)
+
+        publications = analyzer._process_batches_parallel(
+            batch_paths=iter([records[:6], records[6:]]),
+            num_processes=2,
+            year_tolerance=1,
+            title_threshold=40,
+            author_threshold=30,
+            publisher_threshold=50,
+            early_exit_title=95,
+            early_exit_author=90,
+            early_exit_publisher=85,
+            score_everything_mode=False,
+            minimum_combined_score=None,
+            brute_force_missing_year=False,
+            min_year=None,
+            max_year=None,
+            executor="threads",
+            batch_size=6,
+            # Every batch is over budget after its first record
+            target_batch_seconds=1e-9,
+        )
+
+        assert sorted(int(pub.source_id) for pub in publications) == list(range(12))
+        assert analyzer.results.statistics.total_records == 12
+
+
+class TestCostOrdering:
+    """Test dispatching pickled batches by predicted cost"""
+
+    def test_most_expensive_batches_first(self):
+        """Test batches go out longest first and predictions are logged against times"""
+        analyzer = MarcCopyrightAnalyzer()
+        analyzer.registration_index = None
+        analyzer.renewal_index = None
+        costs = {"a.pkl": 5.0, "b.pkl": 50.0, "c.pkl": 1.0, "d.pkl": 20.0}
+        dispatched = []
+
+        def fake_imap(func, batch_infos):
+            for info in batch_infos:
+                dispatched.append(info[1])
+                # Batch time roughly tracks the predicted cost
+                stats = BatchStats(batch_id=info[0], processing_time=costs[info[1]] / 10)
+                yield info[0], f"/tmp/{info[1]}", stats
+
+        with (
+            patch("marc_pd_tool.adapters.api._batch_processing.Pool") as mock_pool_class,
+            patch("marc_pd_tool.adapters.api._batch_processing.logger") as mock_logger,
+        ):
+            mock_pool_class.return_value.__enter__.return_value.imap_unordered = fake_imap
+            analyzer._process_batches_parallel(
+                batch_paths=list(costs),
+                num_processes=2,
+                year_tolerance=1,
+                title_threshold=40,
+                author_threshold=30,
+                publisher_threshold=50,
+                early_exit_title=95,
+                early_exit_author=90,
+                early_exit_publisher=85,
+                score_everything_mode=False,
+                minimum_combined_score=None,
+                brute_force_missing_year=False,
+                min_year=None,
+                max_year=None,
+                batch_costs=costs,
+            )
+
+        assert dispatched == ["b.pkl", "d.pkl", "a.pkl", "c.pkl"]
+        logged = " ".join(str(call.args[0]) for call in mock_logger.info.call_args_list)
+        assert "Predicted cost: 50" in logged
+        assert "rank correlation 1.00 with batch times over 4 batches" in logged
+        analyzer.results.cleanup_temp_files()
+
+
+class TestResume:
+    """Test resuming an interrupted run from its run directory"""
+
+    @staticmethod
+    def analyzer() -> MarcCopyrightAnalyzer:
+        """Analyzer with small indexes loaded, matching on threads"""
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import build_wordbased_index
+
+        analyzer = MarcCopyrightAnalyzer()
+        analyzer.registration_index = build_wordbased_index(
+            [
+                Publication(title=f"Poems of the {word}", pub_date="1950", source_id=f"R{i}")
+                for i, word in enumerate(["sea", "river", "hills"])
+            ]
+        )
+        analyzer.renewal_index = build_wordbased_index(
+            [Publication(title="Poems of the sea", pub_date="1950", source_id="N0")]
+        )
+        analyzer.generic_detector = None
+        return analyzer
+
+    @staticmethod
+    def new_run(parent: Path) -> tuple[RunDirectory, list[str]]:
+        """Run directory holding four pickled batches of three records"""
+        words = ["sea", "river", "hills", "plains"]
+        run = RunDirectory.create({}, str(parent))
+        paths = []
+        for batch in range(4):
+            path = join(run.batch_dir, f"batch_{batch:05d}.pkl")
+            records = [
+                Publication(
+                    title=f"Poems of the {words[(batch + i) % 4]}",
+                    pub_date="1950",
+                    source_id=f"{batch}-{i}",
+                )
+                for i in range(3)
+            ]
+            with open(path, "wb") as f:
+                dump(records, f, protocol=HIGHEST_PROTOCOL)
+            paths.append(path)
+        return run, paths
+
+    @staticmethod
+    def process(analyzer: MarcCopyrightAnalyzer, paths: list[str], run: RunDirectory) -> None:
+        """Match the batches on two threads, recording progress in the run"""
+        analyzer._process_batches_parallel(
+            batch_paths=paths,
+            num_processes=2,
+            year_tolerance=1,
+            title_threshold=40,
+            author_threshold=30,
+            publisher_threshold=50,
+            early_exit_title=95,
+            early_exit_author=90,
+            early_exit_publisher=85,
+            score_everything_mode=False,
+            minimum_combined_score=None,
+            brute_force_missing_year=False,
+            min_year=None,
+            max_year=None,
+            executor="threads",
+            run_directory=run,
+        )
+
+    def test_resume_matches_only_unfinished_batches(self, tmp_path):
+        """Test a resumed run skips completed batches and ends with the same statistics"""
+        uninterrupted = self.analyzer()
+        run, paths = self.new_run(tmp_path / "full")
+        self.process(uninterrupted, paths, run)
+
+        interrupted = self.analyzer()
+        run, paths = self.new_run(tmp_path / "resumed")
+        mark_complete = RunDirectory.mark_complete
+
+        def interrupt_after_two(run: RunDirectory, *args: object) -> None:
+            if len(run.completed_batches()) == 2:
+                raise KeyboardInterrupt
+            mark_complete(run, *args)
+
+        with patch.object(RunDirectory, "mark_complete", interrupt_after_two):
+            self.process(interrupted, paths, run)
+
+        run = RunDirectory.open(run.path)
+        completed = run.completed_batches()
+        pending = run.pending_batches(completed)
+        assert len(completed) == 2
+        assert len(pending) == 2
+
+        resumed = self.analyzer()
+        with patch("marc_pd_tool.adapters.api._batch_processing.process_batch") as mock_process:
+            mock_process.side_effect = process_batch
+            self.process(resumed, pending, run)
+
+        # Only the unfinished batches were matched again
+        assert sorted(call.args[0][1] for call in mock_process.call_args_list) == pending
+        assert resumed.results.statistics.to_dict() == uninterrupted.results.statistics.to_dict()
+        assert resumed.results.statistics.total_records == 12
+        resumed.results.load_all_publications()
+        uninterrupted.results.load_all_publications()
+        assert sorted(
+            (pub.source_id, pub.copyright_status) for pub in resumed.results.publications
+        ) == sorted(
+            (pub.source_id, pub.copyright_status) for pub in uninterrupted.results.publications
+        )
+        assert run.pending_batches(run.completed_batches()) == []
+
+    def test_pipelined_run_warns_it_cant_be_resumed(self, tmp_path):
+        """Test a pipelined run records nothing in the run directory and says so"""
+        analyzer = self.analyzer()
+        run, _ = self.new_run(tmp_path)
+        records = [Publication(title="Poems of the sea", pub_date="1950", source_id="M0")]
+
+        with patch("marc_pd_tool.adapters.api._batch_processing.logger") as mock_logger:
+            analyzer._process_batches_parallel(
+                batch_paths=iter([records]),
+                num_processes=2,
+                year_tolerance=1,
+                title_threshold=40,
+                author_threshold=30,
+                publisher_threshold=50,
+                early_exit_title=95,
+                early_exit_author=90,
+                early_exit_publisher=85,
+                score_everything_mode=False,
+                minimum_combined_score=None,
+                brute_force_missing_year=False,
+                min_year=None,
+                max_year=None,
+                executor="threads",
+                run_directory=run,
+            )
+
+        mock_logger.warning.assert_any_call(
+            "Pipelined mode keeps no run directory: an interrupted run can't be resumed"
+        )
+        assert analyzer.results.statistics.total_records == 1
+        assert not run.completed_batches()
+
+    def test_finished_run_directory_is_removed(self, tmp_path):
+        """Test a finished run's directory is removed once its results are exported"""
+        analyzer = self.analyzer()
+        run, paths = self.new_run(tmp_path)
+        analyzer.run_directory = run
+        self.process(analyzer, paths, run)
+
+        analyzer._finish_run_directory(str(tmp_path / "results"), AnalysisOptions())
+
+        assert not Path(run.path).exists()
+        assert analyzer.run_directory is None
+        assert analyzer.results.result_file_paths == []
+
+    def test_keep_run_dir(self, tmp_path):
+        """Test --keep-run-dir keeps a finished run's directory"""
+        analyzer = self.analyzer()
+        run, paths = self.new_run(tmp_path)
+        analyzer.run_directory = run
+        self.process(analyzer, paths, run)
+
+        analyzer._finish_run_directory(
+            str(tmp_path / "results"), AnalysisOptions(keep_run_dir=True)
+        )
+
+        assert Path(run.path).exists()
+        assert analyzer.run_directory is run
+
+    def test_interrupted_run_directory_is_kept(self, tmp_path):
+        """Test a run with unfinished batches keeps its directory for --resume"""
+        analyzer = self.analyzer()
+        run, paths = self.new_run(tmp_path)
+        analyzer.run_directory = run
+        self.process(analyzer, paths[:2], run)
+
+        analyzer._finish_run_directory(str(tmp_path / "results"), AnalysisOptions())
+
+        assert Path(run.path).exists()
+        assert len(run.pending_batches(run.completed_batches())) == 2
+
+    def test_unexported_run_directory_is_left_to_cleanup(self, tmp_path):
+        """Test a run without output is removed by cleanup_temp_files()"""
+        analyzer = self.analyzer()
+        run, paths = self.new_run(tmp_path)
+        analyzer.run_directory = run
+        self.process(analyzer, paths, run)
+
+        analyzer._finish_run_directory(None, AnalysisOptions())
+        analyzer.results.load_all_publications()
+        assert len(analyzer.results.publications) == 12
+        analyzer.results.cleanup_temp_files()
+
+        assert not Path(run.path).exists()
+
+
+class TestResultCache:
+    """Test reusing match results of unchanged records across runs"""
+
+    @staticmethod
+    def run(
+        tmp_path: Path, registrations: list[str], records: list[Publication]
+    ) -> MarcCopyrightAnalyzer:
+        """Match records on threads with the result cache in tmp_path"""
+        # Local imports
+        from marc_pd_tool.application.processing.indexer import build_wordbased_index
+
+        analyzer = MarcCopyrightAnalyzer(cache_dir=str(tmp_path / "cache"))
+        analyzer.registration_index = build_wordbased_index(
+            [
+                Publication(title=title, pub_date="1950", source_id=f"R{i}")
+                for i, title in enumerate(registrations)
+            ]
+        )
+        analyzer.renewal_index = build_wordbased_index([])
+        analyzer.generic_detector = None
+        analyzer._process_batches_parallel(
+            batch_paths=iter([records[:2], records[2:]]),
+            num_processes=2,
+            year_tolerance=1,
+            title_threshold=40,
+            author_threshold=30,
+            publisher_threshold=50,
+            early_exit_title=95,
+            early_exit_author=90,
+            early_exit_publisher=85,
+            score_everything_mode=False,
+            minimum_combined_score=None,
+            brute_force_missing_year=False,
+            min_year=None,
+            max_year=None,
+            executor="threads",
+            use_result_cache=True,
+        )
+        return analyzer
+
+    @staticmethod
+    def records(*titles: str) -> list[Publication]:
+        """Dated MARC records with the given titles"""
+        return [
+            Publication(title=title, pub_date="1950", source_id=f"M{i}")
+            for i, title in enumerate(titles)
+        ]
+
+    def test_rerun_reuses_unchanged_records(self, tmp_path):
+        """Test a rerun only matches changed records and keeps every result"""
+        titles = ["Poems of the sea", "River songs", "Hills at dusk"]
+        registrations = ["Poems of the sea", "River songs"]
+        first = self.run(tmp_path, registrations, self.records(*titles))
+        assert first.results.statistics.cached_records == 0
+        assert first.results.statistics.computed_records == 3
+
+        second = self.run(tmp_path, registrations, self.records(*titles))
+        assert second.results.statistics.cached_records == 3
+        assert second.results.statistics.computed_records == 0
+        assert second.results.statistics.registration_matches == 2
+        assert sorted(
+            (pub.source_id, pub.copyright_status, pub.has_registration_match())
+            for pub in second.results.publications
+        ) == sorted(
+            (pub.source_id, pub.copyright_status, pub.has_registration_match())
+            for pub in first.results.publications
+        )
+
+        changed = self.run(tmp_path, registrations, self.records(*titles[:2], "Hills at dawn"))
+        assert changed.results.statistics.cached_records == 2
+        assert changed.results.statistics.computed_records == 1
+
+    def test_changed_index_matches_again(self, tmp_path):
+        """Test results cached against other registrations aren't reused"""
+        records = self.records("Poems of the sea", "River songs", "Hills at dusk")
+        self.run(tmp_path, ["Poems of the sea"], records)
+
+        rerun = self.run(
+            tmp_path, ["Poems of the sea", "Hills at dusk"], self.records("Poems of the sea")
+        )
+
+        assert rerun.results.statistics.cached_records == 0
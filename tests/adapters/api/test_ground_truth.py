@@ -22,6 +22,7 @@ from marc_pd_tool.core.domain.enums import CountryClassification
 from marc_pd_tool.core.domain.enums import MatchType
 from marc_pd_tool.core.domain.match_result import MatchResult
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import PublicationStore
 from marc_pd_tool.infrastructure.config import ConfigLoader
 
 
@@ -253,7 +254,9 @@ class TestGroundTruthComponent:
         """Test extraction when indexes are loaded from cache"""
         # Set up cached indexes
         mock_index = Mock(spec=DataIndexer)
-        mock_index.publications = [Publication(title="Cached Pub", source_id="cached_001")]
+        mock_index.publications = PublicationStore.from_publications(
+            [Publication(title="Cached Pub", source_id="cached_001")]
+        )
 
         mock_analyzer.registration_index = mock_index
         mock_analyzer.renewal_index = mock_index
@@ -281,13 +284,14 @@ class TestGroundTruthComponent:
             # Call the method
             mock_analyzer.extract_ground_truth(marc_path="test.xml")
 
-            # Verify that publications were extracted from indexes
-            assert mock_analyzer.copyright_data == mock_index.publications
-            assert mock_analyzer.renewal_data == mock_index.publications
+            # Verify that publications were rebuilt from the indexes
+            for data in (mock_analyzer.copyright_data, mock_analyzer.renewal_data):
+                assert [type(pub) for pub in data] == [Publication]
+                assert [pub.source_id for pub in data] == ["cached_001"]
 
-            # Verify extractor was called with index publications
+            # Verify extractor was called with the rebuilt publications
             mock_extractor.extract_ground_truth_pairs.assert_called_once_with(
-                [], mock_index.publications, mock_index.publications
+                [], mock_analyzer.copyright_data, mock_analyzer.renewal_data
             )
 
     def test_extract_ground_truth_no_renewals(self, mock_analyzer):
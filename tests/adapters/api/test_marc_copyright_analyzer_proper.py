@@ -9,10 +9,14 @@ from tempfile import TemporaryDirectory
 from unittest.mock import Mock
 from unittest.mock import patch
 
+# Third party imports
+import pytest
+
 # Local imports
 from marc_pd_tool.adapters.api import AnalysisResults
 from marc_pd_tool.adapters.api import MarcCopyrightAnalyzer
 from marc_pd_tool.application.models.config_models import AnalysisOptions
+from marc_pd_tool.application.processing.task_graph import TaskGraph
 from marc_pd_tool.core.domain.enums import CopyrightStatus
 from tests.fixtures.publications import PublicationBuilder
 
@@ -60,7 +64,13 @@ class TestMarcCopyrightAnalyzerProper:
             analyzer = MarcCopyrightAnalyzer(cache_dir=custom_cache_dir)
 
             assert analyzer.cache_dir == custom_cache_dir
-            mock_cache_manager.assert_called_once_with(custom_cache_dir)
+            caching_config = analyzer.config.caching
+            mock_cache_manager.assert_called_once_with(
+                custom_cache_dir,
+                max_bytes=caching_config.max_bytes,
+                compression=caching_config.compression,
+                compression_level=caching_config.compression_level,
+            )
 
     def test_initialization_force_refresh(self):
         """Test analyzer initialization with force refresh"""
@@ -111,7 +121,7 @@ class TestMarcCopyrightAnalyzerProper:
                 mock_process_batches.side_effect = process_batches
 
                 # Analyze the file
-                results = analyzer.analyze_marc_file(str(marc_path))
+                results = analyzer.analyze_marc_file(str(marc_path), temp_dir=temp_dir)
 
                 # Verify methods were called
                 mock_load.assert_called_once()
@@ -183,7 +193,9 @@ class TestMarcCopyrightAnalyzerProper:
                 mock_loader.extract_batches_to_disk.return_value = (["batch1.pkl"], 1, 0)
                 mock_marc_loader_class.return_value = mock_loader
 
-                results = analyzer.analyze_marc_file(str(marc_path), output_path=output_path)
+                results = analyzer.analyze_marc_file(
+                    str(marc_path), output_path=output_path, temp_dir=temp_dir
+                )
 
                 # Verify _process_marc_batches was called with output_path
                 mock_process_batches.assert_called_once()
@@ -322,3 +334,89 @@ class TestMarcCopyrightAnalyzerProper:
                             # Verify processing occurred
                             assert len(analyzer.results.publications) == 2
                             assert result_pubs == pubs  # Should return the publications passed in
+
+
+class TestPhase1Scheduling:
+    """Test loading and indexing both data sources over one shared pool"""
+
+    def test_load_and_index_data_runs_both_chains(self, tmp_path):
+        """Test that both indexes are built and every task is timed"""
+        copyright_dir = tmp_path / "reg"
+        copyright_dir.mkdir()
+        (copyright_dir / "1950.xml").write_text(
+            """<?xml version="1.0"?>
+            <copyrightEntries>
+                <copyrightEntry id="A1"><title>The Lost Road</title>
+                    <regDate date="1950-01-01"/></copyrightEntry>
+            </copyrightEntries>"""
+        )
+        renewal_dir = tmp_path / "ren"
+        renewal_dir.mkdir()
+        (renewal_dir / "1978.tsv").write_text(
+            "title\tauthor\toreg\todat\tentry_id\trdat\tclaimants\tfull_text\n"
+            "The Lost Road\tSmith\tA1\t1950-01-01\tR1\t1978-01-01\tSmith\tText\n"
+        )
+
+        analyzer = MarcCopyrightAnalyzer(cache_dir=str(tmp_path / "cache"))
+        analyzer.copyright_dir = str(copyright_dir)
+        analyzer.renewal_dir = str(renewal_dir)
+
+        graphs: list[TaskGraph] = []
+        log_timings = TaskGraph.log_timings
+
+        def record(graph: TaskGraph) -> None:
+            graphs.append(graph)
+            log_timings(graph)
+
+        with (
+            patch.object(TaskGraph, "log_timings", autospec=True, side_effect=record),
+            patch("marc_pd_tool.adapters.api._analyzer.build_wordbased_index") as sequential,
+        ):
+            analyzer._load_and_index_data(AnalysisOptions(num_processes=2))
+
+        assert analyzer.registration_index is not None
+        assert analyzer.renewal_index is not None
+        assert analyzer.registration_index.size() == 1
+        assert analyzer.renewal_index.size() == 1
+        # The shared pool served the index builds; no sequential fallback
+        sequential.assert_not_called()
+        assert sorted(timing.name for timing in graphs[0].timings) == [
+            "index registrations",
+            "index renewals",
+            "load registrations",
+            "load renewals",
+        ]
+
+    def test_phase1_tasks_require_both_indexes(self):
+        """Test Phase 1 fails loudly if a task left an index unbuilt"""
+        analyzer = MarcCopyrightAnalyzer()
+
+        with (
+            patch.object(analyzer, "_load_copyright_data"),
+            patch.object(analyzer, "_load_renewal_data"),
+            patch.object(analyzer, "_build_registration_index"),
+            patch.object(analyzer, "_build_renewal_index"),
+        ):
+            with pytest.raises(RuntimeError, match="without building both indexes"):
+                analyzer._run_phase1_tasks(AnalysisOptions(num_processes=1))
+
+    def test_waiting_job_reuses_indexes_built_by_lock_holder(self):
+        """Test a job that waited on the build lock loads the indexes instead of building"""
+        analyzer = MarcCopyrightAnalyzer()
+        registration, renewal = Mock(), Mock()
+        cache_manager = Mock()
+        cache_manager.get_cached_indexes.side_effect = [None, (registration, renewal)]
+        cache_manager.index_build_lock.return_value.__enter__ = Mock(
+            return_value=Mock(waited=True)
+        )
+        cache_manager.index_build_lock.return_value.__exit__ = Mock(return_value=None)
+        analyzer.cache_manager = cache_manager
+
+        with patch.object(analyzer, "_run_phase1_tasks") as run_phase1:
+            analyzer._load_and_index_data(AnalysisOptions(min_year=1930, max_year=1940))
+
+        run_phase1.assert_not_called()
+        cache_manager.cache_indexes.assert_not_called()
+        cache_manager.index_build_lock.assert_called_once_with(1930, 1940, False)
+        assert analyzer.registration_index is registration
+        assert analyzer.renewal_index is renewal
@@ -0,0 +1,152 @@
+# tests/adapters/cli/test_cache_command.py
+
+"""Tests for the `marc-pd-tool cache build` subcommand"""
+
+# Standard library imports
+from argparse import ArgumentTypeError
+from unittest.mock import patch
+
+# Third party imports
+from pytest import raises
+
+# Local imports
+from marc_pd_tool.adapters.cli.cache_command import ALL_YEARS
+from marc_pd_tool.adapters.cli.cache_command import build_cache_windows
+from marc_pd_tool.adapters.cli.cache_command import create_cache_parser
+from marc_pd_tool.adapters.cli.cache_command import parse_year_window
+from marc_pd_tool.adapters.cli.cache_command import plan_windows
+from marc_pd_tool.adapters.cli.cache_command import window_label
+from marc_pd_tool.cli import main
+
+
+def write_sources(tmp_path):
+    """Write a one-record copyright and renewal dataset"""
+    copyright_dir = tmp_path / "reg"
+    copyright_dir.mkdir()
+    (copyright_dir / "1950.xml").write_text("""<?xml version="1.0"?>
+        <copyrightEntries>
+            <copyrightEntry id="A1"><title>The Lost Road</title>
+                <regDate date="1950-01-01"/></copyrightEntry>
+        </copyrightEntries>""")
+    renewal_dir = tmp_path / "ren"
+    renewal_dir.mkdir()
+    (renewal_dir / "1978.tsv").write_text(
+        "title\tauthor\toreg\todat\tentry_id\trdat\tclaimants\tfull_text\n"
+        "The Lost Road\tSmith\tA1\t1950-01-01\tR1\t1978-01-01\tSmith\tText\n"
+    )
+    return str(copyright_dir), str(renewal_dir)
+
+
+class TestYearWindows:
+    """Test parsing and planning year windows"""
+
+    def test_parse_year_window(self):
+        """Test every accepted window form"""
+        assert parse_year_window("all") == ALL_YEARS
+        assert parse_year_window("1930-1940") == (1930, 1940)
+        assert parse_year_window("1950-") == (1950, None)
+        assert parse_year_window("-1925") == (None, 1925)
+        assert parse_year_window("1935") == (1935, 1935)
+
+    def test_parse_year_window_rejects_invalid(self):
+        """Test malformed and reversed windows are argument errors"""
+        with raises(ArgumentTypeError):
+            parse_year_window("nineteen-thirty")
+        with raises(ArgumentTypeError):
+            parse_year_window("1940-1930")
+
+    def test_window_label(self):
+        """Test windows are named for the build report"""
+        assert window_label(ALL_YEARS) == "all"
+        assert window_label((1930, 1940)) == "1930-1940"
+        assert window_label((1950, None)) == "1950-present"
+
+    def test_plan_windows_derives_covered_windows(self):
+        """Test windows inside another requested window are derived from it"""
+        built, derived = plan_windows(
+            [(1930, 1940), ALL_YEARS, (1950, 1960), (1930, 1940)], lambda outer, inner: True
+        )
+
+        assert built == [ALL_YEARS]
+        assert derived == [(1930, 1940), (1950, 1960)]
+
+    def test_plan_windows_builds_disjoint_windows(self):
+        """Test windows that no other window covers are all built"""
+        built, derived = plan_windows(
+            [(1930, 1940), (1935, 1945), (1950, None)], lambda outer, inner: True
+        )
+
+        assert built == [(1930, 1940), (1935, 1945), (1950, None)]
+        assert derived == []
+
+    def test_plan_windows_builds_windows_that_cant_be_derived(self):
+        """Test a covered window is built when deriving it would differ from a build"""
+        built, derived = plan_windows(
+            [ALL_YEARS, (1930, 1940), (1950, 1960)], lambda outer, inner: inner != (1930, 1940)
+        )
+
+        assert built == [ALL_YEARS, (1930, 1940)]
+        assert derived == [(1950, 1960)]
+
+
+class TestCacheBuild:
+    """Test building cache entries for year windows"""
+
+    def test_build_reports_time_and_sizes_per_window(self, tmp_path):
+        """Test a built and a derived window each report their cache entries"""
+        copyright_dir, renewal_dir = write_sources(tmp_path)
+        cache_dir = str(tmp_path / "cache")
+
+        reports = build_cache_windows(
+            [ALL_YEARS, (1970, 1980)], copyright_dir, renewal_dir, cache_dir, max_workers=1
+        )
+
+        assert [(report.window, report.derived) for report in reports] == [
+            ("all", False),
+            ("1970-1980", True),
+        ]
+        assert sorted(reports[0].entry_sizes) == [
+            "copyright_data/all",
+            "generic_detector",
+            "indexes/all",
+            "renewal_data/all",
+        ]
+        assert "indexes/1970_1980" in reports[1].entry_sizes
+        assert all(size > 0 for report in reports for size in report.entry_sizes.values())
+
+    def test_window_skipping_source_files_is_built(self, tmp_path):
+        """Test a window whose build skips files holding its entries isn't derived"""
+        copyright_dir, renewal_dir = write_sources(tmp_path)
+
+        # A 1950 build skips 1978.tsv by its name, though it renews a 1950 entry
+        reports = build_cache_windows(
+            [ALL_YEARS, (1950, 1950)],
+            copyright_dir,
+            renewal_dir,
+            str(tmp_path / "cache"),
+            max_workers=1,
+        )
+
+        assert [(report.window, report.derived) for report in reports] == [
+            ("all", False),
+            ("1950-1950", False),
+        ]
+
+    def test_parser_defaults_to_all_years(self):
+        """Test `cache build` without windows builds the full range"""
+        args = create_cache_parser().parse_args(["build", "--cache-dir", "cache"])
+
+        assert args.cache_command == "build"
+        assert args.windows == [ALL_YEARS]
+
+    def test_main_dispatches_cache_subcommand(self):
+        """Test `marc-pd-tool cache ...` runs the cache subcommand, not an analysis"""
+        with (
+            patch("sys.argv", ["marc-pd-tool", "cache", "build", "1930-1940"]),
+            patch("marc_pd_tool.adapters.cli.main.cache_main") as cache_main,
+            patch("marc_pd_tool.adapters.cli.main.MarcCopyrightAnalyzer") as analyzer_class,
+        ):
+            main()
+
+        cache_main.assert_called_once_with(["build", "1930-1940"])
+        analyzer_class.assert_not_called()
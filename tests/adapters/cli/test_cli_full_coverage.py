@@ -474,6 +474,13 @@ class TestCreateArgumentParserFullCoverage:
         # assert hasattr(args, "debug")  # Removed - use -vv for debug
         assert hasattr(args, "disable_file_logging")
 
+    def test_resume_and_pipeline_are_exclusive(self) -> None:
+        """Test that a pipelined run can't resume a run directory"""
+        parser = create_argument_parser()
+
+        with raises(SystemExit), patch("sys.stderr"):
+            parser.parse_args(["--marcxml", "test.xml", "--pipeline", "--resume", "run"])
+
 
 class TestEdgeCasesFullCoverage:
     """Test edge cases for full coverage"""
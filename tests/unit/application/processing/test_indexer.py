@@ -11,6 +11,8 @@ This file consolidates all tests from:
 """
 
 # Standard library imports
+from pickle import dumps
+from pickle import loads
 from unittest import TestCase
 from unittest.mock import Mock
 
@@ -32,6 +34,7 @@ from marc_pd_tool.application.processing.text_processing import MultiLanguageSte
 from marc_pd_tool.core.domain.enums import CountryClassification
 from marc_pd_tool.core.domain.index_entry import IndexEntry
 from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import PublicationView
 from marc_pd_tool.infrastructure.config import ConfigLoader
 from marc_pd_tool.shared.utils.text_utils import extract_significant_words
 from marc_pd_tool.shared.utils.text_utils import normalize_text_standard
@@ -327,6 +330,18 @@ class TestIndexEntry:
         entry.add(1)  # Duplicate
         assert entry.ids == {1, 2}
 
+    def test_from_ids(self):
+        """Test building entries from ID collections"""
+        assert IndexEntry.from_ids([]).is_empty() is True
+        assert IndexEntry.from_ids([3, 3]).ids == {3}
+        assert IndexEntry.from_ids([3, 1]).ids == {1, 3}
+
+    def test_len(self):
+        """Test entries report their size"""
+        assert len(IndexEntry()) == 0
+        assert len(IndexEntry.from_ids([7])) == 1
+        assert len(IndexEntry.from_ids([3, 1, 3])) == 2
+
 
 # ============================================================================
 # Text Normalization Tests
@@ -759,7 +774,7 @@ class TestDataIndexer(TestCase):
         candidates = self.indexer.get_candidates_list(query_pub)
         assert isinstance(candidates, list)
         assert len(candidates) > 0
-        assert all(isinstance(pub, Publication) for pub in candidates)
+        assert all(isinstance(pub, PublicationView) for pub in candidates)
 
     def test_get_stats(self):
         """Test getting indexer statistics"""
@@ -1059,6 +1074,42 @@ class TestDataIndexerSerialization:
         assert new_indexer._lang_processor is None
         assert new_indexer._stemmer is None
 
+    def test_sections_load_on_first_access(self):
+        """Test a header with a section loader reads each section once, when used"""
+        indexer = build_wordbased_index(
+            [Publication(title="The Lost Road", source_id="001", lccn="50012345", year=1950)]
+        )
+        header, sections = indexer.split_sections()
+        requested = []
+
+        def loader(name):
+            requested.append(name)
+            return sections[name]
+
+        header.attach_sections(loader)
+        assert header.loaded_sections == []
+
+        # An LCCN hit returns before any other index is consulted
+        query = Publication(title="Anything", lccn="50012345")
+        assert header.find_candidates(query) == {0}
+        assert requested == ["lccn_index"]
+
+        header.load_sections()
+        assert header.loaded_sections == list(sections)
+        assert sorted(requested) == sorted(sections)
+        assert header.get_stats() == indexer.get_stats()
+
+    def test_pickling_loads_missing_sections(self):
+        """Test a lazily loaded index pickles with every section"""
+        indexer = build_wordbased_index([Publication(title="The Lost Road", source_id="001")])
+        header, sections = indexer.split_sections()
+        header.attach_sections(sections.__getitem__)
+
+        restored = loads(dumps(header))
+
+        assert restored.loaded_sections == list(sections)
+        assert restored.title_index.keys() == indexer.title_index.keys()
+
 
 # ============================================================================
 # Year Indexing Tests
@@ -1148,6 +1199,37 @@ class TestBuildWordbasedIndex:
         assert index.enable_abbreviation_expansion is False
 
 
+class TestEstimateCandidates:
+    """Test predicting candidate counts from posting sizes"""
+
+    @fixture
+    def index(self) -> DataIndexer:
+        """Many poems spread over ten years, and one specific work"""
+        publications = [
+            Publication(title="Poems", author=f"Poet {i}", year=1950 + i % 10) for i in range(100)
+        ]
+        publications.append(
+            Publication(title="Ohio Waters", author="Jones", year=1951, lccn="50012345")
+        )
+        return build_wordbased_index(publications)
+
+    def test_generic_title_predicts_more(self, index):
+        """Test a common title predicts more candidates than a rare one"""
+        generic = Publication(title="Poems", year=1951)
+        specific = Publication(title="Ohio Waters", year=1951)
+
+        assert index.estimate_candidates(generic) > 10 * index.estimate_candidates(specific)
+        # The year window holds about a third of the poems
+        actual = len(index.find_candidates(generic))
+        assert actual / 2 < index.estimate_candidates(generic) < actual * 2
+
+    def test_lccn_and_missing_data(self, index):
+        """Test LCCN hits, year-less records and unknown titles"""
+        assert index.estimate_candidates(Publication(title="Anything", lccn="50012345")) == 1
+        assert index.estimate_candidates(Publication(title="Poems")) == 100
+        assert index.estimate_candidates(Publication(title="Zzyzx", year=1951)) == 0
+
+
 # ============================================================================
 # Integration Tests
 # ============================================================================
@@ -1692,3 +1774,69 @@ class TestKeyGeneration:
         for i in range(len(auth_keys)):
             for j in range(i + 1, len(auth_keys)):
                 assert len(auth_keys[i] & auth_keys[j]) > 0
+
+
+class TestSubsetByYear:
+    """Test deriving a year-range index from a wider index"""
+
+    @staticmethod
+    def _postings(indexer: DataIndexer) -> dict[str, dict[object, set[str]]]:
+        """Index postings keyed by source_id so indexes with different pub_ids compare"""
+        source_ids = [pub.source_id for pub in indexer.publications]
+        return {
+            name: {
+                key: {source_ids[pub_id] for pub_id in entry.ids}
+                for key, entry in getattr(indexer, name).items()
+            }
+            for name in (
+                "title_index",
+                "author_index",
+                "publisher_index",
+                "year_index",
+                "lccn_index",
+            )
+        }
+
+    def test_subset_matches_index_built_from_filtered_publications(self):
+        """Test a derived subset equals an index built from the same year range"""
+        publications = [
+            Publication(
+                title=f"History of the {subject} Valley",
+                author=f"{subject}, Anne",
+                publisher=f"{subject} Press",
+                lccn=f"{year % 100}-{i}" if i % 2 else None,
+                source_id=f"R{i}",
+                year=year,
+            )
+            for i, (subject, year) in enumerate(
+                [("Ohio", 1925), ("Hudson", 1932), ("Missouri", 1938), ("Ohio", 1945)]
+            )
+        ] + [Publication(title="Undated Ohio pamphlet", source_id="R9")]
+
+        full = build_wordbased_index(publications)
+        subset = full.subset_by_year(1930, 1940)
+        expected = build_wordbased_index(
+            [pub for pub in publications if pub.year is None or 1930 <= pub.year <= 1940]
+        )
+
+        assert [pub.source_id for pub in subset.publications] == ["R1", "R2", "R9"]
+        assert self._postings(subset) == self._postings(expected)
+        assert subset.title_counts == expected.title_counts
+        assert set(subset.year_index) == {1932, 1938}
+
+    def test_open_ended_subset(self):
+        """Test subsets with only a minimum or only a maximum year"""
+        publications = [
+            Publication(title=f"Book {year}", source_id=str(year), year=year)
+            for year in (1920, 1930, 1940)
+        ]
+        full = build_wordbased_index(publications)
+
+        assert [p.source_id for p in full.subset_by_year(1930, None).publications] == [
+            "1930",
+            "1940",
+        ]
+        assert [p.source_id for p in full.subset_by_year(None, 1930).publications] == [
+            "1920",
+            "1930",
+        ]
@@ -27,6 +27,7 @@ from marc_pd_tool.application.processing.matching._match_builder import (
 )
 from marc_pd_tool.application.processing.matching._score_combiner import ScoreCombiner
 from marc_pd_tool.application.processing.matching_engine import DataMatcher
+from marc_pd_tool.application.processing.matching_engine import estimate_batch_cost
 from marc_pd_tool.application.processing.matching_engine import init_worker
 from marc_pd_tool.application.processing.matching_engine import process_batch
 from marc_pd_tool.application.processing.similarity_calculator import (
@@ -2955,6 +2956,279 @@ class TestProcessBatch:
             assert stats.registration_matches_found == 0
             assert stats.renewal_matches_found == 0
 
+    def test_process_batch_in_memory_batch(self, tmp_path):
+        """Test that pipelined runs can pass the publications instead of a pickle path"""
+        result_dir = tmp_path / "results"
+        result_dir.mkdir()
+
+        publications = [
+            Publication(
+                title="Book 1",
+                author="Author 1",
+                pub_date="1955",
+                source_id="001",
+                country_code="xxu",
+                country_classification=CountryClassification.US,
+            )
+        ]
+
+        batch_info = (
+            3,  # batch_id
+            publications,  # in-memory batch
+            str(tmp_path / "cache"),  # cache_dir
+            str(tmp_path / "copyright"),  # copyright_dir
+            str(tmp_path / "renewal"),  # renewal_dir
+            "test_hash",  # config_hash
+            {"min_length": 10},  # detector_config
+            0,  # total_batches (unknown while pipelining)
+            40,  # title_threshold
+            30,  # author_threshold
+            20,  # publisher_threshold
+            2,  # year_tolerance
+            95,  # early_exit_title
+            90,  # early_exit_author
+            85,  # early_exit_publisher
+            False,  # score_everything_mode
+            None,  # minimum_combined_score
+            False,  # brute_force_missing_year
+            1950,  # min_year
+            1960,  # max_year
+            str(result_dir),  # result_temp_dir
+        )
+
+        mock_index = Mock()
+        mock_index.find_candidates = Mock(return_value=[])
+        mock_index.publications = []
+
+        # Local imports
+        import marc_pd_tool.application.processing.matching_engine
+
+        with (
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine,
+                "_worker_registration_index",
+                mock_index,
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine,
+                "_worker_renewal_index",
+                mock_index,
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine,
+                "_worker_generic_detector",
+                Mock(is_generic=Mock(return_value=False)),
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_config", None
+            ),
+        ):
+            batch_id, result_path, stats = process_batch(batch_info)
+
+            assert batch_id == 3
+            assert exists(result_path)
+            assert stats.marc_count == 1
+
+    def test_process_batch_defers_tail_over_budget(self, tmp_path):
+        """Test a batch over its time budget hands back its unprocessed records"""
+        publications = [
+            Publication(title=f"Book {i}", pub_date="1955", source_id=f"00{i}") for i in range(4)
+        ]
+        publications[1].year = None
+
+        batch_info = (
+            1,  # batch_id
+            publications,  # in-memory batch
+            str(tmp_path / "cache"),  # cache_dir
+            str(tmp_path / "copyright"),  # copyright_dir
+            str(tmp_path / "renewal"),  # renewal_dir
+            "test_hash",  # config_hash
+            {"min_length": 10},  # detector_config
+            0,  # total_batches
+            40,  # title_threshold
+            30,  # author_threshold
+            20,  # publisher_threshold
+            2,  # year_tolerance
+            95,  # early_exit_title
+            90,  # early_exit_author
+            85,  # early_exit_publisher
+            False,  # score_everything_mode
+            None,  # minimum_combined_score
+            False,  # brute_force_missing_year
+            1950,  # min_year
+            1960,  # max_year
+            None,  # result_temp_dir (return the publications)
+        )
+
+        # Local imports
+        import marc_pd_tool.application.processing.matching_engine
+
+        with (
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine,
+                "_worker_registration_index",
+                None,
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_renewal_index", None
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_config", None
+            ),
+            # Every clock reading is 10 seconds after the previous one
+            patch(
+                "marc_pd_tool.application.processing.matching_engine.time",
+                side_effect=[0.0, 10.0, 20.0, 30.0],
+            ),
+        ):
+            _, processed, stats = process_batch(batch_info, time_budget=15.0)
+
+        # Book 1 (skipped, no year) starts at 10s; Book 2 would start at 20s, over budget
+        assert [pub.source_id for pub in processed] == ["000"]
+        assert stats.skipped_no_year == 1
+        assert [pub.source_id for pub in stats.deferred] == ["002", "003"]
+        assert "deferred" not in stats.to_dict()
+
+    def test_process_batch_keeps_batch_file(self, tmp_path):
+        """Test a pickled batch is only deleted when the caller doesn't keep it"""
+        kept = tmp_path / "batch_00000.pkl"
+        removed = tmp_path / "batch_00001.pkl"
+        for path in (kept, removed):
+            with open(path, "wb") as f:
+                pickle_dump([Publication(title="Book", pub_date="1955", source_id="001")], f)
+
+        def batch_info(path):
+            return (
+                1,  # batch_id
+                str(path),  # batch_path
+                str(tmp_path / "cache"),  # cache_dir
+                str(tmp_path / "copyright"),  # copyright_dir
+                str(tmp_path / "renewal"),  # renewal_dir
+                "test_hash",  # config_hash
+                {"min_length": 10},  # detector_config
+                2,  # total_batches
+                40,  # title_threshold
+                30,  # author_threshold
+                20,  # publisher_threshold
+                2,  # year_tolerance
+                95,  # early_exit_title
+                90,  # early_exit_author
+                85,  # early_exit_publisher
+                False,  # score_everything_mode
+                None,  # minimum_combined_score
+                False,  # brute_force_missing_year
+                1950,  # min_year
+                1960,  # max_year
+                None,  # result_temp_dir (return the publications)
+            )
+
+        # Local imports
+        import marc_pd_tool.application.processing.matching_engine
+
+        with (
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine,
+                "_worker_registration_index",
+                None,
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_renewal_index", None
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_config", None
+            ),
+        ):
+            _, kept_result, _ = process_batch(batch_info(kept), keep_batch_file=True)
+            _, removed_result, _ = process_batch(batch_info(removed))
+
+        assert kept.exists()
+        assert not removed.exists()
+        assert len(kept_result) == len(removed_result) == 1
+
+    def test_process_batch_reuses_cached_results(self, tmp_path):
+        """Test cached records keep their results and matched records are cached"""
+        # Local imports
+        import marc_pd_tool.application.processing.matching_engine
+        from marc_pd_tool.core.domain.match_result import MatchResult
+        from marc_pd_tool.infrastructure.cache import MatchResultCache
+        from marc_pd_tool.infrastructure.cache import match_outcome
+        from marc_pd_tool.infrastructure.cache import match_record_key
+        from marc_pd_tool.infrastructure.cache import match_run_key
+
+        cached = Publication(title="Known Book", pub_date="1955", source_id="001")
+        cached.registration_match = MatchResult(
+            matched_title="Known Book",
+            matched_author="",
+            similarity_score=90.0,
+            title_score=90.0,
+            author_score=0.0,
+            year_difference=0,
+            source_id="R1",
+            source_type="registration",
+        )
+        cache = MatchResultCache.open(str(tmp_path / "cache"), match_run_key("index"))
+        cache.store({match_record_key(cached): match_outcome(cached)})
+
+        batch = [
+            Publication(title="Known Book", pub_date="1955", source_id="001"),
+            Publication(title="New Book", pub_date="1956", source_id="002"),
+        ]
+        batch_info = (
+            1,  # batch_id
+            batch,  # in-memory batch
+            str(tmp_path / "cache"),  # cache_dir
+            str(tmp_path / "copyright"),  # copyright_dir
+            str(tmp_path / "renewal"),  # renewal_dir
+            "test_hash",  # config_hash
+            {"min_length": 10},  # detector_config
+            1,  # total_batches
+            40,  # title_threshold
+            30,  # author_threshold
+            20,  # publisher_threshold
+            2,  # year_tolerance
+            95,  # early_exit_title
+            90,  # early_exit_author
+            85,  # early_exit_publisher
+            False,  # score_everything_mode
+            None,  # minimum_combined_score
+            False,  # brute_force_missing_year
+            1950,  # min_year
+            1960,  # max_year
+            None,  # result_temp_dir (return the publications)
+        )
+
+        with (
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine,
+                "_worker_registration_index",
+                None,
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_renewal_index", None
+            ),
+            patch.object(
+                marc_pd_tool.application.processing.matching_engine, "_worker_config", None
+            ),
+        ):
+            _, processed, stats = process_batch(batch_info, result_cache=cache)
+
+        assert [pub.source_id for pub in processed] == ["001", "002"]
+        assert processed[0].registration_match.source_id == "R1"
+        assert processed[0].copyright_status
+        assert stats.cached_records == 1
+        assert stats.marc_count == 2
+        assert stats.registration_matches_found == 1
+        assert match_record_key(batch[1]) in cache.lookup([match_record_key(batch[1])])
+
+    def test_estimate_batch_cost(self):
+        """Test batch cost adds one per matched record to its predicted candidates"""
+        registration_index = Mock(estimate_candidates=Mock(return_value=4.0))
+        renewal_index = Mock(estimate_candidates=Mock(return_value=0.5))
+        batch = [Publication(title="Dated", pub_date="1955"), Publication(title="Undated")]
+
+        assert estimate_batch_cost(batch, registration_index, renewal_index) == 5.5
+        assert estimate_batch_cost(batch, registration_index, renewal_index, True) == 11.0
+
     def test_process_batch_worker_not_initialized(self, tmp_path):
         """Test process_batch when worker is not initialized"""
         # Create a temporary batch file
@@ -0,0 +1,123 @@
+# tests/unit/application/processing/test_shared_index.py
+
+"""Tests for indexes published in shared memory"""
+
+# Standard library imports
+from multiprocessing.shared_memory import SharedMemory
+from pickle import dumps
+from pickle import loads
+
+# Third party imports
+from pytest import fixture
+from pytest import raises
+
+# Local imports
+from marc_pd_tool.application.processing.indexer import DataIndexer
+from marc_pd_tool.application.processing.indexer import build_wordbased_index
+from marc_pd_tool.application.processing.shared_index import SharedIndexSegment
+from marc_pd_tool.application.processing.shared_index import attach_shared_index
+from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import STORE_FIELDS
+
+
+def store_rows(index: DataIndexer) -> list[tuple[object, ...]]:
+    """Every stored field of every publication, for comparing stores"""
+    store = index.publications
+    return [
+        tuple(store.value(field, i) for field in STORE_FIELDS) + (store.year(i),)
+        for i in range(len(store))
+    ]
+
+
+@fixture
+def publications() -> list[Publication]:
+    """Publications covering every index and a few awkward strings"""
+    return [
+        Publication(
+            title="The Lost Road",
+            author="Smith, John",
+            publisher="Ohio Press",
+            pub_date="1950",
+            lccn="50012345",
+            source_id="R1",
+        ),
+        Publication(title="Ohio Waters", author="Jones", year=1951, source_id="R2"),
+        Publication(title="Résumé d'Émile", publisher="Éditions", year=1951, source_id="R3"),
+        Publication(title="Undated road notes", source_id="R4"),
+        Publication(title="Œuvres complètes", year=1952, source_id="R5"),
+    ]
+
+
+class TestSharedIndex:
+    """Test attaching an index published in shared memory"""
+
+    def test_attached_index_matches_original(self, publications):
+        """Test lookups, stored values and stats read from shared memory"""
+        index = build_wordbased_index(publications)
+
+        with SharedIndexSegment(index) as segment:
+            shared = attach_shared_index(segment.handle)
+
+            for query in publications + [Publication(title="Nothing alike", year=1900)]:
+                assert shared.find_candidates(query) == index.find_candidates(query)
+            assert store_rows(shared) == store_rows(index)
+            assert shared.get_stats() == index.get_stats()
+            assert shared.title_counts == index.title_counts
+
+    def test_postings_behave_like_dicts(self, publications):
+        """Test membership, iteration and misses of the packed postings"""
+        index = build_wordbased_index(publications)
+
+        with SharedIndexSegment(index) as segment:
+            shared = attach_shared_index(segment.handle)
+
+            assert set(shared.title_index) == set(index.title_index)
+            assert {year: entry.ids for year, entry in shared.year_index.items()} == {
+                year: entry.ids for year, entry in index.year_index.items()
+            }
+            assert "50012345" in shared.lccn_index
+            assert shared.title_index.get("zzz") is None
+            assert shared.year_index.get("1951") is None
+            with raises(KeyError):
+                shared.author_index["nobody"]
+
+    def test_subset_of_attached_index(self, publications):
+        """Test a year-range index can be derived from a shared index"""
+        index = build_wordbased_index(publications)
+
+        with SharedIndexSegment(index) as segment:
+            subset = attach_shared_index(segment.handle).subset_by_year(1951, 1951)
+
+        expected = index.subset_by_year(1951, 1951)
+        assert store_rows(subset) == store_rows(expected)
+        assert set(subset.title_index) == set(expected.title_index)
+
+    def test_handle_survives_pickling(self, publications):
+        """Test a handle sent to a spawned worker still attaches"""
+        index = build_wordbased_index(publications)
+
+        with SharedIndexSegment(index) as segment:
+            shared = attach_shared_index(loads(dumps(segment.handle)))
+
+            assert [pub.source_id for pub in shared.publications] == [
+                pub.source_id for pub in publications
+            ]
+
+    def test_empty_index(self):
+        """Test an index with no publications can be published"""
+        with SharedIndexSegment(build_wordbased_index([])) as segment:
+            shared = attach_shared_index(segment.handle)
+
+            assert len(shared.publications) == 0
+            assert shared.find_candidates(Publication(title="Anything", year=1950)) == set()
+
+    def test_close_removes_segment(self, publications):
+        """Test closing the owner removes the segment"""
+        segment = SharedIndexSegment(build_wordbased_index(publications))
+        name = segment.handle.segment
+
+        segment.close()
+        segment.close()
+
+        with raises(FileNotFoundError):
+            SharedMemory(name=name, track=False)
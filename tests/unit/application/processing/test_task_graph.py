@@ -0,0 +1,67 @@
+# tests/unit/application/processing/test_task_graph.py
+
+"""Tests for the dependency-ordered task runner"""
+
+# Standard library imports
+from threading import Event
+
+# Third party imports
+from pytest import raises
+
+# Local imports
+from marc_pd_tool.application.processing.task_graph import TaskGraph
+
+
+class TestTaskGraph:
+    """Test task ordering, concurrency, failures and timings"""
+
+    def test_dependencies_run_first(self):
+        """Test that a task starts only after the tasks it depends on"""
+        order: list[str] = []
+        graph = TaskGraph("test")
+        graph.add("load", lambda: order.append("load"))
+        graph.add("index", lambda: order.append("index"), depends_on=("load",))
+
+        graph.run()
+
+        assert order == ["load", "index"]
+        assert sorted(timing.name for timing in graph.timings) == ["index", "load"]
+
+    def test_independent_chains_overlap(self):
+        """Test that independent tasks run at the same time"""
+        started = Event()
+        graph = TaskGraph("test")
+        graph.add("first", lambda: started.set())
+        # Would time out (and fail) if "first" could not run concurrently
+        graph.add("second", lambda: None if started.wait(timeout=5) else 1 / 0)
+
+        graph.run()
+
+        assert len(graph.timings) == 2
+
+    def test_failure_skips_dependents_and_is_raised(self):
+        """Test that a failed task skips its dependents but not other chains"""
+        ran: list[str] = []
+
+        def fail() -> None:
+            raise RuntimeError("load failed")
+
+        graph = TaskGraph("test")
+        graph.add("load registrations", fail)
+        graph.add("load renewals", lambda: ran.append("load renewals"))
+        graph.add("index registrations", lambda: ran.append("index"), ("load registrations",))
+
+        with raises(RuntimeError, match="load failed"):
+            graph.run()
+
+        assert ran == ["load renewals"]
+
+    def test_invalid_graphs_are_rejected(self):
+        """Test duplicate names and unknown dependencies"""
+        graph = TaskGraph("test")
+        graph.add("load", lambda: None)
+
+        with raises(ValueError):
+            graph.add("load", lambda: None)
+        with raises(ValueError):
+            graph.add("index", lambda: None, depends_on=("missing",))
@@ -32,6 +32,7 @@ from marc_pd_tool.application.processing.text_processing import GenericTitleDete
 from marc_pd_tool.application.processing.text_processing import LanguageProcessor
 from marc_pd_tool.application.processing.text_processing import MultiLanguageStemmer
 from marc_pd_tool.application.processing.text_processing import _get_publisher_stopwords
+from marc_pd_tool.application.processing.text_processing import count_title_frequencies
 from marc_pd_tool.application.processing.text_processing import expand_abbreviations
 from marc_pd_tool.application.processing.text_processing import normalize_publisher_text
 
@@ -252,6 +253,28 @@ class TestMultiLanguageStemmer:
         assert new_stemmer._stemmers is None
         assert new_stemmer.language_map == stemmer.language_map
 
+    def test_stemmers_per_thread(self):
+        """Test each thread stems with its own stemmers"""
+        # Standard library imports
+        from threading import Thread
+
+        stemmer = MultiLanguageStemmer()
+        main_stemmers = stemmer._get_stemmers()
+        seen = []
+
+        def stem_in_thread():
+            assert stemmer._stemmers is None
+            seen.append(stemmer._get_stemmers())
+            seen.append(stemmer.stem_words(["running"], "eng"))
+
+        thread = Thread(target=stem_in_thread)
+        thread.start()
+        thread.join()
+
+        assert seen[0] is not main_stemmers
+        assert seen[1] == stemmer.stem_words(["running"], "eng")
+        assert stemmer._get_stemmers() is main_stemmers
+
 
 # ============================================================================
 # MULTILANGUAGE STEMMER PROPERTY-BASED TESTS
@@ -910,6 +933,45 @@ class TestGenericTitleDetector:
         assert len(detector.title_counts) <= 10
         assert detector._trim_performed is True
 
+    def test_title_count_trimming_keeps_repeated_titles(self):
+        """Test trimming drops titles seen once before any repeated title"""
+        detector = GenericTitleDetector(max_title_counts=10)
+        for _ in range(3):
+            detector.add_title("Poems")
+
+        for i in range(15):
+            detector.add_title(f"Title {i}")
+
+        assert detector.title_counts["poems"] == 3
+        assert len(detector.title_counts) <= 10
+
+    def test_count_title_frequencies(self):
+        """Test only titles short enough to be generic by frequency are counted"""
+        counts = count_title_frequencies(
+            ["Poems.", "POEMS", "Sermons", "", None, "A title well over twenty characters"]
+        )
+
+        assert counts == {"poems": 2, "sermons": 1}
+
+    def test_from_title_counts(self):
+        """Test a detector built from precomputed tables applies the frequency rule"""
+        detector = GenericTitleDetector.from_title_counts(
+            [{"ohio waters": 2}, {"ohio waters": 1, "lost road": 1}], frequency_threshold=3
+        )
+
+        assert detector.is_generic("Ohio Waters") is True
+        assert detector.get_detection_reason("Ohio Waters") == "frequency: 3 occurrences"
+        assert detector.is_generic("Lost Road") is False
+
+    def test_add_title_counts_clears_cached_results(self):
+        """Test results cached before a table is added don't go stale"""
+        detector = GenericTitleDetector(frequency_threshold=2)
+        assert detector.is_generic("Ohio Waters") is False
+
+        detector.add_title_counts({"ohio waters": 5})
+
+        assert detector.is_generic("Ohio Waters") is True
+
 
 # ============================================================================
 # GENERIC TITLE DETECTOR PATTERN TESTS
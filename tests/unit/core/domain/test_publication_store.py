@@ -0,0 +1,150 @@
+# tests/unit/core/domain/test_publication_store.py
+
+"""Tests for the struct-of-arrays publication store"""
+
+# Standard library imports
+from pickle import dumps
+from pickle import loads
+
+# Third party imports
+from pytest import raises
+
+# Local imports
+from marc_pd_tool.application.processing.indexer import build_wordbased_index
+from marc_pd_tool.core.domain.enums import CountryClassification
+from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.core.domain.publication_store import PublicationStore
+from marc_pd_tool.core.domain.publication_store import PublicationView
+
+
+def make_publications() -> list[Publication]:
+    """Publications sharing authors/publishers, with some missing fields"""
+    return [
+        Publication(
+            title=f"The Collected Works, Volume {i}",
+            author="Smith, John, 1900-1980",
+            pub_date="1950",
+            publisher="Macmillan & Co.",
+            place="New York",
+            lccn="50-12345" if i == 0 else None,
+            source="Registration",
+            source_id=f"R{i}",
+            country_classification=CountryClassification.US,
+            full_text=f"Collected works {i}",
+        )
+        for i in range(3)
+    ] + [Publication(title="Untitled", source_id="R9")]
+
+
+class TestPublicationStore:
+    """Test storing publications as interned columns"""
+
+    def test_views_match_publications(self):
+        """Test that every view field equals the stored publication's"""
+        pubs = make_publications()
+        store = PublicationStore.from_publications(pubs)
+
+        assert len(store) == len(pubs)
+        for pub, view in zip(pubs, store):
+            assert isinstance(view, PublicationView)
+            for name in (
+                "title",
+                "original_title",
+                "author",
+                "main_author",
+                "publisher",
+                "place",
+                "pub_date",
+                "lccn",
+                "normalized_lccn",
+                "source_id",
+                "full_text",
+                "language_code",
+                "year",
+                "country_classification",
+            ):
+                assert getattr(view, name) == getattr(pub, name), name
+
+    def test_strings_are_stored_once(self):
+        """Test that repeated values share one string table entry"""
+        store = PublicationStore.from_publications(make_publications())
+
+        # 4 titles/ids/texts each, but only one author, publisher and place
+        assert store._strings.count("Smith, John, 1900-1980") == 1
+        assert store._strings.count("Macmillan & Co.") == 1
+        assert store.value("original_author", 0) is store.value("original_author", 2)
+
+    def test_append_and_extend_agree(self):
+        """Test building one record at a time gives the same store"""
+        pubs = make_publications()
+        appended = PublicationStore()
+        positions = [appended.append(pub) for pub in pubs]
+        extended = PublicationStore.from_publications(pubs)
+
+        assert positions == [0, 1, 2, 3]
+        assert sorted(appended._strings, key=str) == sorted(extended._strings, key=str)
+        for i in positions:
+            assert appended[i].to_publication().to_dict() == extended[i].to_publication().to_dict()
+
+    def test_indexing(self):
+        """Test negative indexes, slices and out-of-range errors"""
+        store = PublicationStore.from_publications(make_publications())
+
+        assert store[-1].source_id == "R9"
+        assert [view.source_id for view in store[1:3]] == ["R1", "R2"]
+        with raises(IndexError):
+            store[4]
+
+    def test_subset(self):
+        """Test subsets keep the chosen records and only the strings they use"""
+        store = PublicationStore.from_publications(make_publications())
+
+        subset = store.subset([3, 1])
+
+        assert len(subset) == 2
+        assert [view.source_id for view in subset] == ["R9", "R1"]
+        assert subset[1].to_publication().to_dict() == store[1].to_publication().to_dict()
+        assert "R0" not in subset._strings
+        assert len(subset._strings) == len(set(subset._strings))
+
+    def test_pickle_round_trip(self):
+        """Test pickling and adding records after unpickling"""
+        pubs = make_publications()
+        store = loads(dumps(PublicationStore.from_publications(pubs[:3])))
+
+        assert store[0].lccn == "50-12345"
+        assert store.append(pubs[3]) == 3
+        assert store[3].title == "Untitled"
+        assert store.value("original_author", 3) is None
+
+    def test_fingerprint(self):
+        """Test the fingerprint follows the stored records"""
+        pubs = make_publications()
+        fingerprint = PublicationStore.from_publications(pubs).fingerprint()
+
+        assert PublicationStore.from_publications(pubs).fingerprint() == fingerprint
+        assert loads(dumps(PublicationStore.from_publications(pubs))).fingerprint() == fingerprint
+        assert PublicationStore.from_publications(pubs[:3]).fingerprint() != fingerprint
+        pubs[1].original_publisher = "Harper"
+        assert PublicationStore.from_publications(pubs).fingerprint() != fingerprint
+
+    def test_to_publication(self):
+        """Test rebuilding a full Publication from a view"""
+        pub = make_publications()[0]
+        rebuilt = PublicationStore.from_publications([pub])[0].to_publication()
+
+        assert rebuilt.to_dict() == pub.to_dict()
+
+
+class TestIndexerStore:
+    """Test that the indexer keeps its publications in a store"""
+
+    def test_index_publications_are_views(self):
+        """Test candidate lookups resolve to store views"""
+        index = build_wordbased_index(make_publications())
+
+        assert isinstance(index.publications, PublicationStore)
+        query = Publication(title="The Collected Works, Volume 1", pub_date="1950")
+        candidates = index.find_candidates(query)
+        assert candidates
+        assert "R1" in {index.publications[i].source_id for i in candidates}
@@ -0,0 +1,88 @@
+# tests/unit/infrastructure/cache/test_build_lock.py
+
+"""Tests for the cross-process cache build lock"""
+
+# Standard library imports
+from json import dumps
+from os.path import exists
+from os.path import join
+from socket import gethostname
+from threading import Event
+from threading import Thread
+from time import sleep
+
+# Local imports
+from marc_pd_tool.infrastructure.cache._build_lock import CacheBuildLock
+from marc_pd_tool.infrastructure.cache._manager import CacheManager
+
+
+class TestCacheBuildLock:
+    """Test CacheBuildLock acquisition, waiting and stale lock recovery"""
+
+    def test_acquire_and_release(self, tmp_path):
+        """Test an uncontended lock is taken without waiting and removed on release"""
+        path = str(tmp_path / "entry.lock")
+
+        with CacheBuildLock(path) as lock:
+            assert lock.held is True
+            assert lock.waited is False
+            assert exists(path)
+
+        assert not exists(path)
+
+    def test_second_holder_waits_for_first(self, tmp_path):
+        """Test a second process blocks until the first releases, then sees it waited"""
+        path = str(tmp_path / "entry.lock")
+        first = CacheBuildLock(path)
+        first.acquire()
+        events: list[str] = []
+        started = Event()
+
+        def second() -> None:
+            lock = CacheBuildLock(path, poll_interval=0.01)
+            started.set()
+            with lock:
+                events.append(f"acquired waited={lock.waited}")
+
+        thread = Thread(target=second)
+        thread.start()
+        started.wait()
+        sleep(0.1)
+        events.append("released")
+        first.release()
+        thread.join(timeout=5)
+
+        assert events == ["released", "acquired waited=True"]
+
+    def test_lock_of_dead_process_is_broken(self, tmp_path):
+        """Test a lock left by a process that no longer exists doesn't block"""
+        path = tmp_path / "entry.lock"
+        path.write_text(dumps({"host": gethostname(), "pid": 2**22 + 12345, "started": 0}))
+
+        lock = CacheBuildLock(str(path), poll_interval=0.01)
+        lock.acquire()
+
+        assert lock.held is True
+        lock.release()
+
+    def test_timeout_proceeds_without_lock(self, tmp_path):
+        """Test a waiter gives up after its timeout without taking the lock"""
+        path = str(tmp_path / "entry.lock")
+        holder = CacheBuildLock(path)
+        holder.acquire()
+
+        lock = CacheBuildLock(path, timeout=0.05, poll_interval=0.01)
+        assert lock.acquire() is True
+        assert lock.held is False
+
+        lock.release()
+        assert exists(path)  # Still the holder's lock
+        holder.release()
+
+    def test_index_build_lock_names_entry(self, tmp_path):
+        """Test the cache manager keys index locks by year range"""
+        manager = CacheManager(str(tmp_path / "cache"))
+
+        lock = manager.index_build_lock(1930, 1940)
+
+        assert lock.path == join(manager.locks_dir, "indexes_1930_1940.lock")
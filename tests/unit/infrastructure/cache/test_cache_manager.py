@@ -3,7 +3,11 @@
 """Comprehensive unit tests for CacheManager"""
 
 # Standard library imports
+from os import listdir
 from os import makedirs
+from os import remove
+from os import stat as os_stat
+from os import utime
 from os.path import exists
 from os.path import getmtime
 from os.path import join
@@ -15,6 +19,9 @@ from time import time
 from unittest.mock import patch
 
 # Local imports
+from marc_pd_tool.application.processing.indexer import DataIndexer
+from marc_pd_tool.application.processing.indexer import INDEX_SECTIONS
+from marc_pd_tool.application.processing.indexer import build_wordbased_index
 from marc_pd_tool.core.domain.publication import Publication
 from marc_pd_tool.infrastructure.cache._manager import CacheManager
 
@@ -442,3 +449,557 @@ class TestCacheManager:
                 cache_subdir, [source_file, "/another"], {"key": "value"}
             )
             assert valid is False
+
+
+class TestFingerprintValidation:
+    """Test fingerprint-based cache validation"""
+
+    def _make_source(self, temp_dir: str) -> str:
+        source_dir = join(temp_dir, "source")
+        makedirs(join(source_dir, "sub"))
+        for name, content in [("a.tsv", "alpha"), ("sub/b.tsv", "beta")]:
+            with open(join(source_dir, name), "w") as f:
+                f.write(content)
+        return source_dir
+
+    def _bump_mtime(self, path: str) -> None:
+        stat = os_stat(path)
+        utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000_000))
+
+    def test_metadata_records_per_file_fingerprints(self):
+        """Test saved metadata holds size, mtime_ns and hash for every file"""
+        with TemporaryDirectory() as temp_dir:
+            source_dir = self._make_source(temp_dir)
+            manager = CacheManager(join(temp_dir, "cache"))
+
+            assert manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+
+            metadata = manager._load_metadata(join(manager.renewal_cache_dir, "all"))
+            fingerprints = metadata["source_fingerprints"][source_dir]
+            assert set(fingerprints) == {"a.tsv", "sub/b.tsv"}
+            assert fingerprints["a.tsv"]["size"] == 5
+            assert (
+                fingerprints["a.tsv"]["mtime_ns"] == os_stat(join(source_dir, "a.tsv")).st_mtime_ns
+            )
+            assert fingerprints["a.tsv"]["hash"] is not None
+
+    def test_touched_file_keeps_cache_valid(self):
+        """Test a new mtime with unchanged content doesn't invalidate the cache"""
+        with TemporaryDirectory() as temp_dir:
+            source_dir = self._make_source(temp_dir)
+            manager = CacheManager(join(temp_dir, "cache"))
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+
+            self._bump_mtime(join(source_dir, "a.tsv"))
+            manager.refresh_sources()
+            cached = manager.get_cached_renewal_data(source_dir)
+
+            assert cached is not None
+            assert cached[0].title == "Renewal"
+            # The new mtime is recorded so the next run doesn't hash the file again
+            metadata = manager._load_metadata(join(manager.renewal_cache_dir, "all"))
+            recorded = metadata["source_fingerprints"][source_dir]["a.tsv"]
+            assert recorded["mtime_ns"] == os_stat(join(source_dir, "a.tsv")).st_mtime_ns
+
+    def test_changed_added_and_removed_files_invalidate_cache(self):
+        """Test real content changes and file set changes invalidate the cache"""
+        with TemporaryDirectory() as temp_dir:
+            source_dir = self._make_source(temp_dir)
+            manager = CacheManager(join(temp_dir, "cache"))
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+            cache_subdir = join(manager.renewal_cache_dir, "all")
+
+            # Same size, different content
+            with open(join(source_dir, "a.tsv"), "w") as f:
+                f.write("alphA")
+            self._bump_mtime(join(source_dir, "a.tsv"))
+            manager.refresh_sources()
+            assert manager._is_cache_valid(cache_subdir, [source_dir]) is False
+
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+            with open(join(source_dir, "sub", "c.tsv"), "w") as f:
+                f.write("gamma")
+            manager.refresh_sources()
+            assert manager._is_cache_valid(cache_subdir, [source_dir]) is False
+
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+            remove(join(source_dir, "sub", "b.tsv"))
+            manager.refresh_sources()
+            assert manager._is_cache_valid(cache_subdir, [source_dir]) is False
+
+    def test_one_scan_per_source_per_run(self):
+        """Test several cache checks against the same sources share one scan each"""
+        with TemporaryDirectory() as temp_dir:
+            source_dir = self._make_source(temp_dir)
+            other_dir = self._make_source(join(temp_dir, "other"))
+            manager = CacheManager(join(temp_dir, "cache"))
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+            manager.cache_generic_detector(source_dir, other_dir, {"threshold": 1}, {"d": 1})
+
+            manager.refresh_sources()
+            with patch(
+                "marc_pd_tool.infrastructure.cache._manager.walk",
+                side_effect=AssertionError("directory walk in fingerprint mode"),
+            ):
+                assert manager.get_cached_renewal_data(source_dir) is not None
+                assert manager.get_cached_renewal_data(source_dir, 1950, 1960) is None
+                assert (
+                    manager.get_cached_generic_detector(source_dir, other_dir, {"threshold": 1})
+                    is not None
+                )
+
+            assert manager.fingerprinter.scan_count == 4  # two before refresh, two after
+
+    def test_touch_without_hashes_invalidates_cache(self):
+        """Test any mtime change counts as a change when hashing is disabled"""
+        with TemporaryDirectory() as temp_dir:
+            source_dir = self._make_source(temp_dir)
+            manager = CacheManager(join(temp_dir, "cache"), hash_contents=False)
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+
+            manager.refresh_sources()
+            assert manager.get_cached_renewal_data(source_dir) is not None
+
+            self._bump_mtime(join(source_dir, "a.tsv"))
+            manager.refresh_sources()
+            assert manager.get_cached_renewal_data(source_dir) is None
+
+    def test_mtime_mode_keeps_directory_walk(self):
+        """Test mtime mode stores no fingerprints and invalidates on a touch"""
+        with TemporaryDirectory() as temp_dir:
+            source_dir = self._make_source(temp_dir)
+            manager = CacheManager(join(temp_dir, "cache"), validation="mtime")
+            manager.cache_renewal_data(source_dir, [Publication(title="Renewal")])
+
+            metadata = manager._load_metadata(join(manager.renewal_cache_dir, "all"))
+            assert metadata["source_fingerprints"] == {}
+            assert manager.get_cached_renewal_data(source_dir) is not None
+
+            self._bump_mtime(join(source_dir, "a.tsv"))
+            assert manager.get_cached_renewal_data(source_dir) is None
+
+
+class TestSupersetIndexDerivation:
+    """Test deriving year-range indexes from a cached wider range"""
+
+    def _setup(self, temp_dir: str) -> tuple[CacheManager, str, str]:
+        copyright_dir = join(temp_dir, "reg")
+        renewal_dir = join(temp_dir, "ren")
+        for directory in (copyright_dir, renewal_dir):
+            makedirs(directory)
+            with open(join(directory, "data.txt"), "w") as f:
+                f.write("data")
+        return CacheManager(join(temp_dir, "cache")), copyright_dir, renewal_dir
+
+    def _index(self, years: list[int]) -> DataIndexer:
+        return build_wordbased_index(
+            [Publication(title=f"Book of {year}", source_id=str(year), year=year) for year in years]
+        )
+
+    def test_subset_range_derived_from_all_years(self):
+        """Test a year window is derived from an all-years index and cached"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            manager.cache_indexes(
+                copyright_dir,
+                renewal_dir,
+                "hash",
+                self._index([1925, 1935, 1945]),
+                self._index([1930, 1950]),
+            )
+
+            result = manager.get_cached_indexes(copyright_dir, renewal_dir, "hash", 1930, 1940)
+
+            assert result is not None
+            registration, renewal = result
+            assert [pub.source_id for pub in registration.publications] == ["1935"]
+            assert [pub.source_id for pub in renewal.publications] == ["1930"]
+            # The derived range is cached for the next run
+            assert exists(join(manager.indexes_cache_dir, "1930_1940", "registration.pkl"))
+
+    def test_narrowest_superset_is_used(self):
+        """Test the smallest cached range covering the request is preferred"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "hash", self._index([1]), self._index([1])
+            )
+            manager.cache_indexes(
+                copyright_dir,
+                renewal_dir,
+                "hash",
+                self._index([1925, 1935]),
+                self._index([1935]),
+                1920,
+                1950,
+            )
+
+            subdir, min_year, max_year = manager._find_superset_index_cache(
+                copyright_dir, renewal_dir, "hash", 1930, 1940
+            )
+
+            assert subdir == join(manager.indexes_cache_dir, "1920_1950")
+            assert (min_year, max_year) == (1920, 1950)
+
+    def test_no_derivation_across_config_or_wider_ranges(self):
+        """Test indexes built with another config or a narrower range are not used"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "other", self._index([1935]), self._index([1935])
+            )
+            manager.cache_indexes(
+                copyright_dir,
+                renewal_dir,
+                "hash",
+                self._index([1935]),
+                self._index([1935]),
+                1932,
+                1938,
+            )
+
+            assert (
+                manager.get_cached_indexes(copyright_dir, renewal_dir, "hash", 1930, 1940) is None
+            )
+            assert manager.get_cached_indexes(copyright_dir, renewal_dir, "hash") is None
+
+
+class TestDerivedIndexMatchesBuild:
+    """Test derived year-range indexes equal indexes built from the source files"""
+
+    @staticmethod
+    def _write_sources(temp_dir: str, misfiled: bool) -> tuple[str, str]:
+        """Copyright files in year directories and renewal files named by year"""
+        copyright_dir = join(temp_dir, "reg")
+        renewal_dir = join(temp_dir, "ren")
+        entries = {
+            "1935": ['<title>Poems of the sea</title><regDate date="1935-01-01"/>'],
+            "1950": ['<title>River songs</title><regDate date="1950-01-01"/>'],
+        }
+        if misfiled:
+            entries["1950"] += [
+                # In-range publication date, filed under its registration year
+                "<title>Hills at dusk</title><publisher><pubDate date='1936'/></publisher>"
+                '<regDate date="1950-01-01"/>',
+                "<title>Plains</title>",
+            ]
+        for year, bodies in entries.items():
+            makedirs(join(copyright_dir, year))
+            with open(join(copyright_dir, year, "entries.xml"), "w") as f:
+                f.write("<copyrightEntries>")
+                for i, body in enumerate(bodies):
+                    f.write(f'<copyrightEntry id="{year}-{i}">{body}</copyrightEntry>')
+                f.write("</copyrightEntries>")
+        makedirs(renewal_dir)
+        for year, title in [("1935", "Poems of the sea"), ("1950", "River songs")]:
+            with open(join(renewal_dir, f"{year}.tsv"), "w") as f:
+                f.write("title\tauthor\toreg\todat\tentry_id\trdat\tclaimants\tfull_text\n")
+                f.write(f"{title}\tSmith\tA{year}\t{year}-01-01\tR{year}\t1963-01-01\tSmith\t\n")
+        return copyright_dir, renewal_dir
+
+    @staticmethod
+    def _build(
+        manager: CacheManager,
+        copyright_dir: str,
+        renewal_dir: str,
+        min_year: int | None,
+        max_year: int | None,
+    ) -> tuple[DataIndexer, DataIndexer]:
+        """Indexes built from the source files loaded for a year range"""
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence import CopyrightDataLoader
+        from marc_pd_tool.infrastructure.persistence import RenewalDataLoader
+
+        copyright_loader = CopyrightDataLoader(copyright_dir, 1, cache_dir=manager.cache_dir)
+        renewal_loader = RenewalDataLoader(renewal_dir, 1, cache_dir=manager.cache_dir)
+        return (
+            build_wordbased_index(copyright_loader.load_all_copyright_data(min_year, max_year)),
+            build_wordbased_index(renewal_loader.load_all_renewal_data(min_year, max_year)),
+        )
+
+    @staticmethod
+    def _contents(index: DataIndexer) -> tuple[list[tuple[str | None, int | None]], dict]:
+        """Publications and title postings of an index, by source id"""
+        source_ids = [pub.source_id for pub in index.publications]
+        postings = {
+            key: sorted(source_ids[pub_id] or "" for pub_id in entry.ids)
+            for key, entry in index.title_index.items()
+        }
+        return sorted((pub.source_id, pub.year) for pub in index.publications), postings
+
+    def test_derived_index_equals_built_index(self):
+        """Test an index derived from all years equals one built for the range"""
+        with TemporaryDirectory() as temp_dir:
+            copyright_dir, renewal_dir = self._write_sources(temp_dir, misfiled=False)
+            manager = CacheManager(join(temp_dir, "cache"))
+            manager.cache_indexes(
+                copyright_dir,
+                renewal_dir,
+                "hash",
+                *self._build(manager, copyright_dir, renewal_dir, None, None),
+            )
+
+            derived = manager.get_cached_indexes(copyright_dir, renewal_dir, "hash", 1930, 1940)
+            built = self._build(manager, copyright_dir, renewal_dir, 1930, 1940)
+
+            assert derived is not None
+            assert [self._contents(index) for index in derived] == [
+                self._contents(index) for index in built
+            ]
+
+    def test_misfiled_and_undated_entries_prevent_derivation(self):
+        """Test a range whose build skips files holding its entries is not derived"""
+        with TemporaryDirectory() as temp_dir:
+            copyright_dir, renewal_dir = self._write_sources(temp_dir, misfiled=True)
+            manager = CacheManager(join(temp_dir, "cache"))
+            all_years = self._build(manager, copyright_dir, renewal_dir, None, None)
+            manager.cache_indexes(copyright_dir, renewal_dir, "hash", *all_years)
+
+            built = self._build(manager, copyright_dir, renewal_dir, 1930, 1940)
+            subset = all_years[0].subset_by_year(1930, 1940)
+
+            # The build skips 1950/entries.xml, so its 1936 and undated entries are missing
+            assert self._contents(built[0]) != self._contents(subset)
+            assert [pub.source_id for pub in built[0].publications] == ["1935-0"]
+            assert (
+                manager.get_cached_indexes(copyright_dir, renewal_dir, "hash", 1930, 1940) is None
+            )
+
+
+class TestCacheBudgetAndCompression:
+    """Test compressed cache files, access tracking and LRU eviction"""
+
+    def test_compressed_entries_round_trip(self):
+        """Test gzip and lzma files are detected on load whatever the current setting"""
+        with TemporaryDirectory() as temp_dir:
+            data = [Publication(title=f"Book {i}", source_id=str(i)) for i in range(50)]
+            for method, magic in [("gzip", b"\x1f\x8b"), ("lzma", b"\xfd7zXZ")]:
+                writer = CacheManager(temp_dir, compression=method)
+                assert writer.cache_renewal_data("/renewal", data, 1900 + len(method))
+
+                cache_subdir = join(writer.renewal_cache_dir, f"{1900 + len(method)}_present")
+                pickle_file = join(cache_subdir, f"publications_{1900 + len(method)}_present.pkl")
+                with open(pickle_file, "rb") as f:
+                    assert f.read(len(magic)) == magic
+
+                reader = CacheManager(temp_dir)
+                loaded = reader._load_cache_data(cache_subdir, pickle_file.rsplit("/", 1)[1])
+                assert [pub.source_id for pub in loaded] == [pub.source_id for pub in data]
+
+    def test_hits_are_recorded(self):
+        """Test get_cache_info reports entry sizes and hit history"""
+        with TemporaryDirectory() as temp_dir:
+            manager = CacheManager(temp_dir)
+            manager.cache_renewal_data("/renewal", [Publication(title="Renewal")])
+            cache_subdir = join(manager.renewal_cache_dir, "all")
+
+            manager._load_cache_data(cache_subdir, "publications_all.pkl")
+            manager._load_cache_data(cache_subdir, "publications_all.pkl")
+
+            entry = manager.get_cache_info()["entries"]["renewal_data/all"]
+            assert entry["hits"] == 2
+            assert len(entry["recent_hits"]) == 2
+            assert entry["size_bytes"] > 0
+            assert entry["last_access"] >= entry["written"]
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test writes beyond the budget evict the least recently used entries"""
+        with TemporaryDirectory() as temp_dir:
+            manager = CacheManager(temp_dir)
+            data = [Publication(title="x" * 2000, source_id=str(i)) for i in range(5)]
+            for year in (1930, 1940, 1950):
+                manager.cache_copyright_data("/copyright", data, year, year)
+            sizes = manager.entry_sizes()
+            entry_size = sizes["copyright_data/1930_1930"]
+
+            # Touch the oldest entry so 1940 becomes the least recently used
+            manager._load_cache_data(
+                join(manager.copyright_cache_dir, "1930_1930"), "publications_1930_1930.pkl"
+            )
+            manager.max_bytes = int(entry_size * 3.5)
+            manager.cache_copyright_data("/copyright", data, 1960, 1960)
+
+            remaining = set(manager.entry_sizes())
+            assert remaining == {
+                "copyright_data/1930_1930",
+                "copyright_data/1950_1950",
+                "copyright_data/1960_1960",
+            }
+            assert "copyright_data/1940_1940" not in manager.get_cache_info()["entries"]
+
+    def test_entry_just_written_is_kept(self):
+        """Test an entry larger than the budget survives its own write"""
+        with TemporaryDirectory() as temp_dir:
+            manager = CacheManager(temp_dir, max_bytes=1)
+            manager.cache_renewal_data("/renewal", [Publication(title="Renewal")], 1930, 1940)
+
+            assert set(manager.entry_sizes()) == {"renewal_data/1930_1940"}
+
+    def test_remove_entry(self):
+        """Test removing a single entry leaves the others alone"""
+        with TemporaryDirectory() as temp_dir:
+            manager = CacheManager(temp_dir)
+            manager.cache_renewal_data("/renewal", [Publication(title="Renewal")])
+            manager.cache_generic_detector("/copyright", "/renewal", {"threshold": 1}, {"d": 1})
+
+            manager.remove_entry("generic_detector")
+
+            assert set(manager.entry_sizes()) == {"renewal_data/all"}
+            assert exists(manager.generic_detector_cache_dir)
+
+
+class TestAtomicWrites:
+    """Test cache files are replaced atomically"""
+
+    def test_failed_write_keeps_previous_file(self):
+        """Test a write that fails midway leaves the old cache file and no temp files"""
+        with TemporaryDirectory() as temp_dir:
+            manager = CacheManager(temp_dir)
+            manager.cache_renewal_data("/renewal", [Publication(title="Old")])
+            cache_subdir = join(manager.renewal_cache_dir, "all")
+
+            with patch(
+                "marc_pd_tool.infrastructure.cache._manager.pickle_dump",
+                side_effect=OSError("disk full"),
+            ):
+                assert manager.cache_renewal_data("/renewal", [Publication(title="New")]) is False
+
+            loaded = manager._load_cache_data(cache_subdir, "publications_all.pkl")
+            assert [pub.title for pub in loaded] == ["Old"]
+            assert not [name for name in listdir(cache_subdir) if name.endswith(".tmp")]
+
+
+class TestSectionedIndexCache:
+    """Test indexes are cached as sections loaded on first use"""
+
+    def _setup(self, temp_dir: str, **kwargs) -> tuple[CacheManager, str, str]:
+        copyright_dir = join(temp_dir, "reg")
+        renewal_dir = join(temp_dir, "ren")
+        for directory in (copyright_dir, renewal_dir):
+            makedirs(directory)
+            with open(join(directory, "data.txt"), "w") as f:
+                f.write("data")
+        return CacheManager(join(temp_dir, "cache"), **kwargs), copyright_dir, renewal_dir
+
+    def _index(self, titles: list[str]) -> DataIndexer:
+        return build_wordbased_index(
+            [
+                Publication(title=title, source_id=str(i), year=1950)
+                for i, title in enumerate(titles)
+            ]
+        )
+
+    def test_cached_index_loads_sections_on_demand(self):
+        """Test a cache hit reads no section until it is used"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            registration = self._index(["The Lost Road", "Ohio Waters"])
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "hash", registration, self._index(["Renewed"])
+            )
+
+            cached_registration, cached_renewal = manager.get_cached_indexes(
+                copyright_dir, renewal_dir, "hash"
+            )
+
+            assert cached_registration.loaded_sections == []
+            assert cached_renewal.loaded_sections == []
+            assert len(cached_registration.publications) == 2
+            assert cached_registration.loaded_sections == ["publications"]
+            assert cached_renewal.loaded_sections == []
+
+            query = Publication(title="The Lost Road", year=1950)
+            assert cached_registration.find_candidates(query) == registration.find_candidates(query)
+            assert cached_registration.get_stats() == registration.get_stats()
+
+    def test_sections_survive_rewrite_of_entry(self):
+        """Test a loaded header keeps reading its own sections after the entry is rewritten"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "hash", self._index(["Old"]), self._index(["Old"])
+            )
+            old_registration, _ = manager.get_cached_indexes(copyright_dir, renewal_dir, "hash")
+
+            manager.cache_indexes(
+                copyright_dir,
+                renewal_dir,
+                "hash",
+                self._index(["New", "Newer"]),
+                self._index(["New"]),
+            )
+
+            # Superseded section files are removed; one set per index remains
+            cache_subdir = join(manager.indexes_cache_dir, "all")
+            section_files = [
+                name
+                for name in listdir(cache_subdir)
+                if name.startswith("registration.") and name != "registration.pkl"
+            ]
+            assert len(section_files) == len(INDEX_SECTIONS)
+            assert [pub.title for pub in old_registration.publications] == ["Old"]
+            new_registration, _ = manager.get_cached_indexes(copyright_dir, renewal_dir, "hash")
+            assert [pub.title for pub in new_registration.publications] == ["New", "Newer"]
+
+    def test_missing_section_is_a_cache_miss(self):
+        """Test an entry whose section files are gone isn't returned"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "hash", self._index(["A"]), self._index(["B"])
+            )
+            cache_subdir = join(manager.indexes_cache_dir, "all")
+            remove(
+                join(
+                    cache_subdir,
+                    next(name for name in listdir(cache_subdir) if ".title_index." in name),
+                )
+            )
+
+            assert manager.get_cached_indexes(copyright_dir, renewal_dir, "hash") is None
+
+    def test_compressed_sections(self):
+        """Test sections are written and lazily read with compression"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir, compression="gzip")
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "hash", self._index(["Gzip"]), self._index(["Lzma"])
+            )
+
+            registration, renewal = manager.get_cached_indexes(copyright_dir, renewal_dir, "hash")
+
+            assert [pub.title for pub in registration.publications] == ["Gzip"]
+            assert set(renewal.title_index) == set(self._index(["Lzma"]).title_index)
+
+    def test_index_without_title_counts_is_a_cache_miss(self):
+        """Test an index cached before title counts were kept is rebuilt"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            manager.cache_indexes(
+                copyright_dir, renewal_dir, "hash", self._index(["A"]), self._index(["B"])
+            )
+            cache_subdir = join(manager.indexes_cache_dir, "all")
+            header = manager._load_cache_data(cache_subdir, "registration.pkl")
+            sections = tuple(section for section in header.sections if section != "title_counts")
+            manager._write_cache_file(
+                join(cache_subdir, "registration.pkl"), header._replace(sections=sections)
+            )
+
+            assert manager.get_cached_indexes(copyright_dir, renewal_dir, "hash") is None
+
+    def test_generic_detector_cache_is_keyed_by_year_range(self):
+        """Test a detector counted over one year range isn't reused for another"""
+        with TemporaryDirectory() as temp_dir:
+            manager, copyright_dir, renewal_dir = self._setup(temp_dir)
+            detector_config = {"enable_generic_detection": True}
+            manager.cache_generic_detector(
+                copyright_dir, renewal_dir, detector_config, {"type": "detector"}, 1930, 1940
+            )
+
+            assert manager.get_cached_generic_detector(
+                copyright_dir, renewal_dir, detector_config, 1930, 1940
+            ) == {"type": "detector"}
+            assert (
+                manager.get_cached_generic_detector(copyright_dir, renewal_dir, detector_config)
+                is None
+            )
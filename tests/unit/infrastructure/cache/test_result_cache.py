@@ -0,0 +1,110 @@
+# tests/unit/infrastructure/cache/test_result_cache.py
+
+"""Tests for the cross-run match result cache"""
+
+# Standard library imports
+from pickle import dumps
+from pickle import loads
+from threading import Thread
+
+# Local imports
+from marc_pd_tool.core.domain.match_result import MatchResult
+from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.cache import MatchResultCache
+from marc_pd_tool.infrastructure.cache import apply_match_outcome
+from marc_pd_tool.infrastructure.cache import match_outcome
+from marc_pd_tool.infrastructure.cache import match_record_key
+from marc_pd_tool.infrastructure.cache import match_run_key
+
+
+def matched_publication() -> Publication:
+    """A MARC publication with a registration match and a generic title"""
+    pub = Publication(title="Poems", author="Frost, Robert", pub_date="1950", source_id="M1")
+    pub.registration_match = MatchResult(
+        matched_title="Poems",
+        matched_author="Frost, Robert",
+        similarity_score=92.0,
+        title_score=100.0,
+        author_score=85.0,
+        year_difference=0,
+        source_id="R1",
+        source_type="registration",
+    )
+    pub.generic_title_detected = True
+    pub.registration_generic_title = True
+    pub.generic_detection_reason = "predefined_generic_title"
+    return pub
+
+
+class TestMatchResultCache:
+    """Test storing and reusing match results across runs"""
+
+    def test_store_and_lookup(self, tmp_path):
+        """Test results come back for their record and run key only"""
+        cache = MatchResultCache.open(str(tmp_path), match_run_key("index", 40))
+        pub = matched_publication()
+        key = match_record_key(pub)
+
+        assert cache.lookup([key]) == {}
+        cache.store({key: match_outcome(pub)})
+
+        reused = Publication(title="Poems", author="Frost, Robert", pub_date="1950")
+        apply_match_outcome(reused, cache.lookup([key])[key])
+        assert reused.registration_match.source_id == "R1"
+        assert reused.renewal_match is None
+        assert reused.registration_generic_title is True
+        assert reused.generic_detection_reason == "predefined_generic_title"
+
+        other_run = MatchResultCache.open(str(tmp_path), match_run_key("index", 45))
+        assert other_run.lookup([key]) == {}
+
+    def test_record_key_covers_matching_fields(self):
+        """Test only fields matching reads change a record's key"""
+        pub = Publication(title="Poems", author="Frost", publisher="Holt", pub_date="1950")
+        key = match_record_key(pub)
+
+        same = Publication(
+            title="Poems",
+            author="Frost",
+            publisher="Holt",
+            pub_date="1950",
+            place="New York",
+            source_id="M2",
+        )
+        assert match_record_key(same) == key
+        for changed in (
+            Publication(title="Poems", author="Frost", publisher="Holt", pub_date="1951"),
+            Publication(title="Poems", author="Frost", publisher="Knopf", pub_date="1950"),
+            Publication(title="Poems", author="Frost", publisher="Holt", pub_date="1950", lccn="1"),
+        ):
+            assert match_record_key(changed) != key
+
+    def test_pickled_cache_opens_own_connection(self, tmp_path):
+        """Test a cache sent to a worker reads what another thread stored"""
+        cache = MatchResultCache.open(str(tmp_path), match_run_key("index"))
+        pub = matched_publication()
+        key = match_record_key(pub)
+        cache.store({key: match_outcome(pub)})
+
+        found = []
+        worker_cache = loads(dumps(cache))
+        thread = Thread(target=lambda: found.append(worker_cache.lookup([key])))
+        thread.start()
+        thread.join()
+
+        assert key in found[0]
+
+    def test_lookup_of_many_keys(self, tmp_path):
+        """Test lookups of more keys than one query takes"""
+        cache = MatchResultCache.open(str(tmp_path), match_run_key("index"))
+        pubs = [Publication(title=f"Book {i}", pub_date="1950") for i in range(1200)]
+        cache.store({match_record_key(pub): match_outcome(pub) for pub in pubs[::2]})
+
+        assert len(cache.lookup([match_record_key(pub) for pub in pubs])) == 600
+
+    def test_unusable_cache_dir(self, tmp_path):
+        """Test the cache is skipped when its directory can't be created"""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+
+        assert MatchResultCache.open(str(blocker / "cache"), match_run_key("index")) is None
@@ -0,0 +1,88 @@
+# tests/unit/infrastructure/persistence/test_columnar_shard.py
+
+"""Tests for columnar publication shards"""
+
+# Standard library imports
+from pathlib import Path
+
+# Third party imports
+from pytest import raises
+
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence._columnar_shard import ColumnarShard
+from marc_pd_tool.infrastructure.persistence._columnar_shard import write_shard
+from marc_pd_tool.infrastructure.persistence._parallel_renewal_loader import (
+    ParallelRenewalLoader,
+)
+
+
+class TestColumnarShard:
+    """Test writing and mapping shards"""
+
+    def test_round_trip_preserves_publications(self, tmp_path):
+        """Test that publications read back equal the ones written"""
+        publications = [
+            Publication(
+                title="The Great Novel",
+                author="Smith, John",
+                pub_date="1950-01-01",
+                publisher="Acme",
+                place="New York",
+                lccn="50012345",
+                source="Copyright",
+                source_id="A1",
+            ),
+            Publication(title="Ünïcödé title", source="Renewal", full_text="Text \ud800"),
+            Publication(title="No date", author="Smith, John", source="Copyright"),
+        ]
+        shard_path = str(tmp_path / "test.shard")
+
+        assert write_shard(shard_path, publications) == 3
+
+        with ColumnarShard(shard_path) as shard:
+            assert len(shard) == 3
+            assert list(shard.years) == [1950, -1, -1]
+            # Repeated strings are stored once
+            assert shard.strings().count("Smith, John") == 1
+            loaded = shard.to_publications()
+
+        for original, copy in zip(publications, loaded):
+            for slot in Publication.__slots__:
+                assert getattr(copy, slot, None) == getattr(original, slot, None), slot
+
+    def test_empty_shard(self, tmp_path):
+        """Test a shard without rows"""
+        shard_path = str(tmp_path / "empty.shard")
+        write_shard(shard_path, [])
+
+        with ColumnarShard(shard_path) as shard:
+            assert shard.to_publications() == []
+
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a non-shard file is refused"""
+        other = tmp_path / "other.shard"
+        other.write_bytes(b"not a shard at all")
+
+        with raises(ValueError):
+            ColumnarShard(str(other))
+
+
+class TestShardedParallelLoading:
+    """Test that parallel loaders hand results back through shards"""
+
+    def test_results_keep_file_order_and_shards_are_removed(self, tmp_path):
+        """Test file-ordered results and cleanup of the shard directory"""
+        data_dir = tmp_path / "renewals"
+        data_dir.mkdir()
+        for year in range(1950, 1956):
+            (data_dir / f"{year}.tsv").write_text(
+                f"entry_id\ttitle\todat\nR{year}\tBook {year}\t{year}-01-01\n"
+            )
+        shard_dir = tmp_path / "shards"
+
+        loader = ParallelRenewalLoader(str(data_dir), num_workers=3, shard_dir=str(shard_dir))
+        publications = loader.load_all_parallel()
+
+        assert [pub.year for pub in publications] == list(range(1950, 1956))
+        assert list(Path(shard_dir).iterdir()) == []
@@ -524,3 +524,33 @@ class TestCopyrightDataLoaderEdgeCases:
             pub = publications[0]
             assert "<special>" in pub.original_title
             assert "&" in pub.original_title
+
+
+class TestCompressedCopyrightInput:
+    """Test loading gzip/bzip2/xz compressed copyright XML files"""
+
+    def test_compressed_xml_files_load_like_plain(self, sample_copyright_xml):
+        """Test that compressed XML files are found and parsed"""
+        # Standard library imports
+        from bz2 import compress as bz2_compress
+        from gzip import compress as gzip_compress
+
+        with TemporaryDirectory() as temp_dir:
+            year_dir = Path(temp_dir) / "1960"
+            year_dir.mkdir()
+            (year_dir / "a.xml.gz").write_bytes(gzip_compress(sample_copyright_xml.encode("utf-8")))
+            (year_dir / "b.xml.bz2").write_bytes(bz2_compress(sample_copyright_xml.encode("utf-8")))
+
+            loader = CopyrightDataLoader(temp_dir)
+            publications = loader.load_all_copyright_data()
+
+            assert len(publications) == 4
+            assert loader.year_range == (1925, 1960)
+
+            # Sequential fallback reads the same files
+            sequential = [
+                pub
+                for xml_file in sorted(year_dir.iterdir())
+                for pub in loader._extract_from_file(xml_file)
+            ]
+            assert len(sequential) == 4
@@ -0,0 +1,202 @@
+# tests/unit/infrastructure/persistence/test_iso2709_reader.py
+
+"""Tests for binary MARC21 (ISO 2709) input"""
+
+# Standard library imports
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import Mock
+from xml.etree.ElementTree import fromstring
+
+# Local imports
+from marc_pd_tool.core.domain.enums import CountryClassification
+from marc_pd_tool.infrastructure.persistence import MarcLoader
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import is_iso2709_file
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import iter_iso2709_records
+from marc_pd_tool.infrastructure.persistence._iso2709_reader import parse_iso2709_record
+
+CONTROL_008 = "750101s1955    nyu           000 0 eng  "
+
+
+def build_record(
+    control: list[tuple[str, str]],
+    data: list[tuple[str, list[tuple[str, str | bytes]]]],
+    utf8: bool = True,
+) -> bytes:
+    """Build an ISO 2709 record from control fields and (tag, subfields) data fields
+
+    Subfield text given as bytes is stored as is, e.g. already encoded as MARC-8.
+    """
+    fields = [(tag, value.encode("utf-8") + b"\x1e") for tag, value in control]
+    for tag, subfields in data:
+        body = b"  " + b"".join(
+            b"\x1f" + code.encode() + (text if isinstance(text, bytes) else text.encode())
+            for code, text in subfields
+        )
+        fields.append((tag, body + b"\x1e"))
+
+    directory = b""
+    field_data = b""
+    for tag, value in fields:
+        directory += f"{tag}{len(value):04d}{len(field_data):05d}".encode()
+        field_data += value
+    directory += b"\x1e"
+
+    base_address = 24 + len(directory)
+    record_length = base_address + len(field_data) + 1
+    coding = "a" if utf8 else " "
+    leader = f"{record_length:05d}nam {coding}22{base_address:05d}   4500".encode()
+    return leader + directory + field_data + b"\x1d"
+
+
+SAMPLE_CONTROL = [("001", "rec-001"), ("008", CONTROL_008)]
+SAMPLE_DATA = [
+    ("010", [("a", "  55012345 ")]),
+    ("100", [("a", "Smith, John, 1900-")]),
+    ("245", [("a", "The great novel :"), ("b", "a story [microform]"), ("c", "by John Smith")]),
+    ("250", [("a", "2nd ed.")]),
+    ("260", [("a", "New York :"), ("b", "Acme Press,"), ("c", "1955.")]),
+]
+
+
+class TestIso2709Reader:
+    """Test reading binary MARC records"""
+
+    def test_binary_record_matches_marcxml_extraction(self, tmp_path):
+        """Test that a binary record yields the same Publication as its MARCXML form"""
+        marc_file = tmp_path / "records.mrc"
+        marc_file.write_bytes(build_record(SAMPLE_CONTROL, SAMPLE_DATA))
+
+        loader = MarcLoader(str(marc_file), batch_size=10, num_workers=1)
+        batches = list(loader.iter_batches())
+        assert len(batches) == 1
+        binary_pub = batches[0][0]
+
+        xml_fields = "".join(
+            f'<controlfield tag="{tag}">{value}</controlfield>' for tag, value in SAMPLE_CONTROL
+        ) + "".join(
+            f'<datafield tag="{tag}" ind1=" " ind2=" ">'
+            + "".join(f'<subfield code="{code}">{text}</subfield>' for code, text in subfields)
+            + "</datafield>"
+            for tag, subfields in SAMPLE_DATA
+        )
+        xml_pub = MarcLoader("dummy.xml")._extract_from_record(
+            fromstring(f"<record>{xml_fields}</record>")
+        )
+
+        assert xml_pub is not None
+        for slot in binary_pub.__slots__:
+            assert getattr(binary_pub, slot, None) == getattr(xml_pub, slot, None), slot
+
+        assert binary_pub.original_title == "The great novel : a story"
+        assert binary_pub.main_author == "Smith, John"
+        assert binary_pub.lccn == "55012345"
+        assert binary_pub.year == 1955
+        assert binary_pub.country_classification == CountryClassification.US
+
+    def test_marc8_record_matches_marcxml_extraction(self, tmp_path):
+        """Test that MARC-8 diacritics and special letters decode like their MARCXML form"""
+        marc8_data = [
+            ("100", [("a", b"Bront\xe8e, Charlotte,")]),
+            ("245", [("a", b"Les mis\xe2erables de l'\xa5sop, \xf0ca va")]),
+            ("260", [("a", b"Krak\xe2ow :"), ("b", b"\xb1\xe2od\xe2z,"), ("c", b"1955.")]),
+        ]
+        unicode_data = [
+            ("100", [("a", "Brontë, Charlotte,")]),
+            ("245", [("a", "Les misérables de l'Æsop, ça va")]),
+            ("260", [("a", "Kraków :"), ("b", "łódź,"), ("c", "1955.")]),
+        ]
+        marc_file = tmp_path / "records.mrc"
+        marc_file.write_bytes(build_record(SAMPLE_CONTROL, marc8_data, utf8=False))
+
+        loader = MarcLoader(str(marc_file), batch_size=10, num_workers=1)
+        binary_pub = [pub for batch in loader.iter_batches() for pub in batch][0]
+
+        xml_fields = "".join(
+            f'<controlfield tag="{tag}">{value}</controlfield>' for tag, value in SAMPLE_CONTROL
+        ) + "".join(
+            f'<datafield tag="{tag}" ind1=" " ind2=" ">'
+            + "".join(f'<subfield code="{code}">{text}</subfield>' for code, text in subfields)
+            + "</datafield>"
+            for tag, subfields in unicode_data
+        )
+        xml_pub = MarcLoader("dummy.xml")._extract_from_record(
+            fromstring(f"<record>{xml_fields}</record>")
+        )
+
+        assert xml_pub is not None
+        for slot in binary_pub.__slots__:
+            assert getattr(binary_pub, slot, None) == getattr(xml_pub, slot, None), slot
+        assert binary_pub.original_title == "Les misérables de l'Æsop, ça va"
+        assert binary_pub.original_publisher == "łódź,"
+
+    def test_marc8_other_character_sets_are_dropped(self):
+        """Test text escaped into a non-Latin MARC-8 set isn't decoded as Latin letters"""
+        fields = parse_iso2709_record(
+            build_record(
+                [("001", "1")],
+                [("245", [("a", b"Title \x1b(NABC\x1b(B end \x80")])],
+                utf8=False,
+            ),
+            frozenset(["245"]),
+        )
+
+        assert fields is not None
+        assert fields[1][("245", "a")] == "Title  end "
+
+    def test_filtering_and_counts_apply_to_binary_input(self, tmp_path):
+        """Test that year filters and record counts work for binary files"""
+        records = b""
+        for i, year in enumerate([1950, 1960, 1970]):
+            control = [("001", f"{i}"), ("008", CONTROL_008.replace("1955", str(year)))]
+            data = [("245", [("a", f"Title {i}")]), ("260", [("c", f"{year}.")])]
+            records += build_record(control, data) + b"\n"
+
+        marc_file = tmp_path / "records.mrc"
+        marc_file.write_bytes(records)
+
+        loader = MarcLoader(str(marc_file), batch_size=10, min_year=1955, num_workers=1)
+        pubs = [pub for batch in loader.iter_batches() for pub in batch]
+
+        assert [pub.source_id for pub in pubs] == ["1", "2"]
+        assert loader.total_record_count == 3
+        assert loader.filtered_count == 1
+
+    def test_format_detection(self, tmp_path):
+        """Test selection by extension and by sniffing the leader"""
+        record = build_record(SAMPLE_CONTROL, SAMPLE_DATA)
+
+        unknown_binary = tmp_path / "export.dat"
+        unknown_binary.write_bytes(record)
+        unknown_xml = tmp_path / "export.txt"
+        unknown_xml.write_text('<?xml version="1.0"?><collection/>')
+
+        assert is_iso2709_file(Path(tmp_path / "records.mrc"))
+        assert is_iso2709_file(unknown_binary)
+        assert not is_iso2709_file(unknown_xml)
+
+        # Directories pick up binary files alongside MARCXML
+        (tmp_path / "records.mrc").write_bytes(record)
+        (tmp_path / "records.xml").write_text('<?xml version="1.0"?><collection/>')
+        files = MarcLoader(str(tmp_path))._get_marc_files()
+        assert sorted(f.name for f in files) == ["records.mrc", "records.xml"]
+
+    def test_reader_resynchronises_on_bad_length(self):
+        """Test that a corrupt record length doesn't lose the following records"""
+        good = build_record(SAMPLE_CONTROL, SAMPLE_DATA)
+        corrupt = b"99999" + good[5:]
+
+        records = list(iter_iso2709_records(BytesIO(corrupt + good + good)))
+
+        assert records == [corrupt, good, good]
+
+    def test_reader_resynchronises_without_seeking(self):
+        """Test that bad lengths are recovered from on a stream that can't seek"""
+        good = build_record(SAMPLE_CONTROL, SAMPLE_DATA)
+        short = b"00010" + good[5:]
+        stream = BytesIO(good + short + b"99999" + good[5:] + b"\n" + good)
+        stream.seek = Mock(side_effect=OSError("stream is not seekable"))
+
+        records = list(iter_iso2709_records(stream))
+
+        assert records == [good, short, b"99999" + good[5:], good]
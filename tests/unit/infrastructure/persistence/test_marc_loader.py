@@ -354,6 +354,15 @@ class TestStreamingMarcLoader:
                 assert len(batch) == 1
                 assert batch[0].title == "Test title three"
 
+    def test_extract_batches_to_disk_predicts_costs(self, temp_marcxml_file: str):
+        """Test extract_batches_to_disk records a predicted cost for every batch"""
+        loader = MarcLoader(temp_marcxml_file, batch_size=2)
+
+        with TemporaryDirectory() as temp_dir:
+            pickle_paths, _, _ = loader.extract_batches_to_disk(temp_dir, batch_cost=len)
+
+            assert loader.batch_costs == {pickle_paths[0]: 2, pickle_paths[1]: 1}
+
     def test_extract_batches_to_disk_with_filtering(self, temp_marcxml_file: str):
         """Test extract_batches_to_disk respects filtering options"""
         # Filter to only include records from 1976 and later
@@ -374,6 +383,52 @@ class TestStreamingMarcLoader:
                 assert batch[0].year == 1976
                 assert batch[1].year == 1977
 
+    def test_extract_batches_to_disk_single_parse(self, temp_marcxml_file: str):
+        """Test extract_batches_to_disk parses each file once and never re-reads batches"""
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence import _marc_loader
+
+        loader = MarcLoader(temp_marcxml_file, batch_size=2)
+
+        with TemporaryDirectory() as temp_dir:
+            with patch.object(
+                _marc_loader, "iterparse", wraps=_marc_loader.iterparse
+            ) as mock_iterparse:
+                pickle_paths, total_records, filtered_count = loader.extract_batches_to_disk(
+                    temp_dir
+                )
+
+            # No separate counting pass over the file
+            assert mock_iterparse.call_count == 1
+            assert len(pickle_paths) == 2
+            assert total_records == 3
+            assert loader.total_record_count == 3
+            assert loader.filtered_count == 0
+
+    def test_iter_batches_compressed_input(self, temp_marcxml_file: str, tmp_path):
+        """Test that gzip and xz compressed MARCXML stream the same batches"""
+        # Standard library imports
+        from gzip import compress as gzip_compress
+        from lzma import compress as xz_compress
+
+        content = Path(temp_marcxml_file).read_bytes()
+        (tmp_path / "a.xml.gz").write_bytes(gzip_compress(content))
+        (tmp_path / "b.marcxml.xz").write_bytes(xz_compress(content))
+
+        expected = [
+            [pub.original_title for pub in batch]
+            for batch in MarcLoader(temp_marcxml_file, batch_size=2).iter_batches()
+        ]
+
+        for name in ["a.xml.gz", "b.marcxml.xz"]:
+            loader = MarcLoader(str(tmp_path / name), batch_size=2)
+            batches = [[pub.original_title for pub in batch] for batch in loader.iter_batches()]
+            assert batches == expected
+            assert loader.total_record_count == 3
+
+        # Directory discovery includes compressed files
+        assert len(MarcLoader(str(tmp_path))._get_marc_files()) == 2
+
     def test_extract_batches_to_disk_auto_temp_dir(self, temp_marcxml_file: str):
         """Test extract_batches_to_disk creates temp directory when none provided"""
         loader = MarcLoader(temp_marcxml_file, batch_size=2)
@@ -495,6 +550,105 @@ class TestStreamingMarcLoader:
             assert len(batch) == 1
 
 
+# =============================================================================
+# PARALLEL BYTE-RANGE PARSING TESTS
+# =============================================================================
+
+
+class TestParallelByteRangeParsing:
+    """Test splitting a single large MARC file into record-aligned byte ranges"""
+
+    @staticmethod
+    def _write_collection(prefix: str, count: int) -> str:
+        """Write a MARCXML collection with the given element prefix ("" or "marc:")"""
+        ns_attr = (
+            'xmlns:marc="http://www.loc.gov/MARC21/slim"'
+            if prefix
+            else 'xmlns="http://www.loc.gov/MARC21/slim"'
+        )
+        records = []
+        for i in range(count):
+            year = 1950 + i % 30
+            country = "nyu" if i % 3 else "enk"
+            records.append(f"""  <{prefix}record>
+    <{prefix}controlfield tag="001">{i:05d}</{prefix}controlfield>
+    <{prefix}controlfield tag="008">750101s{year}    {country}           000 0 eng  </{prefix}controlfield>
+    <{prefix}datafield tag="245" ind1="1" ind2="0">
+      <{prefix}subfield code="a">Title number {i}</{prefix}subfield>
+    </{prefix}datafield>
+  </{prefix}record>""")
+        content = (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f"<{prefix}collection {ns_attr}>\n" + "\n".join(records) + f"\n</{prefix}collection>\n"
+        )
+        with NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
+            f.write(content)
+            return f.name
+
+    def test_ranges_start_at_record_boundaries(self):
+        """Test that every byte range begins with a record start tag"""
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence._parallel_marc_loader import (
+            find_record_byte_ranges,
+        )
+
+        marc_file = Path(self._write_collection("marc:", 40))
+        header, footer, ranges = find_record_byte_ranges(marc_file, chunk_bytes=1000)
+
+        assert header.rstrip().endswith(b">")
+        assert footer == b"</marc:collection>"
+        assert len(ranges) > 1
+
+        data = marc_file.read_bytes()
+        for start, end in ranges:
+            assert data[start:].startswith(b"<marc:record>")
+        # Ranges are contiguous and stop before the closing root tag
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert data[ranges[-1][1] :].startswith(footer)
+
+    def test_parallel_parse_matches_sequential(self):
+        """Test that parallel parsing yields the same batches and filter counts"""
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence import _marc_loader
+
+        for prefix in ["", "marc:"]:
+            marc_path = self._write_collection(prefix, 60)
+
+            sequential = MarcLoader(marc_path, batch_size=7, us_only=True, num_workers=1)
+            expected = [[pub.source_id for pub in batch] for batch in sequential.iter_batches()]
+
+            parallel = MarcLoader(marc_path, batch_size=7, us_only=True, num_workers=2)
+            with (
+                patch.object(_marc_loader, "PARALLEL_PARSE_MIN_BYTES", 0),
+                patch.object(_marc_loader, "PARALLEL_PARSE_MIN_CHUNK_BYTES", 1500),
+            ):
+                actual = [[pub.source_id for pub in batch] for batch in parallel.iter_batches()]
+
+            assert actual == expected
+            assert parallel.total_record_count == sequential.total_record_count == 60
+            assert parallel.filtered_count == sequential.filtered_count == 20
+
+    def test_unsplittable_file_falls_back_to_sequential(self):
+        """Test that a file whose root tag can't be found is parsed sequentially"""
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence import _marc_loader
+
+        with NamedTemporaryFile(mode="w", suffix=".xml", delete=False) as f:
+            f.write(
+                '<record xmlns="http://www.loc.gov/MARC21/slim">'
+                '<datafield tag="245"><subfield code="a">Lone record</subfield></datafield>'
+                "</record>"
+            )
+            marc_path = f.name
+
+        loader = MarcLoader(marc_path, batch_size=5, num_workers=2)
+        with patch.object(_marc_loader, "PARALLEL_PARSE_MIN_BYTES", 0):
+            batches = list(loader.iter_batches())
+
+        assert len(batches) == 1
+        assert batches[0][0].original_title == "Lone record"
+
+
 # =============================================================================
 # RECORD EXTRACTION TESTS
 # =============================================================================
@@ -675,44 +829,60 @@ class TestMarcLoaderRecordExtraction:
         assert pub is not None
         assert pub.language_code == "fre"
 
-    def test_extract_marc_field_with_namespace(self):
-        """Test _extract_marc_field with namespaced XML"""
-        loader = MarcLoader("/dummy")
+    def test_extract_from_record_field_precedence_single_walk(self):
+        """Test that 264 wins over an earlier 260 and the first repeated field is used"""
+        loader = MarcLoader("dummy.xml")
 
-        # Create record with namespace
-        record_xml = """<record xmlns="http://www.loc.gov/MARC21/slim">
-            <datafield tag="264">
-                <subfield code="c">1950</subfield>
+        record = fromstring("""
+        <record>
+            <controlfield tag="001">rec-1</controlfield>
+            <datafield tag="260" ind1=" " ind2=" ">
+                <subfield code="b">Old Publisher</subfield>
+                <subfield code="c">1950.</subfield>
             </datafield>
-        </record>"""
-
-        record = fromstring(record_xml)
-        ns = {"marc": "http://www.loc.gov/MARC21/slim"}
-
-        field = loader._extract_marc_field(record, ns, ["264"], "c")
-
-        assert field is not None
-        assert field.text == "1950"
+            <datafield tag="264" ind1=" " ind2="1">
+                <subfield code="b">New Publisher</subfield>
+            </datafield>
+            <datafield tag="245" ind1="1" ind2="0">
+                <subfield code="a">First title</subfield>
+                <subfield code="c">by First Author</subfield>
+            </datafield>
+            <datafield tag="245" ind1="1" ind2="0">
+                <subfield code="a">Second title</subfield>
+            </datafield>
+        </record>
+        """)
 
-    def test_extract_marc_field_fallback_tags(self):
-        """Test _extract_marc_field trying multiple tags"""
-        loader = MarcLoader("/dummy")
+        pub = loader._extract_from_record(record)
 
-        # Create record with only 260 field (fallback)
-        record_xml = """<record xmlns="http://www.loc.gov/MARC21/slim">
-            <datafield tag="260">
-                <subfield code="b">Old Publisher Format</subfield>
+        assert pub is not None
+        assert pub.original_title == "First title"
+        assert pub.original_author == "by First Author"
+        assert pub.original_publisher == "New Publisher"
+        # No 264$c, so the date falls back to 260$c
+        assert pub.pub_date == "1950."
+        assert pub.source_id == "rec-1"
+
+    def test_extract_from_record_namespace_switch(self):
+        """Test that one loader handles namespaced and plain records in turn"""
+        loader = MarcLoader("dummy.xml")
+        body = """
+            <controlfield tag="001">{id}</controlfield>
+            <datafield tag="245" ind1="1" ind2="0">
+                <subfield code="a">Title {id}</subfield>
             </datafield>
-        </record>"""
-
-        record = fromstring(record_xml)
-        ns = {"marc": "http://www.loc.gov/MARC21/slim"}
+        """
+        marc_ns = 'xmlns="http://www.loc.gov/MARC21/slim"'
+        records = [
+            fromstring(f"<record {marc_ns}>{body.format(id=1)}</record>"),
+            fromstring(f"<record>{body.format(id=2)}</record>"),
+            fromstring(f"<record {marc_ns}>{body.format(id=3)}</record>"),
+        ]
 
-        # Try 264 first, then 260
-        field = loader._extract_marc_field(record, ns, ["264", "260"], "b")
+        pubs = [loader._extract_from_record(record) for record in records]
 
-        assert field is not None
-        assert field.text == "Old Publisher Format"
+        assert [pub.source_id for pub in pubs] == ["1", "2", "3"]
+        assert [pub.original_title for pub in pubs] == ["Title 1", "Title 2", "Title 3"]
 
 
 # =============================================================================
@@ -491,3 +491,32 @@ Too Many\tColumns\tA99999\t1960-01-01\tR99999\t1988-01-01\tPublisher\tuuid-456\t
             # At least the complete row should parse
             complete_entries = [pub for pub in publications if "complete row" in pub.title.lower()]
             assert len(complete_entries) > 0
+
+
+class TestCompressedRenewalInput:
+    """Test loading gzip/bzip2/xz compressed renewal TSV files"""
+
+    def test_compressed_tsv_files_load_like_plain(self, sample_renewal_tsv):
+        """Test that compressed TSVs give the same entries and years as plain ones"""
+        # Standard library imports
+        from gzip import compress as gzip_compress
+        from lzma import compress as xz_compress
+
+        with TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            (temp_path / "1953-from-db.tsv.gz").write_bytes(
+                gzip_compress(sample_renewal_tsv.encode("utf-8"))
+            )
+            (temp_path / "1988.tsv.xz").write_bytes(xz_compress(sample_renewal_tsv.encode("utf-8")))
+
+            loader = RenewalDataLoader(temp_dir)
+            publications = loader.load_all_renewal_data()
+
+            assert len(publications) == 6
+            assert {pub.original_title for pub in publications} == {
+                "The Great Gatsby",
+                "To Kill a Mockingbird",
+                "Animal Farm",
+            }
+            assert loader.max_data_year == 1988
+            assert loader.year_range == (1925, 1960)
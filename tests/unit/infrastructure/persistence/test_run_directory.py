@@ -0,0 +1,117 @@
+# tests/unit/infrastructure/persistence/test_run_directory.py
+
+"""Tests for the durable run directory and its manifest"""
+
+# Standard library imports
+from os.path import exists
+from os.path import join
+from pathlib import Path
+
+# Third party imports
+from pytest import raises
+
+# Local imports
+from marc_pd_tool.infrastructure.persistence import RunDirectory
+from marc_pd_tool.infrastructure.persistence._run_directory import BatchResultEntry
+
+
+def add_batches(run: RunDirectory, count: int) -> list[str]:
+    """Write empty batch pickles into the run directory"""
+    paths = []
+    for i in range(count):
+        path = join(run.batch_dir, f"batch_{i:05d}.pkl")
+        Path(path).write_bytes(b"")
+        paths.append(path)
+    return paths
+
+
+def piece(run: RunDirectory, batch_id: int, matches: int = 0) -> BatchResultEntry:
+    """A processed piece whose result and stats files exist"""
+    result_file = join(run.result_dir, f"batch_{batch_id}_result.pkl")
+    Path(result_file).write_bytes(b"")
+    Path(run.result_dir, f"batch_{batch_id}_stats.pkl").write_bytes(b"")
+    return BatchResultEntry(
+        batch_id=batch_id,
+        result_file=result_file,
+        stats={"batch_id": batch_id, "marc_count": 10, "registration_matches_found": matches},
+    )
+
+
+class TestRunDirectory:
+    """Test creating, reopening and recording progress in a run directory"""
+
+    def test_create_and_open(self, tmp_path):
+        """Test settings and predicted costs survive reopening"""
+        run = RunDirectory.create(
+            {"marc_path": "/data/catalog.xml", "min_year": 1950}, str(tmp_path)
+        )
+        paths = add_batches(run, 2)
+        run.save_batch_costs({paths[0]: 3.0, paths[1]: 7.5})
+
+        reopened = RunDirectory.open(run.path)
+
+        assert Path(run.path).parent == tmp_path
+        assert reopened.settings == {"marc_path": "/data/catalog.xml", "min_year": 1950}
+        assert reopened.batch_costs == {"batch_00000.pkl": 3.0, "batch_00001.pkl": 7.5}
+
+    def test_open_without_run(self, tmp_path):
+        """Test a directory that holds no run can't be resumed"""
+        with raises(FileNotFoundError):
+            RunDirectory.open(str(tmp_path))
+
+        (tmp_path / "run.json").write_text("{")
+        with raises(ValueError, match="Unreadable run file"):
+            RunDirectory.open(str(tmp_path))
+
+    def test_check_settings(self, tmp_path):
+        """Test a resumed run must use the settings the run started with"""
+        run = RunDirectory.create({"min_year": 1950, "us_only": False}, str(tmp_path))
+
+        run.check_settings({"min_year": 1950, "us_only": False})
+        with raises(ValueError, match="min_year: 1950 -> 1960"):
+            run.check_settings({"min_year": 1960, "us_only": False})
+
+    def test_completed_batches_are_not_pending(self, tmp_path):
+        """Test completing a batch records it and removes its pickle"""
+        run = RunDirectory.create({}, str(tmp_path))
+        paths = add_batches(run, 3)
+
+        run.mark_complete(paths[1], [piece(run, 2, matches=4), piece(run, 5)])
+        completed = RunDirectory.open(run.path).completed_batches()
+
+        assert not exists(paths[1])
+        assert list(completed) == ["batch_00001.pkl"]
+        assert [p.result_file for p in completed["batch_00001.pkl"].results] == [
+            "batch_2_result.pkl",
+            "batch_5_result.pkl",
+        ]
+        assert completed["batch_00001.pkl"].results[0].stats["registration_matches_found"] == 4
+        assert run.pending_batches(completed) == [paths[0], paths[2]]
+        assert run.next_batch_id(completed) == 6
+
+    def test_interrupted_manifest_write(self, tmp_path):
+        """Test a manifest line cut short by a crash leaves its batch pending"""
+        run = RunDirectory.create({}, str(tmp_path))
+        paths = add_batches(run, 2)
+        run.mark_complete(paths[0], [piece(run, 1)])
+        with open(run.manifest_path, "a") as f:
+            f.write('{"batch": "batch_00001.pkl", "resu')
+
+        completed = run.completed_batches()
+
+        assert list(completed) == ["batch_00000.pkl"]
+        assert run.pending_batches(completed) == [paths[1]]
+
+    def test_discard_unfinished_results(self, tmp_path):
+        """Test result files of batches that didn't complete are removed"""
+        run = RunDirectory.create({}, str(tmp_path))
+        paths = add_batches(run, 2)
+        run.mark_complete(paths[0], [piece(run, 1)])
+        piece(run, 2)
+
+        run.discard_unfinished_results(run.completed_batches())
+
+        assert sorted(path.name for path in Path(run.result_dir).iterdir()) == [
+            "batch_1_result.pkl",
+            "batch_1_stats.pkl",
+        ]
@@ -0,0 +1,156 @@
+# tests/unit/infrastructure/persistence/test_source_manifest.py
+
+"""Tests for the persisted source-file manifest"""
+
+# Standard library imports
+from os import utime
+from pathlib import Path
+
+# Local imports
+from marc_pd_tool.infrastructure.persistence import CopyrightDataLoader
+from marc_pd_tool.infrastructure.persistence import RenewalDataLoader
+from marc_pd_tool.infrastructure.persistence._parallel_renewal_loader import (
+    ParallelRenewalLoader,
+)
+from marc_pd_tool.infrastructure.persistence._source_manifest import SourceManifest
+
+TSV_HEADER = "title\tauthor\toreg\todat\tentry_id\trdat\tclaimants\tfull_text\n"
+
+
+def write_renewals(path: Path, years: list[str]) -> None:
+    """Write a renewal TSV with one row per original registration date"""
+    rows = "".join(
+        f"Book {i}\tAuthor\tA{i}\t{year}\tR{i}\t1980-01-01\tClaimant\tText\n"
+        for i, year in enumerate(years)
+    )
+    path.write_text(TSV_HEADER + rows)
+
+
+class TestSourceManifest:
+    """Test building, persisting and updating the manifest"""
+
+    def test_entries_record_counts_and_years(self, tmp_path):
+        """Test per-file record counts, year ranges and undated counts"""
+        write_renewals(tmp_path / "a.tsv", ["1950-01-01", "1955-03-01"])
+        write_renewals(tmp_path / "b.tsv", ["1960-01-01", "unknown"])
+
+        loader = RenewalDataLoader(str(tmp_path))
+        manifest = loader.manifest
+
+        a = manifest.get(tmp_path / "a.tsv")
+        b = manifest.get(tmp_path / "b.tsv")
+        assert a is not None and b is not None
+        assert (a.record_count, a.min_year, a.max_year, a.undated_count) == (2, 1950, 1955, 0)
+        assert (b.record_count, b.min_year, b.max_year, b.undated_count) == (2, 1960, 1960, 1)
+        assert manifest.year_range == (1950, 1960)
+        assert manifest.record_count == 4
+        assert loader.year_range == (1950, 1960)
+
+    def test_manifest_persists_and_rescans_only_changed_files(self, tmp_path):
+        """Test that unchanged and merely touched files are not rescanned"""
+        data_dir = tmp_path / "renewals"
+        data_dir.mkdir()
+        cache_dir = str(tmp_path / "cache")
+        write_renewals(data_dir / "a.tsv", ["1950-01-01"])
+        write_renewals(data_dir / "b.tsv", ["1960-01-01"])
+
+        scanned: list[str] = []
+
+        def scanner(path: Path):
+            scanned.append(path.name)
+            return RenewalDataLoader(str(data_dir))._iter_row_years(path)
+
+        SourceManifest(data_dir, ".tsv", scanner, cache_dir=cache_dir).refresh()
+        assert sorted(scanned) == ["a.tsv", "b.tsv"]
+
+        # Touch one file without changing it and rewrite the other
+        scanned.clear()
+        stat = (data_dir / "a.tsv").stat()
+        utime(data_dir / "a.tsv", (stat.st_atime, stat.st_mtime + 10))
+        write_renewals(data_dir / "b.tsv", ["1961-01-01", "1962-01-01"])
+        (data_dir / "c.tsv").write_text(TSV_HEADER)
+
+        manifest = SourceManifest(data_dir, ".tsv", scanner, cache_dir=cache_dir).refresh()
+        assert sorted(scanned) == ["b.tsv", "c.tsv"]
+        assert manifest.year_range == (1950, 1962)
+        assert manifest.record_count == 3
+
+        # A fresh manifest reads everything from disk without scanning
+        scanned.clear()
+        (data_dir / "c.tsv").unlink()
+        manifest = SourceManifest(data_dir, ".tsv", scanner, cache_dir=cache_dir).refresh()
+        assert scanned == []
+        assert sorted(manifest.entries) == ["a.tsv", "b.tsv"]
+
+    def test_may_contain_years(self, tmp_path):
+        """Test year-window checks, keeping files with undated entries"""
+        write_renewals(tmp_path / "dated.tsv", ["1950-01-01", "1952-01-01"])
+        write_renewals(tmp_path / "undated.tsv", ["1950-01-01", "n.d."])
+
+        manifest = RenewalDataLoader(str(tmp_path)).manifest
+
+        assert manifest.may_contain_years(tmp_path / "dated.tsv", 1951, None)
+        assert not manifest.may_contain_years(tmp_path / "dated.tsv", 1953, None)
+        assert not manifest.may_contain_years(tmp_path / "dated.tsv", None, 1949)
+        assert manifest.may_contain_years(tmp_path / "undated.tsv", 1953, None)
+        assert manifest.may_contain_years(tmp_path / "missing.tsv", 1953, None)
+
+    def test_failed_scan_is_not_persisted(self, tmp_path):
+        """Test a file that can't be parsed is kept for loading and rescanned"""
+        data_dir = tmp_path / "copyright"
+        data_dir.mkdir()
+        cache_dir = str(tmp_path / "cache")
+        (data_dir / "broken.xml").write_text(
+            """<?xml version="1.0"?>
+            <copyrightEntries>
+                <copyrightEntry><regDate date="1930-01-01"/></copyrightEntry>
+                <copyrightEntry><regDate date="1960-01-01"/>"""
+        )
+
+        manifest = CopyrightDataLoader(str(data_dir), cache_dir=cache_dir).manifest
+
+        assert manifest.get(data_dir / "broken.xml") is None
+        assert manifest.may_contain_years(data_dir / "broken.xml", 1950, None)
+
+        scanned: list[str] = []
+
+        def scanner(path: Path):
+            scanned.append(path.name)
+            return CopyrightDataLoader(str(data_dir))._iter_entry_years(path)
+
+        SourceManifest(data_dir, ".xml", scanner, cache_dir=cache_dir, kind="copyright").refresh()
+        assert scanned == ["broken.xml"]
+
+
+class TestManifestFileSkipping:
+    """Test that loaders skip files wholly outside the year range"""
+
+    def test_parallel_renewal_loader_skips_out_of_range_files(self, tmp_path):
+        """Test that only files overlapping the window are opened"""
+        write_renewals(tmp_path / "early.tsv", ["1930-01-01", "1935-01-01"])
+        write_renewals(tmp_path / "late.tsv", ["1960-01-01"])
+
+        loader = RenewalDataLoader(str(tmp_path))
+        parallel = ParallelRenewalLoader(
+            str(tmp_path), min_year=1950, num_workers=1, manifest=loader.manifest
+        )
+
+        assert [Path(path).name for path in parallel.tsv_files] == ["late.tsv"]
+        pubs = loader.load_all_renewal_data(min_year=1950)
+        assert [pub.year for pub in pubs] == [1960]
+
+    def test_copyright_max_data_year_falls_back_to_manifest(self, tmp_path):
+        """Test max_data_year without year directories"""
+        (tmp_path / "entries.xml").write_text(
+            """<?xml version="1.0"?>
+            <copyrightEntries>
+                <copyrightEntry><title>A</title><regDate date="1948-01-01"/></copyrightEntry>
+                <copyrightEntry><title>B</title><regDate date="1951-01-01"/></copyrightEntry>
+            </copyrightEntries>"""
+        )
+
+        loader = CopyrightDataLoader(str(tmp_path), cache_dir=str(tmp_path / "cache"))
+
+        assert loader.max_data_year == 1951
+        assert loader.year_range == (1948, 1951)
+        assert list((tmp_path / "cache" / "source_manifests").glob("copyright_*.json"))
@@ -0,0 +1,124 @@
+# tests/unit/infrastructure/persistence/test_string_interner.py
+
+"""Tests for load-time interning of repeated field values"""
+
+# Standard library imports
+from pathlib import Path
+
+# Local imports
+from marc_pd_tool.core.domain.publication import Publication
+from marc_pd_tool.infrastructure.persistence import RenewalDataLoader
+from marc_pd_tool.infrastructure.persistence._columnar_shard import ColumnarShard
+from marc_pd_tool.infrastructure.persistence._columnar_shard import write_shard
+from marc_pd_tool.infrastructure.persistence._string_interner import (
+    STRING_TABLE_FILENAME,
+)
+from marc_pd_tool.infrastructure.persistence._string_interner import StringInterner
+
+
+def fresh(value: str) -> str:
+    """Build an equal string that is a distinct object"""
+    return "".join(list(value))
+
+
+class TestStringInterner:
+    """Test sharing equal strings"""
+
+    def test_equal_values_share_one_object(self):
+        """Test that interning returns the first string seen"""
+        interner = StringInterner()
+        first = interner.intern(fresh("Macmillan"))
+        second = interner.intern(fresh("Macmillan"))
+
+        assert first == second and first is second
+        assert interner.intern(None) is None
+        assert interner.intern("") == ""
+        assert interner.value_count == 2
+        assert len(interner) == 1
+        assert interner.dedup_ratio == 2.0
+
+    def test_intern_publication(self):
+        """Test that only repeated-value fields are replaced"""
+        interner = StringInterner()
+        pubs = [
+            Publication(
+                title=fresh("A title"),
+                author=fresh("Smith, John"),
+                publisher=fresh("Macmillan"),
+                place=fresh("New York"),
+                pub_date=fresh("1950"),
+            )
+            for _ in range(2)
+        ]
+        for pub in pubs:
+            interner.intern_publication(pub)
+
+        assert pubs[0].original_author is pubs[1].original_author
+        assert pubs[0].original_publisher is pubs[1].original_publisher
+        assert pubs[0].original_place is pubs[1].original_place
+        assert pubs[0].pub_date is pubs[1].pub_date
+        assert pubs[0].original_title is not pubs[1].original_title
+
+    def test_max_size_stops_growth(self):
+        """Test that a full table still serves existing strings"""
+        interner = StringInterner(max_size=1)
+        kept = interner.intern(fresh("kept"))
+
+        assert interner.intern(fresh("kept")) is kept
+        assert interner.intern("other") == "other"
+        assert len(interner) == 1
+
+    def test_table_persists_in_cache_dir(self, tmp_path):
+        """Test saving and seeding the table from the cache directory"""
+        interner = StringInterner.for_cache_dir(str(tmp_path))
+        interner.intern("Macmillan")
+        interner.save()
+
+        assert (tmp_path / STRING_TABLE_FILENAME).exists()
+        seeded = StringInterner.for_cache_dir(str(tmp_path))
+        assert len(seeded) == 1
+        assert seeded.seeded_count == 1
+
+    def test_unreadable_table_is_ignored(self, tmp_path):
+        """Test that a corrupt table starts an empty interner"""
+        (tmp_path / STRING_TABLE_FILENAME).write_bytes(b"not a pickle")
+
+        assert len(StringInterner.for_cache_dir(str(tmp_path))) == 0
+
+
+class TestLoaderInterning:
+    """Test interning in the loaders"""
+
+    def test_shards_share_strings(self, tmp_path):
+        """Test that values repeated across shards become one object"""
+        interner = StringInterner()
+        loaded: list[Publication] = []
+        for i in range(2):
+            path = str(tmp_path / f"{i}.shard")
+            write_shard(path, [Publication(title=f"T{i}", author=fresh("Smith, John"))])
+            with ColumnarShard(path) as shard:
+                loaded.extend(shard.to_publications(interner))
+
+        assert loaded[0].original_author is loaded[1].original_author
+        assert interner.value_count == 2
+
+    def test_renewal_loader_saves_table(self, tmp_path):
+        """Test that loading renewals persists the table with the cache"""
+        data_dir = tmp_path / "renewals"
+        data_dir.mkdir()
+        rows = "".join(
+            f"Book {i}\tSmith, John\tA{i}\t1950-01-01\tR{i}\t1978-01-01\tClaimant\tText\n"
+            for i in range(3)
+        )
+        (data_dir / "a.tsv").write_text(
+            "title\tauthor\toreg\todat\tentry_id\trdat\tclaimants\tfull_text\n" + rows
+        )
+        cache_dir = tmp_path / "cache"
+
+        pubs = RenewalDataLoader(
+            str(data_dir), num_workers=1, cache_dir=str(cache_dir)
+        ).load_all_renewal_data()
+
+        assert len(pubs) == 3
+        assert pubs[0].original_author is pubs[2].original_author
+        assert Path(cache_dir / STRING_TABLE_FILENAME).exists()
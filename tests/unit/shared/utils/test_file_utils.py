@@ -0,0 +1,70 @@
+# tests/unit/shared/utils/test_file_utils.py
+
+"""Tests for plain and compressed input file helpers"""
+
+# Standard library imports
+from bz2 import compress as bz2_compress
+from gzip import compress as gzip_compress
+from lzma import compress as xz_compress
+
+# Local imports
+from marc_pd_tool.shared.utils.file_utils import find_data_files
+from marc_pd_tool.shared.utils.file_utils import open_binary
+from marc_pd_tool.shared.utils.file_utils import open_text
+from marc_pd_tool.shared.utils.file_utils import strip_compression_suffix
+
+CONTENT = "title\tauthor\nÉtude\tDoe, Jane\n"
+
+
+class TestOpenCompressed:
+    """Test transparent decompression"""
+
+    def test_open_text_all_formats(self, tmp_path):
+        """Test that plain, gzip, bzip2 and xz files read back identically"""
+        raw = CONTENT.encode("utf-8")
+        files = {
+            "data.tsv": raw,
+            "data1.tsv.gz": gzip_compress(raw),
+            "data2.tsv.bz2": bz2_compress(raw),
+            "data3.tsv.xz": xz_compress(raw),
+        }
+        for name, data in files.items():
+            (tmp_path / name).write_bytes(data)
+
+        for name in files:
+            with open_text(tmp_path / name) as f:
+                assert f.read() == CONTENT, name
+            with open_binary(tmp_path / name) as f:
+                assert f.read() == raw, name
+
+    def test_open_binary_with_raw_handle(self, tmp_path):
+        """Test that progress can be tracked on the compressed handle"""
+        path = tmp_path / "data.xml.gz"
+        path.write_bytes(gzip_compress(b"<root/>" * 1000))
+
+        with open(path, "rb") as raw, open_binary(path, raw) as f:
+            assert f.read().startswith(b"<root/>")
+            assert raw.tell() == path.stat().st_size
+
+
+class TestFindDataFiles:
+    """Test discovery of data files and their compressed copies"""
+
+    def test_finds_compressed_copies(self, tmp_path):
+        """Test that compressed files are matched on the inner suffix"""
+        for name in ["1950.tsv", "1951.tsv.gz", "1952.tsv.xz", "notes.txt.gz", "1953.xml"]:
+            (tmp_path / name).write_bytes(b"")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "1954.tsv.bz2").write_bytes(b"")
+
+        names = [p.name for p in find_data_files(tmp_path, ".tsv")]
+        assert names == ["1950.tsv", "1951.tsv.gz", "1952.tsv.xz"]
+
+        recursive = [p.name for p in find_data_files(tmp_path, ".tsv", recursive=True)]
+        assert "1954.tsv.bz2" in recursive
+
+    def test_strip_compression_suffix(self):
+        """Test that only compression suffixes are removed"""
+        assert strip_compression_suffix("a/1950.tsv.gz").name == "1950.tsv"
+        assert strip_compression_suffix("a/1950.tsv").name == "1950.tsv"
+        assert strip_compression_suffix("catalog.mrc.xz").suffix == ".mrc"
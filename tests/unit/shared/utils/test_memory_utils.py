@@ -3,12 +3,16 @@
 """Tests for memory monitoring utilities"""
 
 # Standard library imports
+from gc import disable
+from gc import enable
+from gc import isenabled
 from time import sleep
 from unittest.mock import Mock
 from unittest.mock import patch
 
 # Local imports
 from marc_pd_tool.shared.utils.memory_utils import MemoryMonitor
+from marc_pd_tool.shared.utils.memory_utils import paused_gc
 
 
 class TestMemoryMonitor:
@@ -375,3 +379,25 @@ class TestMemoryMonitorIntegration:
                 summary = monitor.get_final_summary()
                 assert isinstance(summary, str)
                 assert len(summary) > 0
+
+
+class TestPausedGc:
+    """Test pausing the cyclic garbage collector"""
+
+    def test_restores_previous_state(self):
+        """Test that the collector is paused inside and restored on exit"""
+        assert isenabled()
+        try:
+            with paused_gc():
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert isenabled()
+
+        disable()
+        try:
+            with paused_gc():
+                assert not isenabled()
+            assert not isenabled()
+        finally:
+            enable()
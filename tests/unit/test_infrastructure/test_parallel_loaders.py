@@ -9,6 +9,7 @@ from pathlib import Path
 from pytest import mark
 
 # Local imports
+from marc_pd_tool.core.domain.publication import Publication
 from marc_pd_tool.infrastructure.persistence._copyright_loader import (
     CopyrightDataLoader,
 )
@@ -339,6 +340,55 @@ R{year}2\tSecond Book {year}\t\t{year}-12-25\tFull text for second book"""
             assert pub1.full_text == pub2.full_text
 
 
+class TestPositionalTsvParsing:
+    """Test the positional fast path against csv.DictReader parsing"""
+
+    TSV_CONTENT = (
+        "entry_id\tvolume\tpart\tauthor\ttitle\toreg\todat\tid\tfull_text\n"
+        "R1\t\t\tSmith, John\t Padded Title \tA1\t1950-01-15\tX\tText one\n"
+        "R2\tv2\t\tDoe, Jane\tUndated Book\tA2\tn.d.\tX\tText two\n"
+        "R3\t\t\t\t\tA3\t1951-01-01\tX\tNo title\n"
+        "R4\t\t\tShort Row\tTruncated\n"
+        "\n"
+        "R5\t\t\tLee, Ann\tLate Book\tA5\t1962-05-01\tX\tText five\n"
+    )
+
+    def test_positional_matches_dict_reader(self) -> None:
+        """Test identical publications with and without year filters"""
+        # Local imports
+        from marc_pd_tool.infrastructure.persistence._parallel_renewal_loader import (
+            _parse_tsv_dict_rows,
+        )
+        from marc_pd_tool.infrastructure.persistence._parallel_renewal_loader import (
+            _parse_tsv_positional,
+        )
+
+        for min_year, max_year in [(None, None), (1951, None), (None, 1955)]:
+            expected = _parse_tsv_dict_rows(self.TSV_CONTENT, "test.tsv", min_year, max_year)
+            actual = _parse_tsv_positional(self.TSV_CONTENT, min_year, max_year)
+
+            assert len(actual) == len(expected)
+            for fast, slow in zip(actual, expected):
+                for slot in Publication.__slots__:
+                    assert getattr(fast, slot, None) == getattr(slow, slot, None), slot
+
+        titles = [pub.title for pub in _parse_tsv_positional(self.TSV_CONTENT, None, 1955)]
+        assert titles == ["Padded Title", "Undated Book"]
+
+    def test_quoted_fields_use_csv_parsing(self, tmp_path: Path) -> None:
+        """Test that files with quoted fields keep csv quoting semantics"""
+        tsv_file = tmp_path / "quoted.tsv"
+        tsv_file.write_text(
+            'entry_id\ttitle\todat\tfull_text\nR1\t"Tab\tin title"\t1950-01-01\t"Multi\nline"\n'
+        )
+
+        publications = _load_single_tsv_file_static(str(tsv_file), None, None)
+
+        assert len(publications) == 1
+        assert publications[0].original_title == "Tab\tin title"
+        assert publications[0].full_text == "Multi\nline"
+
+
 class TestParallelLoadingPerformance:
     """Test performance improvements with parallel loading"""
 
@@ -93,6 +93,21 @@ class TestParallelIndexer:
         for lccn in seq_index.lccn_index:
             assert seq_index.lccn_index[lccn].ids == par_index.lccn_index[lccn].ids
 
+    def test_parallel_title_counts_match_sequential(self) -> None:
+        """Test title frequencies counted across chunks add up to the sequential counts"""
+        publications = [
+            Publication(title=title, source_id=str(i))
+            for i, title in enumerate(
+                ["Poems", "Annual report", f"A long and distinctive title number {0}"] * 400
+            )
+        ]
+
+        seq_index = build_wordbased_index(publications)
+        par_index = build_wordbased_index_parallel(publications, num_workers=3)
+
+        assert par_index.title_counts == seq_index.title_counts
+        assert par_index.title_counts == {"poems": 400, "annual report": 400}
+
     def test_parallel_indexing_with_unicode(self) -> None:
         """Test parallel indexing with unicode characters"""
         publications = [